@@ -28,6 +28,7 @@ from __future__ import (
     unicode_literals,
 )
 
+from bisect import bisect_right
 from collections import Counter
 from fractions import Fraction
 
@@ -45,9 +46,16 @@ class Arithmetic(object):
 
     This is based on Andrew Dalke's public domain implementation
     :cite:`Dalke:2005`. It has been ported to use the fractions.Fraction class.
+
+    Given a precision, encoding & decoding instead use fixed-precision integer
+    arithmetic, with renormalization, after Witten, Neal & Cleary
+    :cite:`Witten:1987`. Its codes are within a bit or so of the length of
+    those of exact arithmetic, but each symbol takes constant time, where the
+    fractions of exact arithmetic grow with every symbol.
     """
 
     _probs = {}
+    _freqs = None
 
     def __init__(self, text=None):
         """Initialize arithmetic coder object.
@@ -82,6 +90,50 @@ class Arithmetic(object):
 
         """
         self._probs = probs
+        self._freqs = None
+
+    def _freq_table(self):
+        r"""Return the probs dictionary as a table of integer frequencies.
+
+        Returns
+        -------
+        tuple
+            The total frequency, the characters in order of their ranges, the
+            cumulative frequency at the start of each of their ranges, and a
+            dict of each character's range as a pair of cumulative frequencies
+
+        Example
+        -------
+        >>> ac = Arithmetic('banana')
+        >>> total, chars, starts, bounds = ac._freq_table()
+        >>> total, chars, starts
+        (7, ['a', 'n', 'b', '\x00'], [0, 3, 5, 6])
+        >>> bounds['n']
+        (3, 5)
+
+        """
+        if self._freqs is None:
+            ranges = sorted(
+                (
+                    (Fraction(minval), Fraction(maxval), char)
+                    for char, (minval, maxval) in self._probs.items()
+                ),
+                key=lambda x: x[0],
+            )
+            # The least common multiple of the denominators
+            total = long(1)
+            for minval, maxval, _ in ranges:
+                for val in (minval, maxval):
+                    total *= Fraction(total, val.denominator).denominator
+
+            chars = [char for _, _, char in ranges]
+            starts = [int(minval * total) for minval, _, _ in ranges]
+            bounds = {
+                char: (int(minval * total), int(maxval * total))
+                for minval, maxval, char in ranges
+            }
+            self._freqs = (total, chars, starts, bounds)
+        return self._freqs
 
     def train(self, text):
         r"""Generate a probability dict from the provided text.
@@ -138,6 +190,7 @@ class Arithmetic(object):
 
         tot = 0
         self._probs = {}
+        self._freqs = None
         prev = Fraction(0)
         for char, count in sorted(
             counts.items(), key=lambda x: (x[1], x[0]), reverse=True
@@ -147,7 +200,7 @@ class Arithmetic(object):
             prev = follow
             tot = tot + count
 
-    def encode(self, text):
+    def encode(self, text, precision=None):
         """Encode a text using arithmetic coding.
 
         Text and the 0-order probability statistics -> longval, nbits
@@ -158,22 +211,36 @@ class Arithmetic(object):
         ----------
         text : str
             A string to encode
+        precision : int
+            The number of bits of the integers used in fixed-precision
+            arithmetic coding (e.g. 32), or None to use exact arithmetic. The
+            text must be decoded with the same precision.
 
         Returns
         -------
         tuple
             The arithmetically coded text
 
+        Raises
+        ------
+        ValueError
+            Precision too low for the probabilities.
+
         Example
         -------
         >>> ac = Arithmetic('the quick brown fox jumped over the lazy dog')
         >>> ac.encode('align')
         (16720586181, 34)
+        >>> ac.encode('align', precision=32)
+        (16720586179, 34)
 
         """
         text = text_type(text)
         if '\x00' in text:
             text = text.replace('\x00', ' ')
+        if precision is not None:
+            return self._encode_fixed(text, precision)
+
         minval = Fraction(0)
         maxval = Fraction(1)
 
@@ -201,7 +268,120 @@ class Arithmetic(object):
         # the division truncation is deliberate
         return avg.numerator // avg.denominator, nbits
 
-    def decode(self, longval, nbits):
+    def _check_precision(self, precision):
+        """Return the frequency table, if precision suffices for it.
+
+        Each character must be left a non-empty range of integers, even when
+        the range being divided is as narrow as renormalization allows (a
+        quarter of the integers of the given precision).
+
+        Parameters
+        ----------
+        precision : int
+            The number of bits of the integers used in arithmetic coding
+
+        Returns
+        -------
+        tuple
+            The frequency table, as from :py:meth:`_freq_table`
+
+        Raises
+        ------
+        ValueError
+            Precision too low for the probabilities.
+
+        Example
+        -------
+        >>> ac = Arithmetic('banana')
+        >>> ac._check_precision(5)[0]
+        7
+        >>> ac._check_precision(4)
+        Traceback (most recent call last):
+            ...
+        ValueError: Precision of 4 bits is too low for the probabilities.
+
+        """
+        freqs = self._freq_table()
+        if freqs[0] > long(1) << (precision - 2):
+            raise ValueError(
+                'Precision of {} bits is too low for the '
+                'probabilities.'.format(precision)
+            )
+        return freqs
+
+    def _encode_fixed(self, text, precision):
+        """Encode a text using fixed-precision arithmetic coding.
+
+        The interval [low, high] is narrowed to each character's share of it,
+        rounded to integers. Whenever it lies within the lower or upper half
+        of the integers, the next bit of the code is known, and the interval
+        is doubled. When it straddles the middle within the central half, the
+        next bit is not yet known, so the interval is doubled about the
+        middle and the bit left pending until it is.
+
+        Parameters
+        ----------
+        text : str
+            A string to encode, without NUL characters
+        precision : int
+            The number of bits of the integers used in arithmetic coding
+
+        Returns
+        -------
+        tuple
+            The arithmetically coded text
+
+        Example
+        -------
+        >>> ac = Arithmetic('banana')
+        >>> ac._encode_fixed('banana', 16)
+        (12199, 14)
+
+        """
+        total, _, _, bounds = self._check_precision(precision)
+        half = long(1) << (precision - 1)
+        quarter = half >> 1
+        low = long(0)
+        high = (half << 1) - 1
+        pending = 0
+        bits = []
+
+        for char in text + '\x00':
+            start, end = bounds[char]
+            span = high - low + 1
+            high = low + span * end // total - 1
+            low = low + span * start // total
+
+            while True:
+                if high < half:
+                    bits.append('0' + '1' * pending)
+                    pending = 0
+                elif low >= half:
+                    bits.append('1' + '0' * pending)
+                    pending = 0
+                    low -= half
+                    high -= half
+                elif low >= quarter and high < half + quarter:
+                    pending += 1
+                    low -= quarter
+                    high -= quarter
+                else:
+                    break
+                low <<= 1
+                high = (high << 1) + 1
+
+        # Two more bits select the lower or upper central quarter, either of
+        # which lies within the interval; the bits that would follow are all
+        # 0, as the decoder assumes.
+        if low < quarter:
+            bits.append('01' + '1' * pending)
+        else:
+            bits.append('10' + '0' * pending)
+
+        code = ''.join(bits)
+        return long(code, 2), long(len(code))
+
+    def decode(self, longval, nbits, precision=None):
         """Decode the number to a string using the given statistics.
 
         Parameters
@@ -210,32 +390,58 @@ class Arithmetic(object):
             The first part of an encoded tuple from encode
         nbits : int
             The second part of an encoded tuple from encode
+        precision : int
+            The number of bits of the integers used in fixed-precision
+            arithmetic coding, as passed to encode, or None to use exact
+            arithmetic
 
         Returns
         -------
         str
             The arithmetically decoded text
 
+        Raises
+        ------
+        ValueError
+            Precision too low for the probabilities.
+
         Example
         -------
         >>> ac = Arithmetic('the quick brown fox jumped over the lazy dog')
         >>> ac.decode(16720586181, 34)
         'align'
+        >>> ac.decode(16720586179, 34, precision=32)
+        'align'
 
         """
+        if precision is not None:
+            return self._decode_fixed(longval, nbits, precision)
+
         val = Fraction(longval, long(1) << nbits)
         letters = []
 
-        probs_items = [
-            (char, minval, maxval)
-            for (char, (minval, maxval)) in self._probs.items()
-        ]
+        probs_items = sorted(
+            (
+                (minval, maxval, char)
+                for (char, (minval, maxval)) in self._probs.items()
+            ),
+            key=lambda x: x[0],
+        )
+        starts = [minval for minval, _, _ in probs_items]
+        # A value in none of the ranges falls to the last of the probs
+        # dictionary, as in a linear search
+        fallback = None
+        for char, (minval, maxval) in self._probs.items():
+            fallback = (minval, maxval, char)
 
         char = '\x00'
         while True:
-            for (char, minval, maxval) in probs_items:  # noqa: B007
-                if minval <= val < maxval:
-                    break
+            if probs_items:
+                idx = bisect_right(starts, val) - 1
+                if idx >= 0 and val < probs_items[idx][1]:
+                    minval, maxval, char = probs_items[idx]
+                else:
+                    minval, maxval, char = fallback
 
             if char == '\x00':
                 break
@@ -244,6 +450,79 @@ class Arithmetic(object):
             val = (val - minval) / delta
         return ''.join(letters)
 
+    def _decode_fixed(self, longval, nbits, precision):
+        """Decode the number to a string using fixed-precision arithmetic.
+
+        The decoder mirrors the encoder's intervals, reading the code a
+        precision's worth of bits at a time (padded with 0s), and finds each
+        character by searching the cumulative frequencies.
+
+        Parameters
+        ----------
+        longval : int
+            The first part of an encoded tuple from encode
+        nbits : int
+            The second part of an encoded tuple from encode
+        precision : int
+            The number of bits of the integers used in arithmetic coding
+
+        Returns
+        -------
+        str
+            The arithmetically decoded text
+
+        Example
+        -------
+        >>> ac = Arithmetic('banana')
+        >>> ac._decode_fixed(12199, 14, 16)
+        'banana'
+
+        """
+        total, chars, starts, bounds = self._check_precision(precision)
+        half = long(1) << (precision - 1)
+        quarter = half >> 1
+        low = long(0)
+        high = (half << 1) - 1
+        # The code's bits, padded with 0s to at least the precision
+        code = '{:0{}b}'.format(longval, nbits) if nbits else ''
+        code += '0' * (precision - len(code))
+        value = long(code[:precision], 2)
+        pos = precision
+        letters = []
+
+        while True:
+            span = high - low + 1
+            count = ((value - low + 1) * total - 1) // span
+            char = chars[bisect_right(starts, count) - 1]
+            if char == '\x00':
+                break
+            letters.append(char)
+
+            start, end = bounds[char]
+            high = low + span * end // total - 1
+            low = low + span * start // total
+
+            while True:
+                if high < half:
+                    pass
+                elif low >= half:
+                    low -= half
+                    high -= half
+                    value -= half
+                elif low >= quarter and high < half + quarter:
+                    low -= quarter
+                    high -= quarter
+                    value -= quarter
+                else:
+                    break
+                low <<= 1
+                high = (high << 1) + 1
+                value <<= 1
+                if pos < len(code):
+                    value += code[pos] == '1'
+                    pos += 1
+        return ''.join(letters)
+
 
 def ac_train(text):
     r"""Generate a probability dict from the provided text.
@@ -28,11 +28,23 @@ from __future__ import (
     unicode_literals,
 )
 
-from six.moves import range
+from numpy import concatenate as np_concatenate
+from numpy import cumsum as np_cumsum
+from numpy import empty as np_empty
+from numpy import frombuffer as np_frombuffer
+from numpy import full as np_full
+from numpy import int64 as np_int64
+from numpy import lexsort as np_lexsort
+from numpy import uint32 as np_uint32
 
+from six.moves import range
 
 __all__ = ['BWT', 'bwt_decode', 'bwt_encode']
 
+# The word length (including the terminator) from which sorting its suffixes
+# with numpy outpaces sorting its rotations as strings
+_SUFFIX_ARRAY_MIN_LEN = 1024
+
 
 class BWT(object):
     """Burrows-Wheeler Transform.
@@ -40,8 +52,88 @@ class BWT(object):
     The Burrows-Wheeler transform is an attempt at placing similar characters
     together to improve compression.
     Cf. :cite:`Burrows:1994`.
+
+    Since the terminator occurs just once, the rotations of a word are in
+    the order of its suffixes, so encoding longer words sorts the suffixes
+    (as a suffix array) rather than the rotations themselves. Decoding
+    follows the last-to-first mapping from character to character, rather
+    than rebuilding the table of rotations.
     """
 
+    @staticmethod
+    def _codes(word):
+        """Return the code points of a word, as a numpy array.
+
+        Parameters
+        ----------
+        word : str
+            The word to encode
+
+        Returns
+        -------
+        numpy.ndarray
+            The code point of each character of word
+
+        Examples
+        --------
+        >>> BWT._codes('align')
+        array([ 97, 108, 105, 103, 110], dtype=uint32)
+
+        """
+        return np_frombuffer(word.encode('utf-32-le'), dtype=np_uint32)
+
+    @classmethod
+    def _suffix_array(cls, word):
+        """Return the suffix array of a word.
+
+        The suffixes are sorted by prefix doubling :cite:`Manber:1993`: once
+        they are ranked by their first k characters, they are ranked by their
+        first 2k characters by sorting on the pair of the ranks of each suffix
+        & of the suffix k characters later. Each round is a numpy sort, and
+        the rounds end as soon as all ranks differ.
+
+        Parameters
+        ----------
+        word : str
+            The word whose suffixes are to be sorted
+
+        Returns
+        -------
+        numpy.ndarray
+            The starting position of each suffix of word, in sorted order
+
+        Examples
+        --------
+        >>> BWT._suffix_array('banana$')
+        array([6, 5, 3, 1, 0, 4, 2])
+
+        """
+        length = len(word)
+        rank = cls._codes(word).astype(np_int64)
+        order = np_empty(0, dtype=np_int64)
+        offset = 1
+        while True:
+            # The rank of the suffix offset characters later (-1 past the end)
+            later = np_full(length, -1, dtype=np_int64)
+            later[: length - offset] = rank[offset:]
+            order = np_lexsort((later, rank))
+
+            rank_sorted = rank[order]
+            later_sorted = later[order]
+            new_rank = np_concatenate(
+                (
+                    [0],
+                    np_cumsum(
+                        (rank_sorted[1:] != rank_sorted[:-1])
+                        | (later_sorted[1:] != later_sorted[:-1])
+                    ),
+                )
+            )
+            rank[order] = new_rank
+            if new_rank[-1] == length - 1:
+                return order
+            offset <<= 1
+
     def encode(self, word, terminator='\0'):
         r"""Return the Burrows-Wheeler transformed form of a word.
 
@@ -82,10 +174,20 @@ class BWT(object):
                 )
             else:
                 word += terminator
-                wordlist = sorted(
-                    word[i:] + word[:i] for i in range(len(word))
+                if len(word) < _SUFFIX_ARRAY_MIN_LEN:
+                    wordlist = sorted(
+                        word[i:] + word[:i] for i in range(len(word))
+                    )
+                    return ''.join([w[-1] for w in wordlist])
+
+                # The last character of each rotation is the one preceding
+                # its suffix.
+                codes = self._codes(word)
+                return (
+                    codes[self._suffix_array(word) - 1]
+                    .tobytes()
+                    .decode('utf-32-le')
                 )
-                return ''.join([w[-1] for w in wordlist])
         else:
             return terminator
 
@@ -128,13 +230,41 @@ class BWT(object):
                     )
                 )
             else:
-                wordlist = [''] * len(code)
-                for i in range(len(code)):
-                    wordlist = sorted(
-                        code[i] + wordlist[i] for i in range(len(code))
-                    )
-                rows = [w for w in wordlist if w[-1] == terminator][0]
-                return rows.rstrip(terminator)
+                length = len(code)
+                # Row j of the sorted table of rotations begins with the
+                # character at first[j] of code, the next character of the
+                # row is at first[first[j]], and so on (the inverse of the
+                # last-to-first mapping), so each row is spelled out by
+                # following first around its cycle.
+                first = sorted(range(length), key=code.__getitem__)
+
+                # The word is the first row to end with the terminator. For a
+                # proper transform, first is a single cycle & that row is the
+                # one ending with the terminator's occurrence in code.
+                word_row = None
+                seen = [False] * length
+                for start in range(length):
+                    if seen[start]:
+                        continue
+                    cycle = [start]
+                    seen[start] = True
+                    row = first[start]
+                    while row != start:
+                        seen[row] = True
+                        cycle.append(row)
+                        row = first[row]
+
+                    for pos, row in enumerate(cycle):
+                        if (word_row is None or row < word_row[0]) and code[
+                            cycle[(pos + length) % len(cycle)]
+                        ] == terminator:
+                            word_row = (row, cycle, pos)
+
+                row, cycle, pos = word_row
+                return ''.join(
+                    code[cycle[(pos + step) % len(cycle)]]
+                    for step in range(1, length + 1)
+                ).rstrip(terminator)
         else:
             return ''
 
@@ -30,7 +30,12 @@ from __future__ import (
 
 from collections import Counter
 
+from numpy import array as np_array
+from numpy import errstate as np_errstate
+from numpy import maximum as np_maximum
+
 from ._token_distance import _TokenDistance
+from ..tokenizer import QGramVectorizer
 
 __all__ = ['Bag', 'bag', 'dist_bag', 'sim_bag']
 
@@ -127,6 +132,145 @@ class Bag(_TokenDistance):
 
         return self.dist_abs(src, tar) / max_length
 
+    def dist_matrix(self, src_collection, tar_collection=None):
+        """Return the matrix of normalized bag distances of two collections.
+
+        The bags of every member of each collection are built just once, into
+        a shared sparse count matrix (:py:class:`.QGramMatrix`), and the
+        intersection sizes of all pairs, from which the bag distances follow,
+        are calculated at once.
+
+        Parameters
+        ----------
+        src_collection : iterable
+            Source strings for comparison
+        tar_collection : iterable
+            Target strings for comparison; if None, the members of
+            src_collection are compared with each other
+
+        Returns
+        -------
+        numpy.ndarray
+            Normalized bag distance between each source (row) & each target
+            (column)
+
+        Examples
+        --------
+        >>> cmp = Bag()
+        >>> cmp.dist_matrix(['cat', 'act'], ['hat', 'cat', 'dog'])
+        array([[0.33333333, 0.        , 1.        ],
+               [0.33333333, 0.        , 1.        ]])
+
+        """
+        src_collection = list(src_collection)
+        tar_collection = (
+            src_collection if tar_collection is None else list(tar_collection)
+        )
+
+        vectorizer = QGramVectorizer()
+        src_matrix = vectorizer.transform(
+            Counter(term) for term in src_collection
+        )
+        tar_matrix = vectorizer.transform(
+            Counter(term) for term in tar_collection
+        )
+
+        src_len = src_matrix.magnitudes[:, None]
+        tar_len = tar_matrix.magnitudes[None, :]
+        int_len = src_matrix.intersection(tar_matrix)
+        with np_errstate(divide='ignore', invalid='ignore'):
+            dists = np_maximum(src_len - int_len, tar_len - int_len) / (
+                np_maximum(src_len, tar_len)
+            )
+        dists[(src_len == 0) | (tar_len == 0)] = 1.0
+
+        keys = {}
+        src_keys = np_array(
+            [self._term_key(term, keys) for term in src_collection], dtype=int
+        )
+        tar_keys = np_array(
+            [self._term_key(term, keys) for term in tar_collection], dtype=int
+        )
+        dists[src_keys[:, None] == tar_keys[None, :]] = 0.0
+        return dists
+
+    def sim_matrix(self, src_collection, tar_collection=None):
+        """Return the matrix of normalized bag similarities of two collections.
+
+        Parameters
+        ----------
+        src_collection : iterable
+            Source strings for comparison
+        tar_collection : iterable
+            Target strings for comparison; if None, the members of
+            src_collection are compared with each other
+
+        Returns
+        -------
+        numpy.ndarray
+            Normalized bag similarity between each source (row) & each target
+            (column)
+
+        Examples
+        --------
+        >>> cmp = Bag()
+        >>> cmp.sim_matrix(['cat', 'act'], ['hat', 'cat', 'dog'])
+        array([[0.66666667, 1.        , 0.        ],
+               [0.66666667, 1.        , 0.        ]])
+
+        """
+        return 1.0 - self.dist_matrix(src_collection, tar_collection)
+
+    def dist_many(self, src, targets):
+        """Return the normalized bag distances to many strings.
+
+        This is the one-row case of :py:meth:`dist_matrix`.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            Normalized bag distance between src & each target
+
+        Examples
+        --------
+        >>> cmp = Bag()
+        >>> cmp.dist_many('cat', ['hat', 'cat', 'act', 'dog'])
+        array([0.33333333, 0.        , 0.        , 1.        ])
+
+        """
+        return self.dist_matrix([src], targets)[0]
+
+    def sim_many(self, src, targets):
+        """Return the normalized bag similarities to many strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            Normalized bag similarity between src & each target
+
+        Examples
+        --------
+        >>> cmp = Bag()
+        >>> cmp.sim_many('cat', ['hat', 'cat', 'act', 'dog'])
+        array([0.66666667, 1.        , 1.        , 0.        ])
+
+        """
+        return 1.0 - self.dist_many(src, targets)
+
 
 def bag(src, tar):
     """Return the bag distance between two strings.
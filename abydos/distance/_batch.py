@@ -0,0 +1,552 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2014-2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._batch.
+
+Batch edit distance kernel, for many pairs of strings at once
+"""
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+from numpy import arange as np_arange
+from numpy import argsort as np_argsort
+from numpy import array as np_array
+from numpy import cumsum as np_cumsum
+from numpy import flatnonzero as np_flatnonzero
+from numpy import float64 as np_float64
+from numpy import frombuffer as np_frombuffer
+from numpy import full as np_full
+from numpy import int32 as np_int32
+from numpy import int64 as np_int64
+from numpy import minimum as np_minimum
+from numpy import repeat as np_repeat
+from numpy import uint32 as np_uint32
+from numpy import uint64 as np_uint64
+from numpy import uint8 as np_uint8
+from numpy import unique as np_unique
+from numpy import where as np_where
+from numpy import zeros as np_zeros
+
+from six.moves import range
+
+__all__ = [
+    '_batch_bitpar_dist',
+    '_batch_edit_dist',
+    '_batch_lcs_len',
+    '_encode_pairs',
+    '_pairs_edit_dist',
+]
+
+# The number of pairs processed together by _pairs_edit_dist
+_BATCH_SIZE = 1024
+
+# The number of bits in a word of the bit-vector kernels
+_WORD_SIZE = 64
+
+# The number of set bits in each byte value
+_POPCOUNT = np_array([bin(byte).count('1') for byte in range(256)])
+
+_ONE = np_uint64(1)
+
+
+def _pad_codes(codes, lens, pad):
+    """Return concatenated character codes as a padded 2-dimensional array.
+
+    Parameters
+    ----------
+    codes : numpy.ndarray
+        The character codes of a sequence of strings, concatenated
+    lens : numpy.ndarray
+        The lengths of the strings
+    pad : int
+        The padding code
+
+    Returns
+    -------
+    numpy.ndarray
+        The codes of each string in a row, padded to the greatest length
+
+    Examples
+    --------
+    >>> _pad_codes(np_arange(5), np_array([2, 0, 3]), -1)
+    array([[ 0,  1, -1],
+           [-1, -1, -1],
+           [ 2,  3,  4]], dtype=int32)
+
+    """
+    width = max(lens.max(), 1) if len(lens) else 1
+    padded = np_full((len(lens), width), pad, np_int32)
+    starts = np_cumsum(lens) - lens
+    padded[
+        np_repeat(np_arange(len(lens)), lens),
+        np_arange(len(codes)) - np_repeat(starts, lens),
+    ] = codes
+    return padded
+
+
+def _encode_pairs(pairs):
+    """Return the characters of pairs of strings as padded code arrays.
+
+    Each distinct character is numbered, in code point order. Source strings
+    are padded with -1 & target strings with -2, so padding never matches any
+    character (or other padding).
+
+    Parameters
+    ----------
+    pairs : list
+        A list of (src, tar) string pairs
+
+    Returns
+    -------
+    tuple
+        The source codes & target codes (as 2-dimensional numpy int32 arrays,
+        one row per pair) and the source & target lengths
+
+    Examples
+    --------
+    >>> src_codes, tar_codes, src_lens, tar_lens = _encode_pairs(
+    ... [('cat', 'hat'), ('a', 'ab')])
+    >>> src_codes
+    array([[ 2,  0,  4],
+           [ 0, -1, -1]], dtype=int32)
+    >>> tar_codes
+    array([[ 3,  0,  4],
+           [ 0,  1, -2]], dtype=int32)
+    >>> src_lens
+    array([3, 1])
+    >>> tar_lens
+    array([3, 2])
+
+    """
+    srcs = [src for src, _ in pairs]
+    tars = [tar for _, tar in pairs]
+    src_lens = np_array([len(src) for src in srcs], dtype=np_int64)
+    tar_lens = np_array([len(tar) for tar in tars], dtype=np_int64)
+
+    # All characters are decoded to code points at once & then numbered.
+    code_points = np_frombuffer(
+        (''.join(srcs) + ''.join(tars)).encode('utf-32-le'), dtype=np_uint32
+    )
+    codes = np_unique(code_points, return_inverse=True)[1]
+
+    split = src_lens.sum()
+    return (
+        _pad_codes(codes[:split], src_lens, -1),
+        _pad_codes(codes[split:], tar_lens, -2),
+        src_lens,
+        tar_lens,
+    )
+
+
+def _pattern_masks(pat_codes, text_codes):
+    """Return the match masks of a batch of patterns, for the bit kernels.
+
+    Parameters
+    ----------
+    pat_codes : numpy.ndarray
+        The padded character codes of the patterns, as from
+        :py:func:`_encode_pairs`, at most 64 wide
+    text_codes : numpy.ndarray
+        The padded character codes of the texts
+
+    Returns
+    -------
+    numpy.ndarray
+        The match masks, with one row per pattern and one column per character
+        code: bit i of the mask at [p, c] is set if character i of pattern p
+        has code c. Both padding codes index columns that texts never match.
+
+    Examples
+    --------
+    >>> pat_codes, text_codes, _, _ = _encode_pairs([('aba', 'abc')])
+    >>> _pattern_masks(pat_codes, text_codes)
+    array([[5, 2, 0, 0, 0]], dtype=uint64)
+
+    """
+    rows = np_arange(len(pat_codes))
+    n_codes = max(pat_codes.max(), text_codes.max()) + 1
+    # Padding codes are negative, so they index the two final columns.
+    peq = np_zeros((len(pat_codes), n_codes + 2), dtype=np_uint64)
+    for i in range(pat_codes.shape[1]):
+        peq[rows, pat_codes[:, i]] |= _ONE << np_uint64(i)
+    return peq
+
+
+def _batch_bitpar_dist(pat_codes, text_codes, pat_lens, text_lens, osa=False):
+    """Return the unit-cost Levenshtein distances of a batch of pairs.
+
+    This is the bit-vector algorithm of
+    :py:meth:`Levenshtein._dist_abs_bitpar`, run on a numpy array of 64-bit
+    words, one per pair, so that each step over the characters of the texts
+    advances a column of every pair's matrix at once. Patterns must be at
+    most 64 characters long.
+
+    Parameters
+    ----------
+    pat_codes : numpy.ndarray
+        The padded character codes of the patterns, as from
+        :py:func:`_encode_pairs`
+    text_codes : numpy.ndarray
+        The padded character codes of the texts
+    pat_lens : numpy.ndarray
+        The lengths of the patterns
+    text_lens : numpy.ndarray
+        The lengths of the texts
+    osa : bool
+        If True, Optimal String Alignment distances are computed
+
+    Returns
+    -------
+    numpy.ndarray
+        The distance of each pair
+
+    Examples
+    --------
+    >>> encoded = _encode_pairs([('cat', 'hat'), ('Neil', 'Niall'),
+    ... ('ATCG', 'TAGC'), ('', 'abc')])
+    >>> _batch_bitpar_dist(*encoded)
+    array([1, 3, 3, 3])
+    >>> _batch_bitpar_dist(*encoded, osa=True)
+    array([1, 3, 2, 3])
+
+    """
+    rows = np_arange(len(pat_lens))
+    peq = _pattern_masks(pat_codes, text_codes)
+    full = np_array([(1 << int(n)) - 1 for n in pat_lens], dtype=np_uint64)
+    last = np_array([1 << int(n) >> 1 for n in pat_lens], dtype=np_uint64)
+
+    v_pos = full.copy()
+    v_neg = np_zeros(len(pat_lens), dtype=np_uint64)
+    d_zero = v_neg.copy()
+    prev_eq = v_neg.copy()
+    score = pat_lens.copy()
+    # An empty pattern's distance is just the length of the text
+    out = np_where(pat_lens == 0, text_lens, pat_lens)
+
+    for j in range(text_codes.shape[1]):
+        eq = peq[rows, text_codes[:, j]]
+        d_next = (((eq & v_pos) + v_pos) ^ v_pos) | eq | v_neg
+        if osa:
+            # transpositions
+            d_next |= ((~d_zero & eq) << _ONE) & prev_eq
+            prev_eq = eq
+        d_zero = d_next & full
+
+        h_pos = v_neg | (~(d_zero | v_pos) & full)
+        h_neg = d_zero & v_pos
+        score += (h_pos & last).astype(bool)
+        score -= (h_neg & last).astype(bool)
+
+        # Pairs whose text ends here are done
+        done = np_flatnonzero((text_lens == j + 1) & (pat_lens > 0))
+        out[done] = score[done]
+
+        h_pos = ((h_pos << _ONE) | _ONE) & full
+        h_neg = (h_neg << _ONE) & full
+        v_pos = h_neg | (~(d_zero | h_pos) & full)
+        v_neg = h_pos & d_zero
+
+    return out
+
+
+def _batch_lcs_len(pat_codes, text_codes, pat_lens, text_lens):
+    """Return the LCS lengths of a batch of pairs.
+
+    This is the bit-vector algorithm of :py:meth:`LCSseq._lcsseq_bits`, run
+    on a numpy array of 64-bit words, one per pair. Patterns must be at most
+    64 characters long.
+
+    Parameters
+    ----------
+    pat_codes : numpy.ndarray
+        The padded character codes of the patterns, as from
+        :py:func:`_encode_pairs`
+    text_codes : numpy.ndarray
+        The padded character codes of the texts
+    pat_lens : numpy.ndarray
+        The lengths of the patterns
+    text_lens : numpy.ndarray
+        The lengths of the texts
+
+    Returns
+    -------
+    numpy.ndarray
+        The length of the longest common subsequence of each pair
+
+    Examples
+    --------
+    >>> _batch_lcs_len(*_encode_pairs([('cat', 'hat'), ('Neil', 'Niall'),
+    ... ('ATCG', 'TAGC'), ('', 'abc')]))
+    array([2, 3, 2, 0])
+
+    """
+    rows = np_arange(len(pat_lens))
+    peq = _pattern_masks(pat_codes, text_codes)
+    full = np_array([(1 << int(n)) - 1 for n in pat_lens], dtype=np_uint64)
+
+    # Padding in a text matches nothing, which leaves vec unchanged.
+    vec = full.copy()
+    for j in range(text_codes.shape[1]):
+        match = vec & peq[rows, text_codes[:, j]]
+        vec = ((vec + match) | (vec - match)) & full
+
+    unset = _POPCOUNT[vec.view(np_uint8)].reshape(-1, 8).sum(axis=1)
+    return pat_lens - unset
+
+
+def _batch_edit_dist(
+    src_codes,
+    tar_codes,
+    src_lens,
+    tar_lens,
+    ins_cost,
+    del_cost,
+    sub_cost,
+    trans_cost=None,
+    dtype=np_int64,
+):
+    """Return the edit distances of a batch of pairs of strings.
+
+    The dynamic programming matrices of all pairs are filled together, one
+    anti-diagonal at a time, with the batch as the second vector dimension:
+    the number of steps taken by the interpreter depends only on the
+    greatest string lengths in the batch, not on the number of pairs. Each
+    pair's matrix is padded to the greatest lengths, but cells beyond a
+    pair's own lengths never feed into its result.
+
+    Each anti-diagonal is stored in dtype, so values are rounded (or
+    truncated) exactly as they would be in a matrix of that dtype filled
+    cell by cell.
+
+    Parameters
+    ----------
+    src_codes : numpy.ndarray
+        The padded character codes of the source strings, as from
+        :py:func:`_encode_pairs`
+    tar_codes : numpy.ndarray
+        The padded character codes of the target strings
+    src_lens : numpy.ndarray
+        The lengths of the source strings
+    tar_lens : numpy.ndarray
+        The lengths of the target strings
+    ins_cost : int or float
+        The cost of an insert
+    del_cost : int or float
+        The cost of a delete
+    sub_cost : int or float
+        The cost of a substitution
+    trans_cost : int or float
+        The cost of an Optimal String Alignment transposition, or None to
+        disallow transpositions
+    dtype : numpy.dtype
+        The data type of the matrices
+
+    Returns
+    -------
+    numpy.ndarray
+        The edit distance of each pair, in dtype
+
+    Examples
+    --------
+    >>> encoded = _encode_pairs([('cat', 'hat'), ('Niall', 'Neil'),
+    ... ('ATCG', 'TAGC'), ('', 'abc')])
+    >>> _batch_edit_dist(*encoded, ins_cost=1, del_cost=1, sub_cost=1)
+    array([1, 3, 3, 3])
+    >>> _batch_edit_dist(*encoded, ins_cost=1, del_cost=1, sub_cost=1,
+    ... trans_cost=1)
+    array([1, 3, 2, 3])
+
+    """
+    batch = len(src_lens)
+    src_max = src_codes.shape[1]
+    tar_max = tar_codes.shape[1]
+    # Reversed, so that a slice runs in order of increasing i (decreasing j)
+    tar_rev = tar_codes[:, ::-1]
+    total_lens = src_lens + tar_lens
+
+    out = np_zeros(batch, dtype=dtype)
+    # Each anti-diagonal is indexed by [pair, i]; diags[-1] is the latest.
+    diags = [np_zeros((batch, src_max + 1), dtype=dtype)]
+
+    for k in range(1, src_max + tar_max + 1):
+        prev = diags[-1]
+        new = np_zeros((batch, src_max + 1), dtype=dtype)
+        if k <= tar_max:
+            new[:, 0] = k * ins_cost
+        if k <= src_max:
+            new[:, k] = k * del_cost
+
+        # The interior cells run from i=lo to i=hi, with j = k - i.
+        lo = max(1, k - tar_max)
+        hi = min(src_max, k - 1)
+        if lo <= hi:
+            # tar_rev[:, j_rev] are tar_codes[:, j - 1], for i from lo to hi
+            j_rev = slice(tar_max - k + lo, tar_max - k + hi + 1)
+
+            vals = np_minimum(
+                prev[:, lo - 1 : hi] + np_float64(del_cost),
+                prev[:, lo : hi + 1] + np_float64(ins_cost),
+            )
+            vals = np_minimum(
+                vals,
+                diags[-2][:, lo - 1 : hi]
+                + np_where(
+                    src_codes[:, lo - 1 : hi] == tar_rev[:, j_rev],
+                    0.0,
+                    sub_cost,
+                ),
+            )
+
+            if trans_cost is not None and k >= 4:
+                # Cells with i >= 2 & j >= 2 may be reached by a transposition
+                t_lo = max(lo, 2)
+                t_hi = min(hi, k - 2)
+                if t_lo <= t_hi:
+                    swap = (
+                        src_codes[:, t_lo - 1 : t_hi]
+                        == tar_rev[
+                            :, tar_max - k + t_lo + 1 : tar_max - k + t_hi + 2
+                        ]
+                    ) & (
+                        src_codes[:, t_lo - 2 : t_hi - 1]
+                        == tar_rev[
+                            :, tar_max - k + t_lo : tar_max - k + t_hi + 1
+                        ]
+                    )
+                    cells = slice(t_lo - lo, t_hi - lo + 1)
+                    vals[:, cells] = np_where(
+                        swap,
+                        np_minimum(
+                            vals[:, cells],
+                            diags[-4][:, t_lo - 2 : t_hi - 1] + trans_cost,
+                        ),
+                        vals[:, cells],
+                    )
+
+            new[:, lo : hi + 1] = vals
+
+        # Pairs whose final cell lies on this anti-diagonal are done
+        done = np_flatnonzero(total_lens == k)
+        out[done] = new[done, src_lens[done]]
+
+        diags.append(new)
+        if len(diags) > 4:
+            del diags[0]
+
+    return out
+
+
+def _pairs_edit_dist(
+    pairs, ins_cost, del_cost, sub_cost, trans_cost=None, dtype=np_int64
+):
+    """Return the edit distances of many pairs of strings.
+
+    The pairs are sorted by length and divided into batches of similar
+    lengths, to limit padding. Unit-cost Levenshtein & OSA distances are
+    computed by :py:func:`_batch_bitpar_dist` and indel distances (unit
+    inserts & deletes, with no cheaper substitutions or transpositions) by
+    way of :py:func:`_batch_lcs_len`, so long as the shorter string of each
+    pair fits in a 64-bit word; other batches are passed to
+    :py:func:`_batch_edit_dist`.
+
+    Parameters
+    ----------
+    pairs : list
+        A list of (src, tar) string pairs
+    ins_cost : int or float
+        The cost of an insert
+    del_cost : int or float
+        The cost of a delete
+    sub_cost : int or float
+        The cost of a substitution
+    trans_cost : int or float
+        The cost of an Optimal String Alignment transposition, or None to
+        disallow transpositions
+    dtype : numpy.dtype
+        The data type of the matrices
+
+    Returns
+    -------
+    numpy.ndarray
+        The edit distance of each pair, as floats
+
+    Examples
+    --------
+    >>> _pairs_edit_dist([('cat', 'hat'), ('Niall', 'Neil'), ('ATCG', 'TAGC')],
+    ... 1, 1, 1)
+    array([1., 3., 3.])
+    >>> _pairs_edit_dist([('cat', 'hat'), ('Niall', 'Neil'), ('ATCG', 'TAGC')],
+    ... 1, 1, 2)
+    array([2., 3., 4.])
+
+    """
+    kernel = None
+    if ins_cost == del_cost == 1:
+        if sub_cost == 1 and trans_cost in {None, 1}:
+            kernel = 'lev'
+        elif sub_cost >= 2 and (trans_cost is None or trans_cost >= 2):
+            kernel = 'indel'
+
+    out = np_zeros(len(pairs), dtype=np_float64)
+    order = np_argsort(
+        [max(len(src), len(tar)) for src, tar in pairs], kind='mergesort'
+    )
+    for start in range(0, len(pairs), _BATCH_SIZE):
+        batch = order[start : start + _BATCH_SIZE]
+        batch_pairs = [pairs[pos] for pos in batch]
+
+        if kernel is None or any(
+            len(src) > _WORD_SIZE and len(tar) > _WORD_SIZE
+            for src, tar in batch_pairs
+        ):
+            out[batch] = _batch_edit_dist(
+                *_encode_pairs(batch_pairs),
+                ins_cost=ins_cost,
+                del_cost=del_cost,
+                sub_cost=sub_cost,
+                trans_cost=trans_cost,
+                dtype=dtype
+            )
+            continue
+
+        # These distances are symmetric, so the shorter string of each pair
+        # is taken as the pattern.
+        encoded = _encode_pairs(
+            [
+                (src, tar) if len(src) <= len(tar) else (tar, src)
+                for src, tar in batch_pairs
+            ]
+        )
+        if kernel == 'lev':
+            out[batch] = _batch_bitpar_dist(
+                *encoded, osa=trans_cost is not None
+            )
+        else:
+            out[batch] = encoded[2] + encoded[3] - 2 * _batch_lcs_len(*encoded)
+    return out
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -116,6 +116,42 @@ class Chebyshev(Minkowski):
         """
         raise NotImplementedError('Method disabled for Chebyshev distance.')
 
+    def sim_many(self, *args, **kwargs):
+        """Raise exception when called.
+
+        Parameters
+        ----------
+        *args
+            Variable length argument list
+        **kwargs
+            Arbitrary keyword arguments
+
+        Raises
+        ------
+        NotImplementedError
+            Method disabled for Chebyshev distance
+
+        """
+        raise NotImplementedError('Method disabled for Chebyshev distance.')
+
+    def dist_many(self, *args, **kwargs):
+        """Raise exception when called.
+
+        Parameters
+        ----------
+        *args
+            Variable length argument list
+        **kwargs
+            Arbitrary keyword arguments
+
+        Raises
+        ------
+        NotImplementedError
+            Method disabled for Chebyshev distance
+
+        """
+        raise NotImplementedError('Method disabled for Chebyshev distance.')
+
 
 def chebyshev(src, tar, qval=2, alphabet=None):
     r"""Return the Chebyshev distance between two strings.
@@ -30,6 +30,8 @@ from __future__ import (
 
 from math import sqrt
 
+from numpy import sqrt as np_sqrt
+
 from ._token_distance import _TokenDistance
 
 __all__ = ['Cosine', 'dist_cosine', 'sim_cosine']
@@ -85,6 +87,32 @@ class Cosine(_TokenDistance):
 
         return q_intersection_mag / sqrt(q_src_mag * q_tar_mag)
 
+    def _sim_from_magnitudes(self, src_mag, tar_mag, int_mag):
+        """Return cosine similarities from q-gram multiset magnitudes.
+
+        Parameters
+        ----------
+        src_mag : numpy.ndarray
+            The magnitudes of the source q-gram multisets
+        tar_mag : numpy.ndarray
+            The magnitudes of the target q-gram multisets
+        int_mag : numpy.ndarray
+            The magnitudes of the intersections of the q-gram multisets
+
+        Returns
+        -------
+        numpy.ndarray
+            Cosine similarities
+
+        Examples
+        --------
+        >>> cmp = Cosine()
+        >>> cmp._sim_from_magnitudes(4, 4, 2)
+        0.5
+
+        """
+        return int_mag / np_sqrt(src_mag * tar_mag)
+
 
 def sim_cosine(src, tar, qval=2):
     r"""Return the cosine similarity of two strings.
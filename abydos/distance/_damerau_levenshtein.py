@@ -30,12 +30,19 @@ from __future__ import (
 
 from sys import maxsize
 
+from numpy import arange as np_arange
+from numpy import full as np_full
+from numpy import inf as np_inf
 from numpy import int as np_int
+from numpy import maximum as np_maximum
+from numpy import minimum as np_minimum
+from numpy import where as np_where
 from numpy import zeros as np_zeros
 
 from six.moves import range
 
 from ._distance import _Distance
+from ._wavefront import _char_codes, _use_wavefront
 
 __all__ = [
     'DamerauLevenshtein',
@@ -54,8 +61,18 @@ class DamerauLevenshtein(_Distance):
     https://github.com/KevinStern/software-and-algorithms/blob/master/src/main/java/blogspot/software_and_algorithms/stern_library/string/DamerauLevenshteinAlgorithm.java
     """
 
-    def dist_abs(self, src, tar, cost=(1, 1, 1, 1)):
-        """Return the Damerau-Levenshtein distance between two strings.
+    @staticmethod
+    def _dist_abs_banded(src, tar, cost, max_distance):
+        """Return the Damerau-Levenshtein distance, if at most max_distance.
+
+        Only the diagonal band of cells that may hold values no greater than
+        max_distance is computed :cite:`Ukkonen:1985`. Provided that a
+        transposition never costs less than a delete, computation also stops
+        as soon as a row holds only values exceeding max_distance, including
+        that of deleting the whole prefix of src (the column before the first
+        of tar, which is not stored): every later cell is reached from one of
+        these at no lesser cost, or by a transposition from an earlier row,
+        which costs no less than deleting down to this row instead.
 
         Parameters
         ----------
@@ -65,47 +82,138 @@ class DamerauLevenshtein(_Distance):
             Target string for comparison
         cost : tuple
             A 4-tuple representing the cost of the four possible edits:
-            inserts, deletes, substitutions, and transpositions, respectively
-            (by default: (1, 1, 1, 1))
+            inserts, deletes, substitutions, and transpositions, respectively;
+            the costs of inserts & deletes must be equal
+        max_distance : int or float
+            The greatest distance of interest
 
         Returns
         -------
-        int (may return a float if cost has float values)
-            The Damerau-Levenshtein distance between src & tar
-
-        Raises
-        ------
-        ValueError
-            Unsupported cost assignment; the cost of two transpositions must
-            not be less than the cost of an insert plus a delete.
+        int or float
+            The Damerau-Levenshtein distance between src & tar, or
+            max_distance + 1 if it exceeds max_distance
 
         Examples
         --------
-        >>> cmp = DamerauLevenshtein()
-        >>> cmp.dist_abs('cat', 'hat')
-        1
-        >>> cmp.dist_abs('Niall', 'Neil')
-        3
-        >>> cmp.dist_abs('aluminum', 'Catalan')
-        7
-        >>> cmp.dist_abs('ATCG', 'TAGC')
+        >>> DamerauLevenshtein._dist_abs_banded('ATCG', 'TAGC', (1, 1, 1, 1),
+        ... 2)
+        2
+        >>> DamerauLevenshtein._dist_abs_banded('ATCG', 'TAGC', (1, 1, 1, 1),
+        ... 1)
         2
 
         """
         ins_cost, del_cost, sub_cost, trans_cost = cost
+        src_len = len(src)
+        tar_len = len(tar)
+        inf = float('inf')
 
-        if src == tar:
-            return 0
-        if not src:
-            return len(tar) * ins_cost
-        if not tar:
-            return len(src) * del_cost
+        if ins_cost > 0:
+            band = int(max_distance // ins_cost)
+        else:
+            band = max(src_len, tar_len)
+        early_exit = trans_cost >= del_cost
 
-        if 2 * trans_cost < ins_cost + del_cost:
-            raise ValueError(
-                'Unsupported cost assignment; the cost of two transpositions '
-                + 'must not be less than the cost of an insert plus a delete.'
+        d_mat = [[inf] * tar_len for _ in range(src_len)]
+
+        if src[0] != tar[0]:
+            d_mat[0][0] = min(sub_cost, ins_cost + del_cost)
+        else:
+            d_mat[0][0] = 0
+
+        for i in range(1, min(src_len, band + 1)):
+            del_distance = d_mat[i - 1][0] + del_cost
+            ins_distance = (i + 1) * del_cost + ins_cost
+            match_distance = i * del_cost + (
+                0 if src[i] == tar[0] else sub_cost
             )
+            d_mat[i][0] = min(del_distance, ins_distance, match_distance)
+
+        for j in range(1, min(tar_len, band + 1)):
+            del_distance = (j + 1) * ins_cost + del_cost
+            ins_distance = d_mat[0][j - 1] + ins_cost
+            match_distance = j * ins_cost + (
+                0 if src[0] == tar[j] else sub_cost
+            )
+            d_mat[0][j] = min(del_distance, ins_distance, match_distance)
+
+        if early_exit and min(min(d_mat[0]), del_cost) > max_distance:
+            return max_distance + 1
+
+        src_index_by_character = {src[0]: 0}
+        for i in range(1, src_len):
+            row = d_mat[i]
+            lo_j = max(1, i - band)
+            # The last match of src[i] in tar before the band
+            max_src_letter_match_index = tar.rfind(src[i], 0, lo_j)
+            for j in range(lo_j, min(tar_len, i + band + 1)):
+                candidate_swap_index = src_index_by_character.get(tar[j], -1)
+                j_swap = max_src_letter_match_index
+                del_distance = d_mat[i - 1][j] + del_cost
+                ins_distance = row[j - 1] + ins_cost
+                match_distance = d_mat[i - 1][j - 1]
+                if src[i] != tar[j]:
+                    match_distance += sub_cost
+                else:
+                    max_src_letter_match_index = j
+
+                if candidate_swap_index != -1 and j_swap != -1:
+                    i_swap = candidate_swap_index
+
+                    if i_swap == 0 and j_swap == 0:
+                        pre_swap_cost = 0
+                    else:
+                        pre_swap_cost = d_mat[max(0, i_swap - 1)][
+                            max(0, j_swap - 1)
+                        ]
+                    swap_distance = (
+                        pre_swap_cost
+                        + (i - i_swap - 1) * del_cost
+                        + (j - j_swap - 1) * ins_cost
+                        + trans_cost
+                    )
+                else:
+                    swap_distance = inf
+
+                row[j] = min(
+                    del_distance, ins_distance, match_distance, swap_distance
+                )
+            if early_exit and min(min(row), (i + 1) * del_cost) > max_distance:
+                return max_distance + 1
+            src_index_by_character[src[i]] = i
+
+        if d_mat[src_len - 1][tar_len - 1] > max_distance:
+            return max_distance + 1
+        return d_mat[src_len - 1][tar_len - 1]
+
+    @staticmethod
+    def _init_matrix(src, tar, cost):
+        """Return the Damerau-Levenshtein matrix, with its first row & column.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison (non-empty)
+        tar : str
+            Target string for comparison (non-empty)
+        cost : tuple
+            A 4-tuple representing the cost of the four possible edits:
+            inserts, deletes, substitutions, and transpositions, respectively
+
+        Returns
+        -------
+        numpy.ndarray
+            The matrix, in which cell [i, j] will hold the distance between
+            src[:i + 1] & tar[:j + 1]; only the first row & column are filled
+
+        Examples
+        --------
+        >>> DamerauLevenshtein._init_matrix('ab', 'ba', (1, 1, 1, 1))
+        array([[1, 1],
+               [1, 0]])
+
+        """
+        ins_cost, del_cost, sub_cost = cost[:3]
 
         d_mat = np_zeros((len(src)) * (len(tar)), dtype=np_int).reshape(
             (len(src), len(tar))
@@ -114,7 +222,6 @@ class DamerauLevenshtein(_Distance):
         if src[0] != tar[0]:
             d_mat[0, 0] = min(sub_cost, ins_cost + del_cost)
 
-        src_index_by_character = {src[0]: 0}
         for i in range(1, len(src)):
             del_distance = d_mat[i - 1, 0] + del_cost
             ins_distance = (i + 1) * del_cost + ins_cost
@@ -131,6 +238,37 @@ class DamerauLevenshtein(_Distance):
             )
             d_mat[0, j] = min(del_distance, ins_distance, match_distance)
 
+        return d_mat
+
+    @staticmethod
+    def _dist_abs_dp(src, tar, cost):
+        """Return the Damerau-Levenshtein distance, filling the matrix by cell.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison (non-empty)
+        tar : str
+            Target string for comparison (non-empty)
+        cost : tuple
+            A 4-tuple representing the cost of the four possible edits:
+            inserts, deletes, substitutions, and transpositions, respectively
+
+        Returns
+        -------
+        int
+            The Damerau-Levenshtein distance between src & tar
+
+        Examples
+        --------
+        >>> DamerauLevenshtein._dist_abs_dp('ATCG', 'TAGC', (1, 1, 1, 1))
+        2
+
+        """
+        ins_cost, del_cost, sub_cost, trans_cost = cost
+        d_mat = DamerauLevenshtein._init_matrix(src, tar, cost)
+
+        src_index_by_character = {src[0]: 0}
         for i in range(1, len(src)):
             max_src_letter_match_index = 0 if src[i] == tar[0] else -1
             for j in range(1, len(tar)):
@@ -173,7 +311,169 @@ class DamerauLevenshtein(_Distance):
 
         return d_mat[len(src) - 1, len(tar) - 1]
 
-    def dist(self, src, tar, cost=(1, 1, 1, 1)):
+    @staticmethod
+    def _dist_abs_wavefront(src, tar, cost):
+        """Return the Damerau-Levenshtein distance, filling by wavefront.
+
+        This computes the same matrix as :py:meth:`_dist_abs_dp`, one
+        anti-diagonal at a time, with numpy vector operations. For each cell,
+        the last position in src before row i of the cell's target character,
+        and the last position in tar before column j of its source character,
+        from which the transposition is measured, are looked up in tables
+        indexed by position & character code.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison (non-empty)
+        tar : str
+            Target string for comparison (non-empty)
+        cost : tuple
+            A 4-tuple representing the cost of the four possible edits:
+            inserts, deletes, substitutions, and transpositions, respectively
+
+        Returns
+        -------
+        int
+            The Damerau-Levenshtein distance between src & tar
+
+        Examples
+        --------
+        >>> DamerauLevenshtein._dist_abs_wavefront('ATCG', 'TAGC',
+        ... (1, 1, 1, 1))
+        2
+
+        """
+        ins_cost, del_cost, sub_cost, trans_cost = cost
+        d_mat = DamerauLevenshtein._init_matrix(src, tar, cost)
+        src_len = len(src)
+        tar_len = len(tar)
+        src_codes, tar_codes, alphabet = _char_codes(src, tar)
+
+        # last_src[i, c] is the last index before i at which c occurs in src,
+        # or -1; likewise last_tar[j, c] for tar.
+        last_src = np_full((src_len, len(alphabet)), -1, dtype=np_int)
+        for i in range(1, src_len):
+            last_src[i] = last_src[i - 1]
+            last_src[i, src_codes[i - 1]] = i - 1
+        last_tar = np_full((tar_len, len(alphabet)), -1, dtype=np_int)
+        for j in range(1, tar_len):
+            last_tar[j] = last_tar[j - 1]
+            last_tar[j, tar_codes[j - 1]] = j - 1
+
+        for k in range(2, src_len + tar_len - 1):
+            i = np_arange(max(1, k - tar_len + 1), min(src_len - 1, k - 1) + 1)
+            j = k - i
+
+            del_distance = d_mat[i - 1, j] + del_cost
+            ins_distance = d_mat[i, j - 1] + ins_cost
+            match_distance = d_mat[i - 1, j - 1] + np_where(
+                src_codes[i] != tar_codes[j], sub_cost, 0
+            )
+
+            i_swap = last_src[i, tar_codes[j]]
+            j_swap = last_tar[j, src_codes[i]]
+            pre_swap_cost = np_where(
+                (i_swap == 0) & (j_swap == 0),
+                0,
+                d_mat[np_maximum(0, i_swap - 1), np_maximum(0, j_swap - 1)],
+            )
+            swap_distance = np_where(
+                (i_swap != -1) & (j_swap != -1),
+                pre_swap_cost
+                + (i - i_swap - 1) * del_cost
+                + (j - j_swap - 1) * ins_cost
+                + trans_cost,
+                np_inf,
+            )
+
+            d_mat[i, j] = np_minimum(
+                np_minimum(del_distance, ins_distance),
+                np_minimum(match_distance, swap_distance),
+            )
+
+        return d_mat[src_len - 1, tar_len - 1]
+
+    def dist_abs(self, src, tar, cost=(1, 1, 1, 1), max_distance=None):
+        """Return the Damerau-Levenshtein distance between two strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        cost : tuple
+            A 4-tuple representing the cost of the four possible edits:
+            inserts, deletes, substitutions, and transpositions, respectively
+            (by default: (1, 1, 1, 1))
+        max_distance : int
+            If set, only distances up to this value are computed exactly: as
+            soon as the distance is known to exceed max_distance, the
+            computation stops and max_distance + 1 is returned
+
+        Returns
+        -------
+        int (may return a float if cost has float values)
+            The Damerau-Levenshtein distance between src & tar
+
+        Raises
+        ------
+        ValueError
+            Unsupported cost assignment; the cost of two transpositions must
+            not be less than the cost of an insert plus a delete.
+
+        Examples
+        --------
+        >>> cmp = DamerauLevenshtein()
+        >>> cmp.dist_abs('cat', 'hat')
+        1
+        >>> cmp.dist_abs('Niall', 'Neil')
+        3
+        >>> cmp.dist_abs('aluminum', 'Catalan')
+        7
+        >>> cmp.dist_abs('ATCG', 'TAGC')
+        2
+
+        >>> cmp.dist_abs('aluminum', 'Catalan', max_distance=2)
+        3
+
+        """
+        ins_cost, del_cost, sub_cost, trans_cost = cost
+
+        if src == tar:
+            return 0
+        if max_distance is not None:
+            if ins_cost != del_cost:
+                # With asymmetric insert & delete costs, the transposition
+                # recurrence below can undercut the length-difference bound,
+                # so the distance is computed in full.
+                distance = self.dist_abs(src, tar, cost)
+                if distance > max_distance:
+                    return max_distance + 1
+                return distance
+            # Every length difference must be made up by inserts or deletes.
+            if abs(len(src) - len(tar)) * ins_cost > max_distance:
+                return max_distance + 1
+        if not src:
+            return len(tar) * ins_cost
+        if not tar:
+            return len(src) * del_cost
+
+        if 2 * trans_cost < ins_cost + del_cost:
+            raise ValueError(
+                'Unsupported cost assignment; the cost of two transpositions '
+                + 'must not be less than the cost of an insert plus a delete.'
+            )
+
+        if max_distance is not None:
+            return self._dist_abs_banded(src, tar, cost, max_distance)
+
+        if _use_wavefront(len(src), len(tar)):
+            return self._dist_abs_wavefront(src, tar, cost)
+        return self._dist_abs_dp(src, tar, cost)
+
+    def dist(self, src, tar, cost=(1, 1, 1, 1), max_distance=None):
         """Return the Damerau-Levenshtein similarity of two strings.
 
         Damerau-Levenshtein distance normalized to the interval [0, 1].
@@ -195,6 +495,10 @@ class DamerauLevenshtein(_Distance):
             A 4-tuple representing the cost of the four possible edits:
             inserts, deletes, substitutions, and transpositions, respectively
             (by default: (1, 1, 1, 1))
+        max_distance : float
+            If set, only normalized distances up to this value are computed
+            exactly; 1.0 is returned for any pair whose normalized distance
+            exceeds max_distance
 
         Returns
         -------
@@ -212,17 +516,25 @@ class DamerauLevenshtein(_Distance):
         0.875
         >>> cmp.dist('ATCG', 'TAGC')
         0.5
+        >>> cmp.dist('ATCG', 'TAGC', max_distance=0.25)
+        1.0
 
         """
         if src == tar:
             return 0.0
         ins_cost, del_cost = cost[:2]
-        return self.dist_abs(src, tar, cost) / (
-            max(len(src) * del_cost, len(tar) * ins_cost)
-        )
+        normalizer = max(len(src) * del_cost, len(tar) * ins_cost)
+        if max_distance is None:
+            return self.dist_abs(src, tar, cost) / normalizer
+
+        max_distance *= normalizer
+        distance = self.dist_abs(src, tar, cost, max_distance)
+        if distance > max_distance:
+            return 1.0
+        return distance / normalizer
 
 
-def damerau_levenshtein(src, tar, cost=(1, 1, 1, 1)):
+def damerau_levenshtein(src, tar, cost=(1, 1, 1, 1), max_distance=None):
     """Return the Damerau-Levenshtein distance between two strings.
 
     This is a wrapper of :py:meth:`DamerauLevenshtein.dist_abs`.
@@ -237,6 +549,10 @@ def damerau_levenshtein(src, tar, cost=(1, 1, 1, 1)):
         A 4-tuple representing the cost of the four possible edits: inserts,
         deletes, substitutions, and transpositions, respectively (by default:
         (1, 1, 1, 1))
+    max_distance : int
+        If set, only distances up to this value are computed exactly: as soon
+        as the distance is known to exceed max_distance, the computation stops
+        and max_distance + 1 is returned
 
     Returns
     -------
@@ -255,10 +571,10 @@ def damerau_levenshtein(src, tar, cost=(1, 1, 1, 1)):
     2
 
     """
-    return DamerauLevenshtein().dist_abs(src, tar, cost)
+    return DamerauLevenshtein().dist_abs(src, tar, cost, max_distance)
 
 
-def dist_damerau(src, tar, cost=(1, 1, 1, 1)):
+def dist_damerau(src, tar, cost=(1, 1, 1, 1), max_distance=None):
     """Return the Damerau-Levenshtein similarity of two strings.
 
     This is a wrapper of :py:meth:`DamerauLevenshtein.dist`.
@@ -273,6 +589,10 @@ def dist_damerau(src, tar, cost=(1, 1, 1, 1)):
         A 4-tuple representing the cost of the four possible edits: inserts,
         deletes, substitutions, and transpositions, respectively (by default:
         (1, 1, 1, 1))
+    max_distance : float
+        If set, only normalized distances up to this value are computed
+        exactly; 1.0 is returned for any pair whose normalized distance exceeds
+        max_distance
 
     Returns
     -------
@@ -291,7 +611,7 @@ def dist_damerau(src, tar, cost=(1, 1, 1, 1)):
     0.5
 
     """
-    return DamerauLevenshtein().dist(src, tar, cost)
+    return DamerauLevenshtein().dist(src, tar, cost, max_distance)
 
 
 def sim_damerau(src, tar, cost=(1, 1, 1, 1)):
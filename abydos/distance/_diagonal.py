@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2014-2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._diagonal.
+
+Diagonal-transition (O(nd)) unit-cost edit distance kernel
+"""
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+__all__ = ['_diagonal_budget', '_diagonal_dist', '_match_len']
+
+# The length of the shorter string below which the bit-vector algorithms are
+# always used
+_DIAGONAL_MIN_LEN = 256
+
+# The ratio of the geometric mean of the string lengths to the greatest
+# distance sought by diagonal transition: the square of that distance times
+# the cost of a diagonal step roughly matches half the cost of the
+# bit-vector algorithms, so giving up costs less than the detour
+_DIAGONAL_RATIO = 128
+
+# The value of a diagonal that has not been reached
+_UNREACHED = -2
+
+
+def _match_len(src, tar, src_pos, tar_pos):
+    """Return the length of the common prefix of src[src_pos:] & tar[tar_pos:].
+
+    Slices of doubling length are compared until one differs, and the first
+    difference within it is then found by halving, so a match of length n
+    takes O(log n) comparisons of slices.
+
+    Parameters
+    ----------
+    src : str
+        Source string
+    tar : str
+        Target string
+    src_pos : int
+        The starting position in src
+    tar_pos : int
+        The starting position in tar
+
+    Returns
+    -------
+    int
+        The length of the match
+
+    Examples
+    --------
+    >>> _match_len('Niall', 'Neil', 0, 0)
+    1
+    >>> _match_len('a' * 100 + 'b', 'a' * 120, 0, 0)
+    100
+    >>> _match_len('Niall', 'Neil', 4, 3)
+    1
+
+    """
+    limit = min(len(src) - src_pos, len(tar) - tar_pos)
+    length = 0
+    step = 1
+    growing = True
+    while step:
+        if (
+            length + step <= limit
+            and src[src_pos + length : src_pos + length + step]
+            == tar[tar_pos + length : tar_pos + length + step]
+        ):
+            length += step
+            if growing:
+                step <<= 1
+        else:
+            growing = False
+            step >>= 1
+    return length
+
+
+def _diagonal_budget(src_len, tar_len):
+    """Return the greatest distance worth seeking by diagonal transition.
+
+    The diagonal-transition algorithm takes O(d^2) steps for distance d,
+    while the bit-vector algorithms take a step per character of one string,
+    each costing in proportion to the length of the other. Beyond this
+    budget, the bit-vector algorithms are expected to be faster.
+
+    Parameters
+    ----------
+    src_len : int
+        The length of the source string
+    tar_len : int
+        The length of the target string
+
+    Returns
+    -------
+    int
+        The greatest distance to seek, or 0 if the strings are too short to
+        benefit
+
+    Examples
+    --------
+    >>> _diagonal_budget(100, 100)
+    0
+    >>> _diagonal_budget(1000, 1000)
+    7
+    >>> _diagonal_budget(100000, 100000)
+    781
+
+    """
+    if min(src_len, tar_len) < _DIAGONAL_MIN_LEN:
+        return 0
+    return int((src_len * tar_len) ** 0.5) // _DIAGONAL_RATIO
+
+
+def _diagonal_dist(src, tar, max_distance, indel=False):
+    """Return the unit-cost edit distance, if it is at most max_distance.
+
+    This is the diagonal-transition algorithm of Ukkonen
+    :cite:`Ukkonen:1985` & Myers :cite:`Myers:1986`. For each distance d in
+    turn, the furthest row reachable within d edits is found on each
+    diagonal (on which the difference of the tar & src positions is fixed)
+    from those of distance d - 1 on the same & neighbouring diagonals, then
+    extended along the diagonal by as many matching characters as follow.
+    The distance is the first d at which the diagonal of the final cell
+    reaches the last row, so the time taken is O((n + m) d) rather than
+    O(nm). Diagonals from which the final cell cannot be reached within
+    max_distance are skipped.
+
+    Parameters
+    ----------
+    src : str
+        Source string for comparison
+    tar : str
+        Target string for comparison
+    max_distance : int
+        The greatest distance to seek
+    indel : bool
+        If True, the indel distance (in which substitutions are not allowed)
+        is sought, rather than the Levenshtein distance
+
+    Returns
+    -------
+    int
+        The distance between src & tar, or None if it exceeds max_distance
+
+    Examples
+    --------
+    >>> _diagonal_dist('Niall', 'Neil', 5)
+    3
+    >>> _diagonal_dist('Niall', 'Neil', 5, indel=True)
+    3
+    >>> _diagonal_dist('ATCG', 'TAGC', 2, indel=True) is None
+    True
+
+    """
+    src_len = len(src)
+    tar_len = len(tar)
+    # The diagonal of the final cell
+    goal = tar_len - src_len
+    if abs(goal) > max_distance:
+        return None
+
+    # The furthest row reached on diagonal k is at rows[k + offset].
+    offset = max_distance + 1
+    rows = [_UNREACHED] * (2 * offset + 1)
+    rows[offset] = _match_len(src, tar, 0, 0)
+    if goal == 0 and rows[offset] == src_len:
+        return 0
+
+    for dist in range(1, max_distance + 1):
+        prev = rows[:]
+        slack = max_distance - dist
+        for k in range(
+            max(-dist, -src_len, goal - slack),
+            min(dist, tar_len, goal + slack) + 1,
+        ):
+            idx = k + offset
+            # delete (from diagonal k + 1) or insert (from diagonal k - 1)
+            row = max(prev[idx + 1] + 1, prev[idx - 1])
+            if indel:
+                row = max(row, prev[idx])
+            else:
+                # substitute
+                row = max(row, prev[idx] + 1)
+            row = min(row, src_len, tar_len - k)
+            if row < max(0, -k):
+                continue
+
+            row += _match_len(src, tar, row, row + k)
+            rows[idx] = row
+            if k == goal and row == src_len:
+                return dist
+    return None
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
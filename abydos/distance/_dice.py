@@ -77,6 +77,34 @@ class Dice(Tversky):
         """
         return super(self.__class__, self).sim(src, tar, qval, 0.5, 0.5)
 
+    def _sim_from_magnitudes(self, src_mag, tar_mag, int_mag):
+        """Return Sørensen–Dice coefficients from q-gram multiset magnitudes.
+
+        Parameters
+        ----------
+        src_mag : numpy.ndarray
+            The magnitudes of the source q-gram multisets
+        tar_mag : numpy.ndarray
+            The magnitudes of the target q-gram multisets
+        int_mag : numpy.ndarray
+            The magnitudes of the intersections of the q-gram multisets
+
+        Returns
+        -------
+        numpy.ndarray
+            Sørensen–Dice similarities
+
+        Examples
+        --------
+        >>> cmp = Dice()
+        >>> cmp._sim_from_magnitudes(4, 4, 2)
+        0.5
+
+        """
+        return super(self.__class__, self)._sim_from_magnitudes(
+            src_mag, tar_mag, int_mag, 0.5, 0.5
+        )
+
 
 def sim_dice(src, tar, qval=2):
     """Return the Sørensen–Dice coefficient of two strings.
@@ -28,6 +28,9 @@ from __future__ import (
     unicode_literals,
 )
 
+from numpy import array as np_array
+from numpy import float64 as np_float64
+
 
 class _Distance(object):
     """Abstract Distance class."""
@@ -98,6 +101,138 @@ class _Distance(object):
         """
         return self.dist(src, tar, *args, **kwargs)
 
+    def sim_many(self, src, targets, *args, **kwargs):
+        """Return the similarities of one string to each of many strings.
+
+        Subclasses may override this to prepare src only once, rather than
+        once per target.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable
+            Target strings for comparison
+        *args
+            Variable length argument list.
+        **kwargs
+            Arbitrary keyword arguments.
+
+        Returns
+        -------
+        numpy.ndarray
+            The similarity of src to each target, as floats
+
+        Examples
+        --------
+        >>> from abydos.distance import Ident
+        >>> Ident().sim_many('cat', ['cat', 'hat', 'cat'])
+        array([1., 0., 1.])
+
+        """
+        return np_array(
+            [self.sim(src, tar, *args, **kwargs) for tar in targets],
+            dtype=np_float64,
+        )
+
+    def dist_many(self, src, targets, *args, **kwargs):
+        """Return the distances of one string to each of many strings.
+
+        Subclasses may override this to prepare src only once, rather than
+        once per target.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable
+            Target strings for comparison
+        *args
+            Variable length argument list.
+        **kwargs
+            Arbitrary keyword arguments.
+
+        Returns
+        -------
+        numpy.ndarray
+            The distance of src to each target, as floats
+
+        Examples
+        --------
+        >>> from abydos.distance import Ident
+        >>> Ident().dist_many('cat', ['cat', 'hat', 'cat'])
+        array([0., 1., 0.])
+
+        """
+        return np_array(
+            [self.dist(src, tar, *args, **kwargs) for tar in targets],
+            dtype=np_float64,
+        )
+
+    def sim_pairs(self, pairs, *args, **kwargs):
+        """Return the similarities of many pairs of strings.
+
+        Subclasses may override this to compute the similarities of a batch
+        of pairs together.
+
+        Parameters
+        ----------
+        pairs : iterable
+            (src, tar) pairs of strings for comparison
+        *args
+            Variable length argument list.
+        **kwargs
+            Arbitrary keyword arguments.
+
+        Returns
+        -------
+        numpy.ndarray
+            The similarity of each pair, as floats
+
+        Examples
+        --------
+        >>> from abydos.distance import Ident
+        >>> Ident().sim_pairs([('cat', 'cat'), ('cat', 'hat')])
+        array([1., 0.])
+
+        """
+        return np_array(
+            [self.sim(src, tar, *args, **kwargs) for src, tar in pairs],
+            dtype=np_float64,
+        )
+
+    def dist_pairs(self, pairs, *args, **kwargs):
+        """Return the distances of many pairs of strings.
+
+        Subclasses may override this to compute the distances of a batch of
+        pairs together.
+
+        Parameters
+        ----------
+        pairs : iterable
+            (src, tar) pairs of strings for comparison
+        *args
+            Variable length argument list.
+        **kwargs
+            Arbitrary keyword arguments.
+
+        Returns
+        -------
+        numpy.ndarray
+            The distance of each pair, as floats
+
+        Examples
+        --------
+        >>> from abydos.distance import Ident
+        >>> Ident().dist_pairs([('cat', 'cat'), ('cat', 'hat')])
+        array([0., 1.])
+
+        """
+        return np_array(
+            [self.dist(src, tar, *args, **kwargs) for src, tar in pairs],
+            dtype=np_float64,
+        )
+
 
 if __name__ == '__main__':
     import doctest
@@ -30,6 +30,7 @@ from __future__ import (
 
 from unicodedata import normalize as unicode_normalize
 
+from numpy import array as np_array
 from numpy import int as np_int
 from numpy import zeros as np_zeros
 
@@ -37,6 +38,7 @@ from six import text_type
 from six.moves import range
 
 from ._distance import _Distance
+from ._wavefront import _char_codes, _use_wavefront, _wavefront_dist
 
 __all__ = ['Editex', 'dist_editex', 'editex', 'sim_editex']
 
@@ -63,6 +65,212 @@ class Editex(_Distance):
 
     _all_letters = frozenset('ABCDEFGIJKLMNOPQRSTUVXYZ')
 
+    def _r_cost(self, ch1, ch2, cost):
+        """Return r(a,b) according to Zobel & Dart's definition.
+
+        Parameters
+        ----------
+        ch1 : str
+            The first character to compare
+        ch2 : str
+            The second character to compare
+        cost : tuple
+            The match, same-group, and mismatch costs
+
+        Returns
+        -------
+        int
+            r(a,b) according to Zobel & Dart's definition
+
+        Examples
+        --------
+        >>> cmp = Editex()
+        >>> cmp._r_cost('C', 'K', (0, 1, 2))
+        1
+        >>> cmp._r_cost('C', 'H', (0, 1, 2))
+        2
+
+        """
+        if ch1 == ch2:
+            return cost[0]
+        if ch1 in self._all_letters and ch2 in self._all_letters:
+            for group in self._letter_groups:
+                if ch1 in group and ch2 in group:
+                    return cost[1]
+        return cost[2]
+
+    def _d_cost(self, ch1, ch2, cost):
+        """Return d(a,b) according to Zobel & Dart's definition.
+
+        Parameters
+        ----------
+        ch1 : str
+            The first character to compare
+        ch2 : str
+            The second character to compare
+        cost : tuple
+            The match, same-group, and mismatch costs
+
+        Returns
+        -------
+        int
+            d(a,b) according to Zobel & Dart's definition
+
+        Examples
+        --------
+        >>> cmp = Editex()
+        >>> cmp._d_cost('H', 'C', (0, 1, 2))
+        1
+        >>> cmp._d_cost('C', 'H', (0, 1, 2))
+        2
+
+        """
+        if ch1 != ch2 and (ch1 == 'H' or ch1 == 'W'):
+            return cost[1]
+        return self._r_cost(ch1, ch2, cost)
+
+    def _borders(self, src, tar, cost, local):
+        """Return the first column & row of the Editex matrix.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison (normalized & non-empty)
+        tar : str
+            Target string for comparison (normalized & non-empty)
+        cost : tuple
+            The match, same-group, and mismatch costs
+        local : bool
+            If True, the local variant of Editex is used
+
+        Returns
+        -------
+        tuple
+            The first column & first row of the matrix
+
+        Examples
+        --------
+        >>> cmp = Editex()
+        >>> cmp._borders('CAT', 'HAT', (0, 1, 2), False)
+        (array([0, 2, 4, 6]), array([0, 2, 3, 5]))
+        >>> cmp._borders('CAT', 'HAT', (0, 1, 2), True)
+        (array([0, 0, 0, 0]), array([0, 2, 3, 5]))
+
+        """
+        first_col = np_zeros(len(src) + 1, dtype=np_int)
+        first_row = np_zeros(len(tar) + 1, dtype=np_int)
+        src = ' ' + src
+        tar = ' ' + tar
+
+        if not local:
+            for i in range(1, len(src)):
+                first_col[i] = first_col[i - 1] + self._d_cost(
+                    src[i - 1], src[i], cost
+                )
+        for j in range(1, len(tar)):
+            first_row[j] = first_row[j - 1] + self._d_cost(
+                tar[j - 1], tar[j], cost
+            )
+        return first_col, first_row
+
+    def _dist_abs_dp(self, src, tar, cost, local):
+        """Return the Editex distance, filling the matrix cell by cell.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison (normalized & non-empty)
+        tar : str
+            Target string for comparison (normalized & non-empty)
+        cost : tuple
+            The match, same-group, and mismatch costs
+        local : bool
+            If True, the local variant of Editex is used
+
+        Returns
+        -------
+        int
+            Editex distance
+
+        Examples
+        --------
+        >>> Editex()._dist_abs_dp('NIALL', 'NEIL', (0, 1, 2), False)
+        2
+
+        """
+        d_mat = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_int)
+        d_mat[:, 0], d_mat[0, :] = self._borders(src, tar, cost, local)
+        lens = len(src)
+        lent = len(tar)
+        src = ' ' + src
+        tar = ' ' + tar
+
+        for i in range(1, lens + 1):
+            for j in range(1, lent + 1):
+                d_mat[i, j] = min(
+                    d_mat[i - 1, j] + self._d_cost(src[i - 1], src[i], cost),
+                    d_mat[i, j - 1] + self._d_cost(tar[j - 1], tar[j], cost),
+                    d_mat[i - 1, j - 1] + self._r_cost(src[i], tar[j], cost),
+                )
+
+        return d_mat[lens, lent]
+
+    def _dist_abs_wavefront(self, src, tar, cost, local):
+        """Return the Editex distance, filling the matrix by wavefront.
+
+        This computes the same matrix as :py:meth:`_dist_abs_dp`, one
+        anti-diagonal at a time, with numpy vector operations.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison (normalized & non-empty)
+        tar : str
+            Target string for comparison (normalized & non-empty)
+        cost : tuple
+            The match, same-group, and mismatch costs
+        local : bool
+            If True, the local variant of Editex is used
+
+        Returns
+        -------
+        int
+            Editex distance
+
+        Examples
+        --------
+        >>> Editex()._dist_abs_wavefront('NIALL', 'NEIL', (0, 1, 2), False)
+        2
+
+        """
+        src_codes, tar_codes, alphabet = _char_codes(src, tar)
+        sub_table = np_array(
+            [
+                [self._r_cost(ch1, ch2, cost) for ch2 in alphabet]
+                for ch1 in alphabet
+            ]
+        )
+        first_col, first_row = self._borders(src, tar, cost, local)
+        src = ' ' + src
+        tar = ' ' + tar
+        del_costs = [0] + [
+            self._d_cost(src[i - 1], src[i], cost) for i in range(1, len(src))
+        ]
+        ins_costs = [0] + [
+            self._d_cost(tar[j - 1], tar[j], cost) for j in range(1, len(tar))
+        ]
+
+        return _wavefront_dist(
+            src_codes,
+            tar_codes,
+            sub_table,
+            first_col,
+            first_row,
+            del_costs,
+            ins_costs,
+            dtype=np_int,
+        )
+
     def dist_abs(self, src, tar, cost=(0, 1, 2), local=False):
         """Return the Editex distance between two strings.
 
@@ -96,51 +304,7 @@ class Editex(_Distance):
         6
 
         """
-        match_cost, group_cost, mismatch_cost = cost
-
-        def r_cost(ch1, ch2):
-            """Return r(a,b) according to Zobel & Dart's definition.
-
-            Parameters
-            ----------
-            ch1 : str
-                The first character to compare
-            ch2 : str
-                The second character to compare
-
-            Returns
-            -------
-            int
-                r(a,b) according to Zobel & Dart's definition
-
-            """
-            if ch1 == ch2:
-                return match_cost
-            if ch1 in self._all_letters and ch2 in self._all_letters:
-                for group in self._letter_groups:
-                    if ch1 in group and ch2 in group:
-                        return group_cost
-            return mismatch_cost
-
-        def d_cost(ch1, ch2):
-            """Return d(a,b) according to Zobel & Dart's definition.
-
-            Parameters
-            ----------
-            ch1 : str
-                The first character to compare
-            ch2 : str
-                The second character to compare
-
-            Returns
-            -------
-            int
-                d(a,b) according to Zobel & Dart's definition
-
-            """
-            if ch1 != ch2 and (ch1 == 'H' or ch1 == 'W'):
-                return group_cost
-            return r_cost(ch1, ch2)
+        mismatch_cost = cost[2]
 
         # convert both src & tar to NFKD normalized unicode
         src = unicode_normalize('NFKD', text_type(src.upper()))
@@ -156,27 +320,9 @@ class Editex(_Distance):
         if not tar:
             return len(src) * mismatch_cost
 
-        d_mat = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_int)
-        lens = len(src)
-        lent = len(tar)
-        src = ' ' + src
-        tar = ' ' + tar
-
-        if not local:
-            for i in range(1, lens + 1):
-                d_mat[i, 0] = d_mat[i - 1, 0] + d_cost(src[i - 1], src[i])
-        for j in range(1, lent + 1):
-            d_mat[0, j] = d_mat[0, j - 1] + d_cost(tar[j - 1], tar[j])
-
-        for i in range(1, lens + 1):
-            for j in range(1, lent + 1):
-                d_mat[i, j] = min(
-                    d_mat[i - 1, j] + d_cost(src[i - 1], src[i]),
-                    d_mat[i, j - 1] + d_cost(tar[j - 1], tar[j]),
-                    d_mat[i - 1, j - 1] + r_cost(src[i], tar[j]),
-                )
-
-        return d_mat[lens, lent]
+        if _use_wavefront(len(src), len(tar)):
+            return self._dist_abs_wavefront(src, tar, cost, local)
+        return self._dist_abs_dp(src, tar, cost, local)
 
     def dist(self, src, tar, cost=(0, 1, 2), local=False):
         """Return the normalized Editex distance between two strings.
@@ -30,6 +30,9 @@ from __future__ import (
 
 from types import GeneratorType
 
+from numpy import array as np_array
+from numpy import float64 as np_float64
+
 from six.moves import range
 
 from ._distance import _Distance
@@ -167,13 +170,38 @@ class Eudex(_Distance):
             tar, max_length=max_length
         )
 
+        return self._xored_distance(
+            xored, self._weights_list(weights, max_length), normalized
+        )
+
+    @staticmethod
+    def _weights_list(weights, max_length):
+        """Return the list of byte weights, lowest-order byte last.
+
+        Parameters
+        ----------
+        weights : str, iterable, or generator function
+            The weights or weights generator function, as for
+            :py:meth:`dist_abs`
+        max_length : int
+            The number of characters to encode as a eudex hash
+
+        Returns
+        -------
+        list or None
+            The weights, or None if a simple Hamming distance is called for
+
+        Examples
+        --------
+        >>> Eudex._weights_list('fibonacci', 8)
+        [34, 21, 13, 8, 5, 3, 2, 1]
+        >>> Eudex._weights_list(None, 8) is None
+        True
+
+        """
         # Simple hamming distance (all bits are equal)
         if not weights:
-            binary = bin(xored)
-            distance = binary.count('1')
-            if normalized:
-                return distance / (len(binary) - 2)
-            return distance
+            return None
 
         # If weights is a function, it should create a generator,
         # which we now use to populate a list
@@ -185,13 +213,47 @@ class Eudex(_Distance):
             weights = Eudex.gen_fibonacci()
         if isinstance(weights, GeneratorType):
             weights = [next(weights) for _ in range(max_length)][::-1]
+        return list(weights)
+
+    @staticmethod
+    def _xored_distance(xored, weights, normalized):
+        """Return the weighted Hamming distance encoded by XORed hashes.
+
+        Parameters
+        ----------
+        xored : int
+            The XOR of two eudex hashes
+        weights : list or None
+            The weights, as returned by :py:meth:`_weights_list`
+        normalized : bool
+            Normalizes to [0, 1] if True
+
+        Returns
+        -------
+        int or float
+            The Eudex Hamming distance
+
+        Examples
+        --------
+        >>> Eudex._xored_distance(0b1000000011, [1, 2, 4], False)
+        10
+
+        """
+        if weights is None:
+            binary = bin(xored)
+            distance = binary.count('1')
+            if normalized:
+                return distance / (len(binary) - 2)
+            return distance
 
         # Sum the weighted hamming distance
         distance = 0
         max_distance = 0
-        while (xored or normalized) and weights:
-            max_distance += 8 * weights[-1]
-            distance += bin(xored & 0xFF).count('1') * weights.pop()
+        for weight in reversed(weights):
+            if not (xored or normalized):
+                break
+            max_distance += 8 * weight
+            distance += bin(xored & 0xFF).count('1') * weight
             xored >>= 8
 
         if normalized:
@@ -235,6 +297,77 @@ class Eudex(_Distance):
         """
         return self.dist_abs(src, tar, weights, max_length, True)
 
+    def dist_many(self, src, targets, weights='exponential', max_length=8):
+        """Return normalized Eudex distances to many strings.
+
+        The Eudex hash of src and the list of weights are computed just once
+        and reused for every target.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable
+            Target strings for comparison
+        weights : str, iterable, or generator function
+            The weights or weights generator function
+        max_length : int
+            The number of characters to encode as a eudex hash
+
+        Returns
+        -------
+        numpy.ndarray
+            The normalized Eudex Hamming distance between src & each target
+
+        Examples
+        --------
+        >>> cmp = Eudex()
+        >>> cmp.dist_many('Niall', ['Neil', 'Niall', 'Colin'])
+        array([0.00098039, 0.        , 0.25686275])
+
+        """
+        src_hash = eudex(src, max_length=max_length)
+        weights = self._weights_list(weights, max_length)
+        return np_array(
+            [
+                self._xored_distance(
+                    src_hash ^ eudex(tar, max_length=max_length),
+                    weights,
+                    True,
+                )
+                for tar in targets
+            ],
+            dtype=np_float64,
+        )
+
+    def sim_many(self, src, targets, weights='exponential', max_length=8):
+        """Return normalized Eudex similarities to many strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable
+            Target strings for comparison
+        weights : str, iterable, or generator function
+            The weights or weights generator function
+        max_length : int
+            The number of characters to encode as a eudex hash
+
+        Returns
+        -------
+        numpy.ndarray
+            The normalized Eudex Hamming similarity between src & each target
+
+        Examples
+        --------
+        >>> cmp = Eudex()
+        >>> cmp.sim_many('Niall', ['Neil', 'Niall', 'Colin'])
+        array([0.99901961, 1.        , 0.74313725])
+
+        """
+        return 1.0 - self.dist_many(src, targets, weights, max_length)
+
 
 def eudex_hamming(
     src, tar, weights='exponential', max_length=8, normalized=False
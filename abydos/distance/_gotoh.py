@@ -28,8 +28,11 @@ from __future__ import (
     unicode_literals,
 )
 
+from numpy import arange as np_arange
 from numpy import float32 as np_float32
-from numpy import zeros as np_zeros
+from numpy import float64 as np_float64
+from numpy import full as np_full
+from numpy import maximum as np_maximum
 
 from six.moves import range
 
@@ -46,6 +49,55 @@ class Gotoh(NeedlemanWunsch):
     affine gap penalties.
     """
 
+    def alignment(self, src, tar, gap_open=1, gap_ext=0.4, sim_func=sim_ident):
+        """Return a Gotoh alignment of two strings.
+
+        Only the score is kept by :py:meth:`dist_abs`; this also traces the
+        alignment back, in space linear in the lengths of the strings (see
+        :py:meth:`NeedlemanWunsch._hirschberg`), so that even very long
+        strings can be aligned.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        gap_open : float
+            The cost of an open alignment gap (1 by default)
+        gap_ext : float
+            The cost of an alignment gap extension (0.4 by default)
+        sim_func : function
+            A function that returns the similarity of two characters (identity
+            similarity by default)
+
+        Returns
+        -------
+        tuple
+            The Gotoh score, and src & tar with gaps (as '-') inserted to align
+            them
+
+        Examples
+        --------
+        >>> cmp = Gotoh()
+        >>> cmp.alignment('cat', 'hat')
+        (2.0, 'cat', 'hat')
+        >>> cmp.alignment('Niall', 'Neil')
+        (1.0, 'Niall', 'N-eil')
+        >>> score, src, tar = cmp.alignment('aluminum', 'Catalan')
+        >>> round(score, 12)
+        -0.4
+        >>> print(src)
+        -aluminum
+        >>> print(tar)
+        Catalan--
+
+        """
+        # A gap in one string may not directly follow a gap in the other.
+        return self._alignment(
+            src, tar, sim_func, (gap_open, gap_ext, float('inf'))
+        )
+
     def dist_abs(self, src, tar, gap_open=1, gap_ext=0.4, sim_func=sim_ident):
         """Return the Gotoh score of two strings.
 
@@ -81,43 +133,39 @@ class Gotoh(NeedlemanWunsch):
         2.0
 
         """
-        d_mat = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_float32)
-        p_mat = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_float32)
-        q_mat = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_float32)
-
-        d_mat[0, 0] = 0
-        p_mat[0, 0] = float('-inf')
-        q_mat[0, 0] = float('-inf')
-        for i in range(1, len(src) + 1):
-            d_mat[i, 0] = float('-inf')
-            p_mat[i, 0] = -gap_open - gap_ext * (i - 1)
-            q_mat[i, 0] = float('-inf')
-            q_mat[i, 1] = -gap_open
-        for j in range(1, len(tar) + 1):
-            d_mat[0, j] = float('-inf')
-            p_mat[0, j] = float('-inf')
-            p_mat[1, j] = -gap_open
-            q_mat[0, j] = -gap_open - gap_ext * (j - 1)
+        src_codes, tar_codes, sub_mat = self._substitution_matrix(
+            src, tar, sim_func
+        )
+
+        # The rows of the three matrices: d ends in a match, p in a gap in
+        # tar, and q in a gap in src
+        d_row = np_full(len(tar) + 1, float('-inf'))
+        d_row[0] = 0
+        p_row = np_full(len(tar) + 1, float('-inf'))
+        q_row = self._float32_row(
+            -gap_open - gap_ext * (np_arange(len(tar) + 1) - 1)
+        )
+        q_row[0] = float('-inf')
 
         for i in range(1, len(src) + 1):
-            for j in range(1, len(tar) + 1):
-                sim_val = sim_func(src[i - 1], tar[j - 1])
-                d_mat[i, j] = max(
-                    d_mat[i - 1, j - 1] + sim_val,
-                    p_mat[i - 1, j - 1] + sim_val,
-                    q_mat[i - 1, j - 1] + sim_val,
-                )
-
-                p_mat[i, j] = max(
-                    d_mat[i - 1, j] - gap_open, p_mat[i - 1, j] - gap_ext
-                )
-
-                q_mat[i, j] = max(
-                    d_mat[i, j - 1] - gap_open, q_mat[i, j - 1] - gap_ext
-                )
-
-        i, j = (n - 1 for n in d_mat.shape)
-        return max(d_mat[i, j], p_mat[i, j], q_mat[i, j])
+            d_prev, p_prev, q_prev = d_row, p_row, q_row
+            d_row = np_full(len(tar) + 1, float('-inf'))
+            d_row[1:] = self._float32_row(
+                np_maximum(np_maximum(d_prev[:-1], p_prev[:-1]), q_prev[:-1])
+                + sub_mat[src_codes[i - 1], tar_codes]
+            )
+
+            p_row = np_full(
+                len(tar) + 1, -gap_open - gap_ext * (i - 1), dtype=np_float64
+            )
+            p_row[1:] = np_maximum(d_prev[1:] - gap_open, p_prev[1:] - gap_ext)
+            p_row = self._float32_row(p_row)
+
+            q_row = self._extend_gaps(
+                float('-inf'), d_row[:-1] - gap_open, gap_ext
+            )
+
+        return np_float32(max(d_row[-1], p_row[-1], q_row[-1]))
 
 
 def gotoh(src, tar, gap_open=1, gap_ext=0.4, sim_func=sim_ident):
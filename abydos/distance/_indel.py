@@ -28,6 +28,9 @@ from __future__ import (
     unicode_literals,
 )
 
+from numpy import array as np_array
+from numpy import float64 as np_float64
+
 from ._distance import _Distance
 from ._levenshtein import Levenshtein
 
@@ -43,7 +46,7 @@ class Indel(_Distance):
 
     _lev = Levenshtein()
 
-    def dist_abs(self, src, tar):
+    def dist_abs(self, src, tar, max_distance=None):
         """Return the indel distance between two strings.
 
         Parameters
@@ -52,6 +55,10 @@ class Indel(_Distance):
             Source string for comparison
         tar : str
             Target string for comparison
+        max_distance : int
+            If set, only distances up to this value are computed exactly: as
+            soon as the distance is known to exceed max_distance, the
+            computation stops and max_distance + 1 is returned
 
         Returns
         -------
@@ -69,13 +76,19 @@ class Indel(_Distance):
         5
         >>> cmp.dist_abs('ATCG', 'TAGC')
         4
+        >>> cmp.dist_abs('ATCG', 'TAGC', max_distance=2)
+        3
 
         """
         return self._lev.dist_abs(
-            src, tar, mode='lev', cost=(1, 1, 9999, 9999)
+            src,
+            tar,
+            mode='lev',
+            cost=(1, 1, 9999, 9999),
+            max_distance=max_distance,
         )
 
-    def dist(self, src, tar):
+    def dist(self, src, tar, max_distance=None):
         """Return the normalized indel distance between two strings.
 
         This is equivalent to normalized Levenshtein distance, when only
@@ -87,6 +100,10 @@ class Indel(_Distance):
             Source string for comparison
         tar : str
             Target string for comparison
+        max_distance : float
+            If set, only normalized distances up to this value are computed
+            exactly; 1.0 is returned for any pair whose normalized distance
+            exceeds max_distance
 
         Returns
         -------
@@ -104,14 +121,100 @@ class Indel(_Distance):
         0.454545454545
         >>> cmp.dist('ATCG', 'TAGC')
         0.5
+        >>> cmp.dist('ATCG', 'TAGC', max_distance=0.25)
+        1.0
 
         """
         if src == tar:
             return 0.0
-        return self.dist_abs(src, tar) / (len(src) + len(tar))
+        normalizer = len(src) + len(tar)
+        if max_distance is None:
+            return self.dist_abs(src, tar) / normalizer
+
+        max_distance *= normalizer
+        distance = self.dist_abs(src, tar, max_distance)
+        if distance > max_distance:
+            return 1.0
+        return distance / normalizer
+
+    def dist_abs_pairs(self, pairs):
+        """Return the indel distances of many pairs of strings.
+
+        The pairs are computed in batches, as by
+        :py:meth:`Levenshtein.dist_abs_pairs`.
+
+        Parameters
+        ----------
+        pairs : iterable
+            (src, tar) pairs of strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The indel distance of each pair, as floats
+
+        Examples
+        --------
+        >>> cmp = Indel()
+        >>> cmp.dist_abs_pairs([('cat', 'hat'), ('Niall', 'Neil'),
+        ... ('Colin', 'Cuilen'), ('ATCG', 'TAGC')])
+        array([2., 3., 5., 4.])
+
+        """
+        return self._lev.dist_abs_pairs(
+            pairs, mode='lev', cost=(1, 1, 9999, 9999)
+        )
+
+    def dist_pairs(self, pairs):
+        """Return the normalized indel distances of many pairs of strings.
+
+        Parameters
+        ----------
+        pairs : iterable
+            (src, tar) pairs of strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The normalized indel distance of each pair
+
+        Examples
+        --------
+        >>> cmp = Indel()
+        >>> cmp.dist_pairs([('Colin', 'Cuilen'), ('ATCG', 'TAGC'), ('', '')])
+        array([0.45454545, 0.5       , 0.        ])
+
+        """
+        pairs = list(pairs)
+        normalizers = np_array(
+            [len(src) + len(tar) or 1 for src, tar in pairs], dtype=np_float64
+        )
+        return self.dist_abs_pairs(pairs) / normalizers
+
+    def sim_pairs(self, pairs):
+        """Return the normalized indel similarities of many pairs of strings.
+
+        Parameters
+        ----------
+        pairs : iterable
+            (src, tar) pairs of strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The normalized indel similarity of each pair
+
+        Examples
+        --------
+        >>> cmp = Indel()
+        >>> cmp.sim_pairs([('Colin', 'Cuilen'), ('ATCG', 'TAGC'), ('', '')])
+        array([0.54545455, 0.5       , 1.        ])
+
+        """
+        return 1.0 - self.dist_pairs(pairs)
 
 
-def indel(src, tar):
+def indel(src, tar, max_distance=None):
     """Return the indel distance between two strings.
 
     Parameters
@@ -120,6 +223,10 @@ def indel(src, tar):
         Source string for comparison
     tar : str
         Target string for comparison
+    max_distance : int
+        If set, only distances up to this value are computed exactly: as soon
+        as the distance is known to exceed max_distance, the computation stops
+        and max_distance + 1 is returned
 
     Returns
     -------
@@ -138,10 +245,10 @@ def indel(src, tar):
     4
 
     """
-    return Indel().dist_abs(src, tar)
+    return Indel().dist_abs(src, tar, max_distance)
 
 
-def dist_indel(src, tar):
+def dist_indel(src, tar, max_distance=None):
     """Return the normalized indel distance between two strings.
 
     This is equivalent to normalized Levenshtein distance, when only inserts
@@ -153,6 +260,10 @@ def dist_indel(src, tar):
         Source string for comparison
     tar : str
         Target string for comparison
+    max_distance : float
+        If set, only normalized distances up to this value are computed
+        exactly; 1.0 is returned for any pair whose normalized distance exceeds
+        max_distance
 
     Returns
     -------
@@ -171,7 +282,7 @@ def dist_indel(src, tar):
     0.5
 
     """
-    return Indel().dist(src, tar)
+    return Indel().dist(src, tar, max_distance)
 
 
 def sim_indel(src, tar):
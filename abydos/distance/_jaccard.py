@@ -80,6 +80,34 @@ class Jaccard(Tversky):
         """
         return super(self.__class__, self).sim(src, tar, qval, 1, 1)
 
+    def _sim_from_magnitudes(self, src_mag, tar_mag, int_mag):
+        """Return Jaccard similarities from q-gram multiset magnitudes.
+
+        Parameters
+        ----------
+        src_mag : numpy.ndarray
+            The magnitudes of the source q-gram multisets
+        tar_mag : numpy.ndarray
+            The magnitudes of the target q-gram multisets
+        int_mag : numpy.ndarray
+            The magnitudes of the intersections of the q-gram multisets
+
+        Returns
+        -------
+        numpy.ndarray
+            Jaccard similarities
+
+        Examples
+        --------
+        >>> cmp = Jaccard()
+        >>> cmp._sim_from_magnitudes(4, 4, 2)
+        0.3333333333333333
+
+        """
+        return super(self.__class__, self)._sim_from_magnitudes(
+            src_mag, tar_mag, int_mag, 1, 1
+        )
+
     def tanimoto_coeff(self, src, tar, qval=2):
         """Return the Tanimoto distance between two strings.
 
@@ -32,9 +32,11 @@ from __future__ import (
     unicode_literals,
 )
 
-from six.moves import range
+from numpy import array as np_array
+from numpy import float64 as np_float64
 
 from ._distance import _Distance
+from ._levenshtein import Levenshtein
 from ..tokenizer import QGrams
 
 __all__ = ['JaroWinkler', 'dist_jaro_winkler', 'sim_jaro_winkler']
@@ -50,6 +52,11 @@ class JaroWinkler(_Distance):
     http://web.archive.org/web/20110629121242/http://www.census.gov/geo/msb/stand/strcmp.c
     :cite:`Winkler:1994`. The above file is a US Government publication and,
     accordingly, in the public domain.
+
+    In place of the C code's arrays of match flags, the positions of each
+    q-gram in the target & the matched positions are held as bitmasks, so
+    each q-gram of the source is matched in a few integer operations rather
+    than by scanning its search range.
     """
 
     def sim(
@@ -128,6 +135,162 @@ class JaroWinkler(_Distance):
         >>> round(sim_jaro_winkler('ATCG', 'TAGC', mode='jaro'), 12)
         0.833333333333
 
+        """
+        self._check_params(mode, boost_threshold, scaling_factor)
+
+        if src == tar:
+            return 1.0
+
+        src = self._qgram_list(src, qval)
+        tar = self._qgram_list(tar, qval)
+
+        return self._sim_qgrams(
+            src, tar, mode, long_strings, boost_threshold, scaling_factor
+        )
+
+    @staticmethod
+    def _qgram_list(term, qval):
+        """Return the q-grams of a term, in order, after stripping it.
+
+        Parameters
+        ----------
+        term : str
+            The term to divide into q-grams
+        qval : int
+            The length of each q-gram
+
+        Returns
+        -------
+        list or str
+            The q-grams of term, or (when qval is 1) the stripped term itself,
+            whose characters are its q-grams
+
+        Examples
+        --------
+        >>> JaroWinkler._qgram_list(' Niall ', 1)
+        'Niall'
+        >>> JaroWinkler._qgram_list(' Niall ', 2)
+        ['$N', 'Ni', 'ia', 'al', 'll', 'l#']
+
+        """
+        term = term.strip()
+        if qval == 1:
+            return term
+        return QGrams(term, qval)._ordered_list
+
+    @staticmethod
+    def _match_masks(src, tar, tar_masks):
+        """Return the Jaro matches of two q-gram lists, as bitmasks.
+
+        Each q-gram of src is matched, in turn, with the first unmatched equal
+        q-gram of tar within the search range of its position. Rather than
+        scanning the search range, the first such q-gram is found as the
+        lowest set bit of the positions of that q-gram in tar, less those
+        already matched & those outside the search range.
+
+        Parameters
+        ----------
+        src : list
+            Source q-grams for comparison, in order
+        tar : list
+            Target q-grams for comparison, in order
+        tar_masks : dict
+            The positions of each q-gram in tar, as bitmasks, as returned by
+            :py:meth:`.Levenshtein._pattern_bitmasks`
+
+        Returns
+        -------
+        tuple
+            The number of matches, and the matched positions in src & in tar,
+            as bitmasks
+
+        Examples
+        --------
+        >>> tar_masks = Levenshtein._pattern_bitmasks('Neil')
+        >>> num_com, src_matched, tar_matched = JaroWinkler._match_masks(
+        ... 'Niall', 'Neil', tar_masks)
+        >>> num_com, bin(src_matched), bin(tar_matched)
+        (3, '0b1011', '0b1101')
+
+        """
+        search_range = max(0, max(len(src), len(tar)) // 2 - 1)
+        num_com = 0
+        src_matched = 0
+        tar_matched = 0
+        for i, qgram in enumerate(src):
+            candidates = tar_masks.get(qgram, 0) & ~tar_matched
+            if candidates:
+                low_lim = (i - search_range) if (i >= search_range) else 0
+                candidates &= (1 << (i + search_range + 1)) - (1 << low_lim)
+                if candidates:
+                    tar_matched |= candidates & -candidates
+                    src_matched |= 1 << i
+                    num_com += 1
+        return num_com, src_matched, tar_matched
+
+    @staticmethod
+    def _transpositions(src, tar, src_matched, tar_matched):
+        """Return the number of transpositions among matched q-grams.
+
+        The matched q-grams of src & of tar are paired in order, and half of
+        the number of pairs that differ is returned.
+
+        Parameters
+        ----------
+        src : list
+            Source q-grams for comparison, in order
+        tar : list
+            Target q-grams for comparison, in order
+        src_matched : int
+            The matched positions in src, as a bitmask
+        tar_matched : int
+            The matched positions in tar, as a bitmask
+
+        Returns
+        -------
+        int
+            The number of transpositions
+
+        Examples
+        --------
+        >>> JaroWinkler._transpositions('ATCG', 'TAGC', 0b1111, 0b1111)
+        2
+
+        """
+        n_trans = 0
+        while src_matched:
+            src_bit = src_matched & -src_matched
+            tar_bit = tar_matched & -tar_matched
+            if src[src_bit.bit_length() - 1] != tar[tar_bit.bit_length() - 1]:
+                n_trans += 1
+            src_matched ^= src_bit
+            tar_matched ^= tar_bit
+        return n_trans // 2
+
+    @staticmethod
+    def _check_params(mode, boost_threshold, scaling_factor):
+        """Raise a ValueError if the Winkler parameters are out of range.
+
+        Parameters
+        ----------
+        mode : str
+            ``winkler`` or ``jaro``
+        boost_threshold : float
+            A value between 0 and 1, below which the Winkler boost is not
+            applied
+        scaling_factor : float
+            A value between 0 and 0.25, indicating by how much to boost scores
+            for matching prefixes
+
+        Raises
+        ------
+        ValueError
+            Unsupported boost_threshold assignment; boost_threshold must be
+            between 0 and 1.
+        ValueError
+            Unsupported scaling_factor assignment; scaling_factor must be
+            between 0 and 0.25.'
+
         """
         if mode == 'winkler':
             if boost_threshold > 1 or boost_threshold < 0:
@@ -141,12 +304,42 @@ class JaroWinkler(_Distance):
                     + 'scaling_factor must be between 0 and 0.25.'
                 )
 
-        if src == tar:
-            return 1.0
+    @classmethod
+    def _sim_qgrams(
+        cls, src, tar, mode, long_strings, boost_threshold, scaling_factor
+    ):
+        """Return the Jaro or Jaro-Winkler similarity of two q-gram lists.
 
-        src = QGrams(src.strip(), qval)._ordered_list
-        tar = QGrams(tar.strip(), qval)._ordered_list
+        Parameters
+        ----------
+        src : list
+            Source q-grams for comparison, in order
+        tar : list
+            Target q-grams for comparison, in order
+        mode : str
+            ``winkler`` or ``jaro``
+        long_strings : bool
+            Set to True to increase the probability of a match when the number
+            of matched characters is large
+        boost_threshold : float
+            A value between 0 and 1, below which the Winkler boost is not
+            applied
+        scaling_factor : float
+            A value between 0 and 0.25, indicating by how much to boost scores
+            for matching prefixes
+
+        Returns
+        -------
+        float
+            Jaro or Jaro-Winkler similarity
+
+        Examples
+        --------
+        >>> round(JaroWinkler._sim_qgrams(list('Niall'), list('Neil'),
+        ... 'winkler', False, 0.7, 0.1), 12)
+        0.805
 
+        """
         lens = len(src)
         lent = len(tar)
 
@@ -154,48 +347,20 @@ class JaroWinkler(_Distance):
         if lens == 0 or lent == 0:
             return 0.0
 
-        if lens > lent:
-            search_range = lens
-            minv = lent
-        else:
-            search_range = lent
-            minv = lens
-
-        # Zero out the flags
-        src_flag = [0] * search_range
-        tar_flag = [0] * search_range
-        search_range = max(0, search_range // 2 - 1)
+        minv = min(lens, lent)
 
         # Looking only within the search range,
         # count and flag the matched pairs.
-        num_com = 0
-        yl1 = lent - 1
-        for i in range(lens):
-            low_lim = (i - search_range) if (i >= search_range) else 0
-            hi_lim = (i + search_range) if ((i + search_range) <= yl1) else yl1
-            for j in range(low_lim, hi_lim + 1):
-                if (tar_flag[j] == 0) and (tar[j] == src[i]):
-                    tar_flag[j] = 1
-                    src_flag[i] = 1
-                    num_com += 1
-                    break
+        num_com, src_matched, tar_matched = cls._match_masks(
+            src, tar, Levenshtein._pattern_bitmasks(tar)
+        )
 
         # If no characters in common - return
         if num_com == 0:
             return 0.0
 
         # Count the number of transpositions
-        k = n_trans = 0
-        for i in range(lens):
-            if src_flag[i] != 0:
-                j = 0
-                for j in range(k, lent):  # pragma: no branch
-                    if tar_flag[j] != 0:
-                        k = j + 1
-                        break
-                if src[i] != tar[j]:
-                    n_trans += 1
-        n_trans //= 2
+        n_trans = cls._transpositions(src, tar, src_matched, tar_matched)
 
         # Main weight computation for Jaro distance
         weight = (
@@ -230,6 +395,112 @@ class JaroWinkler(_Distance):
 
         return weight
 
+    def sim_many(
+        self,
+        src,
+        targets,
+        qval=1,
+        mode='winkler',
+        long_strings=False,
+        boost_threshold=0.7,
+        scaling_factor=0.1,
+    ):
+        """Return the Jaro or Jaro-Winkler similarities to many strings.
+
+        The q-grams of src are extracted just once and reused for every
+        target; each target's q-gram positions are then encoded as bitmasks
+        for matching (see :py:meth:`_match_masks`).
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable
+            Target strings for comparison
+        qval : int
+            The length of each q-gram (defaults to 1: character-wise matching)
+        mode : str
+            Indicates which variant of this distance metric to compute:
+
+                - ``winkler`` -- computes the Jaro-Winkler distance (default)
+                  which increases the score for matches near the start of the
+                  word
+                - ``jaro`` -- computes the Jaro distance
+
+        long_strings : bool
+            Set to True to "Increase the probability of a match when the number
+            of matched characters is large. This option allows for a little
+            more tolerance when the strings are large. It is not an appropriate
+            test when comparing fixed length fields such as phone and social
+            security numbers." (Used in 'winkler' mode only.)
+        boost_threshold : float
+            A value between 0 and 1, below which the Winkler boost is not
+            applied (defaults to 0.7). (Used in 'winkler' mode only.)
+        scaling_factor : float
+            A value between 0 and 0.25, indicating by how much to boost scores
+            for matching prefixes (defaults to 0.1). (Used in 'winkler' mode
+            only.)
+
+        Returns
+        -------
+        numpy.ndarray
+            Jaro or Jaro-Winkler similarity between src & each target
+
+        Examples
+        --------
+        >>> cmp = JaroWinkler()
+        >>> cmp.sim_many('Niall', ['Neil', 'Niall', 'Nigel', ''])
+        array([0.805     , 1.        , 0.78666667, 0.        ])
+
+        """
+        self._check_params(mode, boost_threshold, scaling_factor)
+
+        src_qgrams = self._qgram_list(src, qval)
+        sims = []
+        for tar in targets:
+            if tar == src:
+                sims.append(1.0)
+            else:
+                sims.append(
+                    self._sim_qgrams(
+                        src_qgrams,
+                        self._qgram_list(tar, qval),
+                        mode,
+                        long_strings,
+                        boost_threshold,
+                        scaling_factor,
+                    )
+                )
+        return np_array(sims, dtype=np_float64)
+
+    def dist_many(self, src, targets, *args, **kwargs):
+        """Return the Jaro or Jaro-Winkler distances to many strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable
+            Target strings for comparison
+        *args
+            Variable length argument list, as for :py:meth:`sim_many`
+        **kwargs
+            Arbitrary keyword arguments, as for :py:meth:`sim_many`
+
+        Returns
+        -------
+        numpy.ndarray
+            Jaro or Jaro-Winkler distance between src & each target
+
+        Examples
+        --------
+        >>> cmp = JaroWinkler()
+        >>> cmp.dist_many('Niall', ['Neil', 'Niall', 'Nigel', ''])
+        array([0.195     , 0.        , 0.21333333, 1.        ])
+
+        """
+        return 1.0 - self.sim_many(src, targets, *args, **kwargs)
+
 
 def sim_jaro_winkler(
     src,
@@ -28,22 +28,148 @@ from __future__ import (
     unicode_literals,
 )
 
-from numpy import int as np_int
-from numpy import zeros as np_zeros
+from numpy import array as np_array
+from numpy import float64 as np_float64
+from numpy import maximum as np_maximum
 
+from six.moves import range
+
+from ._batch import _pairs_edit_dist
+from ._diagonal import _diagonal_budget, _diagonal_dist
 from ._distance import _Distance
+from ._levenshtein import Levenshtein
 
 __all__ = ['LCSseq', 'dist_lcsseq', 'lcsseq', 'sim_lcsseq']
 
+# The largest number of dynamic programming matrix cells (of a bit each) for
+# which LCSseq fills the full matrix, rather than dividing the problem with
+# Hirschberg's algorithm, which may break ties differently
+_MATRIX_MAX = 1 << 24
+
 
 class LCSseq(_Distance):
     """Longest common subsequence.
 
     Longest common subsequence (LCSseq) is the longest subsequence of
     characters that two strings have in common.
+
+    Similarity & distance require only the length of the LCS, which is
+    computed with bit-vectors, without building the subsequence itself. For
+    long, similar strings, it is instead derived from their indel distance,
+    found by diagonal transition :cite:`Myers:1986`.
     """
 
-    def lcsseq(self, src, tar):
+    @staticmethod
+    def _lcsseq_bits(peq, pat_len, text):
+        """Return the bit-vector of LCS length increments of a pattern.
+
+        This is the bit-vector LCS algorithm of Allison & Dix
+        :cite:`Allison:1986`, in the formulation of Hyyrö :cite:`Hyyro:2004`.
+        After each character of text, bit j of the vector is 0 iff the length
+        of the LCS of the text so far & pattern[:j + 1] exceeds that of the
+        text so far & pattern[:j].
+
+        Parameters
+        ----------
+        peq : dict
+            The match masks of the pattern, as returned by
+            :py:meth:`.Levenshtein._pattern_bitmasks`
+        pat_len : int
+            The length of the pattern
+        text : str
+            The string to compare against the pattern
+
+        Returns
+        -------
+        int
+            The final bit-vector
+
+        Examples
+        --------
+        >>> peq = Levenshtein._pattern_bitmasks('Neil')
+        >>> bin(LCSseq._lcsseq_bits(peq, 4, 'Niall'))
+        '0b10'
+
+        """
+        full = (1 << pat_len) - 1
+        vec = full
+        for char in text:
+            match = vec & peq.get(char, 0)
+            vec = ((vec + match) | (vec - match)) & full
+        return vec
+
+    @classmethod
+    def _lcsseq_len(cls, src, tar):
+        """Return the length of the longest common subsequence of two strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+
+        Returns
+        -------
+        int
+            The length of the longest common subsequence
+
+        Examples
+        --------
+        >>> LCSseq._lcsseq_len('Niall', 'Neil')
+        3
+        >>> LCSseq._lcsseq_len('aluminum', 'Catalan')
+        3
+
+        """
+        if not src or not tar:
+            return 0
+        # Each character outside the LCS is an insert or a delete.
+        budget = _diagonal_budget(len(src), len(tar))
+        if budget:
+            distance = _diagonal_dist(src, tar, budget, indel=True)
+            if distance is not None:
+                return (len(src) + len(tar) - distance) // 2
+        vec = cls._lcsseq_bits(
+            Levenshtein._pattern_bitmasks(tar), len(tar), src
+        )
+        return len(tar) - bin(vec).count('1')
+
+    @classmethod
+    def _lcsseq_row(cls, src, tar):
+        """Return the LCS lengths of a string & each prefix of another.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+
+        Returns
+        -------
+        list
+            The length of the longest common subsequence of src & tar[:j],
+            for each j from 0 to len(tar)
+
+        Examples
+        --------
+        >>> LCSseq._lcsseq_row('Niall', 'Neil')
+        [0, 1, 1, 2, 3]
+
+        """
+        row = [0] * (len(tar) + 1)
+        if not src or not tar:
+            return row
+        vec = cls._lcsseq_bits(
+            Levenshtein._pattern_bitmasks(tar), len(tar), src
+        )
+        for j in range(len(tar)):
+            row[j + 1] = row[j] + (not (vec >> j) & 1)
+        return row
+
+    @staticmethod
+    def _lcsseq_matrix(src, tar):
         """Return the longest common subsequence of two strings.
 
         Based on the dynamic programming algorithm from
@@ -51,7 +177,12 @@ class LCSseq(_Distance):
         :cite:`rosettacode:2018b`. This is licensed GFDL 1.2.
 
         Modifications include:
-            conversion to a numpy array in place of a list of lists
+            each row of the matrix of LCS lengths is kept as the bit-vector
+            of its increments (see :py:meth:`_lcsseq_bits`), in place of a
+            numpy array, so the matrix takes a bit per cell
+
+        The subsequence is read out from the matrix as before, so ties are
+        broken in the same way.
 
         Parameters
         ----------
@@ -67,42 +198,89 @@ class LCSseq(_Distance):
 
         Examples
         --------
-        >>> sseq = LCSseq()
-        >>> sseq.lcsseq('cat', 'hat')
-        'at'
-        >>> sseq.lcsseq('Niall', 'Neil')
+        >>> LCSseq._lcsseq_matrix('Niall', 'Neil')
         'Nil'
-        >>> sseq.lcsseq('aluminum', 'Catalan')
-        'aln'
-        >>> sseq.lcsseq('ATCG', 'TAGC')
-        'AC'
 
         """
-        lengths = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_int)
-
-        # row 0 and column 0 are initialized to 0 already
-        for i, src_char in enumerate(src):
-            for j, tar_char in enumerate(tar):
-                if src_char == tar_char:
-                    lengths[i + 1, j + 1] = lengths[i, j] + 1
-                else:
-                    lengths[i + 1, j + 1] = max(
-                        lengths[i + 1, j], lengths[i, j + 1]
-                    )
+        peq = Levenshtein._pattern_bitmasks(tar)
+        full = (1 << len(tar)) - 1
+
+        # row 0 has no increments; the length of the LCS of src[:i] &
+        # tar[:j] is the number of 0 bits among the first j of row i
+        rows = [full]
+        for src_char in src:
+            vec = rows[-1]
+            match = vec & peq.get(src_char, 0)
+            rows.append(((vec + match) | (vec - match)) & full)
 
         # read the substring out from the matrix
-        result = ''
+        result = []
         i, j = len(src), len(tar)
+        length = j - bin(rows[i]).count('1')
         while i != 0 and j != 0:
-            if lengths[i, j] == lengths[i - 1, j]:
+            if j - bin(rows[i - 1] & ((1 << j) - 1)).count('1') == length:
                 i -= 1
-            elif lengths[i, j] == lengths[i, j - 1]:
+            elif (rows[i] >> (j - 1)) & 1:
                 j -= 1
             else:
-                result = src[i - 1] + result
+                result.append(src[i - 1])
+                length -= 1
                 i -= 1
                 j -= 1
-        return result
+        return ''.join(reversed(result))
+
+    def lcsseq(self, src, tar):
+        """Return the longest common subsequence of two strings.
+
+        Strings whose dynamic programming matrix has at most 2**24 cells
+        are compared by filling the full matrix, at a bit per cell (see
+        :py:meth:`_lcsseq_matrix`). Longer strings are divided by
+        Hirschberg's algorithm :cite:`Hirschberg:1975`, which may break ties
+        between subsequences of the same length differently: src is split in
+        half, the LCS lengths of its first half with each prefix of tar &
+        of its second half with each suffix of tar are computed (as
+        bit-vectors) in linear space, and tar is split where their sum is
+        greatest. The halves are solved recursively, so memory use is linear
+        rather than quadratic in the lengths of the strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+
+        Returns
+        -------
+        str
+            The longest common subsequence
+
+        Examples
+        --------
+        >>> sseq = LCSseq()
+        >>> sseq.lcsseq('cat', 'hat')
+        'at'
+        >>> sseq.lcsseq('Niall', 'Neil')
+        'Nil'
+        >>> sseq.lcsseq('aluminum', 'Catalan')
+        'aln'
+        >>> sseq.lcsseq('ATCG', 'TAGC')
+        'AC'
+
+        """
+        if len(src) * len(tar) <= _MATRIX_MAX or len(src) < 2:
+            return self._lcsseq_matrix(src, tar)
+
+        mid = len(src) // 2
+        prefix_row = self._lcsseq_row(src[:mid], tar)
+        suffix_row = self._lcsseq_row(src[mid:][::-1], tar[::-1])
+        split = max(
+            range(len(tar) + 1),
+            key=lambda j: prefix_row[j] + suffix_row[len(tar) - j],
+        )
+        return self.lcsseq(src[:mid], tar[:split]) + self.lcsseq(
+            src[mid:], tar[split:]
+        )
 
     def sim(self, src, tar):
         r"""Return the longest common subsequence similarity of two strings.
@@ -141,7 +319,65 @@ class LCSseq(_Distance):
             return 1.0
         elif not src or not tar:
             return 0.0
-        return len(self.lcsseq(src, tar)) / max(len(src), len(tar))
+        return self._lcsseq_len(src, tar) / max(len(src), len(tar))
+
+    def sim_pairs(self, pairs):
+        r"""Return the LCSseq similarities of many pairs of strings.
+
+        The length of the LCS of two strings is
+        :math:`\frac{|s| + |t| - indel(s,t)}{2}`, so the lengths are derived
+        from indel distances, computed in batches as by
+        :py:meth:`Levenshtein.dist_abs_pairs`.
+
+        Parameters
+        ----------
+        pairs : iterable
+            (src, tar) pairs of strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The LCSseq similarity of each pair
+
+        Examples
+        --------
+        >>> sseq = LCSseq()
+        >>> sseq.sim_pairs([('cat', 'hat'), ('Niall', 'Neil'),
+        ... ('aluminum', 'Catalan'), ('ATCG', 'TAGC'), ('', '')])
+        array([0.66666667, 0.6       , 0.375     , 0.5       , 1.        ])
+
+        """
+        pairs = list(pairs)
+        src_lens = np_array([len(src) for src, _ in pairs], dtype=np_float64)
+        tar_lens = np_array([len(tar) for _, tar in pairs], dtype=np_float64)
+        lcs_lens = (src_lens + tar_lens - _pairs_edit_dist(pairs, 1, 1, 2)) / 2
+        sims = lcs_lens / np_maximum(np_maximum(src_lens, tar_lens), 1)
+        # Identical strings, including pairs of empty strings, are similar
+        sims[[src == tar for src, tar in pairs]] = 1.0
+        return sims
+
+    def dist_pairs(self, pairs):
+        """Return the LCSseq distances of many pairs of strings.
+
+        Parameters
+        ----------
+        pairs : iterable
+            (src, tar) pairs of strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The LCSseq distance of each pair
+
+        Examples
+        --------
+        >>> sseq = LCSseq()
+        >>> sseq.dist_pairs([('cat', 'hat'), ('Niall', 'Neil'),
+        ... ('aluminum', 'Catalan'), ('ATCG', 'TAGC'), ('', '')])
+        array([0.33333333, 0.4       , 0.625     , 0.5       , 0.        ])
+
+        """
+        return 1.0 - self.sim_pairs(pairs)
 
 
 def lcsseq(src, tar):
@@ -28,11 +28,6 @@ from __future__ import (
     unicode_literals,
 )
 
-from numpy import int as np_int
-from numpy import zeros as np_zeros
-
-from six.moves import range
-
 from ._distance import _Distance
 
 __all__ = ['LCSstr', 'dist_lcsstr', 'lcsstr', 'sim_lcsstr']
@@ -41,20 +36,137 @@ __all__ = ['LCSstr', 'dist_lcsstr', 'lcsstr', 'sim_lcsstr']
 class LCSstr(_Distance):
     """Longest common substring."""
 
+    @staticmethod
+    def _suffix_automaton(string):
+        """Return the suffix automaton of a string.
+
+        The suffix automaton :cite:`Blumer:1985` is the smallest deterministic
+        automaton accepting every substring of string. It is built online,
+        in time & space linear in the length of string.
+
+        Parameters
+        ----------
+        string : str
+            The string to build the automaton of
+
+        Returns
+        -------
+        tuple
+            The automaton's transitions (a list of dicts mapping characters to
+            states), suffix links, and the length of the longest substring
+            accepted by each state; state 0 is the initial state
+
+        Examples
+        --------
+        >>> trans, link, length = LCSstr._suffix_automaton('abb')
+        >>> trans
+        [{'a': 1, 'b': 4}, {'b': 2}, {'b': 3}, {}, {'b': 3}]
+        >>> link
+        [-1, 0, 4, 4, 0]
+        >>> length
+        [0, 1, 2, 3, 1]
+
+        """
+        trans = [{}]
+        link = [-1]
+        length = [0]
+        last = 0
+
+        for char in string:
+            cur = len(trans)
+            trans.append({})
+            link.append(0)
+            length.append(length[last] + 1)
+
+            state = last
+            while state != -1 and char not in trans[state]:
+                trans[state][char] = cur
+                state = link[state]
+
+            if state != -1:
+                nxt = trans[state][char]
+                if length[state] + 1 == length[nxt]:
+                    link[cur] = nxt
+                else:
+                    # Split nxt, cloning it for the shorter substrings
+                    clone = len(trans)
+                    trans.append(dict(trans[nxt]))
+                    link.append(link[nxt])
+                    length.append(length[state] + 1)
+                    while state != -1 and trans[state].get(char) == nxt:
+                        trans[state][char] = clone
+                        state = link[state]
+                    link[nxt] = link[cur] = clone
+            last = cur
+
+        return trans, link, length
+
+    @classmethod
+    def _lcsstr_stl(cls, src, tar):
+        """Return start positions & length of the longest common substring.
+
+        A suffix automaton of tar is built, and src is run through it,
+        tracking the longest suffix of each prefix of src that is a substring
+        of tar. This takes time & space linear in the lengths of the strings.
+
+        Among longest common substrings, the one ending earliest in src, and
+        its first occurrence in tar, are chosen.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+
+        Returns
+        -------
+        tuple
+            The start position in the source string, start position in the
+            target string, and length of the longest common substring of
+            strings src and tar.
+
+        Examples
+        --------
+        >>> LCSstr._lcsstr_stl('aluminum', 'Catalan')
+        (0, 3, 2)
+        >>> LCSstr._lcsstr_stl('cat', 'dog')
+        (0, 0, 0)
+
+        """
+        trans, link, length = cls._suffix_automaton(tar)
+
+        state = 0
+        current = 0
+        longest, src_longest = 0, 0
+        for i, char in enumerate(src):
+            while state and char not in trans[state]:
+                state = link[state]
+                current = length[state]
+            if char in trans[state]:
+                state = trans[state][char]
+                current += 1
+            else:
+                current = 0
+            if current > longest:
+                longest = current
+                src_longest = i + 1
+
+        if not longest:
+            return 0, 0, 0
+        src_start = src_longest - longest
+        return src_start, tar.find(src[src_start:src_longest]), longest
+
     def lcsstr(self, src, tar):
         """Return the longest common substring of two strings.
 
         Longest common substring (LCSstr).
 
-        Based on the code from
+        This was formerly based on the dynamic programming code from
         https://en.wikibooks.org/wiki/Algorithm_Implementation/Strings/Longest_common_substring
-        :cite:`Wikibooks:2018`.
-        This is licensed Creative Commons: Attribution-ShareAlike 3.0.
-
-        Modifications include:
-
-            - conversion to a numpy array in place of a list of lists
-            - conversion to Python 2/3-safe range from xrange via six
+        :cite:`Wikibooks:2018`, and now uses a suffix automaton (see
+        :py:meth:`_lcsstr_stl`), which returns the same substring in linear
+        rather than quadratic time & space.
 
         Parameters
         ----------
@@ -81,18 +193,8 @@ class LCSstr(_Distance):
         'A'
 
         """
-        lengths = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_int)
-        longest, i_longest = 0, 0
-        for i in range(1, len(src) + 1):
-            for j in range(1, len(tar) + 1):
-                if src[i - 1] == tar[j - 1]:
-                    lengths[i, j] = lengths[i - 1, j - 1] + 1
-                    if lengths[i, j] > longest:
-                        longest = lengths[i, j]
-                        i_longest = i
-                else:
-                    lengths[i, j] = 0
-        return src[i_longest - longest : i_longest]
+        src_start, _, length = self._lcsstr_stl(src, tar)
+        return src[src_start : src_start + length]
 
     def sim(self, src, tar):
         r"""Return the longest common substring similarity of two strings.
@@ -33,12 +33,19 @@ from __future__ import (
 )
 
 
+from numpy import array as np_array
+from numpy import fill_diagonal as np_fill_diagonal
+from numpy import float64 as np_float64
+from numpy import full as np_full
 from numpy import int as np_int
 from numpy import zeros as np_zeros
 
 from six.moves import range
 
+from ._batch import _pairs_edit_dist
+from ._diagonal import _diagonal_budget, _diagonal_dist
 from ._distance import _Distance
+from ._wavefront import _char_codes, _use_wavefront, _wavefront_dist
 
 __all__ = ['Levenshtein', 'dist_levenshtein', 'levenshtein', 'sim_levenshtein']
 
@@ -57,11 +64,136 @@ class Levenshtein(_Distance):
     :cite:`Wagner:1974`.
 
     Levenshtein edit distance ordinarily has unit insertion, deletion, and
-    substitution costs.
+    substitution costs. When all costs are 1, the distance is instead
+    computed with the bit-vector algorithm of Myers :cite:`Myers:1999`, as
+    reformulated by Hyyrö :cite:`Hyyro:2003`, which also covers the Optimal
+    String Alignment variant.
+
+    The unit-cost Levenshtein distance (and the indel distance, when
+    substitutions cost at least as much as an insert & a delete) of long
+    strings is first sought with the diagonal-transition algorithm
+    :cite:`Ukkonen:1985,Myers:1986`, which takes time in proportion to the
+    product of the string length & the distance, so near-duplicates are
+    compared quickly.
     """
 
-    def dist_abs(self, src, tar, mode='lev', cost=(1, 1, 1, 1)):
-        """Return the Levenshtein distance between two strings.
+    @staticmethod
+    def _pattern_bitmasks(pattern):
+        """Return the bit-vector match masks of each character in pattern.
+
+        Parameters
+        ----------
+        pattern : str
+            The string to encode
+
+        Returns
+        -------
+        dict
+            A dict mapping each character in pattern to an int, in which bit i
+            is set iff pattern[i] is that character
+
+        Examples
+        --------
+        >>> sorted(Levenshtein._pattern_bitmasks('abba').items())
+        [('a', 9), ('b', 6)]
+
+        """
+        peq = {}
+        bit = 1
+        for char in pattern:
+            peq[char] = peq.get(char, 0) | bit
+            bit <<= 1
+        return peq
+
+    @staticmethod
+    def _dist_abs_bitpar(peq, pat_len, text, mode='lev', max_distance=None):
+        """Return the unit-cost Levenshtein distance, using bit-vectors.
+
+        This is Hyyrö's formulation :cite:`Hyyro:2003` of Myers' bit-vector
+        algorithm :cite:`Myers:1999`. Python ints serve as arbitrary-length
+        bit-vectors, so a column of the dynamic programming matrix is advanced
+        in a handful of integer operations, regardless of pattern length.
+
+        Parameters
+        ----------
+        peq : dict
+            The match masks of the pattern, as returned by
+            :py:meth:`_pattern_bitmasks`
+        pat_len : int
+            The length of the pattern
+        text : str
+            The string to compare against the pattern
+        mode : str
+            ``lev`` for Levenshtein distance or ``osa`` for Optimal String
+            Alignment distance
+        max_distance : int
+            If set, the computation stops as soon as the distance is known to
+            exceed this value
+
+        Returns
+        -------
+        int
+            The Levenshtein distance between the pattern & text, or
+            max_distance + 1 if it exceeds max_distance
+
+        Examples
+        --------
+        >>> peq = Levenshtein._pattern_bitmasks('ATCG')
+        >>> Levenshtein._dist_abs_bitpar(peq, 4, 'TAGC')
+        3
+        >>> Levenshtein._dist_abs_bitpar(peq, 4, 'TAGC', 'osa')
+        2
+        >>> Levenshtein._dist_abs_bitpar(peq, 4, 'TAGC', max_distance=1)
+        2
+
+        """
+        full = (1 << pat_len) - 1
+        last = 1 << (pat_len - 1)
+        osa = mode == 'osa'
+        remaining = len(text)
+
+        v_pos = full
+        v_neg = 0
+        d_zero = 0
+        prev_eq = 0
+        score = pat_len
+
+        for char in text:
+            eq = peq.get(char, 0)
+            d_next = (((eq & v_pos) + v_pos) ^ v_pos) | eq | v_neg
+            if osa:
+                # transpositions
+                d_next |= ((~d_zero & eq) << 1) & prev_eq
+                prev_eq = eq
+            d_zero = d_next & full
+
+            h_pos = v_neg | (~(d_zero | v_pos) & full)
+            h_neg = d_zero & v_pos
+            if h_pos & last:
+                score += 1
+            elif h_neg & last:
+                score -= 1
+
+            # The last row can fall by at most 1 per remaining column.
+            remaining -= 1
+            if max_distance is not None and score - remaining > max_distance:
+                return max_distance + 1
+
+            h_pos = ((h_pos << 1) | 1) & full
+            h_neg = (h_neg << 1) & full
+            v_pos = h_neg | (~(d_zero | h_pos) & full)
+            v_neg = h_pos & d_zero
+
+        return score
+
+    @staticmethod
+    def _dist_abs_banded(src, tar, mode, cost, max_distance):
+        """Return the Levenshtein distance, if it is at most max_distance.
+
+        Only the diagonal band of cells that may hold values no greater than
+        max_distance is computed :cite:`Ukkonen:1985`, and computation stops
+        as soon as two consecutive rows hold only values exceeding
+        max_distance (since a transposition may skip a row).
 
         Parameters
         ----------
@@ -70,52 +202,110 @@ class Levenshtein(_Distance):
         tar : str
             Target string for comparison
         mode : str
-            Specifies a mode for computing the Levenshtein distance:
+            ``lev`` for Levenshtein distance or ``osa`` for Optimal String
+            Alignment distance
+        cost : tuple
+            A 4-tuple representing the cost of the four possible edits:
+            inserts, deletes, substitutions, and transpositions, respectively
+        max_distance : int or float
+            The greatest distance of interest
 
-                - ``lev`` (default) computes the ordinary Levenshtein distance,
-                  in which edits may include inserts, deletes, and
-                  substitutions
-                - ``osa`` computes the Optimal String Alignment distance, in
-                  which edits may include inserts, deletes, substitutions, and
-                  transpositions but substrings may only be edited once
+        Returns
+        -------
+        int or float
+            The Levenshtein distance between src & tar, or max_distance + 1 if
+            it exceeds max_distance
+
+        Examples
+        --------
+        >>> Levenshtein._dist_abs_banded('ATCG', 'TAGC', 'lev', (2, 2, 2, 2),
+        ... 6)
+        6
+        >>> Levenshtein._dist_abs_banded('ATCG', 'TAGC', 'lev', (2, 2, 2, 2),
+        ... 4)
+        5
+
+        """
+        ins_cost, del_cost, sub_cost, trans_cost = cost
+        src_len = len(src)
+        tar_len = len(tar)
+        inf = float('inf')
+
+        # No cell further than band from the main diagonal can hold a value
+        # below max_distance.
+        min_indel = min(ins_cost, del_cost)
+        if min_indel > 0:
+            band = int(max_distance // min_indel)
+        else:
+            band = max(src_len, tar_len)
+
+        prev2_row = None
+        prev_row = [
+            j * ins_cost if j <= band else inf for j in range(tar_len + 1)
+        ]
+        prev_min = 0
+        for i in range(1, src_len + 1):
+            row = [inf] * (tar_len + 1)
+            if i <= band:
+                row[0] = i * del_cost
+            row_min = row[0]
+            for j in range(max(1, i - band), min(tar_len, i + band) + 1):
+                val = min(
+                    row[j - 1] + ins_cost,  # ins
+                    prev_row[j] + del_cost,  # del
+                    prev_row[j - 1]
+                    + (sub_cost if src[i - 1] != tar[j - 1] else 0),  # sub/==
+                )
+                if (
+                    mode == 'osa'
+                    and i > 1
+                    and j > 1
+                    and src[i - 1] == tar[j - 2]
+                    and src[i - 2] == tar[j - 1]
+                ):
+                    # transposition
+                    val = min(val, prev2_row[j - 2] + trans_cost)
+                row[j] = val
+                if val < row_min:
+                    row_min = val
+            if row_min > max_distance and prev_min > max_distance:
+                return max_distance + 1
+            prev2_row, prev_row, prev_min = prev_row, row, row_min
+
+        if prev_row[tar_len] > max_distance:
+            return max_distance + 1
+        return prev_row[tar_len]
+
+    @staticmethod
+    def _dist_abs_dp(src, tar, mode, cost):
+        """Return the Levenshtein distance, filling the matrix cell by cell.
 
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        mode : str
+            ``lev`` for Levenshtein distance or ``osa`` for Optimal String
+            Alignment distance
         cost : tuple
             A 4-tuple representing the cost of the four possible edits:
             inserts, deletes, substitutions, and transpositions, respectively
-            (by default: (1, 1, 1, 1))
 
         Returns
         -------
-        int (may return a float if cost has float values)
+        int
             The Levenshtein distance between src & tar
 
         Examples
         --------
-        >>> cmp = Levenshtein()
-        >>> cmp.dist_abs('cat', 'hat')
-        1
-        >>> cmp.dist_abs('Niall', 'Neil')
-        3
-        >>> cmp.dist_abs('aluminum', 'Catalan')
-        7
-        >>> cmp.dist_abs('ATCG', 'TAGC')
-        3
-
-        >>> cmp.dist_abs('ATCG', 'TAGC', mode='osa')
+        >>> Levenshtein._dist_abs_dp('ATCG', 'TAGC', 'osa', (2, 2, 2, 1))
         2
-        >>> cmp.dist_abs('ACTG', 'TAGC', mode='osa')
-        4
 
         """
         ins_cost, del_cost, sub_cost, trans_cost = cost
 
-        if src == tar:
-            return 0
-        if not src:
-            return len(tar) * ins_cost
-        if not tar:
-            return len(src) * del_cost
-
         d_mat = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_int)
         for i in range(len(src) + 1):
             d_mat[i, 0] = i * del_cost
@@ -146,7 +336,165 @@ class Levenshtein(_Distance):
 
         return d_mat[len(src), len(tar)]
 
-    def dist(self, src, tar, mode='lev', cost=(1, 1, 1, 1)):
+    @staticmethod
+    def _dist_abs_wavefront(src, tar, mode, cost):
+        """Return the Levenshtein distance, filling the matrix by wavefront.
+
+        This computes the same matrix as :py:meth:`_dist_abs_dp`, one
+        anti-diagonal at a time, with numpy vector operations.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        mode : str
+            ``lev`` for Levenshtein distance or ``osa`` for Optimal String
+            Alignment distance
+        cost : tuple
+            A 4-tuple representing the cost of the four possible edits:
+            inserts, deletes, substitutions, and transpositions, respectively
+
+        Returns
+        -------
+        int
+            The Levenshtein distance between src & tar
+
+        Examples
+        --------
+        >>> Levenshtein._dist_abs_wavefront('ATCG', 'TAGC', 'osa',
+        ... (2, 2, 2, 1))
+        2
+
+        """
+        ins_cost, del_cost, sub_cost, trans_cost = cost
+        src_codes, tar_codes, alphabet = _char_codes(src, tar)
+        sub_table = np_full((len(alphabet), len(alphabet)), sub_cost)
+        np_fill_diagonal(sub_table, 0)
+
+        return _wavefront_dist(
+            src_codes,
+            tar_codes,
+            sub_table,
+            np_array([i * del_cost for i in range(len(src) + 1)]).astype(
+                np_int
+            ),
+            np_array([j * ins_cost for j in range(len(tar) + 1)]).astype(
+                np_int
+            ),
+            np_full(len(src) + 1, del_cost),
+            np_full(len(tar) + 1, ins_cost),
+            trans_cost if mode == 'osa' else None,
+            np_int,
+        )
+
+    def dist_abs(
+        self, src, tar, mode='lev', cost=(1, 1, 1, 1), max_distance=None
+    ):
+        """Return the Levenshtein distance between two strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        mode : str
+            Specifies a mode for computing the Levenshtein distance:
+
+                - ``lev`` (default) computes the ordinary Levenshtein distance,
+                  in which edits may include inserts, deletes, and
+                  substitutions
+                - ``osa`` computes the Optimal String Alignment distance, in
+                  which edits may include inserts, deletes, substitutions, and
+                  transpositions but substrings may only be edited once
+
+        cost : tuple
+            A 4-tuple representing the cost of the four possible edits:
+            inserts, deletes, substitutions, and transpositions, respectively
+            (by default: (1, 1, 1, 1))
+        max_distance : int
+            If set, only distances up to this value are computed exactly: as
+            soon as the distance is known to exceed max_distance, the
+            computation stops and max_distance + 1 is returned
+
+        Returns
+        -------
+        int (may return a float if cost has float values)
+            The Levenshtein distance between src & tar
+
+        Examples
+        --------
+        >>> cmp = Levenshtein()
+        >>> cmp.dist_abs('cat', 'hat')
+        1
+        >>> cmp.dist_abs('Niall', 'Neil')
+        3
+        >>> cmp.dist_abs('aluminum', 'Catalan')
+        7
+        >>> cmp.dist_abs('ATCG', 'TAGC')
+        3
+
+        >>> cmp.dist_abs('ATCG', 'TAGC', mode='osa')
+        2
+        >>> cmp.dist_abs('ACTG', 'TAGC', mode='osa')
+        4
+
+        >>> cmp.dist_abs('aluminum', 'Catalan', max_distance=2)
+        3
+
+        """
+        ins_cost, del_cost, sub_cost, trans_cost = cost
+
+        if src == tar:
+            return 0
+        if max_distance is not None:
+            # Every length difference must be made up by inserts or deletes.
+            if len(src) < len(tar):
+                min_dist = (len(tar) - len(src)) * ins_cost
+            else:
+                min_dist = (len(src) - len(tar)) * del_cost
+            if min_dist > max_distance:
+                return max_distance + 1
+        if not src:
+            return len(tar) * ins_cost
+        if not tar:
+            return len(src) * del_cost
+
+        # Unit-cost Levenshtein & indel distances of long strings are first
+        # sought by diagonal transition, which is fast if they are similar.
+        indel = (
+            ins_cost == del_cost == 1
+            and sub_cost >= 2
+            and (mode == 'lev' or trans_cost >= 2)
+        )
+        if indel or (tuple(cost) == (1, 1, 1, 1) and mode == 'lev'):
+            budget = _diagonal_budget(len(src), len(tar))
+            if budget and max_distance is not None and max_distance <= budget:
+                distance = _diagonal_dist(src, tar, int(max_distance), indel)
+                return max_distance + 1 if distance is None else distance
+            if budget:
+                distance = _diagonal_dist(src, tar, budget, indel)
+                if distance is not None:
+                    return distance
+
+        if tuple(cost) == (1, 1, 1, 1):
+            # Unit-cost distances are symmetric, so the longer string is used
+            # as the pattern, minimizing the number of loop iterations.
+            if len(src) < len(tar):
+                src, tar = tar, src
+            return self._dist_abs_bitpar(
+                self._pattern_bitmasks(src), len(src), tar, mode, max_distance
+            )
+        if max_distance is not None:
+            return self._dist_abs_banded(src, tar, mode, cost, max_distance)
+
+        if _use_wavefront(len(src), len(tar)):
+            return self._dist_abs_wavefront(src, tar, mode, cost)
+        return self._dist_abs_dp(src, tar, mode, cost)
+
+    def dist(self, src, tar, mode='lev', cost=(1, 1, 1, 1), max_distance=None):
         """Return the normalized Levenshtein distance between two strings.
 
         The Levenshtein distance is normalized by dividing the Levenshtein
@@ -176,6 +524,10 @@ class Levenshtein(_Distance):
             A 4-tuple representing the cost of the four possible edits:
             inserts, deletes, substitutions, and transpositions, respectively
             (by default: (1, 1, 1, 1))
+        max_distance : float
+            If set, only normalized distances up to this value are computed
+            exactly; 1.0 is returned for any pair whose normalized distance
+            exceeds max_distance
 
         Returns
         -------
@@ -193,17 +545,280 @@ class Levenshtein(_Distance):
         0.875
         >>> cmp.dist('ATCG', 'TAGC')
         0.75
+        >>> cmp.dist('ATCG', 'TAGC', max_distance=0.5)
+        1.0
 
         """
         if src == tar:
             return 0
         ins_cost, del_cost = cost[:2]
-        return levenshtein(src, tar, mode, cost) / (
-            max(len(src) * del_cost, len(tar) * ins_cost)
+        normalizer = max(len(src) * del_cost, len(tar) * ins_cost)
+        if max_distance is None:
+            return self.dist_abs(src, tar, mode, cost) / normalizer
+
+        max_distance *= normalizer
+        distance = self.dist_abs(src, tar, mode, cost, max_distance)
+        if distance > max_distance:
+            return 1.0
+        return distance / normalizer
+
+    def dist_many(
+        self,
+        src,
+        targets,
+        mode='lev',
+        cost=(1, 1, 1, 1),
+        max_distance=None,
+    ):
+        """Return the normalized Levenshtein distances to many strings.
+
+        For unit costs, the bit-vector match masks of src are computed just
+        once and reused for every target.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable
+            Target strings for comparison
+        mode : str
+            Specifies a mode for computing the Levenshtein distance:
+
+                - ``lev`` (default) computes the ordinary Levenshtein distance,
+                  in which edits may include inserts, deletes, and
+                  substitutions
+                - ``osa`` computes the Optimal String Alignment distance, in
+                  which edits may include inserts, deletes, substitutions, and
+                  transpositions but substrings may only be edited once
+
+        cost : tuple
+            A 4-tuple representing the cost of the four possible edits:
+            inserts, deletes, substitutions, and transpositions, respectively
+            (by default: (1, 1, 1, 1))
+        max_distance : float
+            If set, only normalized distances up to this value are computed
+            exactly; 1.0 is returned for any pair whose normalized distance
+            exceeds max_distance
+
+        Returns
+        -------
+        numpy.ndarray
+            The normalized Levenshtein distance between src & each target
+
+        Examples
+        --------
+        >>> cmp = Levenshtein()
+        >>> cmp.dist_many('cat', ['hat', 'cat', 'chat', 'dog'])
+        array([0.33333333, 0.        , 0.25      , 1.        ])
+
+        """
+        if not src or tuple(cost) != (1, 1, 1, 1):
+            return super(Levenshtein, self).dist_many(
+                src, targets, mode, cost, max_distance
+            )
+
+        peq = self._pattern_bitmasks(src)
+        src_len = len(src)
+        dists = []
+        for tar in targets:
+            if tar == src:
+                dists.append(0.0)
+                continue
+            normalizer = max(src_len, len(tar))
+            if max_distance is None:
+                dists.append(
+                    self._dist_abs_bitpar(peq, src_len, tar, mode) / normalizer
+                )
+                continue
+
+            max_abs = max_distance * normalizer
+            if abs(src_len - len(tar)) > max_abs:
+                dists.append(1.0)
+                continue
+            distance = self._dist_abs_bitpar(peq, src_len, tar, mode, max_abs)
+            dists.append(1.0 if distance > max_abs else distance / normalizer)
+
+        return np_array(dists, dtype=np_float64)
+
+    def sim_many(self, src, targets, *args, **kwargs):
+        """Return the normalized Levenshtein similarities to many strings.
+
+        For unit costs, the bit-vector match masks of src are computed just
+        once and reused for every target, as by :py:meth:`dist_many`.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable
+            Target strings for comparison
+        *args
+            Variable length argument list, as for :py:meth:`dist_many`
+        **kwargs
+            Arbitrary keyword arguments, as for :py:meth:`dist_many`
+
+        Returns
+        -------
+        numpy.ndarray
+            The normalized Levenshtein similarity between src & each target
+
+        Examples
+        --------
+        >>> cmp = Levenshtein()
+        >>> cmp.sim_many('cat', ['hat', 'cat', 'chat', 'dog'])
+        array([0.66666667, 1.        , 0.75      , 0.        ])
+
+        """
+        return 1.0 - self.dist_many(src, targets, *args, **kwargs)
+
+    def dist_abs_pairs(self, pairs, mode='lev', cost=(1, 1, 1, 1)):
+        """Return the Levenshtein distances of many pairs of strings.
+
+        The pairs are computed in batches: the dynamic programming matrices
+        of a batch are filled together, with numpy operations across the
+        batch, so the number of interpreted steps depends on the lengths of
+        the strings but not on the number of pairs.
+
+        Parameters
+        ----------
+        pairs : iterable
+            (src, tar) pairs of strings for comparison
+        mode : str
+            Specifies a mode for computing the Levenshtein distance:
+
+                - ``lev`` (default) computes the ordinary Levenshtein distance,
+                  in which edits may include inserts, deletes, and
+                  substitutions
+                - ``osa`` computes the Optimal String Alignment distance, in
+                  which edits may include inserts, deletes, substitutions, and
+                  transpositions but substrings may only be edited once
+
+        cost : tuple
+            A 4-tuple representing the cost of the four possible edits:
+            inserts, deletes, substitutions, and transpositions, respectively
+            (by default: (1, 1, 1, 1))
+
+        Returns
+        -------
+        numpy.ndarray
+            The Levenshtein distance of each pair, as floats
+
+        Examples
+        --------
+        >>> cmp = Levenshtein()
+        >>> cmp.dist_abs_pairs([('cat', 'hat'), ('Niall', 'Neil'),
+        ... ('aluminum', 'Catalan'), ('ATCG', 'TAGC')])
+        array([1., 3., 7., 3.])
+        >>> cmp.dist_abs_pairs([('ATCG', 'TAGC'), ('ACTG', 'TAGC')],
+        ... mode='osa')
+        array([2., 4.])
+
+        """
+        ins_cost, del_cost, sub_cost, trans_cost = cost
+        pairs = list(pairs)
+        dists = _pairs_edit_dist(
+            pairs,
+            ins_cost,
+            del_cost,
+            sub_cost,
+            trans_cost if mode == 'osa' else None,
+            np_int,
+        )
+        # dist_abs does not round the distances to or from an empty string
+        for pos, (src, tar) in enumerate(pairs):
+            if src != tar and not (src and tar):
+                dists[pos] = len(tar) * ins_cost + len(src) * del_cost
+        return dists
+
+    def dist_pairs(self, pairs, mode='lev', cost=(1, 1, 1, 1)):
+        """Return the normalized Levenshtein distances of many pairs.
+
+        The distances are computed in batches, as by
+        :py:meth:`dist_abs_pairs`.
+
+        Parameters
+        ----------
+        pairs : iterable
+            (src, tar) pairs of strings for comparison
+        mode : str
+            Specifies a mode for computing the Levenshtein distance:
+
+                - ``lev`` (default) computes the ordinary Levenshtein distance,
+                  in which edits may include inserts, deletes, and
+                  substitutions
+                - ``osa`` computes the Optimal String Alignment distance, in
+                  which edits may include inserts, deletes, substitutions, and
+                  transpositions but substrings may only be edited once
+
+        cost : tuple
+            A 4-tuple representing the cost of the four possible edits:
+            inserts, deletes, substitutions, and transpositions, respectively
+            (by default: (1, 1, 1, 1))
+
+        Returns
+        -------
+        numpy.ndarray
+            The normalized Levenshtein distance of each pair
+
+        Examples
+        --------
+        >>> cmp = Levenshtein()
+        >>> cmp.dist_pairs([('cat', 'hat'), ('Niall', 'Neil'), ('', '')])
+        array([0.33333333, 0.6       , 0.        ])
+
+        """
+        ins_cost, del_cost = cost[:2]
+        pairs = list(pairs)
+        normalizers = np_array(
+            [
+                max(len(src) * del_cost, len(tar) * ins_cost) or 1
+                for src, tar in pairs
+            ],
+            dtype=np_float64,
         )
+        return self.dist_abs_pairs(pairs, mode, cost) / normalizers
+
+    def sim_pairs(self, pairs, mode='lev', cost=(1, 1, 1, 1)):
+        """Return the normalized Levenshtein similarities of many pairs.
+
+        The distances are computed in batches, as by
+        :py:meth:`dist_abs_pairs`.
+
+        Parameters
+        ----------
+        pairs : iterable
+            (src, tar) pairs of strings for comparison
+        mode : str
+            Specifies a mode for computing the Levenshtein distance:
+
+                - ``lev`` (default) computes the ordinary Levenshtein distance,
+                  in which edits may include inserts, deletes, and
+                  substitutions
+                - ``osa`` computes the Optimal String Alignment distance, in
+                  which edits may include inserts, deletes, substitutions, and
+                  transpositions but substrings may only be edited once
+
+        cost : tuple
+            A 4-tuple representing the cost of the four possible edits:
+            inserts, deletes, substitutions, and transpositions, respectively
+            (by default: (1, 1, 1, 1))
+
+        Returns
+        -------
+        numpy.ndarray
+            The normalized Levenshtein similarity of each pair
+
+        Examples
+        --------
+        >>> cmp = Levenshtein()
+        >>> cmp.sim_pairs([('cat', 'hat'), ('Niall', 'Neil'), ('', '')])
+        array([0.66666667, 0.4       , 1.        ])
+
+        """
+        return 1.0 - self.dist_pairs(pairs, mode, cost)
 
 
-def levenshtein(src, tar, mode='lev', cost=(1, 1, 1, 1)):
+def levenshtein(src, tar, mode='lev', cost=(1, 1, 1, 1), max_distance=None):
     """Return the Levenshtein distance between two strings.
 
     This is a wrapper of :py:meth:`Levenshtein.dist_abs`.
@@ -227,6 +842,10 @@ def levenshtein(src, tar, mode='lev', cost=(1, 1, 1, 1)):
         A 4-tuple representing the cost of the four possible edits: inserts,
         deletes, substitutions, and transpositions, respectively (by default:
         (1, 1, 1, 1))
+    max_distance : int
+        If set, only distances up to this value are computed exactly: as soon
+        as the distance is known to exceed max_distance, the computation stops
+        and max_distance + 1 is returned
 
     Returns
     -------
@@ -250,10 +869,12 @@ def levenshtein(src, tar, mode='lev', cost=(1, 1, 1, 1)):
     4
 
     """
-    return Levenshtein().dist_abs(src, tar, mode, cost)
+    return Levenshtein().dist_abs(src, tar, mode, cost, max_distance)
 
 
-def dist_levenshtein(src, tar, mode='lev', cost=(1, 1, 1, 1)):
+def dist_levenshtein(
+    src, tar, mode='lev', cost=(1, 1, 1, 1), max_distance=None
+):
     """Return the normalized Levenshtein distance between two strings.
 
     This is a wrapper of :py:meth:`Levenshtein.dist`.
@@ -277,6 +898,10 @@ def dist_levenshtein(src, tar, mode='lev', cost=(1, 1, 1, 1)):
         A 4-tuple representing the cost of the four possible edits: inserts,
         deletes, substitutions, and transpositions, respectively (by default:
         (1, 1, 1, 1))
+    max_distance : float
+        If set, only normalized distances up to this value are computed
+        exactly; 1.0 is returned for any pair whose normalized distance exceeds
+        max_distance
 
     Returns
     -------
@@ -295,7 +920,7 @@ def dist_levenshtein(src, tar, mode='lev', cost=(1, 1, 1, 1)):
     0.75
 
     """
-    return Levenshtein().dist(src, tar, mode, cost)
+    return Levenshtein().dist(src, tar, mode, cost, max_distance)
 
 
 def sim_levenshtein(src, tar, mode='lev', cost=(1, 1, 1, 1)):
@@ -145,6 +145,72 @@ class Minkowski(_TokenDistance):
         """
         return self.dist_abs(src, tar, qval, pval, True, alphabet)
 
+    def sim_many(self, src, targets, qval=2, *args, **kwargs):
+        """Return the similarities of one string to each of many strings.
+
+        The Q-Grams of src are computed just once and reused for every
+        target.
+
+        Parameters
+        ----------
+        src : str
+            Source string (or QGrams/Counter object) for comparison
+        targets : iterable
+            Target strings (or QGrams/Counter objects) for comparison
+        qval : int
+            The length of each q-gram; 0 for non-q-gram version
+        *args
+            Variable length argument list, as for sim
+        **kwargs
+            Arbitrary keyword arguments, as for sim
+
+        Returns
+        -------
+        numpy.ndarray
+            The similarity of src to each target, as floats
+
+        Examples
+        --------
+        >>> cmp = Minkowski()
+        >>> cmp.sim_many('cat', ['hat', 'cat', 'dog'])
+        array([0.5, 1. , 0. ])
+
+        """
+        return self._many(self.sim, src, targets, qval, *args, **kwargs)
+
+    def dist_many(self, src, targets, qval=2, *args, **kwargs):
+        """Return the distances of one string to each of many strings.
+
+        The Q-Grams of src are computed just once and reused for every
+        target.
+
+        Parameters
+        ----------
+        src : str
+            Source string (or QGrams/Counter object) for comparison
+        targets : iterable
+            Target strings (or QGrams/Counter objects) for comparison
+        qval : int
+            The length of each q-gram; 0 for non-q-gram version
+        *args
+            Variable length argument list, as for dist
+        **kwargs
+            Arbitrary keyword arguments, as for dist
+
+        Returns
+        -------
+        numpy.ndarray
+            The distance of src to each target, as floats
+
+        Examples
+        --------
+        >>> cmp = Minkowski()
+        >>> cmp.dist_many('cat', ['hat', 'cat', 'dog'])
+        array([0.5, 0. , 1. ])
+
+        """
+        return self._many(self.dist, src, targets, qval, *args, **kwargs)
+
 
 def minkowski(src, tar, qval=2, pval=1, normalized=False, alphabet=None):
     """Return the Minkowski distance (:math:`L^p`-norm) of two strings.
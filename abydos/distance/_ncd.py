@@ -0,0 +1,507 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2014-2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._ncd.
+
+The distance._ncd module implements abstract class _NCD.
+"""
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+from collections import OrderedDict
+from hashlib import sha1
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
+from threading import Lock
+
+from numpy import float64 as np_float64
+from numpy import zeros as np_zeros
+
+from six.moves import range
+
+from ._distance import _Distance
+
+
+class _NCD(_Distance):
+    """Abstract Normalized Compression Distance class.
+
+    Normalized compression distance (NCD) :cite:`Cilibrasi:2005`.
+
+    The NCD of two strings depends on the compressed size of each string, C(x),
+    and of their concatenations. The compressed sizes of single strings are
+    kept in a bounded least-recently-used cache, keyed by a hash of their
+    UTF-8 encoding (so that long strings are not retained), and the many &
+    matrix methods compress each member of a collection just once, so that
+    comparing n strings with each other takes n compressions of single
+    strings & n(n-1) of concatenations.
+
+    Subclasses supply the compressor, as :py:meth:`_compress`. If it releases
+    the GIL while compressing (as zlib, bzip2, and LZMA do) and is safe to
+    call from several threads at once, they set _releases_gil, and the many &
+    matrix methods may then spread the comparisons over a pool of threads.
+    """
+
+    _cache_size = 1024
+    _sizes = None
+    _lock = None
+    _releases_gil = False
+
+    def __init__(self, cache_size=1024):
+        """Initialize the cache of compressed sizes.
+
+        Parameters
+        ----------
+        cache_size : int
+            The greatest number of compressed sizes of single strings to keep
+
+        """
+        self._cache_size = cache_size
+        self._sizes = OrderedDict()
+        self._lock = Lock()
+
+    def __getstate__(self):
+        """Return the state to pickle, without the cache's lock.
+
+        Returns
+        -------
+        dict
+            The instance's attributes, but for the lock
+
+        Examples
+        --------
+        >>> import pickle
+        >>> from abydos.distance import NCDrle
+        >>> cmp = NCDrle()
+        >>> cmp._size('aaabaabababa')
+        11
+        >>> cmp = pickle.loads(pickle.dumps(cmp))
+        >>> len(cmp._sizes)
+        1
+
+        """
+        state = self.__dict__.copy()
+        state.pop('_lock', None)
+        return state
+
+    def __setstate__(self, state):
+        """Restore the pickled state, with a new lock for the cache.
+
+        Parameters
+        ----------
+        state : dict
+            The instance's attributes, but for the lock
+
+        """
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def _compress(self, text):
+        """Return the compressed size of a string.
+
+        Parameters
+        ----------
+        text : str
+            The string to compress
+
+        Returns
+        -------
+        int
+            The size of the compressed string
+
+        Raises
+        ------
+        NotImplementedError
+            Method disabled for _NCD.
+
+        """
+        raise NotImplementedError(
+            'Method disabled for {}.'.format(type(self).__name__)
+        )
+
+    def _size(self, text):
+        """Return the compressed size of a string, from the cache if possible.
+
+        Parameters
+        ----------
+        text : str
+            The string to compress
+
+        Returns
+        -------
+        int
+            The size of the compressed string
+
+        Examples
+        --------
+        >>> from abydos.distance import NCDrle
+        >>> cmp = NCDrle()
+        >>> cmp._size('aaabaabababa')
+        11
+        >>> len(cmp._sizes)
+        1
+
+        """
+        return self._sizes_of([text])[0]
+
+    def _sizes_of(self, texts, pool=None):
+        """Return the compressed sizes of strings, from the cache if possible.
+
+        Each distinct string missing from the cache is compressed just once.
+
+        Parameters
+        ----------
+        texts : list
+            The strings to compress
+        pool : multiprocessing.pool.ThreadPool
+            A pool of threads in which to compress the strings, or None to
+            compress them in this thread
+
+        Returns
+        -------
+        list
+            The size of each compressed string
+
+        Examples
+        --------
+        >>> from abydos.distance import NCDrle
+        >>> cmp = NCDrle(cache_size=2)
+        >>> cmp._sizes_of(['aaab', 'baaa', 'aaab', 'abab'])
+        [3, 3, 3, 4]
+        >>> len(cmp._sizes)
+        2
+
+        """
+        keys = [sha1(text.encode('utf-8')).digest() for text in texts]
+        known = {}
+        missing = OrderedDict()
+        with self._lock:
+            for key, text in zip(keys, texts):
+                if key in known or key in missing:
+                    continue
+                if key in self._sizes:
+                    # Mark it as the most recently used
+                    known[key] = self._sizes.pop(key)
+                    self._sizes[key] = known[key]
+                else:
+                    missing[key] = text
+
+        if missing:
+            texts = list(missing.values())
+            if pool is None:
+                sizes = [self._compress(text) for text in texts]
+            else:
+                sizes = pool.map(self._compress, texts)
+            with self._lock:
+                for key, size in zip(missing, sizes):
+                    known[key] = size
+                    if self._cache_size > 0:
+                        if len(self._sizes) >= self._cache_size:
+                            self._sizes.popitem(last=False)
+                        self._sizes[key] = size
+
+        return [known[key] for key in keys]
+
+    def _clear_cache(self):
+        """Empty the cache of compressed sizes.
+
+        Subclasses call this when their compressor is changed.
+
+        Examples
+        --------
+        >>> from abydos.distance import NCDrle
+        >>> cmp = NCDrle()
+        >>> cmp._size('aaabaabababa')
+        11
+        >>> cmp._clear_cache()
+        >>> len(cmp._sizes)
+        0
+
+        """
+        with self._lock:
+            self._sizes.clear()
+
+    def _ncd(self, src, tar, src_size, tar_size):
+        """Return the NCD between two strings, given their compressed sizes.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        src_size : int
+            The compressed size of src
+        tar_size : int
+            The compressed size of tar
+
+        Returns
+        -------
+        float
+            Compression distance
+
+        Examples
+        --------
+        >>> from abydos.distance import NCDrle
+        >>> cmp = NCDrle()
+        >>> cmp._ncd('aaab', 'aaac', 3, 3)
+        1.0
+        >>> cmp._ncd('aaab', 'baaa', 3, 3)
+        0.3333333333333333
+
+        """
+        if src == tar:
+            return 0.0
+
+        concat_size = min(self._compress(src + tar), self._compress(tar + src))
+        return (concat_size - min(src_size, tar_size)) / max(
+            src_size, tar_size
+        )
+
+    def dist(self, src, tar):
+        """Return the NCD between two strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+
+        Returns
+        -------
+        float
+            Compression distance
+
+        Examples
+        --------
+        >>> from abydos.distance import NCDrle
+        >>> cmp = NCDrle()
+        >>> cmp.dist('aaab', 'baaa')
+        0.3333333333333333
+
+        """
+        if src == tar:
+            return 0.0
+        return self._ncd(src, tar, self._size(src), self._size(tar))
+
+    def dist_many(self, src, targets, n_jobs=1):
+        """Return the NCDs between one string & each of many strings.
+
+        src is compressed just once, as is each distinct target.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable
+            Target strings for comparison
+        n_jobs : int
+            The number of threads to use, as for :py:meth:`dist_matrix`
+
+        Returns
+        -------
+        numpy.ndarray
+            Compression distance between src & each target
+
+        Examples
+        --------
+        >>> from abydos.distance import NCDrle
+        >>> cmp = NCDrle()
+        >>> cmp.dist_many('aaab', ['aaab', 'baaa', 'aaac'])
+        array([0.        , 0.33333333, 1.        ])
+
+        """
+        return self.dist_matrix([src], targets, n_jobs)[0]
+
+    def sim_many(self, src, targets, *args, **kwargs):
+        """Return the NCD similarities between one string & many strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable
+            Target strings for comparison
+        *args
+            Variable length argument list, as for dist_many
+        **kwargs
+            Arbitrary keyword arguments, as for dist_many
+
+        Returns
+        -------
+        numpy.ndarray
+            Compression similarity between src & each target
+
+        Examples
+        --------
+        >>> from abydos.distance import NCDrle
+        >>> cmp = NCDrle()
+        >>> cmp.sim_many('aaab', ['aaab', 'baaa', 'aaac'])
+        array([1.        , 0.66666667, 0.        ])
+
+        """
+        return 1.0 - self.dist_many(src, targets, *args, **kwargs)
+
+    def dist_matrix(self, src_collection, tar_collection=None, n_jobs=1):
+        """Return the matrix of NCDs between two collections.
+
+        Every member of each collection is compressed just once. If
+        tar_collection is None, the NCD being symmetric, each pair of members
+        of src_collection is compared just once.
+
+        Parameters
+        ----------
+        src_collection : iterable
+            Source strings for comparison
+        tar_collection : iterable
+            Target strings for comparison; if None, the members of
+            src_collection are compared with each other
+        n_jobs : int
+            The number of threads to use; None or a value less than 1 uses one
+            per available CPU. Only compressors that release the GIL (zlib,
+            bzip2, and LZMA) use threads; others compare every pair in this
+            thread.
+
+        Returns
+        -------
+        numpy.ndarray
+            Compression distance between each source (row) & each target
+            (column)
+
+        Examples
+        --------
+        >>> from abydos.distance import NCDrle
+        >>> cmp = NCDrle()
+        >>> cmp.dist_matrix(['aaab', 'baaa', 'aaac'])
+        array([[0.        , 0.33333333, 1.        ],
+               [0.33333333, 0.        , 0.33333333],
+               [1.        , 0.33333333, 0.        ]])
+
+        """
+        src_collection = list(src_collection)
+        symmetric = tar_collection is None
+        tar_collection = src_collection if symmetric else list(tar_collection)
+        dists = np_zeros(
+            (len(src_collection), len(tar_collection)), dtype=np_float64
+        )
+
+        if n_jobs is None or n_jobs < 1:
+            n_jobs = cpu_count()
+        if not self._releases_gil:
+            n_jobs = 1
+        pool = ThreadPool(n_jobs) if n_jobs > 1 else None
+        try:
+            src_sizes = self._sizes_of(src_collection, pool)
+            tar_sizes = (
+                src_sizes
+                if symmetric
+                else self._sizes_of(tar_collection, pool)
+            )
+
+            # Divide the pairs into runs of columns of a row, roughly four
+            # per thread in all
+            if symmetric:
+                starts = [i + 1 for i in range(len(src_collection))]
+            else:
+                starts = [0] * len(src_collection)
+            chunk_size = max(
+                sum(len(tar_collection) - start for start in starts)
+                // (n_jobs * 4),
+                1,
+            )
+            blocks = [
+                (i, j, min(j + chunk_size, len(tar_collection)))
+                for i, start in enumerate(starts)
+                for j in range(start, len(tar_collection), chunk_size)
+            ]
+
+            def _fill_block(block):
+                """Fill in the distances of one run of columns of a row.
+
+                Parameters
+                ----------
+                block : tuple
+                    The row, and the first & last (exclusive) columns
+
+                """
+                i, start, stop = block
+                for j in range(start, stop):
+                    dists[i, j] = self._ncd(
+                        src_collection[i],
+                        tar_collection[j],
+                        src_sizes[i],
+                        tar_sizes[j],
+                    )
+                    if symmetric:
+                        dists[j, i] = dists[i, j]
+
+            if pool is None:
+                for block in blocks:
+                    _fill_block(block)
+            else:
+                pool.map(_fill_block, blocks, chunksize=1)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        return dists
+
+    def sim_matrix(self, src_collection, tar_collection=None, *args, **kwargs):
+        """Return the matrix of NCD similarities between two collections.
+
+        Parameters
+        ----------
+        src_collection : iterable
+            Source strings for comparison
+        tar_collection : iterable
+            Target strings for comparison; if None, the members of
+            src_collection are compared with each other
+        *args
+            Variable length argument list, as for dist_matrix
+        **kwargs
+            Arbitrary keyword arguments, as for dist_matrix
+
+        Returns
+        -------
+        numpy.ndarray
+            Compression similarity between each source (row) & each target
+            (column)
+
+        Examples
+        --------
+        >>> from abydos.distance import NCDrle
+        >>> cmp = NCDrle()
+        >>> cmp.sim_matrix(['aaab', 'baaa'], ['aaab', 'aaac'])
+        array([[1.        , 0.        ],
+               [0.66666667, 0.66666667]])
+
+        """
+        return 1.0 - self.dist_matrix(
+            src_collection, tar_collection, *args, **kwargs
+        )
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -28,13 +28,16 @@ from __future__ import (
     unicode_literals,
 )
 
-from ._distance import _Distance
+from numpy import array as np_array
+from numpy import float64 as np_float64
+
+from ._ncd import _NCD
 from ..compression import Arithmetic
 
 __all__ = ['NCDarith', 'dist_ncd_arith', 'sim_ncd_arith']
 
 
-class NCDarith(_Distance):
+class NCDarith(_NCD):
     """Normalized Compression Distance using arithmetic coding.
 
     Cf. https://en.wikipedia.org/wiki/Arithmetic_coding
@@ -43,10 +46,156 @@ class NCDarith(_Distance):
     """
 
     _coder = None
+    _precision = None
+    _probs = None
+    _trained_probs = None
+
+    def __init__(self, precision=None, cache_size=1024, probs=None):
+        """Initialize the arithmetic coder object.
 
-    def __init__(self):
-        """Initialize the arithmetic coder object."""
+        Parameters
+        ----------
+        precision : int
+            The number of bits of the integers used in fixed-precision
+            arithmetic coding (e.g. 32), or None to use exact arithmetic,
+            which slows with the square of the length of the strings
+        cache_size : int
+            The greatest number of compressed sizes of single strings to keep
+        probs : dict
+            A dictionary trained with :py:meth:`Arithmetic.train` (or
+            :py:meth:`train`), to use whenever the methods are not passed
+            one, so that one training may be shared by many instances
+
+        """
+        super(NCDarith, self).__init__(cache_size)
         self._coder = Arithmetic()
+        self._precision = precision
+        if probs is not None:
+            self._trained_probs = dict(probs)
+
+    def _compress(self, text):
+        """Return the arithmetically coded size of a string, in bits.
+
+        Parameters
+        ----------
+        text : str
+            The string to compress
+
+        Returns
+        -------
+        int
+            The size of the compressed string
+
+        Raises
+        ------
+        ValueError
+            A character of the strings is absent from the coder's probabilities
+
+        Examples
+        --------
+        >>> cmp = NCDarith()
+        >>> cmp._set_probs(Arithmetic('aaabaabababa').get_probs())
+        >>> cmp._compress('aaabaabababa')
+        18
+
+        """
+        try:
+            return self._coder.encode(text, self._precision)[1]
+        except KeyError as err:
+            raise ValueError(
+                'The character {!r} is absent from the coder\'s '
+                'probabilities.'.format(err.args[0])
+            )
+
+    def _set_probs(self, probs):
+        """Set the coder's probabilities, emptying the cache if they change.
+
+        Parameters
+        ----------
+        probs : dict
+            A dictionary trained with :py:meth:`Arithmetic.train`
+
+        Examples
+        --------
+        >>> cmp = NCDarith()
+        >>> cmp._set_probs(Arithmetic('aaabaabababa').get_probs())
+        >>> cmp._size('aaabaabababa')
+        18
+        >>> cmp._set_probs(Arithmetic('aaabaabababa').get_probs())
+        >>> len(cmp._sizes)
+        1
+        >>> cmp._set_probs(Arithmetic('abc').get_probs())
+        >>> len(cmp._sizes)
+        0
+
+        """
+        if probs != self._probs:
+            self._coder.set_probs(probs)
+            self._probs = dict(probs)
+            self._clear_cache()
+
+    def _train(self, text):
+        """Train the coder on a text, emptying the cache.
+
+        Parameters
+        ----------
+        text : str
+            The training text
+
+        """
+        self._coder.train(text)
+        self._probs = None
+        self._clear_cache()
+
+    def train(self, text):
+        """Train the coder on a sample text, for use with all strings.
+
+        Without a trained dictionary, the coder is retrained on each pair of
+        strings compared, so that every pair's strings are compressed afresh.
+        Once trained, on a text representative of the strings to compare,
+        the compressed size of each string is cached & reused.
+
+        The coder has no probability for characters absent from the text, so
+        comparing strings that contain any such character raises a
+        ValueError. The text should therefore include every character of the
+        strings to be compared (e.g. their alphabet, if the sample lacks some
+        of it).
+
+        Parameters
+        ----------
+        text : str
+            The training text
+
+        Examples
+        --------
+        >>> cmp = NCDarith()
+        >>> cmp.train('Niall Neal Neil Nigel Njall')
+        >>> cmp.dist('Niall', 'Neil')
+        0.6842105263157895
+        >>> cmp2 = NCDarith(probs=cmp.get_probs())
+        >>> cmp2.dist('Niall', 'Neil')
+        0.6842105263157895
+
+        """
+        self._trained_probs = Arithmetic(text).get_probs()
+
+    def get_probs(self):
+        """Return the dictionary trained with :py:meth:`train`.
+
+        Returns
+        -------
+        dict
+            The trained dictionary, or None if the coder is retrained on each
+            pair of strings
+
+        Examples
+        --------
+        >>> cmp = NCDarith()
+        >>> cmp.get_probs() is None
+        True
+
+        """
+        return self._trained_probs
 
     def dist(self, src, tar, probs=None):
         """Return the NCD between two strings using arithmetic coding.
@@ -58,13 +207,19 @@ class NCDarith(_Distance):
         tar : str
             Target string for comparison
         probs : dict
-            A dictionary trained with :py:meth:`Arithmetic.train`
+            A dictionary trained with :py:meth:`Arithmetic.train`, or None to
+            use that from :py:meth:`train`
 
         Returns
         -------
         float
             Compression distance
 
+        Raises
+        ------
+        ValueError
+            A character of the strings is absent from the coder's probabilities
+
         Examples
         --------
         >>> cmp = NCDarith()
@@ -77,24 +232,114 @@ class NCDarith(_Distance):
         >>> cmp.dist('ATCG', 'TAGC')
         0.6923076923076923
 
+        >>> cmp = NCDarith(precision=32)
+        >>> cmp.dist('Niall', 'Neil')
+        0.75
+
         """
         if src == tar:
             return 0.0
 
+        if probs is None:
+            probs = self._trained_probs
         if probs is None:
             # lacking a reasonable dictionary, train on the strings themselves
-            self._coder.train(src + tar)
+            self._train(src + tar)
         else:
-            self._coder.set_probs(probs)
+            self._set_probs(probs)
 
-        src_comp = self._coder.encode(src)[1]
-        tar_comp = self._coder.encode(tar)[1]
-        concat_comp = self._coder.encode(src + tar)[1]
-        concat_comp2 = self._coder.encode(tar + src)[1]
+        return super(NCDarith, self).dist(src, tar)
 
-        return (
-            min(concat_comp, concat_comp2) - min(src_comp, tar_comp)
-        ) / max(src_comp, tar_comp)
+    def dist_many(self, src, targets, probs=None, n_jobs=1):
+        """Return the NCDs between one string & each of many strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable
+            Target strings for comparison
+        probs : dict
+            A dictionary trained with :py:meth:`Arithmetic.train`; lacking
+            one (or one from :py:meth:`train`), the coder is trained on each
+            pair of strings in turn, so that src is compressed once per
+            target
+        n_jobs : int
+            Accepted for compatibility with the other NCD classes, but
+            ignored: the arithmetic coder holds the GIL, so every pair is
+            compared in this thread
+
+        Returns
+        -------
+        numpy.ndarray
+            Compression distance between src & each target
+
+        Examples
+        --------
+        >>> cmp = NCDarith()
+        >>> cmp.dist_many('Niall', ['Neil', 'Niall'])
+        array([0.6875, 0.    ])
+
+        """
+        return self.dist_matrix([src], targets, probs, n_jobs)[0]
+
+    def dist_matrix(
+        self, src_collection, tar_collection=None, probs=None, n_jobs=1
+    ):
+        """Return the matrix of NCDs between two collections.
+
+        Parameters
+        ----------
+        src_collection : iterable
+            Source strings for comparison
+        tar_collection : iterable
+            Target strings for comparison; if None, the members of
+            src_collection are compared with each other
+        probs : dict
+            A dictionary trained with :py:meth:`Arithmetic.train`; lacking
+            one (or one from :py:meth:`train`), the coder is trained on each
+            pair of strings in turn, so that every string is compressed once
+            per pair
+        n_jobs : int
+            Accepted for compatibility with the other NCD classes, but
+            ignored: the arithmetic coder holds the GIL, so every pair is
+            compared in this thread
+
+        Returns
+        -------
+        numpy.ndarray
+            Compression distance between each source (row) & each target
+            (column)
+
+        Examples
+        --------
+        >>> cmp = NCDarith()
+        >>> probs = Arithmetic('Niall Neil Nigel').get_probs()
+        >>> cmp.dist_matrix(['Niall', 'Neil', 'Nigel'], probs=probs)
+        array([[0.        , 0.68421053, 0.7       ],
+               [0.68421053, 0.        , 0.7       ],
+               [0.7       , 0.7       , 0.        ]])
+
+        """
+        if probs is None:
+            probs = self._trained_probs
+        if probs is not None:
+            self._set_probs(probs)
+            return super(NCDarith, self).dist_matrix(
+                src_collection, tar_collection
+            )
+
+        src_collection = list(src_collection)
+        tar_collection = (
+            src_collection if tar_collection is None else list(tar_collection)
+        )
+        return np_array(
+            [
+                [self.dist(src, tar) for tar in tar_collection]
+                for src in src_collection
+            ],
+            dtype=np_float64,
+        )
 
 
 def dist_ncd_arith(src, tar, probs=None):
@@ -45,6 +45,28 @@ class NCDbwtrle(NCDrle):
 
     _bwt = BWT()
 
+    def _compress(self, text):
+        """Return the length of the RLE of a string's BWT.
+
+        Parameters
+        ----------
+        text : str
+            The string to compress
+
+        Returns
+        -------
+        int
+            The length of the encoded string
+
+        Examples
+        --------
+        >>> cmp = NCDbwtrle()
+        >>> cmp._compress('aaabaabababa')
+        10
+
+        """
+        return len(self._rle.encode(self._bwt.encode(text)))
+
     def dist(self, src, tar):
         """Return the NCD between two strings using BWT plus RLE.
 
@@ -73,18 +95,7 @@ class NCDbwtrle(NCDrle):
         0.8
 
         """
-        if src == tar:
-            return 0.0
-
-        src_comp = self._rle.encode(self._bwt.encode(src))
-        tar_comp = self._rle.encode(self._bwt.encode(tar))
-        concat_comp = self._rle.encode(self._bwt.encode(src + tar))
-        concat_comp2 = self._rle.encode(self._bwt.encode(tar + src))
-
-        return (
-            min(len(concat_comp), len(concat_comp2))
-            - min(len(src_comp), len(tar_comp))
-        ) / max(len(src_comp), len(tar_comp))
+        return super(NCDbwtrle, self).dist(src, tar)
 
 
 def dist_ncd_bwtrle(src, tar):
@@ -30,12 +30,12 @@ from __future__ import (
 
 import bz2
 
-from ._distance import _Distance
+from ._ncd import _NCD
 
 __all__ = ['NCDbz2', 'dist_ncd_bz2', 'sim_ncd_bz2']
 
 
-class NCDbz2(_Distance):
+class NCDbz2(_NCD):
     """Normalized Compression Distance using bzip2 compression.
 
     Cf. https://en.wikipedia.org/wiki/Bzip2
@@ -44,18 +44,44 @@ class NCDbz2(_Distance):
     """
 
     _level = 9
+    _releases_gil = True
 
-    def __init__(self, level=9):
+    def __init__(self, level=9, cache_size=1024):
         """Initialize bzip2 compressor.
 
         Parameters
         ----------
         level : int
             The compression level (0 to 9)
+        cache_size : int
+            The greatest number of compressed sizes of single strings to keep
 
         """
+        super(NCDbz2, self).__init__(cache_size)
         self._level = level
 
+    def _compress(self, text):
+        """Return the bzip2 compressed size of a string, without its header.
+
+        Parameters
+        ----------
+        text : str
+            The string to compress
+
+        Returns
+        -------
+        int
+            The size of the compressed string
+
+        Examples
+        --------
+        >>> cmp = NCDbz2()
+        >>> cmp._compress('aaabaabababa')
+        30
+
+        """
+        return len(bz2.compress(text.encode('utf-8'), self._level)[10:])
+
     def dist(self, src, tar):
         """Return the NCD between two strings using bzip2 compression.
 
@@ -84,21 +110,7 @@ class NCDbz2(_Distance):
         0.03125
 
         """
-        if src == tar:
-            return 0.0
-
-        src = src.encode('utf-8')
-        tar = tar.encode('utf-8')
-
-        src_comp = bz2.compress(src, self._level)[10:]
-        tar_comp = bz2.compress(tar, self._level)[10:]
-        concat_comp = bz2.compress(src + tar, self._level)[10:]
-        concat_comp2 = bz2.compress(tar + src, self._level)[10:]
-
-        return (
-            min(len(concat_comp), len(concat_comp2))
-            - min(len(src_comp), len(tar_comp))
-        ) / max(len(src_comp), len(tar_comp))
+        return super(NCDbz2, self).dist(src, tar)
 
 
 def dist_ncd_bz2(src, tar):
@@ -28,7 +28,9 @@ from __future__ import (
     unicode_literals,
 )
 
-from ._distance import _Distance
+from six import PY3
+
+from ._ncd import _NCD
 
 try:
     import lzma
@@ -40,7 +42,7 @@ except ImportError:  # pragma: no cover
 __all__ = ['NCDlzma', 'dist_ncd_lzma', 'sim_ncd_lzma']
 
 
-class NCDlzma(_Distance):
+class NCDlzma(_NCD):
     """Normalized Compression Distance using LZMA compression.
 
     Cf. https://en.wikipedia.org/wiki/Lempel-Ziv-Markov_chain_algorithm
@@ -48,6 +50,139 @@ class NCDlzma(_Distance):
     Normalized compression distance (NCD) :cite:`Cilibrasi:2005`.
     """
 
+    _filters = None
+    _releases_gil = True
+
+    def __init__(self, cache_size=1024, filters=None):
+        """Initialize LZMA compressor.
+
+        Parameters
+        ----------
+        cache_size : int
+            The greatest number of compressed sizes of single strings to keep
+        filters : list
+            A raw filter chain (as for lzma.compress), such as one made by
+            :py:meth:`train`, or None to compress in the .xz format (raw
+            filter chains require Python 3.3+)
+
+        Raises
+        ------
+        ValueError
+            Raw filter chains require Python 3.3+
+
+        """
+        super(NCDlzma, self).__init__(cache_size)
+        if filters is not None and not PY3:
+            raise ValueError('Raw filter chains require Python 3.3+')
+        self._filters = filters
+
+    def train(self, corpus):
+        """Fit a raw LZMA2 filter chain to a sample corpus.
+
+        Beyond the 14 byte header that is removed, the .xz format adds some
+        40 bytes of block headers, check & index to each compressed string,
+        which dominate the sizes of short strings, and its default dictionary
+        of 8 MiB takes far longer to set up than to compress them. Strings are
+        instead compressed as raw LZMA2 with the smallest dictionary that
+        holds a concatenation of the longest strings of the corpus.
+
+        Parameters
+        ----------
+        corpus : iterable
+            The sample strings
+
+        Raises
+        ------
+        ValueError
+            Install the PylibLZMA module in order to use LZMA
+        ValueError
+            Raw filter chains require Python 3.3+
+
+        Examples
+        --------
+        >>> cmp = NCDlzma()
+        >>> cmp._compress('Niall')
+        50
+        >>> cmp.train(['Niall', 'Neal', 'Neil', 'Nigel', 'Njall'])
+        >>> cmp._compress('Niall')
+        9
+        >>> cmp.get_filters()[0]['dict_size']
+        4096
+
+        """
+        if lzma is None:  # pragma: no cover
+            raise ValueError(
+                'Install the PylibLZMA module in order to use LZMA'
+            )
+        if not PY3:
+            raise ValueError('Raw filter chains require Python 3.3+')
+        longest = max([len(text.encode('utf-8')) for text in corpus] or [0])
+        # LZMA's smallest dictionary is 4 KiB
+        dict_size = 4096
+        while dict_size < 2 * longest:
+            dict_size <<= 1
+        self._filters = [
+            {'id': lzma.FILTER_LZMA2, 'preset': 6, 'dict_size': dict_size}
+        ]
+        self._clear_cache()
+
+    def get_filters(self):
+        """Return the raw filter chain.
+
+        Returns
+        -------
+        list
+            The raw filter chain, or None if strings are compressed in the .xz
+            format
+
+        Examples
+        --------
+        >>> cmp = NCDlzma()
+        >>> cmp.get_filters() is None
+        True
+
+        """
+        return self._filters
+
+    def _compress(self, text):
+        """Return the LZMA compressed size of a string, without its header.
+
+        Parameters
+        ----------
+        text : str
+            The string to compress
+
+        Returns
+        -------
+        int
+            The size of the compressed string
+
+        Raises
+        ------
+        ValueError
+            Install the PylibLZMA module in order to use LZMA
+
+        Examples
+        --------
+        >>> cmp = NCDlzma()
+        >>> cmp._compress('aaabaabababa')
+        58
+
+        """
+        if lzma is None:  # pragma: no cover
+            raise ValueError(
+                'Install the PylibLZMA module in order to use LZMA'
+            )
+        if self._filters is not None:
+            return len(
+                lzma.compress(
+                    text.encode('utf-8'),
+                    format=lzma.FORMAT_RAW,
+                    filters=self._filters,
+                )
+            )
+        return len(lzma.compress(text.encode('utf-8'))[14:])
+
     def dist(self, src, tar):
         """Return the NCD between two strings using LZMA compression.
 
@@ -81,26 +216,7 @@ class NCDlzma(_Distance):
         0.08695652173913043
 
         """
-        if src == tar:
-            return 0.0
-
-        src = src.encode('utf-8')
-        tar = tar.encode('utf-8')
-
-        if lzma is not None:
-            src_comp = lzma.compress(src)[14:]
-            tar_comp = lzma.compress(tar)[14:]
-            concat_comp = lzma.compress(src + tar)[14:]
-            concat_comp2 = lzma.compress(tar + src)[14:]
-        else:  # pragma: no cover
-            raise ValueError(
-                'Install the PylibLZMA module in order to use LZMA'
-            )
-
-        return (
-            min(len(concat_comp), len(concat_comp2))
-            - min(len(src_comp), len(tar_comp))
-        ) / max(len(src_comp), len(tar_comp))
+        return super(NCDlzma, self).dist(src, tar)
 
 
 def dist_ncd_lzma(src, tar):
@@ -28,13 +28,13 @@ from __future__ import (
     unicode_literals,
 )
 
-from ._distance import _Distance
+from ._ncd import _NCD
 from ..compression import RLE
 
 __all__ = ['NCDrle', 'dist_ncd_rle', 'sim_ncd_rle']
 
 
-class NCDrle(_Distance):
+class NCDrle(_NCD):
     """Normalized Compression Distance using RLE.
 
     Cf. https://en.wikipedia.org/wiki/Run-length_encoding
@@ -44,6 +44,28 @@ class NCDrle(_Distance):
 
     _rle = RLE()
 
+    def _compress(self, text):
+        """Return the length of a string's RLE.
+
+        Parameters
+        ----------
+        text : str
+            The string to compress
+
+        Returns
+        -------
+        int
+            The length of the encoded string
+
+        Examples
+        --------
+        >>> cmp = NCDrle()
+        >>> cmp._compress('aaabaabababa')
+        11
+
+        """
+        return len(self._rle.encode(text))
+
     def dist(self, src, tar):
         """Return the NCD between two strings using RLE.
 
@@ -72,18 +94,7 @@ class NCDrle(_Distance):
         1.0
 
         """
-        if src == tar:
-            return 0.0
-
-        src_comp = self._rle.encode(src)
-        tar_comp = self._rle.encode(tar)
-        concat_comp = self._rle.encode(src + tar)
-        concat_comp2 = self._rle.encode(tar + src)
-
-        return (
-            min(len(concat_comp), len(concat_comp2))
-            - min(len(src_comp), len(tar_comp))
-        ) / max(len(src_comp), len(tar_comp))
+        return super(NCDrle, self).dist(src, tar)
 
 
 def dist_ncd_rle(src, tar):
@@ -29,14 +29,25 @@ from __future__ import (
 )
 
 import zlib
+from collections import Counter, OrderedDict
+from threading import local
 
-from ._distance import _Distance
+from six import PY3
+
+from ._ncd import _NCD
 
 
 __all__ = ['NCDzlib', 'dist_ncd_zlib', 'sim_ncd_zlib']
 
+# The least window size (as a power of 2) of a compressor with a preset
+# dictionary
+_ZDICT_MIN_WBITS = 12
+
+# The distance short of the window size beyond which zlib finds no matches
+_MIN_LOOKAHEAD = 262
+
 
-class NCDzlib(_Distance):
+class NCDzlib(_NCD):
     """Normalized Compression Distance using zlib compression.
 
     Cf. https://zlib.net/
@@ -45,17 +56,264 @@ class NCDzlib(_Distance):
     """
 
     _compressor = None
-
-    def __init__(self, level=zlib.Z_DEFAULT_COMPRESSION):
+    _level = zlib.Z_DEFAULT_COMPRESSION
+    _local = None
+    _narrow_len = 0
+    _releases_gil = True
+    _wide_compressor = None
+    _zdict = None
+
+    def __init__(
+        self, level=zlib.Z_DEFAULT_COMPRESSION, cache_size=1024, zdict=None
+    ):
         """Initialize zlib compressor.
 
         Parameters
         ----------
         level : int
             The compression level (0 to 9)
+        cache_size : int
+            The greatest number of compressed sizes of single strings to keep
+        zdict : bytes
+            A preset dictionary (requires Python 3.3+), such as one made by
+            :py:meth:`train`, or None to compress without one
+
+        Raises
+        ------
+        ValueError
+            Preset dictionaries require Python 3.3+
+
+        """
+        super(NCDzlib, self).__init__(cache_size)
+        self._level = level
+        self._set_zdict(zdict)
+
+    def __getstate__(self):
+        """Return the state to pickle, without the compressors.
+
+        Returns
+        -------
+        dict
+            The instance's attributes, but for the lock & compressors
+
+        """
+        state = super(NCDzlib, self).__getstate__()
+        for name in ('_compressor', '_wide_compressor', '_local'):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        """Restore the pickled state, setting up the compressors anew.
+
+        Parameters
+        ----------
+        state : dict
+            The instance's attributes, but for the lock & compressors
+
+        Examples
+        --------
+        >>> import pickle
+        >>> cmp = pickle.loads(pickle.dumps(NCDzlib()))
+        >>> cmp.dist('Niall', 'Neil')
+        0.45454545454545453
+
+        """
+        super(NCDzlib, self).__setstate__(state)
+        sizes, self._sizes = self._sizes, OrderedDict()
+        self._set_zdict(self._zdict)
+        # The compressors are as before, so the cached sizes still hold
+        self._sizes = sizes
+
+    def _set_zdict(self, zdict):
+        """Set up the compressor with a preset dictionary, emptying the cache.
+
+        Parameters
+        ----------
+        zdict : bytes
+            A preset dictionary, or None to compress without one
+
+        Raises
+        ------
+        ValueError
+            Preset dictionaries require Python 3.3+
+
+        """
+        if zdict is not None and not PY3:
+            raise ValueError('Preset dictionaries require Python 3.3+')
+
+        self._zdict = zdict
+        if zdict is None:
+            self._compressor = zlib.compressobj(self._level)
+            # Emit the stream's header, so that it is not counted in the size
+            # of the first string compressed. Each full flush resets the
+            # compressor, so the size of each string is independent of those
+            # before it.
+            self._compressor.compress(b'')
+            self._compressor.flush(zlib.Z_FULL_FLUSH)
+        else:
+            # A full flush would also discard the dictionary, so each string
+            # is compressed by a fresh copy of a primed compressor. Copying
+            # its window & hash table takes longer than compressing a short
+            # string, so strings short enough to reach back to the start of
+            # the dictionary from their end are compressed with a window
+            # just large enough for that, and longer strings with zlib's
+            # largest window. Within its reach, the size of the window does
+            # not change the compressed data.
+            wbits = min(
+                max((2 * len(zdict) - 1).bit_length(), _ZDICT_MIN_WBITS), 15
+            )
+            self._compressor = self._zdict_compressor(wbits)
+            self._narrow_len = (1 << wbits) - _MIN_LOOKAHEAD - len(zdict)
+            self._wide_compressor = (
+                self._compressor if wbits == 15 else self._zdict_compressor(15)
+            )
+        # Each thread compresses with its own copy of this compressor
+        self._local = local()
+        self._clear_cache()
+
+    def _zdict_compressor(self, wbits):
+        """Return a compressor primed with the preset dictionary.
+
+        Its hash table is a sixteenth of the default size, since it is
+        copied for each string compressed.
+
+        Parameters
+        ----------
+        wbits : int
+            The size of the compressor's window, as a power of 2
+
+        Returns
+        -------
+        zlib.Compress
+            A compressor whose stream header has been emitted
+
+        """
+        compressor = zlib.compressobj(
+            self._level, zlib.DEFLATED, wbits, 4, zdict=self._zdict
+        )
+        compressor.compress(b'')
+        compressor.flush(zlib.Z_SYNC_FLUSH)
+        return compressor
+
+    @staticmethod
+    def _make_zdict(corpus, size=4096):
+        """Return a preset dictionary built from a sample corpus.
+
+        The distinct strings of the corpus are joined from the least to the
+        most frequent, since zlib codes nearer matches more cheaply, and only
+        the last size bytes are kept.
+
+        Parameters
+        ----------
+        corpus : iterable
+            The sample strings
+        size : int
+            The greatest size of the dictionary, in bytes
+
+        Returns
+        -------
+        bytes
+            The preset dictionary
+
+        Examples
+        --------
+        >>> NCDzlib._make_zdict(['Niall', 'Neil', 'Niall', 'Nigel'])
+        b'NeilNigelNiall'
+        >>> NCDzlib._make_zdict(['Niall', 'Neil', 'Niall', 'Nigel'], 8)
+        b'gelNiall'
+
+        """
+        counts = Counter(corpus)
+        zdict = b''.join(
+            text.encode('utf-8')
+            for text, _ in sorted(counts.items(), key=lambda x: (x[1], x[0]))
+        )
+        return zdict[-size:]
+
+    def train(self, corpus, size=4096):
+        """Train a preset dictionary on a sample corpus.
+
+        For short strings, such as names, a preset dictionary of the strings
+        typical of a corpus lets each string be compressed by reference to
+        it, rather than as literals, so that compressed sizes shrink &
+        reflect more of the strings' similarity. This requires Python 3.3+.
+
+        Parameters
+        ----------
+        corpus : iterable
+            The sample strings
+        size : int
+            The greatest size of the dictionary, in bytes (at most 32768);
+            larger dictionaries compress a little better, but more slowly
+
+        Raises
+        ------
+        ValueError
+            Preset dictionaries require Python 3.3+
+
+        Examples
+        --------
+        >>> cmp = NCDzlib()
+        >>> cmp._compress('Niall')
+        11
+        >>> cmp.train(['Niall', 'Neal', 'Neil', 'Nigel', 'Njall'])
+        >>> cmp._compress('Niall')
+        8
+
+        """
+        self._set_zdict(self._make_zdict(corpus, size))
+
+    def get_zdict(self):
+        """Return the preset dictionary.
+
+        Returns
+        -------
+        bytes
+            The preset dictionary, or None if there is none
+
+        Examples
+        --------
+        >>> cmp = NCDzlib()
+        >>> cmp.train(['Niall', 'Neil'])
+        >>> cmp.get_zdict()
+        b'NeilNiall'
+
+        """
+        return self._zdict
+
+    def _compress(self, text):
+        """Return the zlib compressed size of a string.
+
+        Parameters
+        ----------
+        text : str
+            The string to compress
+
+        Returns
+        -------
+        int
+            The size of the compressed string
+
+        Examples
+        --------
+        >>> cmp = NCDzlib()
+        >>> cmp._compress('aaabaabababa')
+        13
 
         """
-        self._compressor = zlib.compressobj(level)
+        data = text.encode('utf-8')
+        if self._zdict is None:
+            compressor = getattr(self._local, 'compressor', None)
+            if compressor is None:
+                compressor = self._local.compressor = self._compressor.copy()
+        elif len(data) <= self._narrow_len:
+            compressor = self._compressor.copy()
+        else:
+            compressor = self._wide_compressor.copy()
+        # Longer strings are partly compressed before the flush
+        return len(compressor.compress(data)) + len(
+            compressor.flush(zlib.Z_FULL_FLUSH)
+        )
 
     def dist(self, src, tar):
         """Return the NCD between two strings using zlib compression.
@@ -85,25 +343,7 @@ class NCDzlib(_Distance):
         0.4
 
         """
-        if src == tar:
-            return 0.0
-
-        src = src.encode('utf-8')
-        tar = tar.encode('utf-8')
-
-        self._compressor.compress(src)
-        src_comp = self._compressor.flush(zlib.Z_FULL_FLUSH)
-        self._compressor.compress(tar)
-        tar_comp = self._compressor.flush(zlib.Z_FULL_FLUSH)
-        self._compressor.compress(src + tar)
-        concat_comp = self._compressor.flush(zlib.Z_FULL_FLUSH)
-        self._compressor.compress(tar + src)
-        concat_comp2 = self._compressor.flush(zlib.Z_FULL_FLUSH)
-
-        return (
-            min(len(concat_comp), len(concat_comp2))
-            - min(len(src_comp), len(tar_comp))
-        ) / max(len(src_comp), len(tar_comp))
+        return super(NCDzlib, self).dist(src, tar)
 
 
 def dist_ncd_zlib(src, tar):
@@ -28,8 +28,18 @@ from __future__ import (
     unicode_literals,
 )
 
+from array import array
+
+from numpy import arange as np_arange
+from numpy import array as np_array
+from numpy import concatenate as np_concatenate
 from numpy import float32 as np_float32
-from numpy import zeros as np_zeros
+from numpy import float64 as np_float64
+from numpy import frombuffer as np_frombuffer
+from numpy import full as np_full
+from numpy import int as np_int
+from numpy import isfinite as np_isfinite
+from numpy import maximum as np_maximum
 
 from six.moves import range
 
@@ -38,14 +48,162 @@ from ._ident import sim_ident
 
 __all__ = ['NeedlemanWunsch', 'needleman_wunsch']
 
+# The largest number of dynamic programming matrix cells for which an
+# alignment is traced back through the full matrices, rather than divided by
+# Hirschberg's algorithm
+_MATRIX_MAX = 4096
+
+# The magnitude below which all integers are exact as float32 values
+_FLOAT32_INT = 1 << 24
+
 
 class NeedlemanWunsch(_Distance):
     """Needleman-Wunsch score.
 
     The Needleman-Wunsch score :cite:`Needleman:1970` is a standard edit
     distance measure.
+
+    The similarity function is evaluated just once per distinct pair of
+    characters, into a substitution matrix, and the dynamic programming
+    matrix is filled a row at a time from it, with numpy vector operations.
+    Cells are held as float32 values, as in a float32 matrix filled cell by
+    cell.
     """
 
+    @staticmethod
+    def _substitution_matrix(src, tar, sim_func):
+        """Return the codes of two strings & their substitution matrix.
+
+        Each distinct character of src & of tar is numbered, in order of
+        first occurrence, and sim_func is called once per pair of a src
+        character & a tar character.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        sim_func : function
+            A function that returns the similarity of two characters
+
+        Returns
+        -------
+        tuple
+            The codes of the characters of src & tar (as numpy arrays) and the
+            substitution matrix, holding at [a, b] the similarity of the src
+            character coded a & the tar character coded b
+
+        Examples
+        --------
+        >>> src_codes, tar_codes, sub_mat = (
+        ... NeedlemanWunsch._substitution_matrix('abba', 'cab', sim_ident))
+        >>> src_codes
+        array([0, 1, 1, 0])
+        >>> tar_codes
+        array([0, 1, 2])
+        >>> sub_mat
+        array([[0., 1., 0.],
+               [0., 0., 1.]])
+
+        """
+        src_chars = {}
+        tar_chars = {}
+        src_codes = [src_chars.setdefault(ch, len(src_chars)) for ch in src]
+        tar_codes = [tar_chars.setdefault(ch, len(tar_chars)) for ch in tar]
+        src_chars = sorted(src_chars, key=src_chars.get)
+        tar_chars = sorted(tar_chars, key=tar_chars.get)
+
+        sub_mat = np_array(
+            [
+                [sim_func(src_ch, tar_ch) for tar_ch in tar_chars]
+                for src_ch in src_chars
+            ],
+            dtype=np_float64,
+        ).reshape(len(src_chars), len(tar_chars))
+        return (
+            np_array(src_codes, dtype=np_int),
+            np_array(tar_codes, dtype=np_int),
+            sub_mat,
+        )
+
+    @staticmethod
+    def _float32_row(values):
+        """Return values rounded to float32, as a float64 array.
+
+        Float32 values held in a float64 array combine with Python floats in
+        float64 arithmetic, as elements of a float32 matrix do.
+
+        Parameters
+        ----------
+        values : numpy.ndarray
+            The values of a matrix row
+
+        Returns
+        -------
+        numpy.ndarray
+            The values, rounded to float32
+
+        Examples
+        --------
+        >>> NeedlemanWunsch._float32_row(np_array([0.4, 1.0]))
+        array([0.40000001, 1.        ])
+
+        """
+        return values.astype(np_float32).astype(np_float64)
+
+    @classmethod
+    def _extend_gaps(cls, first, cells, gap_cost):
+        """Return a matrix row, extending gaps along it from left to right.
+
+        Each cell after the first is the greater of the corresponding value
+        of cells & the previous cell minus gap_cost, rounded to float32.
+
+        When every value is an integer small enough to be exact in float32,
+        rounding changes nothing and the row is computed with vector
+        operations (see :py:meth:`_scan_gaps`); otherwise each cell is
+        rounded in turn.
+
+        Parameters
+        ----------
+        first : float
+            The value of the first cell of the row
+        cells : numpy.ndarray
+            The best value of each subsequent cell, other than by extending a
+            gap from its left
+        gap_cost : float
+            The cost of extending a gap by one cell
+
+        Returns
+        -------
+        numpy.ndarray
+            The row, rounded to float32, as a float64 array
+
+        Examples
+        --------
+        >>> NeedlemanWunsch._extend_gaps(0.0, np_array([-1.0, 3.0, -5.0]), 1)
+        array([ 0., -1.,  3.,  2.])
+        >>> NeedlemanWunsch._extend_gaps(0.0, np_array([-1.0, 3.0, -5.0]),
+        ... 0.4)
+        array([ 0.        , -0.40000001,  3.        ,  2.5999999 ])
+
+        """
+        values = np_concatenate(([first], cells))
+        finite = values[np_isfinite(values)]
+        max_value = abs(finite).max() if len(finite) else 0
+        if (
+            float(gap_cost).is_integer()
+            and (finite == finite.round()).all()
+            and max_value + len(values) * abs(gap_cost) < _FLOAT32_INT
+        ):
+            return cls._scan_gaps(values, gap_cost)
+
+        # An array of C floats rounds each cell as it is appended.
+        row = array(str('f'), [first])
+        for cell in cells.tolist():
+            row.append(max(cell, row[-1] - gap_cost))
+        return np_frombuffer(row, dtype=np_float32).astype(np_float64)
+
     @staticmethod
     def sim_matrix(
         src,
@@ -126,6 +284,428 @@ class NeedlemanWunsch(_Distance):
             return mat[(tar, src)]
         return mismatch_cost
 
+    @staticmethod
+    def _scan_gaps(values, gap_ext):
+        """Return the running maxima of values, less gap_ext per step.
+
+        Cell j of the result is the greatest of values[k] - (j - k) *
+        gap_ext, for k up to j: the best score of reaching cell j, either
+        directly or by extending a gap from an earlier cell. The rows of a
+        2-dimensional array are scanned independently.
+
+        Parameters
+        ----------
+        values : numpy.ndarray
+            The best score of reaching each cell other than by a gap
+            extension
+        gap_ext : float
+            The cost of extending a gap by one cell
+
+        Returns
+        -------
+        numpy.ndarray
+            The best score of reaching each cell
+
+        Examples
+        --------
+        >>> NeedlemanWunsch._scan_gaps(np_array([0.0, -5.0, 3.0, -5.0]), 1)
+        array([ 0., -1.,  3.,  2.])
+
+        """
+        steps = np_arange(values.shape[-1]) * gap_ext
+        return np_maximum.accumulate(values + steps, axis=-1) - steps
+
+    @classmethod
+    def _align_rows(cls, src_codes, tar_codes, sub_mat, costs, start):
+        """Yield the rows of the forward alignment matrices.
+
+        An alignment is a path of steps, each of which is a match (or
+        mismatch) of a src & a tar character, a gap in tar (consuming a src
+        character), or a gap in src (consuming a tar character). For each
+        cell, the best score of a path from the first cell ending in each of
+        these three states is computed.
+
+        Parameters
+        ----------
+        src_codes : numpy.ndarray
+            The character codes of src, as from :py:meth:`_substitution_matrix`
+        tar_codes : numpy.ndarray
+            The character codes of tar
+        sub_mat : numpy.ndarray
+            The substitution matrix
+        costs : tuple
+            The cost of opening a gap, of extending a gap, and of a gap in one
+            string immediately following a gap in the other
+        start : int
+            The state (0 for a match, 1 for a gap in tar, 2 for a gap in src)
+            in which the path begins
+
+        Yields
+        ------
+        tuple
+            The scores of each cell of a row, in the three states
+
+        Examples
+        --------
+        >>> src_codes, tar_codes, sub_mat = (
+        ... NeedlemanWunsch._substitution_matrix('ab', 'b', sim_ident))
+        >>> for row in NeedlemanWunsch._align_rows(src_codes, tar_codes,
+        ... sub_mat, (1, 1, 1), 0):
+        ...     print(row)
+        (array([  0., -inf]), array([-inf, -inf]), array([-inf,  -1.]))
+        (array([-inf,   0.]), array([-1., -2.]), array([-inf,  -2.]))
+        (array([-inf,   0.]), array([-2., -1.]), array([-inf,  -3.]))
+
+        """
+        gap_open, gap_ext, gap_cross = costs
+        cols = len(tar_codes) + 1
+
+        d_row = np_full(cols, float('-inf'))
+        p_row = np_full(cols, float('-inf'))
+        q_row = np_full(cols, float('-inf'))
+        (d_row, p_row, q_row)[start][0] = 0
+        q_row[1:] = np_maximum(d_row[:-1] - gap_open, p_row[:-1] - gap_cross)
+        q_row = cls._scan_gaps(q_row, gap_ext)
+        yield d_row, p_row, q_row
+
+        for src_code in src_codes:
+            d_prev, p_prev, q_prev = d_row, p_row, q_row
+
+            d_row = np_full(cols, float('-inf'))
+            d_row[1:] = (
+                np_maximum(np_maximum(d_prev[:-1], p_prev[:-1]), q_prev[:-1])
+                + sub_mat[src_code, tar_codes]
+            )
+            p_row = np_maximum(
+                np_maximum(d_prev - gap_open, p_prev - gap_ext),
+                q_prev - gap_cross,
+            )
+            q_row = np_full(cols, float('-inf'))
+            q_row[1:] = np_maximum(
+                d_row[:-1] - gap_open, p_row[:-1] - gap_cross
+            )
+            q_row = cls._scan_gaps(q_row, gap_ext)
+            yield d_row, p_row, q_row
+
+    @classmethod
+    def _align_back_row(cls, src_codes, tar_codes, sub_mat, costs, end):
+        """Return the first row of the backward alignment matrices.
+
+        For each cell of the first row and each of the three states, this
+        is the best score of a path from that cell, in that state, to the
+        last cell (the mirror image of :py:meth:`_align_rows`).
+
+        Parameters
+        ----------
+        src_codes : numpy.ndarray
+            The character codes of src, as from :py:meth:`_substitution_matrix`
+        tar_codes : numpy.ndarray
+            The character codes of tar
+        sub_mat : numpy.ndarray
+            The substitution matrix
+        costs : tuple
+            The cost of opening a gap, of extending a gap, and of a gap in one
+            string immediately following a gap in the other
+        end : int
+            The state in which the path must end, or None if it may end in
+            any state
+
+        Returns
+        -------
+        tuple
+            The scores of each cell of the first row, in the three states
+
+        Examples
+        --------
+        >>> src_codes, tar_codes, sub_mat = (
+        ... NeedlemanWunsch._substitution_matrix('ab', 'b', sim_ident))
+        >>> NeedlemanWunsch._align_back_row(src_codes, tar_codes, sub_mat,
+        ... (1, 1, 1), None)
+        (array([ 0., -2.]), array([ 0., -2.]), array([ 0., -2.]))
+
+        """
+        gap_open, gap_ext, gap_cross = costs
+        cols = len(tar_codes) + 1
+
+        # The last row: gaps in src, rightward to the last cell
+        ends = [
+            0.0 if end in {None, state} else float('-inf')
+            for state in range(3)
+        ]
+        q_row = np_full(cols, float('-inf'))
+        q_row[-1] = ends[2]
+        q_row = cls._scan_gaps(q_row[::-1], gap_ext)[::-1]
+        d_row = np_full(cols, ends[0])
+        d_row[:-1] = q_row[1:] - gap_open
+        p_row = np_full(cols, ends[1])
+        p_row[:-1] = q_row[1:] - gap_cross
+
+        for src_code in src_codes[::-1]:
+            d_next, p_next = d_row, p_row
+
+            match = np_full(cols, float('-inf'))
+            match[:-1] = sub_mat[src_code, tar_codes] + d_next[1:]
+            q_row = np_maximum(match, p_next - gap_cross)
+            q_row = cls._scan_gaps(q_row[::-1], gap_ext)[::-1]
+            q_right = np_full(cols, float('-inf'))
+            q_right[:-1] = q_row[1:]
+
+            d_row = np_maximum(
+                np_maximum(match, p_next - gap_open), q_right - gap_open
+            )
+            p_row = np_maximum(
+                np_maximum(match, p_next - gap_ext), q_right - gap_cross
+            )
+
+        return d_row, p_row, q_row
+
+    @classmethod
+    def _align_matrix(cls, src_codes, tar_codes, sub_mat, costs, start, end):
+        """Return the steps of a best alignment, by full matrix traceback.
+
+        Parameters
+        ----------
+        src_codes : numpy.ndarray
+            The character codes of src, as from :py:meth:`_substitution_matrix`
+        tar_codes : numpy.ndarray
+            The character codes of tar
+        sub_mat : numpy.ndarray
+            The substitution matrix
+        costs : tuple
+            The cost of opening a gap, of extending a gap, and of a gap in one
+            string immediately following a gap in the other
+        start : int
+            The state in which the path begins
+        end : int
+            The state in which the path must end, or None if it may end in
+            any state
+
+        Returns
+        -------
+        list
+            The states of the steps of the alignment, in order
+
+        Examples
+        --------
+        >>> src_codes, tar_codes, sub_mat = (
+        ... NeedlemanWunsch._substitution_matrix('Niall', 'Neil', sim_ident))
+        >>> NeedlemanWunsch._align_matrix(src_codes, tar_codes, sub_mat,
+        ... (1, 1, 1), 0, None)
+        [0, 1, 0, 0, 0]
+
+        """
+        gap_open, gap_ext, gap_cross = costs
+        # gap_costs[prev][state] is the cost of a gap step following prev
+        gap_costs = (
+            (None, gap_open, gap_open),
+            (None, gap_ext, gap_cross),
+            (None, gap_cross, gap_ext),
+        )
+        rows = list(
+            cls._align_rows(src_codes, tar_codes, sub_mat, costs, start)
+        )
+
+        i, j = len(src_codes), len(tar_codes)
+        if end is None:
+            end = max(range(3), key=lambda state: rows[i][state][j])
+
+        steps = []
+        state = end
+        while i or j:
+            steps.append(state)
+            if state == 0:
+                i, j = i - 1, j - 1
+                scores = [rows[i][prev][j] for prev in range(3)]
+            elif state == 1:
+                i -= 1
+                scores = [
+                    rows[i][prev][j] - gap_costs[prev][1] for prev in range(3)
+                ]
+            else:
+                j -= 1
+                scores = [
+                    rows[i][prev][j] - gap_costs[prev][2] for prev in range(3)
+                ]
+            state = max(range(3), key=scores.__getitem__)
+        return steps[::-1]
+
+    @classmethod
+    def _hirschberg(cls, src_codes, tar_codes, sub_mat, costs, start, end):
+        """Return the steps of a best alignment, in linear space.
+
+        Short alignments are traced back through the full matrices (see
+        :py:meth:`_align_matrix`). Longer ones are divided by Hirschberg's
+        algorithm :cite:`Hirschberg:1975`, extended to the three states of
+        affine gaps after Myers & Miller :cite:`Myers:1988`: src is split in
+        half, the forward scores of its first half & the backward scores of
+        its second half are computed a row at a time, and the path is split
+        at the cell & state of the middle row where their sum is greatest.
+        The halves are aligned recursively.
+
+        Parameters
+        ----------
+        src_codes : numpy.ndarray
+            The character codes of src, as from :py:meth:`_substitution_matrix`
+        tar_codes : numpy.ndarray
+            The character codes of tar
+        sub_mat : numpy.ndarray
+            The substitution matrix
+        costs : tuple
+            The cost of opening a gap, of extending a gap, and of a gap in one
+            string immediately following a gap in the other
+        start : int
+            The state in which the path begins
+        end : int
+            The state in which the path must end, or None if it may end in
+            any state
+
+        Returns
+        -------
+        list
+            The states of the steps of the alignment, in order
+
+        Examples
+        --------
+        >>> src_codes, tar_codes, sub_mat = (
+        ... NeedlemanWunsch._substitution_matrix('Niall' * 20, 'Neil' * 20,
+        ... sim_ident))
+        >>> steps = NeedlemanWunsch._hirschberg(src_codes, tar_codes,
+        ... sub_mat, (1, 1, 1), 0, None)
+        >>> steps[:10]
+        [0, 1, 0, 0, 0, 0, 1, 0, 0, 0]
+
+        """
+        if (
+            len(src_codes) < 2
+            or len(src_codes) * len(tar_codes) <= _MATRIX_MAX
+        ):
+            return cls._align_matrix(
+                src_codes, tar_codes, sub_mat, costs, start, end
+            )
+
+        mid = len(src_codes) // 2
+        for forward in cls._align_rows(
+            src_codes[:mid], tar_codes, sub_mat, costs, start
+        ):
+            pass
+        backward = cls._align_back_row(
+            src_codes[mid:], tar_codes, sub_mat, costs, end
+        )
+        totals = np_array(forward) + np_array(backward)
+        state, split = divmod(int(totals.argmax()), len(tar_codes) + 1)
+
+        return cls._hirschberg(
+            src_codes[:mid], tar_codes[:split], sub_mat, costs, start, state
+        ) + cls._hirschberg(
+            src_codes[mid:], tar_codes[split:], sub_mat, costs, state, end
+        )
+
+    @classmethod
+    def _alignment(cls, src, tar, sim_func, costs):
+        """Return a best alignment of two strings & its score.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        sim_func : function
+            A function that returns the similarity of two characters
+        costs : tuple
+            The cost of opening a gap, of extending a gap, and of a gap in one
+            string immediately following a gap in the other
+
+        Returns
+        -------
+        tuple
+            The score of the alignment, and src & tar with gaps (as '-')
+            inserted to align them
+
+        Examples
+        --------
+        >>> NeedlemanWunsch._alignment('Niall', 'Neil', sim_ident, (1, 1, 1))
+        (1.0, 'Niall', 'N-eil')
+
+        """
+        src_codes, tar_codes, sub_mat = cls._substitution_matrix(
+            src, tar, sim_func
+        )
+        steps = cls._hirschberg(src_codes, tar_codes, sub_mat, costs, 0, None)
+
+        gap_open, gap_ext, gap_cross = costs
+        score = 0.0
+        src_aligned = []
+        tar_aligned = []
+        i = j = 0
+        prev = 0
+        for state in steps:
+            if state == 0:
+                score += sub_mat[src_codes[i], tar_codes[j]]
+                src_aligned.append(src[i])
+                tar_aligned.append(tar[j])
+                i += 1
+                j += 1
+            elif state == 1:
+                src_aligned.append(src[i])
+                tar_aligned.append('-')
+                i += 1
+            else:
+                src_aligned.append('-')
+                tar_aligned.append(tar[j])
+                j += 1
+            if state:
+                if prev == 0:
+                    score -= gap_open
+                elif prev == state:
+                    score -= gap_ext
+                else:
+                    score -= gap_cross
+            prev = state
+
+        return float(score), ''.join(src_aligned), ''.join(tar_aligned)
+
+    def alignment(self, src, tar, gap_cost=1, sim_func=sim_ident):
+        """Return a Needleman-Wunsch alignment of two strings.
+
+        Only the score is kept by :py:meth:`dist_abs`; this also traces the
+        alignment back, in space linear in the lengths of the strings (see
+        :py:meth:`_hirschberg`), so that even very long strings can be
+        aligned.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        gap_cost : float
+            The cost of an alignment gap (1 by default)
+        sim_func : function
+            A function that returns the similarity of two characters (identity
+            similarity by default)
+
+        Returns
+        -------
+        tuple
+            The Needleman-Wunsch score, and src & tar with gaps (as '-')
+            inserted to align them
+
+        Examples
+        --------
+        >>> cmp = NeedlemanWunsch()
+        >>> cmp.alignment('cat', 'hat')
+        (2.0, 'cat', 'hat')
+        >>> cmp.alignment('Niall', 'Neil')
+        (1.0, 'Niall', 'N-eil')
+        >>> cmp.alignment('aluminum', 'Catalan')
+        (-1.0, 'aluminum', '-Catalan')
+
+        """
+        return self._alignment(
+            src, tar, sim_func, (gap_cost, gap_cost, gap_cost)
+        )
+
     def dist_abs(self, src, tar, gap_cost=1, sim_func=sim_ident):
         """Return the Needleman-Wunsch score of two strings.
 
@@ -159,19 +739,20 @@ class NeedlemanWunsch(_Distance):
         0.0
 
         """
-        d_mat = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_float32)
+        src_codes, tar_codes, sub_mat = self._substitution_matrix(
+            src, tar, sim_func
+        )
 
-        for i in range(len(src) + 1):
-            d_mat[i, 0] = -(i * gap_cost)
-        for j in range(len(tar) + 1):
-            d_mat[0, j] = -(j * gap_cost)
+        prev = self._float32_row(-(np_arange(len(tar) + 1) * gap_cost))
         for i in range(1, len(src) + 1):
-            for j in range(1, len(tar) + 1):
-                match = d_mat[i - 1, j - 1] + sim_func(src[i - 1], tar[j - 1])
-                delete = d_mat[i - 1, j] - gap_cost
-                insert = d_mat[i, j - 1] - gap_cost
-                d_mat[i, j] = max(match, delete, insert)
-        return d_mat[d_mat.shape[0] - 1, d_mat.shape[1] - 1]
+            # match & delete
+            cells = np_maximum(
+                prev[:-1] + sub_mat[src_codes[i - 1], tar_codes],
+                prev[1:] - gap_cost,
+            )
+            # insert
+            prev = self._extend_gaps(-(i * gap_cost), cells, gap_cost)
+        return np_float32(prev[-1])
 
 
 def needleman_wunsch(src, tar, gap_cost=1, sim_func=sim_ident):
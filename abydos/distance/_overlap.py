@@ -28,6 +28,8 @@ from __future__ import (
     unicode_literals,
 )
 
+from numpy import minimum as np_minimum
+
 from ._token_distance import _TokenDistance
 
 __all__ = ['Overlap', 'dist_overlap', 'sim_overlap']
@@ -84,6 +86,32 @@ class Overlap(_TokenDistance):
 
         return q_intersection_mag / min(q_src_mag, q_tar_mag)
 
+    def _sim_from_magnitudes(self, src_mag, tar_mag, int_mag):
+        """Return overlap coefficients from q-gram multiset magnitudes.
+
+        Parameters
+        ----------
+        src_mag : numpy.ndarray
+            The magnitudes of the source q-gram multisets
+        tar_mag : numpy.ndarray
+            The magnitudes of the target q-gram multisets
+        int_mag : numpy.ndarray
+            The magnitudes of the intersections of the q-gram multisets
+
+        Returns
+        -------
+        numpy.ndarray
+            Overlap similarities
+
+        Examples
+        --------
+        >>> cmp = Overlap()
+        >>> cmp._sim_from_magnitudes(4, 4, 2)
+        0.5
+
+        """
+        return int_mag / np_minimum(src_mag, tar_mag)
+
 
 def sim_overlap(src, tar, qval=2):
     r"""Return the overlap coefficient of two strings.
@@ -28,12 +28,8 @@ from __future__ import (
     unicode_literals,
 )
 
-from numpy import int as np_int
-from numpy import zeros as np_zeros
-
-from six.moves import range
-
 from ._distance import _Distance
+from ._lcsstr import LCSstr
 
 __all__ = [
     'RatcliffObershelp',
@@ -89,38 +85,6 @@ class RatcliffObershelp(_Distance):
 
         """
 
-        def _lcsstr_stl(src, tar):
-            """Return start positions & length for Ratcliff-Obershelp.
-
-            Parameters
-            ----------
-            src : str
-                Source string for comparison
-            tar : str
-            Target string for comparison
-
-            Returns
-            -------
-            tuple
-                The start position in the source string, start position in the
-                target string, and length of the longest common substring of
-                strings src and tar.
-
-            """
-            lengths = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_int)
-            longest, src_longest, tar_longest = 0, 0, 0
-            for i in range(1, len(src) + 1):
-                for j in range(1, len(tar) + 1):
-                    if src[i - 1] == tar[j - 1]:
-                        lengths[i, j] = lengths[i - 1, j - 1] + 1
-                        if lengths[i, j] > longest:
-                            longest = lengths[i, j]
-                            src_longest = i
-                            tar_longest = j
-                    else:
-                        lengths[i, j] = 0
-            return src_longest - longest, tar_longest - longest, longest
-
         def _sstr_matches(src, tar):
             """Return the sum of substring match lengths.
 
@@ -147,7 +111,7 @@ class RatcliffObershelp(_Distance):
                 Sum of substring match lengths
 
             """
-            src_start, tar_start, length = _lcsstr_stl(src, tar)
+            src_start, tar_start, length = LCSstr._lcsstr_stl(src, tar)
             if length == 0:
                 return 0
             return (
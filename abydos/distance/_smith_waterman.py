@@ -28,13 +28,20 @@ from __future__ import (
     unicode_literals,
 )
 
+from numpy import arange as np_arange
+from numpy import argsort as np_argsort
+from numpy import array as np_array
+from numpy import concatenate as np_concatenate
+from numpy import count_nonzero as np_count_nonzero
 from numpy import float32 as np_float32
+from numpy import maximum as np_maximum
 from numpy import zeros as np_zeros
 
 from six.moves import range
 
+from ._batch import _BATCH_SIZE, _pad_codes
 from ._ident import sim_ident
-from ._needleman_wunsch import NeedlemanWunsch
+from ._needleman_wunsch import NeedlemanWunsch, _FLOAT32_INT
 
 __all__ = ['SmithWaterman', 'smith_waterman']
 
@@ -45,8 +52,258 @@ class SmithWaterman(NeedlemanWunsch):
     The Smith-Waterman score :cite:`Smith:1981` is a standard edit distance
     measure, differing from Needleman-Wunsch in that it focuses on local
     alignment and disallows negative scores.
+
+    Scores are computed from a query profile :cite:`Farrar:2007`: the
+    similarity of every character of the query (the source string) to each
+    distinct target character, as a vector. The dynamic programming matrix is
+    filled a column (target character) at a time, by adding the profile
+    vector of the target character to the previous column, and gaps down the
+    column are extended afterwards, in Farrar's "lazy F" loop, which is
+    seldom repeated more than a few times. In :py:meth:`dist_abs_many`, the
+    profile is built once & the columns of a batch of targets are filled
+    together, as the lanes of a vector :cite:`Rognes:2011`.
     """
 
+    @classmethod
+    def _query_profile(cls, src, targets, sim_func):
+        """Return the query profile of src & the codes of targets.
+
+        Parameters
+        ----------
+        src : str
+            Source (query) string for comparison
+        targets : list
+            Target strings for comparison
+        sim_func : function
+            A function that returns the similarity of two characters
+
+        Returns
+        -------
+        tuple
+            The query profile, holding at [c, i] the similarity of the i-th
+            character of src & the target character coded c; the codes of
+            the characters of the targets, in rows padded with 0; and the
+            lengths of the targets
+
+        Examples
+        --------
+        >>> profile, codes, lens = SmithWaterman._query_profile('cat',
+        ... ['hat', 'a'], sim_ident)
+        >>> profile
+        array([[0., 0., 0.],
+               [0., 1., 0.],
+               [0., 0., 1.]])
+        >>> codes
+        array([[0, 1, 2],
+               [1, 0, 0]], dtype=int32)
+        >>> lens
+        array([3, 1])
+
+        """
+        src_codes, tar_codes, sub_mat = cls._substitution_matrix(
+            src, ''.join(targets), sim_func
+        )
+        lens = np_array([len(tar) for tar in targets], dtype=int)
+        return sub_mat[src_codes].T, _pad_codes(tar_codes, lens, 0), lens
+
+    @classmethod
+    def _extend_gaps_down(cls, cells, gap_cost, integral):
+        """Return columns of the matrix, extending gaps down them.
+
+        Each cell is the greater of the corresponding value of cells & the
+        cell above it minus gap_cost, rounded to float32. Above the first
+        cell is a 0.
+
+        If integral, every value is an integer small enough to be exact in
+        float32, so the columns are scanned for gaps directly (see
+        :py:meth:`_scan_gaps`). Otherwise, gaps are extended by one cell at a
+        time down every column at once, until none grows.
+
+        Parameters
+        ----------
+        cells : numpy.ndarray
+            The best value of each cell of each column (one per row), other
+            than by extending a gap from above
+        gap_cost : float
+            The cost of extending a gap by one cell
+        integral : bool
+            True if the scores are integers that need no rounding
+
+        Returns
+        -------
+        numpy.ndarray
+            The columns, rounded to float32, as a float64 array
+
+        Examples
+        --------
+        >>> SmithWaterman._extend_gaps_down(np_array([[2.0, 0.0, 0.0]]), 0.4,
+        ... False)
+        array([[2.        , 1.60000002, 1.20000005]])
+
+        """
+        values = np_concatenate((np_zeros((len(cells), 1)), cells), axis=1)
+        if integral:
+            return cls._scan_gaps(values, gap_cost)[:, 1:]
+
+        col = cls._float32_row(values)
+        while True:
+            gaps = cls._float32_row(col[:, :-1] - gap_cost)
+            longer = gaps > col[:, 1:]
+            if not longer.any():
+                return col[:, 1:]
+            col[:, 1:][longer] = gaps[longer]
+
+    @classmethod
+    def _profile_scores(cls, profile, codes, lens, gap_cost):
+        """Return the Smith-Waterman scores of a query against targets.
+
+        Targets are sorted by length and their matrices filled in batches,
+        a column of every target at a time. A target's score is taken from
+        the last cell of its last column, after which it is dropped from
+        the batch.
+
+        Parameters
+        ----------
+        profile : numpy.ndarray
+            The query profile, as from :py:meth:`_query_profile`
+        codes : numpy.ndarray
+            The codes of the characters of the targets, one per row
+        lens : numpy.ndarray
+            The lengths of the targets
+        gap_cost : float
+            The cost of an alignment gap
+
+        Returns
+        -------
+        numpy.ndarray
+            The Smith-Waterman score of each target, rounded to float32
+
+        Examples
+        --------
+        >>> profile, codes, lens = SmithWaterman._query_profile('cat',
+        ... ['hat', 'a', '', 'cat'], sim_ident)
+        >>> SmithWaterman._profile_scores(profile, codes, lens, 1)
+        array([2., 0., 0., 3.])
+
+        """
+        scores = np_zeros(len(lens))
+        query_len = profile.shape[1]
+        if not query_len:
+            return scores
+
+        # Every score & gap sum is bounded by the greatest profile value or
+        # gap cost, times the number of steps to the final cell.
+        max_value = abs(profile).max() if profile.size else 0
+        max_len = lens.max() if len(lens) else 0
+        integral = bool(
+            float(gap_cost).is_integer()
+            and (profile == profile.round()).all()
+            and (max_value + abs(gap_cost)) * (query_len + max_len + 1)
+            < _FLOAT32_INT
+        )
+
+        order = np_argsort(lens, kind='mergesort')
+        for start in range(0, len(order), _BATCH_SIZE):
+            batch = order[start : start + _BATCH_SIZE]
+            batch = batch[lens[batch] > 0]
+            if not len(batch):
+                continue
+            batch_codes = codes[batch]
+            batch_lens = lens[batch]
+            col = np_zeros((len(batch), query_len))
+
+            for j in range(batch_lens.max()):
+                diag = np_zeros(col.shape)
+                diag[:, 1:] = col[:, :-1]
+                # match, delete, or restart the alignment
+                cells = np_maximum(
+                    np_maximum(
+                        diag + profile[batch_codes[:, j]], col - gap_cost
+                    ),
+                    0,
+                )
+                # insert
+                col = cls._extend_gaps_down(cells, gap_cost, integral)
+
+                # Targets are in order of length, so those ending here lead
+                ended = np_count_nonzero(batch_lens == j + 1)
+                if ended:
+                    scores[batch[:ended]] = col[:ended, -1]
+                    batch = batch[ended:]
+                    batch_codes = batch_codes[ended:]
+                    batch_lens = batch_lens[ended:]
+                    col = col[ended:]
+        return scores
+
+    def alignment(self, src, tar, gap_cost=1, sim_func=sim_ident):
+        """Return a Smith-Waterman alignment of two strings.
+
+        The score of :py:meth:`dist_abs` is that of the last cell of the
+        matrix, so the alignment ends with the ends of both strings and
+        begins wherever it scores best. That cell is found in space linear
+        in the lengths of the strings, by aligning the strings backwards
+        from their ends a row at a time, and the substrings from it are then
+        aligned globally (see :py:meth:`NeedlemanWunsch._hirschberg`).
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        gap_cost : float
+            The cost of an alignment gap (1 by default)
+        sim_func : function
+            A function that returns the similarity of two characters (identity
+            similarity by default)
+
+        Returns
+        -------
+        tuple
+            The Smith-Waterman score, and the aligned substrings of src & tar,
+            with gaps (as '-') inserted to align them
+
+        Examples
+        --------
+        >>> cmp = SmithWaterman()
+        >>> cmp.alignment('cat', 'hat')
+        (2.0, 'at', 'at')
+        >>> cmp.alignment('Niall', 'Neil')
+        (1.0, 'l', 'l')
+        >>> cmp.alignment('aluminum', 'Catalan')
+        (0.0, '', '')
+        >>> cmp.alignment('ATCG', 'TAGC')
+        (1.0, 'TCG-', 'TAGC')
+
+        """
+        src_codes, tar_codes, sub_mat = self._substitution_matrix(
+            src[::-1], tar[::-1], sim_func
+        )
+
+        # The nearest cell from the ends with the best score
+        best, src_len, tar_len = 0.0, 0, 0
+        prev = self._float32_row(-(np_arange(len(tar) + 1) * gap_cost))
+        for i in range(1, len(src) + 1):
+            # match & delete
+            cells = np_maximum(
+                prev[:-1] + sub_mat[src_codes[i - 1], tar_codes],
+                prev[1:] - gap_cost,
+            )
+            # insert
+            prev = self._extend_gaps(-(i * gap_cost), cells, gap_cost)
+            j = int(prev.argmax())
+            if prev[j] > best:
+                best, src_len, tar_len = prev[j], i, j
+        if best <= 0:
+            return 0.0, '', ''
+
+        return self._alignment(
+            src[len(src) - src_len :],
+            tar[len(tar) - tar_len :],
+            sim_func,
+            (gap_cost, gap_cost, gap_cost),
+        )
+
     def dist_abs(self, src, tar, gap_cost=1, sim_func=sim_ident):
         """Return the Smith-Waterman score of two strings.
 
@@ -80,19 +337,58 @@ class SmithWaterman(NeedlemanWunsch):
         1.0
 
         """
-        d_mat = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_float32)
+        src_codes, tar_codes, sub_mat = self._substitution_matrix(
+            src, tar, sim_func
+        )
 
-        for i in range(len(src) + 1):
-            d_mat[i, 0] = 0
-        for j in range(len(tar) + 1):
-            d_mat[0, j] = 0
-        for i in range(1, len(src) + 1):
-            for j in range(1, len(tar) + 1):
-                match = d_mat[i - 1, j - 1] + sim_func(src[i - 1], tar[j - 1])
-                delete = d_mat[i - 1, j] - gap_cost
-                insert = d_mat[i, j - 1] - gap_cost
-                d_mat[i, j] = max(0, match, delete, insert)
-        return d_mat[d_mat.shape[0] - 1, d_mat.shape[1] - 1]
+        # The longer string is profiled, for the longer vectors; since the
+        # gap cost is the same in both directions, either gives the score.
+        if len(src) >= len(tar):
+            profile, codes = sub_mat[src_codes].T, tar_codes
+        else:
+            profile, codes = sub_mat[:, tar_codes], src_codes
+        return np_float32(
+            self._profile_scores(
+                profile, codes[None, :], np_array([len(codes)]), gap_cost
+            )[0]
+        )
+
+    def dist_abs_many(self, src, targets, gap_cost=1, sim_func=sim_ident):
+        """Return the Smith-Waterman scores of one string against many.
+
+        The query profile of src is built once and the similarity function
+        is called just once per pair of a src character & a distinct target
+        character.
+
+        Parameters
+        ----------
+        src : str
+            Source (query) string for comparison
+        targets : iterable
+            Target strings for comparison
+        gap_cost : float
+            The cost of an alignment gap (1 by default)
+        sim_func : function
+            A function that returns the similarity of two characters (identity
+            similarity by default)
+
+        Returns
+        -------
+        numpy.ndarray
+            Smith-Waterman score between src & each target, each as from
+            :py:meth:`dist_abs`
+
+        Examples
+        --------
+        >>> cmp = SmithWaterman()
+        >>> cmp.dist_abs_many('cat', ['hat', 'cat', 'Catalan', 'dog'])
+        array([2., 3., 1., 0.])
+
+        """
+        profile, codes, lens = self._query_profile(
+            src, list(targets), sim_func
+        )
+        return self._profile_scores(profile, codes, lens, gap_cost)
 
 
 def smith_waterman(src, tar, gap_cost=1, sim_func=sim_ident):
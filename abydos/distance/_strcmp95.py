@@ -28,15 +28,45 @@ from __future__ import (
     unicode_literals,
 )
 
-from collections import defaultdict
-
-from six.moves import range
-
 from ._distance import _Distance
+from ._jaro_winkler import JaroWinkler
+from ._levenshtein import Levenshtein
 
 __all__ = ['Strcmp95', 'dist_strcmp95', 'sim_strcmp95']
 
 
+def _adjusted_weights(similar_pairs, weight=3):
+    """Return a lookup table of the adjusted weights of similar characters.
+
+    Parameters
+    ----------
+    similar_pairs : tuple
+        Pairs of similar characters
+    weight : int
+        The adjusted weight of each pair (in tenths of a match)
+
+    Returns
+    -------
+    dict
+        A dict mapping each character to a dict mapping each character similar
+        to it to their adjusted weight
+
+    Examples
+    --------
+    >>> table = _adjusted_weights((('A', 'E'), ('A', 'I')))
+    >>> sorted(table['A'].items())
+    [('E', 3), ('I', 3)]
+    >>> table['E']
+    {'A': 3}
+
+    """
+    table = {}
+    for char1, char2 in similar_pairs:
+        table.setdefault(char1, {})[char2] = weight
+        table.setdefault(char2, {})[char1] = weight
+    return table
+
+
 class Strcmp95(_Distance):
     """Strcmp95.
 
@@ -50,6 +80,10 @@ class Strcmp95(_Distance):
     for some common typos and frequently confused characters. It is also
     limited to uppercase ASCII characters, so it is appropriate to American
     names, but not much else.
+
+    Characters are matched with the bitmask matcher of
+    :py:class:`JaroWinkler`, and the table of adjusted weights of similar
+    characters is built once, when the class is defined.
     """
 
     _sp_mx = (
@@ -91,6 +125,11 @@ class Strcmp95(_Distance):
         ('G', 'J'),
     )
 
+    # The adjwt array is used to give partial credit for characters that
+    # may be errors due to known phonetic or character recognition errors.
+    # A typical example is to match the letter "O" with the number "0"
+    _adjwt = _adjusted_weights(_sp_mx)
+
     def sim(self, src, tar, long_strings=False):
         """Return the strcmp95 similarity of two strings.
 
@@ -125,23 +164,6 @@ class Strcmp95(_Distance):
         0.8333333333333334
 
         """
-
-        def _in_range(char):
-            """Return True if char is in the range (0, 91).
-
-            Parameters
-            ----------
-            char : str
-                The character to check
-
-            Returns
-            -------
-            bool
-                True if char is in the range (0, 91)
-
-            """
-            return 91 > ord(char) > 0
-
         ying = src.strip().upper()
         yang = tar.strip().upper()
 
@@ -151,70 +173,40 @@ class Strcmp95(_Distance):
         if not ying or not yang:
             return 0.0
 
-        adjwt = defaultdict(int)
-
-        # Initialize the adjwt array on the first call to the function only.
-        # The adjwt array is used to give partial credit for characters that
-        # may be errors due to known phonetic or character recognition errors.
-        # A typical example is to match the letter "O" with the number "0"
-        for i in self._sp_mx:
-            adjwt[(i[0], i[1])] = 3
-            adjwt[(i[1], i[0])] = 3
-
-        if len(ying) > len(yang):
-            search_range = len(ying)
-            minv = len(yang)
-        else:
-            search_range = len(yang)
-            minv = len(ying)
-
-        # Blank out the flags
-        ying_flag = [0] * search_range
-        yang_flag = [0] * search_range
-        search_range = max(0, search_range // 2 - 1)
+        minv = min(len(ying), len(yang))
 
         # Looking only within the search range,
         # count and flag the matched pairs.
-        num_com = 0
-        yl1 = len(yang) - 1
-        for i in range(len(ying)):
-            low_lim = (i - search_range) if (i >= search_range) else 0
-            hi_lim = (i + search_range) if ((i + search_range) <= yl1) else yl1
-            for j in range(low_lim, hi_lim + 1):
-                if (yang_flag[j] == 0) and (yang[j] == ying[i]):
-                    yang_flag[j] = 1
-                    ying_flag[i] = 1
-                    num_com += 1
-                    break
+        yang_masks = Levenshtein._pattern_bitmasks(yang)
+        num_com, ying_flags, yang_flags = JaroWinkler._match_masks(
+            ying, yang, yang_masks
+        )
 
         # If no characters in common - return
         if num_com == 0:
             return 0.0
 
         # Count the number of transpositions
-        k = n_trans = 0
-        for i in range(len(ying)):
-            if ying_flag[i] != 0:
-                j = 0
-                for j in range(k, len(yang)):  # pragma: no branch
-                    if yang_flag[j] != 0:
-                        k = j + 1
-                        break
-                if ying[i] != yang[j]:
-                    n_trans += 1
-        n_trans //= 2
-
-        # Adjust for similarities in unmatched characters
+        n_trans = JaroWinkler._transpositions(
+            ying, yang, ying_flags, yang_flags
+        )
+
+        # Adjust for similarities in unmatched characters, each of which may
+        # be paired with the first unmatched, unpaired similar character
         n_simi = 0
         if minv > num_com:
-            for i in range(len(ying)):
-                if ying_flag[i] == 0 and _in_range(ying[i]):
-                    for j in range(len(yang)):
-                        if yang_flag[j] == 0 and _in_range(yang[j]):
-                            if (ying[i], yang[j]) in adjwt:
-                                n_simi += adjwt[(ying[i], yang[j])]
-                                yang_flag[j] = 2
-                                break
+            for i, char in enumerate(ying):
+                if (ying_flags >> i) & 1 or char not in self._adjwt:
+                    continue
+                weights = self._adjwt[char]
+                similar = 0
+                for other in weights:
+                    similar |= yang_masks.get(other, 0)
+                similar &= ~yang_flags
+                if similar:
+                    similar &= -similar
+                    n_simi += weights[yang[similar.bit_length() - 1]]
+                    yang_flags |= similar
         num_sim = n_simi / 10.0 + num_com
 
         # Main weight computation
@@ -30,8 +30,13 @@ from __future__ import (
 
 from collections import Counter
 
+from numpy import array as np_array
+from numpy import errstate as np_errstate
+from numpy import float64 as np_float64
+from numpy import zeros as np_zeros
+
 from ._distance import _Distance
-from ..tokenizer import QGrams
+from ..tokenizer import QGramVectorizer, QGrams
 
 
 class _TokenDistance(_Distance):
@@ -65,11 +70,343 @@ class _TokenDistance(_Distance):
          QGrams({'$T': 1, 'TT': 1, 'T#': 1}))
 
         """
-        if isinstance(src, Counter) and isinstance(tar, Counter):
-            return src, tar
+        return self._tokenize(src, qval, skip), self._tokenize(tar, qval, skip)
+
+    def _tokenize(self, term, qval=0, skip=0):
+        """Return the Q-Grams in term.
+
+        Parameters
+        ----------
+        term : str
+            A string (or QGrams/Counter object) to tokenize
+        qval : int
+            The length of each q-gram; 0 for non-q-gram version
+        skip : int
+            The number of characters to skip (only works when term is a
+            string)
+
+        Returns
+        -------
+        Counter
+            Q-Grams
+
+        Examples
+        --------
+        >>> pe = _TokenDistance()
+        >>> pe._tokenize('AT', qval=2)
+        QGrams({'$A': 1, 'AT': 1, 'T#': 1})
+        >>> pe._tokenize('a cat', qval=0)
+        Counter({'a': 1, 'cat': 1})
+
+        """
+        if isinstance(term, Counter):
+            return term
         if qval > 0:
-            return QGrams(src, qval, '$#', skip), QGrams(tar, qval, '$#', skip)
-        return Counter(src.strip().split()), Counter(tar.strip().split())
+            return QGrams(term, qval, '$#', skip)
+        return Counter(term.strip().split())
+
+    def _many(self, measure, src, targets, qval, *args, **kwargs):
+        """Return measure applied to src & each target.
+
+        The Q-Grams of src are computed just once. Pairs for which either
+        side has no Q-Grams, or which are identical, are passed to measure as
+        strings, so that its special cases apply unchanged.
+
+        Parameters
+        ----------
+        measure : method
+            The sim or dist method to apply
+        src : str
+            Source string (or QGrams/Counter object) for comparison
+        targets : iterable
+            Target strings (or QGrams/Counter objects) for comparison
+        qval : int
+            The length of each q-gram; 0 for non-q-gram version
+        *args
+            Variable length argument list, passed on to measure
+        **kwargs
+            Arbitrary keyword arguments, passed on to measure
+
+        Returns
+        -------
+        numpy.ndarray
+            The value of measure for src & each target
+
+        """
+        q_src = self._tokenize(src, qval)
+        values = []
+        for tar in targets:
+            q_tar = self._tokenize(tar, qval)
+            if src == tar or not q_src or not q_tar:
+                values.append(measure(src, tar, qval, *args, **kwargs))
+            else:
+                values.append(measure(q_src, q_tar, qval, *args, **kwargs))
+        return np_array(values, dtype=np_float64)
+
+    # Measures that depend only on the magnitudes of the two q-gram multisets
+    # & of their intersection implement _sim_from_magnitudes(src_mag, tar_mag,
+    # int_mag, *args, **kwargs), vectorized over numpy arrays, so that
+    # sim_matrix & dist_matrix can compute them from a sparse q-gram matrix.
+    # Other measures are computed pair by pair.
+    _sim_from_magnitudes = None
+
+    def _matrix(
+        self, measure, src_collection, tar_collection, qval, *args, **kwargs
+    ):
+        """Return measure applied to each pair of members of two collections.
+
+        Each row is computed by :py:meth:`_many`, so the Q-Grams of each
+        source are computed just once.
+
+        Parameters
+        ----------
+        measure : method
+            The sim or dist method to apply
+        src_collection : list
+            Source strings (or QGrams/Counter objects) for comparison
+        tar_collection : list
+            Target strings (or QGrams/Counter objects) for comparison
+        qval : int
+            The length of each q-gram; 0 for non-q-gram version
+        *args
+            Variable length argument list, passed on to measure
+        **kwargs
+            Arbitrary keyword arguments, passed on to measure
+
+        Returns
+        -------
+        numpy.ndarray
+            The value of measure for each source (row) & target (column)
+
+        """
+        values = np_zeros((len(src_collection), len(tar_collection)))
+        for i, src in enumerate(src_collection):
+            values[i] = self._many(
+                measure, src, tar_collection, qval, *args, **kwargs
+            )
+        return values
+
+    def sim_matrix(
+        self, src_collection, tar_collection=None, qval=2, *args, **kwargs
+    ):
+        """Return the matrix of similarities between two collections.
+
+        Every member of each collection is tokenized just once, into a shared
+        sparse q-gram count matrix (:py:class:`.QGramMatrix`), and the
+        intersection sizes of all pairs are calculated at once from its
+        inverted index. Pairs of identical terms have similarity 1.0 and pairs
+        in which either term has no q-grams have similarity 0.0.
+
+        Measures that do not depend on these sizes alone are computed pair by
+        pair, as by :py:meth:`sim`, tokenizing each source just once.
+
+        Parameters
+        ----------
+        src_collection : iterable
+            Source strings (or QGrams/Counter objects) for comparison
+        tar_collection : iterable
+            Target strings (or QGrams/Counter objects) for comparison; if None,
+            the members of src_collection are compared with each other
+        qval : int
+            The length of each q-gram; 0 for non-q-gram version
+        *args
+            Variable length argument list, as for sim
+        **kwargs
+            Arbitrary keyword arguments, as for sim
+
+        Returns
+        -------
+        numpy.ndarray
+            The similarity of each source (row) to each target (column)
+
+        Examples
+        --------
+        >>> from abydos.distance import Jaccard
+        >>> Jaccard().sim_matrix(['cat', 'hat'], ['hat', 'cat', 'dog'])
+        array([[0.33333333, 1.        , 0.        ],
+               [1.        , 0.33333333, 0.        ]])
+
+        """
+        src_collection = list(src_collection)
+        tar_collection = (
+            src_collection if tar_collection is None else list(tar_collection)
+        )
+        if self._sim_from_magnitudes is None:
+            return self._matrix(
+                self.sim, src_collection, tar_collection, qval, *args, **kwargs
+            )
+
+        vectorizer = QGramVectorizer()
+        src_matrix = vectorizer.transform(
+            self._tokenize(term, qval) for term in src_collection
+        )
+        tar_matrix = vectorizer.transform(
+            self._tokenize(term, qval) for term in tar_collection
+        )
+
+        src_mag = src_matrix.magnitudes[:, None]
+        tar_mag = tar_matrix.magnitudes[None, :]
+        with np_errstate(divide='ignore', invalid='ignore'):
+            sims = self._sim_from_magnitudes(
+                src_mag,
+                tar_mag,
+                src_matrix.intersection(tar_matrix),
+                *args,
+                **kwargs
+            )
+        sims[(src_mag == 0) | (tar_mag == 0)] = 0.0
+
+        keys = {}
+        src_keys = np_array(
+            [self._term_key(term, keys) for term in src_collection], dtype=int
+        )
+        tar_keys = np_array(
+            [self._term_key(term, keys) for term in tar_collection], dtype=int
+        )
+        sims[src_keys[:, None] == tar_keys[None, :]] = 1.0
+        return sims
+
+    def dist_matrix(
+        self, src_collection, tar_collection=None, qval=2, *args, **kwargs
+    ):
+        """Return the matrix of distances between two collections.
+
+        Parameters
+        ----------
+        src_collection : iterable
+            Source strings (or QGrams/Counter objects) for comparison
+        tar_collection : iterable
+            Target strings (or QGrams/Counter objects) for comparison; if None,
+            the members of src_collection are compared with each other
+        qval : int
+            The length of each q-gram; 0 for non-q-gram version
+        *args
+            Variable length argument list, as for sim
+        **kwargs
+            Arbitrary keyword arguments, as for sim
+
+        Returns
+        -------
+        numpy.ndarray
+            The distance of each source (row) to each target (column)
+
+        Examples
+        --------
+        >>> from abydos.distance import Jaccard
+        >>> Jaccard().dist_matrix(['cat', 'hat'], ['hat', 'cat', 'dog'])
+        array([[0.66666667, 0.        , 1.        ],
+               [0.        , 0.66666667, 1.        ]])
+
+        """
+        if self._sim_from_magnitudes is None:
+            src_collection = list(src_collection)
+            tar_collection = (
+                src_collection
+                if tar_collection is None
+                else list(tar_collection)
+            )
+            return self._matrix(
+                self.dist,
+                src_collection,
+                tar_collection,
+                qval,
+                *args,
+                **kwargs
+            )
+        return 1.0 - self.sim_matrix(
+            src_collection, tar_collection, qval, *args, **kwargs
+        )
+
+    @staticmethod
+    def _term_key(term, keys):
+        """Return an integer identifying a term, for equality tests.
+
+        Parameters
+        ----------
+        term : str
+            A string (or QGrams/Counter object)
+        keys : dict
+            The keys assigned so far, which is updated
+
+        Returns
+        -------
+        int
+            The key of term, equal to that of every equal term
+
+        Examples
+        --------
+        >>> keys = {}
+        >>> [_TokenDistance._term_key(t, keys) for t in ['ab', 'c', 'ab']]
+        [0, 1, 0]
+
+        """
+        if isinstance(term, Counter):
+            term = frozenset(item for item in term.items() if item[1])
+        return keys.setdefault(term, len(keys))
+
+    def sim_many(self, src, targets, qval=2, *args, **kwargs):
+        """Return the similarities of one string to each of many strings.
+
+        This is the one-row case of :py:meth:`sim_matrix`.
+
+        Parameters
+        ----------
+        src : str
+            Source string (or QGrams/Counter object) for comparison
+        targets : iterable
+            Target strings (or QGrams/Counter objects) for comparison
+        qval : int
+            The length of each q-gram; 0 for non-q-gram version
+        *args
+            Variable length argument list, as for sim
+        **kwargs
+            Arbitrary keyword arguments, as for sim
+
+        Returns
+        -------
+        numpy.ndarray
+            The similarity of src to each target, as floats
+
+        Examples
+        --------
+        >>> from abydos.distance import Jaccard
+        >>> Jaccard().sim_many('cat', ['hat', 'cat', 'dog'])
+        array([0.33333333, 1.        , 0.        ])
+
+        """
+        return self.sim_matrix([src], targets, qval, *args, **kwargs)[0]
+
+    def dist_many(self, src, targets, qval=2, *args, **kwargs):
+        """Return the distances of one string to each of many strings.
+
+        This is the one-row case of :py:meth:`dist_matrix`.
+
+        Parameters
+        ----------
+        src : str
+            Source string (or QGrams/Counter object) for comparison
+        targets : iterable
+            Target strings (or QGrams/Counter objects) for comparison
+        qval : int
+            The length of each q-gram; 0 for non-q-gram version
+        *args
+            Variable length argument list, as for dist
+        **kwargs
+            Arbitrary keyword arguments, as for dist
+
+        Returns
+        -------
+        numpy.ndarray
+            The distance of src to each target, as floats
+
+        Examples
+        --------
+        >>> from abydos.distance import Jaccard
+        >>> Jaccard().dist_many('cat', ['hat', 'cat', 'dog'])
+        array([0.66666667, 0.        , 1.        ])
+
+        """
+        return self.dist_matrix([src], targets, qval, *args, **kwargs)[0]
 
 
 if __name__ == '__main__':
@@ -28,6 +28,9 @@ from __future__ import (
     unicode_literals,
 )
 
+from numpy import maximum as np_maximum
+from numpy import minimum as np_minimum
+
 from ._token_distance import _TokenDistance
 
 __all__ = ['Tversky', 'dist_tversky', 'sim_tversky']
@@ -142,6 +145,64 @@ class Tversky(_TokenDistance):
         c_val = q_intersection_mag + bias
         return c_val / (beta * (alpha * a_val + (1 - alpha) * b_val) + c_val)
 
+    def _sim_from_magnitudes(
+        self, src_mag, tar_mag, int_mag, alpha=1, beta=1, bias=None
+    ):
+        """Return Tversky indices from q-gram multiset magnitudes.
+
+        Parameters
+        ----------
+        src_mag : numpy.ndarray
+            The magnitudes of the source q-gram multisets
+        tar_mag : numpy.ndarray
+            The magnitudes of the target q-gram multisets
+        int_mag : numpy.ndarray
+            The magnitudes of the intersections of the q-gram multisets
+        alpha : float
+            Tversky index parameter as described above
+        beta : float
+            Tversky index parameter as described above
+        bias : float
+            The symmetric Tversky index bias parameter
+
+        Returns
+        -------
+        numpy.ndarray
+            Tversky similarities
+
+        Raises
+        ------
+        ValueError
+            Unsupported weight assignment; alpha and beta must be greater than
+            or equal to 0.
+
+        Examples
+        --------
+        >>> cmp = Tversky()
+        >>> cmp._sim_from_magnitudes(4, 4, 2)
+        0.3333333333333333
+        >>> cmp._sim_from_magnitudes(6, 5, 2, bias=0.5)
+        0.45454545454545453
+
+        """
+        if alpha < 0 or beta < 0:
+            raise ValueError(
+                'Unsupported weight assignment; alpha and beta '
+                + 'must be greater than or equal to 0.'
+            )
+
+        if bias is None:
+            return int_mag / (
+                int_mag
+                + alpha * (src_mag - int_mag)
+                + beta * (tar_mag - int_mag)
+            )
+
+        a_val = np_minimum(src_mag - int_mag, tar_mag - int_mag)
+        b_val = np_maximum(src_mag - int_mag, tar_mag - int_mag)
+        c_val = int_mag + bias
+        return c_val / (beta * (alpha * a_val + (1 - alpha) * b_val) + c_val)
+
 
 def sim_tversky(src, tar, qval=2, alpha=1, beta=1, bias=None):
     """Return the Tversky index of two strings.
@@ -30,12 +30,16 @@ from __future__ import (
 
 from math import log
 
+from numpy import array as np_array
 from numpy import float32 as np_float32
+from numpy import float64 as np_float64
+from numpy import full as np_full
 from numpy import zeros as np_zeros
 
 from six.moves import range
 
 from ._distance import _Distance
+from ._wavefront import _char_codes, _use_wavefront, _wavefront_dist
 
 __all__ = ['Typo', 'dist_typo', 'sim_typo', 'typo']
 
@@ -91,6 +95,8 @@ class Typo(_Distance):
     )}
     # fmt: on
 
+    _coords = {}
+
     def dist_abs(
         self,
         src,
@@ -170,77 +176,121 @@ class Typo(_Distance):
         if not tar:
             return len(src) * del_cost
 
-        keyboard = self._keyboard[layout]
-        lowercase = {item for sublist in keyboard[0] for item in sublist}
-        uppercase = {item for sublist in keyboard[1] for item in sublist}
+        sub_func = self._substitution_cost_func(
+            metric, sub_cost, shift_cost, layout
+        )
+        if _use_wavefront(len(src), len(tar)):
+            return self._dist_abs_wavefront(
+                src, tar, ins_cost, del_cost, sub_func
+            )
+        return self._dist_abs_dp(src, tar, ins_cost, del_cost, sub_func)
 
-        def _kb_array_for_char(char):
-            """Return the keyboard layout that contains ch.
+    def _char_coords(self, layout):
+        """Return the keyboard coordinates of each key in a layout.
 
-            Parameters
-            ----------
-            char : str
-                The character to lookup
+        The coordinates of each layout are computed once and then cached.
 
-            Returns
-            -------
-            tuple
-                A keyboard
+        Parameters
+        ----------
+        layout : str
+            Name of the keyboard layout
 
-            Raises
-            ------
-            ValueError
-                char not found in any keyboard layouts
+        Returns
+        -------
+        dict
+            A dict mapping each character to its (shift, row, column) position,
+            where shift is 0 for unshifted & 1 for shifted characters
 
-            """
-            if char in lowercase:
-                return keyboard[0]
-            elif char in uppercase:
-                return keyboard[1]
-            raise ValueError(char + ' not found in any keyboard layouts')
+        Examples
+        --------
+        >>> cmp = Typo()
+        >>> cmp._char_coords('QWERTY')['a']
+        (0, 2, 1)
+        >>> cmp._char_coords('QWERTY')['A']
+        (1, 2, 1)
 
-        def _substitution_cost(char1, char2):
-            cost = sub_cost
-            cost *= metric_dict[metric](char1, char2) + shift_cost * (
-                _kb_array_for_char(char1) != _kb_array_for_char(char2)
-            )
-            return cost
+        """
+        if layout not in self._coords:
+            coords = {}
+            for shift, kb_array in enumerate(self._keyboard[layout]):
+                for row_num, row in enumerate(kb_array):
+                    for col_num, char in enumerate(row):
+                        if char not in coords:
+                            coords[char] = (shift, row_num, col_num)
+            self._coords[layout] = coords
+        return self._coords[layout]
 
-        def _get_char_coord(char, kb_array):
-            """Return the row & column of char in the keyboard.
+    def _substitution_cost_func(self, metric, sub_cost, shift_cost, layout):
+        """Return a memoized function giving the cost of substitutions.
+
+        Costs are memoized, so each pair of characters is costed only once.
+
+        Parameters
+        ----------
+        metric : str
+            Supported values include: ``euclidean``, ``manhattan``,
+            ``log-euclidean``, and ``log-manhattan``
+        sub_cost : float
+            The cost of a substitution
+        shift_cost : float
+            The cost of a shift
+        layout : str
+            Name of the keyboard layout to use
+
+        Returns
+        -------
+        function
+            The substitution cost function
+
+        Examples
+        --------
+        >>> cmp = Typo()
+        >>> sub = cmp._substitution_cost_func('manhattan', 0.5, 0.5, 'QWERTY')
+        >>> sub('a', 's')
+        0.5
+        >>> sub('a', 'S')
+        0.75
+
+        """
+        coords = self._char_coords(layout)
+        memo = {}
+
+        def _get_char_coord(char):
+            """Return the shift, row, & column of char in the keyboard.
 
             Parameters
             ----------
             char : str
                 The character to search for
-            kb_array : tuple of tuples
-                The array of key positions
 
             Returns
             -------
             tuple
-                The row & column of the key
+                The shift, row, & column of the key
+
+            Raises
+            ------
+            ValueError
+                char not found in any keyboard layouts
 
             """
-            for row in kb_array:  # pragma: no branch
-                if char in row:
-                    return kb_array.index(row), row.index(char)
+            if char not in coords:
+                raise ValueError(char + ' not found in any keyboard layouts')
+            return coords[char]
 
-        def _euclidean_keyboard_distance(char1, char2):
-            row1, col1 = _get_char_coord(char1, _kb_array_for_char(char1))
-            row2, col2 = _get_char_coord(char2, _kb_array_for_char(char2))
-            return ((row1 - row2) ** 2 + (col1 - col2) ** 2) ** 0.5
+        def _euclidean_keyboard_distance(coord1, coord2):
+            return (
+                (coord1[1] - coord2[1]) ** 2 + (coord1[2] - coord2[2]) ** 2
+            ) ** 0.5
 
-        def _manhattan_keyboard_distance(char1, char2):
-            row1, col1 = _get_char_coord(char1, _kb_array_for_char(char1))
-            row2, col2 = _get_char_coord(char2, _kb_array_for_char(char2))
-            return abs(row1 - row2) + abs(col1 - col2)
+        def _manhattan_keyboard_distance(coord1, coord2):
+            return abs(coord1[1] - coord2[1]) + abs(coord1[2] - coord2[2])
 
-        def _log_euclidean_keyboard_distance(char1, char2):
-            return log(1 + _euclidean_keyboard_distance(char1, char2))
+        def _log_euclidean_keyboard_distance(coord1, coord2):
+            return log(1 + _euclidean_keyboard_distance(coord1, coord2))
 
-        def _log_manhattan_keyboard_distance(char1, char2):
-            return log(1 + _manhattan_keyboard_distance(char1, char2))
+        def _log_manhattan_keyboard_distance(coord1, coord2):
+            return log(1 + _manhattan_keyboard_distance(coord1, coord2))
 
         metric_dict = {
             'euclidean': _euclidean_keyboard_distance,
@@ -249,6 +299,49 @@ class Typo(_Distance):
             'log-manhattan': _log_manhattan_keyboard_distance,
         }
 
+        def _substitution_cost(char1, char2):
+            if (char1, char2) not in memo:
+                coord1 = _get_char_coord(char1)
+                coord2 = _get_char_coord(char2)
+                memo[char1, char2] = sub_cost * (
+                    metric_dict[metric](coord1, coord2)
+                    + shift_cost * (coord1[0] != coord2[0])
+                )
+            return memo[char1, char2]
+
+        return _substitution_cost
+
+    @staticmethod
+    def _dist_abs_dp(src, tar, ins_cost, del_cost, sub_func):
+        """Return the typo distance between two non-empty strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        ins_cost : float
+            The cost of an insert
+        del_cost : float
+            The cost of a delete
+        sub_func : function
+            The substitution cost function, as returned by
+            :py:meth:`_substitution_cost_func`
+
+        Returns
+        -------
+        float
+            Typo distance
+
+        Examples
+        --------
+        >>> cmp = Typo()
+        >>> sub = cmp._substitution_cost_func('manhattan', 0.5, 0.5, 'QWERTY')
+        >>> cmp._dist_abs_dp('cat', 'hat', 1, 1, sub)
+        2.0
+
+        """
         d_mat = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_float32)
         for i in range(len(src) + 1):
             d_mat[i, 0] = i * del_cost
@@ -262,14 +355,73 @@ class Typo(_Distance):
                     d_mat[i, j + 1] + del_cost,  # del
                     d_mat[i, j]
                     + (
-                        _substitution_cost(src[i], tar[j])
-                        if src[i] != tar[j]
-                        else 0
+                        sub_func(src[i], tar[j]) if src[i] != tar[j] else 0
                     ),  # sub/==
                 )
 
         return d_mat[len(src), len(tar)]
 
+    @staticmethod
+    def _dist_abs_wavefront(src, tar, ins_cost, del_cost, sub_func):
+        """Return the typo distance, filling the matrix by wavefront.
+
+        This computes the same matrix as :py:meth:`_dist_abs_dp`, one
+        anti-diagonal at a time, with numpy vector operations. The
+        substitution cost of each pair of distinct characters from src & tar
+        is looked up once.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        ins_cost : float
+            The cost of an insert
+        del_cost : float
+            The cost of a delete
+        sub_func : function
+            The substitution cost function, as returned by
+            :py:meth:`_substitution_cost_func`
+
+        Returns
+        -------
+        float
+            Typo distance
+
+        Examples
+        --------
+        >>> cmp = Typo()
+        >>> sub = cmp._substitution_cost_func('manhattan', 0.5, 0.5, 'QWERTY')
+        >>> cmp._dist_abs_wavefront('cat', 'hat', 1, 1, sub)
+        2.0
+
+        """
+        src_codes, tar_codes, alphabet = _char_codes(src, tar)
+        codes = {char: code for code, char in enumerate(alphabet)}
+        sub_table = np_zeros((len(alphabet), len(alphabet)))
+        for src_char in set(src):
+            for tar_char in set(tar):
+                if src_char != tar_char:
+                    sub_table[codes[src_char], codes[tar_char]] = sub_func(
+                        src_char, tar_char
+                    )
+
+        return _wavefront_dist(
+            src_codes,
+            tar_codes,
+            sub_table,
+            np_array([i * del_cost for i in range(len(src) + 1)]).astype(
+                np_float32
+            ),
+            np_array([j * ins_cost for j in range(len(tar) + 1)]).astype(
+                np_float32
+            ),
+            np_full(len(src) + 1, del_cost),
+            np_full(len(tar) + 1, ins_cost),
+            dtype=np_float32,
+        )
+
     def dist(
         self,
         src,
@@ -326,6 +478,110 @@ class Typo(_Distance):
             max(len(src) * del_cost, len(tar) * ins_cost)
         )
 
+    def dist_many(
+        self,
+        src,
+        targets,
+        metric='euclidean',
+        cost=(1, 1, 0.5, 0.5),
+        layout='QWERTY',
+    ):
+        """Return the normalized typo distances to many strings.
+
+        The keyboard coordinates & substitution costs are computed once and
+        reused for every target.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable
+            Target strings for comparison
+        metric : str
+            Supported values include: ``euclidean``, ``manhattan``,
+            ``log-euclidean``, and ``log-manhattan``
+        cost : tuple
+            A 4-tuple representing the cost of the four possible edits:
+            inserts, deletes, substitutions, and shift, respectively (by
+            default: (1, 1, 0.5, 0.5)) The substitution & shift costs should be
+            significantly less than the cost of an insertion & deletion unless
+            a log metric is used.
+        layout : str
+            Name of the keyboard layout to use (Currently supported:
+            ``QWERTY``, ``Dvorak``, ``AZERTY``, ``QWERTZ``)
+
+        Returns
+        -------
+        numpy.ndarray
+            Normalized typo distance between src & each target
+
+        Raises
+        ------
+        ValueError
+            char not found in any keyboard layouts
+
+        Examples
+        --------
+        >>> cmp = Typo()
+        >>> cmp.dist_many('Niall', ['Neil', 'Niall', 'Nigel'])
+        array([0.56502814, 0.        , 0.62360678])
+
+        """
+        ins_cost, del_cost, sub_cost, shift_cost = cost
+        sub_func = self._substitution_cost_func(
+            metric, sub_cost, shift_cost, layout
+        )
+
+        dists = []
+        for tar in targets:
+            if tar == src:
+                dists.append(0.0)
+                continue
+            if not src:
+                distance = len(tar) * ins_cost
+            elif not tar:
+                distance = len(src) * del_cost
+            elif _use_wavefront(len(src), len(tar)):
+                distance = self._dist_abs_wavefront(
+                    src, tar, ins_cost, del_cost, sub_func
+                )
+            else:
+                distance = self._dist_abs_dp(
+                    src, tar, ins_cost, del_cost, sub_func
+                )
+            dists.append(
+                distance / max(len(src) * del_cost, len(tar) * ins_cost)
+            )
+        return np_array(dists, dtype=np_float64)
+
+    def sim_many(self, src, targets, *args, **kwargs):
+        """Return the normalized typo similarities to many strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable
+            Target strings for comparison
+        *args
+            Variable length argument list, as for :py:meth:`dist_many`
+        **kwargs
+            Arbitrary keyword arguments, as for :py:meth:`dist_many`
+
+        Returns
+        -------
+        numpy.ndarray
+            Normalized typo similarity between src & each target
+
+        Examples
+        --------
+        >>> cmp = Typo()
+        >>> cmp.sim_many('Niall', ['Neil', 'Niall', 'Nigel'])
+        array([0.43497186, 1.        , 0.37639322])
+
+        """
+        return 1.0 - self.dist_many(src, targets, *args, **kwargs)
+
 
 def typo(src, tar, metric='euclidean', cost=(1, 1, 0.5, 0.5), layout='QWERTY'):
     """Return the typo distance between two strings.
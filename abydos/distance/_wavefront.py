@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2014-2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._wavefront.
+
+Anti-diagonal (wavefront) edit distance kernel
+"""
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+from numpy import arange as np_arange
+from numpy import array as np_array
+from numpy import float64 as np_float64
+from numpy import int64 as np_int64
+from numpy import minimum as np_minimum
+from numpy import where as np_where
+from numpy import zeros as np_zeros
+
+from six.moves import range
+
+__all__ = ['_char_codes', '_use_wavefront', '_wavefront_dist']
+
+# The average anti-diagonal length, len(src) * len(tar) / (len(src) +
+# len(tar)), above which the vectorized kernel outpaces a scalar loop over
+# the cells of the matrix
+_WAVEFRONT_MIN_DIAGONAL = 24
+
+
+def _use_wavefront(src_len, tar_len):
+    """Return True if the wavefront kernel is the faster way to fill a matrix.
+
+    Parameters
+    ----------
+    src_len : int
+        The length of the source string
+    tar_len : int
+        The length of the target string
+
+    Returns
+    -------
+    bool
+        True if the wavefront kernel should be used
+
+    Examples
+    --------
+    >>> _use_wavefront(10, 10)
+    False
+    >>> _use_wavefront(100, 100)
+    True
+    >>> _use_wavefront(1000, 5)
+    False
+
+    """
+    return src_len * tar_len > _WAVEFRONT_MIN_DIAGONAL * (src_len + tar_len)
+
+
+def _char_codes(src, tar):
+    """Return integer codes for the characters of two strings.
+
+    Parameters
+    ----------
+    src : str
+        Source string
+    tar : str
+        Target string
+
+    Returns
+    -------
+    tuple
+        The codes of the characters of src & of tar (as numpy arrays) and the
+        list of distinct characters, in which each character's index is its
+        code
+
+    Examples
+    --------
+    >>> src_codes, tar_codes, alphabet = _char_codes('abba', 'cab')
+    >>> src_codes
+    array([0, 1, 1, 0])
+    >>> tar_codes
+    array([2, 0, 1])
+    >>> alphabet
+    ['a', 'b', 'c']
+
+    """
+    codes = {}
+    src_codes = [codes.setdefault(char, len(codes)) for char in src]
+    tar_codes = [codes.setdefault(char, len(codes)) for char in tar]
+    alphabet = sorted(codes, key=codes.get)
+    return (
+        np_array(src_codes, dtype=np_int64),
+        np_array(tar_codes, dtype=np_int64),
+        alphabet,
+    )
+
+
+def _wavefront_dist(
+    src_codes,
+    tar_codes,
+    sub_table,
+    first_col,
+    first_row,
+    del_costs,
+    ins_costs,
+    trans_cost=None,
+    dtype=np_int64,
+):
+    """Return an edit distance, computed one anti-diagonal at a time.
+
+    The dynamic programming matrix of an edit distance with the recurrence
+
+    .. math::
+
+        D_{i,j} = min(D_{i-1,j} + del_i, D_{i,j-1} + ins_j,
+        D_{i-1,j-1} + sub(s_i, t_j))
+
+    (and, optionally, the Optimal String Alignment transposition
+    :math:`D_{i-2,j-2} + trans` where :math:`s_{i-1}s_i = t_jt_{j-1}`) is
+    filled by anti-diagonals :math:`i + j = k`, each of whose cells depends
+    only on earlier anti-diagonals, so that each anti-diagonal is computed
+    with a handful of numpy vector operations rather than a loop over its
+    cells. Substitution costs are gathered from a table indexed by character
+    codes.
+
+    Only the last four anti-diagonals are retained. Each is stored in dtype,
+    so values are rounded (or truncated) exactly as they would be in a
+    matrix of that dtype filled cell by cell.
+
+    Parameters
+    ----------
+    src_codes : numpy.ndarray
+        The character codes of the source string, as from
+        :py:func:`_char_codes`
+    tar_codes : numpy.ndarray
+        The character codes of the target string
+    sub_table : numpy.ndarray
+        The cost of substituting character code b for a, at [a, b]
+        (including a cost, typically 0, for a == b)
+    first_col : numpy.ndarray
+        The first column of the matrix, :math:`D_{i,0}`
+    first_row : numpy.ndarray
+        The first row of the matrix, :math:`D_{0,j}`
+    del_costs : numpy.ndarray
+        The cost of deleting the i-th source character, at index i (index 0
+        is unused)
+    ins_costs : numpy.ndarray
+        The cost of inserting the j-th target character, at index j (index 0
+        is unused)
+    trans_cost : int or float
+        The cost of a transposition, or None to disallow transpositions
+    dtype : numpy.dtype
+        The data type of the matrix
+
+    Returns
+    -------
+    int or float
+        The value of the final cell of the matrix
+
+    Examples
+    --------
+    >>> from numpy import eye, ones
+    >>> src_codes, tar_codes, alphabet = _char_codes('ATCG', 'TAGC')
+    >>> sub_table = 1 - eye(len(alphabet))
+    >>> _wavefront_dist(src_codes, tar_codes, sub_table, np_arange(5),
+    ... np_arange(5), ones(5), ones(5))
+    3
+    >>> _wavefront_dist(src_codes, tar_codes, sub_table, np_arange(5),
+    ... np_arange(5), ones(5), ones(5), trans_cost=1)
+    2
+
+    """
+    src_len = len(src_codes)
+    tar_len = len(tar_codes)
+    sub_table = np_array(sub_table, dtype=np_float64)
+    del_costs = np_array(del_costs, dtype=np_float64)
+    # Reversed, so that a slice runs in order of increasing i (decreasing j)
+    ins_rev = np_array(ins_costs, dtype=np_float64)[::-1]
+    tar_rev = tar_codes[::-1]
+
+    # Each anti-diagonal is indexed by i; diags[-1] is the latest.
+    diags = [np_zeros(src_len + 1, dtype=dtype)]
+    diags[0][0] = first_col[0]
+
+    for k in range(1, src_len + tar_len + 1):
+        prev = diags[-1]
+        new = np_zeros(src_len + 1, dtype=dtype)
+        if k <= tar_len:
+            new[0] = first_row[k]
+        if k <= src_len:
+            new[k] = first_col[k]
+
+        # The interior cells run from i=lo to i=hi, with j = k - i.
+        lo = max(1, k - tar_len)
+        hi = min(src_len, k - 1)
+        if lo <= hi:
+            # ins_rev[j_rev] are ins_costs[j] & tar_rev[j_rev] are
+            # tar_codes[j - 1], for i from lo to hi
+            j_rev = slice(tar_len - k + lo, tar_len - k + hi + 1)
+
+            vals = np_minimum(
+                prev[lo - 1 : hi] + del_costs[lo : hi + 1],
+                prev[lo : hi + 1] + ins_rev[j_rev],
+            )
+            vals = np_minimum(
+                vals,
+                diags[-2][lo - 1 : hi]
+                + sub_table[src_codes[lo - 1 : hi], tar_rev[j_rev]],
+            )
+
+            if trans_cost is not None and k >= 4:
+                # Cells with i >= 2 & j >= 2 may be reached by a transposition
+                t_lo = max(lo, 2)
+                t_hi = min(hi, k - 2)
+                if t_lo <= t_hi:
+                    i = np_arange(t_lo, t_hi + 1)
+                    j = k - i
+                    swap = (src_codes[i - 1] == tar_codes[j - 2]) & (
+                        src_codes[i - 2] == tar_codes[j - 1]
+                    )
+                    cells = slice(t_lo - lo, t_hi - lo + 1)
+                    vals[cells] = np_where(
+                        swap,
+                        np_minimum(vals[cells], diags[-4][i - 2] + trans_cost),
+                        vals[cells],
+                    )
+
+            new[lo : hi + 1] = vals
+
+        diags.append(new)
+        if len(diags) > 4:
+            del diags[0]
+
+    return diags[-1][src_len]
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2014-2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.index.
+
+The index package collects classes that index a collection of terms in order
+to find similar terms without comparing a query to every member of the
+collection:
+
+- :py:class:`MinHashLSHIndex`, a MinHash locality-sensitive hashing index for
+  candidate generation by q-gram Jaccard similarity
+- :py:class:`BKTree`, a Burkhard-Keller tree for range & nearest-neighbor
+  search under integer-valued metrics, such as Levenshtein distance
+- :py:class:`VPTree`, a vantage-point tree for range & nearest-neighbor
+  search under any metric, including real-valued ones
+- :py:class:`SymSpellIndex`, a symmetric deletion index for fast lookup of
+  terms within a small edit distance
+- :py:class:`LevenshteinTrie`, a prefix trie searched for all terms within
+  an edit distance, sharing distance matrix rows among common prefixes
+
+
+As a quick example of :py:class:`.MinHashLSHIndex`:
+
+>>> idx = MinHashLSHIndex(['Niall', 'Nial', 'Neal', 'Neil', 'Kneale'])
+>>> idx.query('Niall', threshold=0.5)
+[('Niall', 1.0), ('Nial', 0.8333333333333334)]
+
+And of :py:class:`.BKTree`:
+
+>>> tree = BKTree(['Niall', 'Neal', 'Neil', 'Nigel', 'Kneale'])
+>>> tree.search('Nial', 1)
+[('Neal', 1), ('Niall', 1)]
+>>> tree.nearest('Nigelle', 2)
+[('Nigel', 2), ('Niall', 3)]
+
+And of :py:class:`.VPTree`:
+
+>>> from abydos.distance import Jaccard
+>>> tree = VPTree(['Niall', 'Neal', 'Neil', 'Nigel', 'Kneale'], Jaccard().dist)
+>>> tree.nearest('Nigelle', 2)
+[('Nigel', 0.4444444444444444), ('Niall', 0.7272727272727273)]
+
+And of :py:class:`.SymSpellIndex`:
+
+>>> idx = SymSpellIndex(['Niall', 'Neal', 'Neil', 'Nigel', 'Kneale'])
+>>> idx.query('Nial', max_distance=1)
+[('Neal', 1), ('Niall', 1)]
+
+And of :py:class:`.LevenshteinTrie`:
+
+>>> trie = LevenshteinTrie(['Niall', 'Neal', 'Neil', 'Nigel', 'Kneale'])
+>>> trie.search('Nial', 2)
+[('Neal', 1), ('Niall', 1), ('Neil', 2), ('Nigel', 2)]
+
+----
+
+"""
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+from ._bktree import BKTree
+from ._levenshtein_trie import LevenshteinTrie
+from ._minhash_lsh import MinHashLSHIndex
+from ._symspell import SymSpellIndex
+from ._vptree import VPTree
+
+__all__ = [
+    'BKTree',
+    'LevenshteinTrie',
+    'MinHashLSHIndex',
+    'SymSpellIndex',
+    'VPTree',
+]
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2014-2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.index._bktree.
+
+Burkhard-Keller tree index
+"""
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+from heapq import heappush, heappushpop
+
+from ..distance import levenshtein
+
+__all__ = ['BKTree']
+
+
+class BKTree(object):
+    """Burkhard-Keller tree.
+
+    A BK-tree :cite:`Burkhard:1973` indexes terms under a metric with
+    discrete (typically integer) values, such as
+    :py:meth:`.Levenshtein.dist_abs`, :py:meth:`.DamerauLevenshtein.dist_abs`,
+    :py:meth:`.Hamming.dist_abs`, or :py:meth:`.Indel.dist_abs`.
+
+    Each node's children are keyed by their distance from the node. By the
+    triangle inequality, a search for terms within radius r of a query at
+    distance d from a node need only descend into the children keyed
+    d - r through d + r.
+
+    The metric must satisfy the triangle inequality (so, e.g., the OSA mode
+    of Levenshtein, which does not, may miss matches).
+    """
+
+    def __init__(self, terms=None, metric=None):
+        """Initialize BKTree.
+
+        Parameters
+        ----------
+        terms : iterable
+            Terms to add to the tree
+        metric : function
+            A metric taking two terms & returning their distance; by
+            default, the Levenshtein distance, :py:func:`.levenshtein`
+
+        """
+        self.metric = levenshtein if metric is None else metric
+        self._root = None
+        self._size = 0
+
+        if terms is not None:
+            self.update(terms)
+
+    def __len__(self):
+        """Return the number of terms in the tree.
+
+        Returns
+        -------
+        int
+            The number of terms in the tree
+
+        Examples
+        --------
+        >>> len(BKTree(['Niall', 'Neal', 'Niall']))
+        2
+
+        """
+        return self._size
+
+    def add(self, term):
+        """Add a term to the tree.
+
+        Adding a term that is already in the tree has no effect.
+
+        Parameters
+        ----------
+        term : str
+            The term to add
+
+        Examples
+        --------
+        >>> tree = BKTree()
+        >>> tree.add('Niall')
+        >>> tree.add('Neal')
+        >>> len(tree)
+        2
+
+        """
+        if self._root is None:
+            self._root = (term, {})
+            self._size = 1
+            return
+
+        node = self._root
+        while True:
+            distance = self.metric(term, node[0])
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (term, {})
+                self._size += 1
+                return
+            node = child
+
+    def update(self, terms):
+        """Add many terms to the tree.
+
+        Parameters
+        ----------
+        terms : iterable
+            The terms to add
+
+        Examples
+        --------
+        >>> tree = BKTree()
+        >>> tree.update(['Niall', 'Neal', 'Neil'])
+        >>> len(tree)
+        3
+
+        """
+        for term in terms:
+            self.add(term)
+
+    def search(self, term, radius):
+        """Return the terms within a distance of a term.
+
+        Parameters
+        ----------
+        term : str
+            The query term
+        radius : int
+            The maximum distance from term of the terms to return
+
+        Returns
+        -------
+        list
+            (term, distance) tuples, in increasing order of distance
+
+        Examples
+        --------
+        >>> tree = BKTree(['Niall', 'Neal', 'Neil', 'Nigel', 'Kneale'])
+        >>> tree.search('Nial', 1)
+        [('Neal', 1), ('Niall', 1)]
+        >>> tree.search('Nial', 2)
+        [('Neal', 1), ('Niall', 1), ('Neil', 2), ('Nigel', 2)]
+
+        """
+        results = []
+        if self._root is None:
+            return results
+
+        stack = [self._root]
+        while stack:
+            node_term, children = stack.pop()
+            distance = self.metric(term, node_term)
+            if distance <= radius:
+                results.append((node_term, distance))
+            for edge, child in children.items():
+                if distance - radius <= edge <= distance + radius:
+                    stack.append(child)
+
+        return sorted(results, key=lambda result: (result[1], result[0]))
+
+    def nearest(self, term, k=1):
+        """Return the nearest terms to a term.
+
+        The search radius shrinks to the distance of the k-th nearest term
+        found so far, so branches that cannot hold a nearer term are pruned.
+        Among terms tied at the k-th distance, which are returned is
+        arbitrary.
+
+        Parameters
+        ----------
+        term : str
+            The query term
+        k : int
+            The number of terms to return
+
+        Returns
+        -------
+        list
+            Up to k (term, distance) tuples, in increasing order of distance
+
+        Examples
+        --------
+        >>> tree = BKTree(['Niall', 'Neal', 'Neil', 'Nigel', 'Kneale'])
+        >>> tree.nearest('Nigell')
+        [('Nigel', 1)]
+        >>> tree.nearest('Nigell', 3)
+        [('Nigel', 1), ('Niall', 2), ('Neil', 3)]
+
+        """
+        if self._root is None or k < 1:
+            return []
+
+        # A max-heap (by negated distance) of the best k terms found so far
+        best = []
+        stack = [self._root]
+        while stack:
+            node_term, children = stack.pop()
+            distance = self.metric(term, node_term)
+            if len(best) < k:
+                heappush(best, (-distance, node_term))
+            elif distance < -best[0][0]:
+                heappushpop(best, (-distance, node_term))
+
+            radius = -best[0][0] if len(best) == k else None
+            for edge, child in children.items():
+                if radius is None or abs(edge - distance) <= radius:
+                    stack.append(child)
+
+        return sorted(
+            ((node_term, -neg_dist) for neg_dist, node_term in best),
+            key=lambda result: (result[1], result[0]),
+        )
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2014-2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.index._levenshtein_trie.
+
+Levenshtein trie
+"""
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+from six.moves import range
+
+__all__ = ['LevenshteinTrie']
+
+# The key under which a trie node stores the term that ends at it; no
+# character of a term can equal it.
+_TERM = None
+
+
+class LevenshteinTrie(object):
+    """Levenshtein trie.
+
+    A prefix trie of terms, searched by walking it depth-first while
+    computing one row of the Levenshtein distance matrix per trie node
+    :cite:`Schulz:2002`. Terms sharing a prefix share the rows computed for
+    it, only the cells within max_distance of the diagonal are computed, and
+    a branch is abandoned as soon as every cell of its row exceeds
+    max_distance, so a search visits only a small part of the trie rather
+    than computing a full matrix for every term.
+    """
+
+    def __init__(self, terms=None, mode='lev'):
+        """Initialize LevenshteinTrie.
+
+        Parameters
+        ----------
+        terms : iterable
+            Terms to add to the trie
+        mode : str
+            Specifies the edit distance to search by:
+
+                - ``lev`` (default) computes the ordinary Levenshtein distance
+                - ``osa`` computes the optimal string alignment distance
+                  (Levenshtein distance with transpositions)
+
+        Raises
+        ------
+        ValueError
+            Unsupported mode
+
+        """
+        if mode not in {'lev', 'osa'}:
+            raise ValueError('Unsupported mode: {}'.format(mode))
+        self.mode = mode
+        self._root = {}
+        self._size = 0
+
+        if terms is not None:
+            self.update(terms)
+
+    def __len__(self):
+        """Return the number of terms in the trie.
+
+        Returns
+        -------
+        int
+            The number of distinct terms in the trie
+
+        Examples
+        --------
+        >>> len(LevenshteinTrie(['Niall', 'Neal', 'Niall']))
+        2
+
+        """
+        return self._size
+
+    def __contains__(self, term):
+        """Return True if term is in the trie.
+
+        Parameters
+        ----------
+        term : str
+            The term to look up
+
+        Returns
+        -------
+        bool
+            True if term is in the trie
+
+        Examples
+        --------
+        >>> trie = LevenshteinTrie(['Niall', 'Neal'])
+        >>> 'Neal' in trie, 'Nea' in trie
+        (True, False)
+
+        """
+        node = self._root
+        for char in term:
+            node = node.get(char)
+            if node is None:
+                return False
+        return _TERM in node
+
+    def add(self, term):
+        """Add a term to the trie.
+
+        Parameters
+        ----------
+        term : str
+            The term to add
+
+        Examples
+        --------
+        >>> trie = LevenshteinTrie()
+        >>> trie.add('Niall')
+        >>> trie.add('Niall')
+        >>> len(trie)
+        1
+
+        """
+        node = self._root
+        for char in term:
+            node = node.setdefault(char, {})
+        if _TERM not in node:
+            node[_TERM] = term
+            self._size += 1
+
+    def update(self, terms):
+        """Add many terms to the trie.
+
+        Parameters
+        ----------
+        terms : iterable
+            The terms to add
+
+        Examples
+        --------
+        >>> trie = LevenshteinTrie()
+        >>> trie.update(['Niall', 'Neal', 'Neil'])
+        >>> len(trie)
+        3
+
+        """
+        for term in terms:
+            self.add(term)
+
+    def search(self, term, max_distance):
+        """Return the terms within an edit distance of a term.
+
+        Parameters
+        ----------
+        term : str
+            The query term
+        max_distance : int
+            The greatest edit distance of the terms to return
+
+        Returns
+        -------
+        list
+            (term, distance) tuples, in increasing order of distance & then
+            term
+
+        Examples
+        --------
+        >>> names = ['Niall', 'Neal', 'Neil', 'Nigel', 'Kneale']
+        >>> trie = LevenshteinTrie(names)
+        >>> trie.search('Nial', 1)
+        [('Neal', 1), ('Niall', 1)]
+        >>> trie.search('Nial', 2)
+        [('Neal', 1), ('Niall', 1), ('Neil', 2), ('Nigel', 2)]
+
+        >>> trie = LevenshteinTrie(['Niall'], mode='osa')
+        >>> trie.search('Nilal', 1)
+        [('Niall', 1)]
+
+        """
+        if max_distance < 0:
+            return []
+
+        osa = self.mode == 'osa'
+        length = len(term)
+        cap = max_distance + 1
+        results = []
+
+        first_row = [min(j, cap) for j in range(length + 1)]
+        if _TERM in self._root and first_row[length] < cap:
+            results.append((self._root[_TERM], first_row[length]))
+
+        # Each entry holds a node, its row, its parent's row, the character
+        # leading to it, and its depth.
+        stack = [(self._root, first_row, None, None, 0)]
+        while stack:
+            node, row, prev_row, prev_char, depth = stack.pop()
+            depth += 1
+            # Cells farther than max_distance from the diagonal must exceed
+            # max_distance, so only the band between lo & hi is computed.
+            lo = max(1, depth - max_distance)
+            hi = min(length, depth + max_distance)
+
+            for char, child in node.items():
+                if char is _TERM:
+                    continue
+
+                new_row = [cap] * (length + 1)
+                new_row[0] = min(depth, cap)
+                for j in range(lo, hi + 1):
+                    dist = row[j - 1] + (term[j - 1] != char)
+                    if row[j] < dist:
+                        dist = row[j] + 1
+                    if new_row[j - 1] < dist:
+                        dist = new_row[j - 1] + 1
+                    if (
+                        osa
+                        and j > 1
+                        and prev_row is not None
+                        and term[j - 1] == prev_char
+                        and term[j - 2] == char
+                        and prev_row[j - 2] < dist
+                    ):
+                        dist = prev_row[j - 2] + 1
+                    new_row[j] = dist if dist < cap else cap
+
+                if _TERM in child and new_row[length] < cap:
+                    results.append((child[_TERM], new_row[length]))
+                if min(new_row[lo - 1 : hi + 1]) < cap:
+                    stack.append((child, new_row, row, char, depth))
+
+        return sorted(results, key=lambda result: (result[1], result[0]))
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
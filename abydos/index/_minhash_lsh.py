@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2014-2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.index._minhash_lsh.
+
+MinHash locality-sensitive hashing index
+"""
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+from zlib import crc32
+
+from numpy import array as np_array
+from numpy import full as np_full
+from numpy import int64 as np_int64
+from numpy import uint32 as np_uint32
+from numpy.random import RandomState
+
+from six.moves import range
+
+from ..distance import Jaccard
+from ..tokenizer import QGrams
+
+__all__ = ['MinHashLSHIndex']
+
+_MERSENNE_PRIME = (1 << 31) - 1
+
+
+class MinHashLSHIndex(object):
+    """MinHash LSH index.
+
+    A MinHash locality-sensitive hashing index
+    :cite:`Broder:1997,Leskovec:2014` finds candidate terms whose q-gram sets
+    have a high Jaccard similarity to a query term without comparing the query
+    to every indexed term.
+
+    Each term's q-gram set is summarized by a signature of num_perm minimum
+    hash values, each of which coincides for two sets with probability equal
+    to their Jaccard similarity. The signature is split into bands of
+    num_perm / bands rows and each band is hashed to a bucket; terms sharing
+    a bucket in any band are candidates. With b bands of r rows, pairs with
+    Jaccard similarity s become candidates with probability
+    :math:`1 - (1 - s^r)^b`, an S-curve whose threshold is roughly
+    :math:`(1/b)^{1/r}`.
+
+    Candidates are verified exactly with a similarity measure (Jaccard, by
+    default), so query results contain no false positives.
+
+    Instances can be pickled, so an index can be built once and reused.
+    """
+
+    def __init__(
+        self, terms=None, qval=2, num_perm=128, bands=32, metric=None, seed=0
+    ):
+        """Initialize MinHashLSHIndex.
+
+        Parameters
+        ----------
+        terms : iterable
+            Terms to add to the index
+        qval : int
+            The length of each q-gram
+        num_perm : int
+            The number of hash functions (the signature length)
+        bands : int
+            The number of bands into which signatures are split; this must
+            divide num_perm
+        metric : _TokenDistance
+            A token similarity measure, such as :py:class:`.Jaccard` or
+            :py:class:`.Dice`, used to verify candidates; its sim method is
+            called with qval
+        seed : int
+            The seed for the random hash functions; indices must share a seed
+            for their signatures to be comparable
+
+        Raises
+        ------
+        ValueError
+            bands must divide num_perm
+
+        """
+        if bands < 1 or num_perm % bands:
+            raise ValueError('bands must divide num_perm')
+
+        self.qval = qval
+        self.num_perm = num_perm
+        self.bands = bands
+        self.metric = Jaccard() if metric is None else metric
+
+        rng = RandomState(seed)
+        self._hash_a = rng.randint(
+            1, _MERSENNE_PRIME, size=(num_perm, 1)
+        ).astype(np_int64)
+        self._hash_b = rng.randint(
+            0, _MERSENNE_PRIME, size=(num_perm, 1)
+        ).astype(np_int64)
+
+        self._rows = num_perm // bands
+        self._signatures = {}
+        self._buckets = [{} for _ in range(bands)]
+
+        if terms is not None:
+            self.update(terms)
+
+    def __len__(self):
+        """Return the number of indexed terms.
+
+        Returns
+        -------
+        int
+            The number of indexed terms
+
+        Examples
+        --------
+        >>> len(MinHashLSHIndex(['Niall', 'Neal', 'Niall']))
+        2
+
+        """
+        return len(self._signatures)
+
+    def __contains__(self, term):
+        """Return True if term is indexed.
+
+        Parameters
+        ----------
+        term : str
+            The term to look up
+
+        Returns
+        -------
+        bool
+            True if term is indexed
+
+        Examples
+        --------
+        >>> 'Neal' in MinHashLSHIndex(['Niall', 'Neal'])
+        True
+
+        """
+        return term in self._signatures
+
+    def signature(self, term):
+        """Return the MinHash signature of a term.
+
+        Parameters
+        ----------
+        term : str
+            The term to hash
+
+        Returns
+        -------
+        numpy.ndarray
+            The minimum value of each hash function over the term's q-grams
+
+        Examples
+        --------
+        >>> idx = MinHashLSHIndex(num_perm=4, bands=2)
+        >>> idx.signature('Niall')
+        array([242457131, 368596011, 372869655, 121430371], dtype=uint32)
+
+        """
+        qgrams = QGrams(term, self.qval)
+        if not qgrams:
+            return np_full(self.num_perm, _MERSENNE_PRIME, dtype=np_uint32)
+
+        hashes = np_array(
+            [crc32(qgram.encode('utf-8')) & 0xFFFFFFFF for qgram in qgrams],
+            dtype=np_int64,
+        )
+        return (
+            ((self._hash_a * hashes + self._hash_b) % _MERSENNE_PRIME)
+            .min(axis=1)
+            .astype(np_uint32)
+        )
+
+    def _band_keys(self, signature):
+        """Return the bucket key of each band of a signature.
+
+        Parameters
+        ----------
+        signature : numpy.ndarray
+            A MinHash signature
+
+        Returns
+        -------
+        list
+            The bucket key (bytes) of each band
+
+        Examples
+        --------
+        >>> idx = MinHashLSHIndex(num_perm=4, bands=2)
+        >>> len(idx._band_keys(idx.signature('Niall')))
+        2
+
+        """
+        return [
+            signature[band * self._rows : (band + 1) * self._rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def add(self, term):
+        """Add a term to the index.
+
+        Adding a term that is already indexed has no effect.
+
+        Parameters
+        ----------
+        term : str
+            The term to add
+
+        Examples
+        --------
+        >>> idx = MinHashLSHIndex()
+        >>> idx.add('Niall')
+        >>> 'Niall' in idx
+        True
+
+        """
+        if term in self._signatures:
+            return
+        signature = self.signature(term)
+        self._signatures[term] = signature
+        for buckets, key in zip(self._buckets, self._band_keys(signature)):
+            buckets.setdefault(key, set()).add(term)
+
+    def update(self, terms):
+        """Add many terms to the index.
+
+        Parameters
+        ----------
+        terms : iterable
+            The terms to add
+
+        Examples
+        --------
+        >>> idx = MinHashLSHIndex()
+        >>> idx.update(['Niall', 'Neal', 'Neil'])
+        >>> len(idx)
+        3
+
+        """
+        for term in terms:
+            self.add(term)
+
+    def remove(self, term):
+        """Remove a term from the index.
+
+        Parameters
+        ----------
+        term : str
+            The term to remove
+
+        Raises
+        ------
+        KeyError
+            term is not indexed
+
+        Examples
+        --------
+        >>> idx = MinHashLSHIndex(['Niall', 'Neal'])
+        >>> idx.remove('Niall')
+        >>> 'Niall' in idx
+        False
+
+        """
+        signature = self._signatures.pop(term)
+        for buckets, key in zip(self._buckets, self._band_keys(signature)):
+            bucket = buckets[key]
+            bucket.discard(term)
+            if not bucket:
+                del buckets[key]
+
+    def candidates(self, term):
+        """Return the indexed terms sharing a bucket with a term.
+
+        Candidates are unverified: they may include terms with low
+        similarity to term and may miss terms with high similarity.
+
+        Parameters
+        ----------
+        term : str
+            The query term
+
+        Returns
+        -------
+        set
+            The candidate terms
+
+        Examples
+        --------
+        >>> idx = MinHashLSHIndex(['Niall', 'Nial', 'Neal', 'Kneale'])
+        >>> sorted(idx.candidates('Niall'))
+        ['Nial', 'Niall']
+
+        """
+        signature = self._signatures.get(term)
+        if signature is None:
+            signature = self.signature(term)
+
+        candidates = set()
+        for buckets, key in zip(self._buckets, self._band_keys(signature)):
+            candidates.update(buckets.get(key, ()))
+        return candidates
+
+    def query(self, term, threshold=0.5):
+        """Return the indexed terms similar to a term.
+
+        Parameters
+        ----------
+        term : str
+            The query term
+        threshold : float
+            The minimum similarity, according to the index's metric, of the
+            terms to return
+
+        Returns
+        -------
+        list
+            (term, similarity) tuples of candidates with similarity of at
+            least threshold, in decreasing order of similarity
+
+        Examples
+        --------
+        >>> idx = MinHashLSHIndex(['Niall', 'Nial', 'Neal', 'Kneale'])
+        >>> idx.query('Niall')
+        [('Niall', 1.0), ('Nial', 0.8333333333333334)]
+        >>> idx.query('Nialls', threshold=0.6)
+        [('Niall', 0.625)]
+
+        """
+        results = []
+        for candidate in self.candidates(term):
+            similarity = self.metric.sim(term, candidate, self.qval)
+            if similarity >= threshold:
+                results.append((candidate, similarity))
+        return sorted(results, key=lambda result: (-result[1], result[0]))
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,341 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2014-2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.index._symspell.
+
+Symmetric deletion (SymSpell) index
+"""
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+from six.moves import range
+
+from ..distance import DamerauLevenshtein, Levenshtein
+
+__all__ = ['SymSpellIndex']
+
+
+class SymSpellIndex(object):
+    """Symmetric deletion index.
+
+    The symmetric deletion index :cite:`Garbe:2012` finds the terms within an
+    edit distance k of a query. Every string obtainable by deleting up to k
+    characters from each term is precomputed and mapped to the term; a query
+    generates its own deletions up to k and looks each up, so only terms
+    sharing a deletion with the query are candidates, which are then
+    verified by computing their edit distance from the query.
+
+    To save memory, deletions may be generated from just the first
+    prefix_length characters of each term (& query), as candidates are
+    always verified against the full strings.
+
+    The number of times each term is added is kept, and matches at equal
+    distance are ranked by it, so an index built from a corpus (e.g. from
+    :py:meth:`.Corpus.words`) favors common words.
+    """
+
+    def __init__(
+        self, terms=None, max_distance=2, prefix_length=7, mode='osa'
+    ):
+        """Initialize SymSpellIndex.
+
+        Parameters
+        ----------
+        terms : iterable
+            Terms to add to the index
+        max_distance : int
+            The greatest edit distance that can be queried
+        prefix_length : int
+            The number of initial characters from which deletions are
+            generated, or None to use whole terms
+        mode : str
+            Specifies the edit distance used to verify candidates:
+
+                - ``lev`` computes the ordinary Levenshtein distance
+                - ``osa`` (default) computes the optimal string alignment
+                  distance (Levenshtein distance with transpositions)
+                - ``dl`` computes the Damerau-Levenshtein distance
+
+        Raises
+        ------
+        ValueError
+            prefix_length must be greater than max_distance
+        ValueError
+            Unsupported mode
+
+        """
+        if prefix_length is not None and prefix_length <= max_distance:
+            raise ValueError('prefix_length must be greater than max_distance')
+        if mode not in {'lev', 'osa', 'dl'}:
+            raise ValueError('Unsupported mode: {}'.format(mode))
+
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.mode = mode
+
+        self._frequencies = {}
+        self._deletes = {}
+
+        if terms is not None:
+            self.update(terms)
+
+    def __len__(self):
+        """Return the number of distinct indexed terms.
+
+        Returns
+        -------
+        int
+            The number of distinct indexed terms
+
+        Examples
+        --------
+        >>> len(SymSpellIndex(['Niall', 'Neal', 'Niall']))
+        2
+
+        """
+        return len(self._frequencies)
+
+    def __contains__(self, term):
+        """Return True if term is indexed.
+
+        Parameters
+        ----------
+        term : str
+            The term to look up
+
+        Returns
+        -------
+        bool
+            True if term is indexed
+
+        Examples
+        --------
+        >>> 'Neal' in SymSpellIndex(['Niall', 'Neal'])
+        True
+
+        """
+        return term in self._frequencies
+
+    def frequency(self, term):
+        """Return the number of times a term has been added.
+
+        Parameters
+        ----------
+        term : str
+            The term to look up
+
+        Returns
+        -------
+        int
+            The number of times term has been added
+
+        Examples
+        --------
+        >>> SymSpellIndex(['Niall', 'Neal', 'Niall']).frequency('Niall')
+        2
+
+        """
+        return self._frequencies.get(term, 0)
+
+    def _deletions(self, term, max_distance):
+        """Return the strings obtained by deleting characters from a term.
+
+        Parameters
+        ----------
+        term : str
+            The term (of which only the prefix is used)
+        max_distance : int
+            The maximum number of characters to delete
+
+        Returns
+        -------
+        set
+            The term's prefix & every string obtained by deleting up to
+            max_distance of its characters
+
+        Examples
+        --------
+        >>> idx = SymSpellIndex(max_distance=1)
+        >>> sorted(idx._deletions('cat', 1))
+        ['at', 'ca', 'cat', 'ct']
+
+        """
+        if self.prefix_length is not None:
+            term = term[: self.prefix_length]
+
+        deletions = {term}
+        frontier = {term}
+        for _ in range(max_distance):
+            frontier = {
+                word[:i] + word[i + 1 :]
+                for word in frontier
+                for i in range(len(word))
+            }
+            deletions |= frontier
+        return deletions
+
+    def add(self, term, count=1):
+        """Add a term to the index.
+
+        Parameters
+        ----------
+        term : str
+            The term to add
+        count : int
+            The number of occurrences of term to record
+
+        Examples
+        --------
+        >>> idx = SymSpellIndex()
+        >>> idx.add('Niall')
+        >>> idx.add('Niall', 3)
+        >>> idx.frequency('Niall')
+        4
+
+        """
+        if term in self._frequencies:
+            self._frequencies[term] += count
+            return
+
+        self._frequencies[term] = count
+        for deletion in self._deletions(term, self.max_distance):
+            self._deletes.setdefault(deletion, []).append(term)
+
+    def update(self, terms):
+        """Add many terms to the index.
+
+        Parameters
+        ----------
+        terms : iterable
+            The terms to add (once per occurrence)
+
+        Examples
+        --------
+        >>> from abydos.corpus import Corpus
+        >>> corp = Corpus('The cat sat on the mat. The dog sat too.')
+        >>> idx = SymSpellIndex()
+        >>> idx.update(corp.words())
+        >>> idx.frequency('sat'), len(idx)
+        (2, 8)
+
+        """
+        for term in terms:
+            self.add(term)
+
+    def _distance(self, src, tar, max_distance):
+        """Return the edit distance of two strings, capped at max_distance+1.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        max_distance : int
+            The greatest distance of interest
+
+        Returns
+        -------
+        int
+            The edit distance, or max_distance + 1 if it is greater than
+            max_distance
+
+        Examples
+        --------
+        >>> idx = SymSpellIndex(mode='dl')
+        >>> idx._distance('ca', 'abc', 2)
+        2
+        >>> idx._distance('cat', 'dog', 2)
+        3
+
+        """
+        if self.mode == 'dl':
+            return DamerauLevenshtein().dist_abs(
+                src, tar, max_distance=max_distance
+            )
+        return Levenshtein().dist_abs(
+            src, tar, mode=self.mode, max_distance=max_distance
+        )
+
+    def query(self, term, max_distance=None):
+        """Return the indexed terms within an edit distance of a term.
+
+        Parameters
+        ----------
+        term : str
+            The query term
+        max_distance : int
+            The greatest edit distance of the terms to return; by default,
+            and at most, the index's max_distance
+
+        Returns
+        -------
+        list
+            (term, distance) tuples, in increasing order of distance & then
+            decreasing order of frequency
+
+        Raises
+        ------
+        ValueError
+            max_distance exceeds the index's max_distance
+
+        Examples
+        --------
+        >>> idx = SymSpellIndex(['Niall', 'Neal', 'Neil', 'Nigel', 'Kneale'])
+        >>> idx.query('Nial')
+        [('Neal', 1), ('Niall', 1), ('Neil', 2), ('Nigel', 2)]
+        >>> idx.query('Nial', max_distance=1)
+        [('Neal', 1), ('Niall', 1)]
+
+        """
+        if max_distance is None:
+            max_distance = self.max_distance
+        elif max_distance > self.max_distance:
+            raise ValueError("max_distance exceeds the index's max_distance")
+
+        candidates = set()
+        for deletion in self._deletions(term, max_distance):
+            candidates.update(self._deletes.get(deletion, ()))
+
+        results = []
+        for candidate in candidates:
+            if abs(len(candidate) - len(term)) > max_distance:
+                continue
+            distance = self._distance(term, candidate, max_distance)
+            if distance <= max_distance:
+                results.append((candidate, distance))
+
+        return sorted(
+            results,
+            key=lambda result: (
+                result[1],
+                -self._frequencies[result[0]],
+                result[0],
+            ),
+        )
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
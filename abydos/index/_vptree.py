@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2014-2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.index._vptree.
+
+Vantage-point tree
+"""
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+from collections import OrderedDict
+from heapq import heappush, heappushpop
+from multiprocessing import Pool, cpu_count
+from random import Random
+
+from six.moves import range
+
+from ..distance import levenshtein
+
+__all__ = ['VPTree']
+
+# The fewest terms whose distances from a vantage point are computed in a
+# process pool, when one is used
+_PARALLEL_MIN = 1024
+
+# The metric of a worker process, set by _init_worker
+_WORKER_STATE = {}
+
+
+def _init_worker(metric):
+    """Store the metric of a worker process.
+
+    Parameters
+    ----------
+    metric : function
+        A metric taking two terms & returning their distance
+
+    """
+    _WORKER_STATE['metric'] = metric
+
+
+def _vp_distances(args):
+    """Return the distances of a list of terms from a vantage point.
+
+    The metric is that stored by :py:func:`_init_worker`.
+
+    Parameters
+    ----------
+    args : tuple
+        The vantage point and the list of terms
+
+    Returns
+    -------
+    list
+        The distance of each term from the vantage point
+
+    Examples
+    --------
+    >>> _init_worker(levenshtein)
+    >>> _vp_distances(('Niall', ['Neal', 'Nigel']))
+    [2, 2]
+    >>> _WORKER_STATE.clear()
+
+    """
+    vantage_point, terms = args
+    metric = _WORKER_STATE['metric']
+    return [metric(term, vantage_point) for term in terms]
+
+
+class VPTree(object):
+    """Vantage-point tree.
+
+    A vantage-point tree :cite:`Yianilos:1993` indexes terms under any
+    metric, including those with continuous values, such as
+    :py:meth:`.Levenshtein.dist_abs`, :py:meth:`.Euclidean.dist_abs`,
+    :py:meth:`.Manhattan.dist_abs`, or :py:meth:`.Jaccard.dist`.
+
+    Each node holds a vantage point & the median distance (mu) of the terms
+    below it from the vantage point; the nearer half of those terms form its
+    inside subtree, and the farther half its outside subtree. By the
+    triangle inequality, a search for terms within radius r of a query at
+    distance d from the vantage point need only descend inside if
+    d - r <= mu and outside if d + r >= mu.
+
+    The metric must satisfy the triangle inequality, or searches may miss
+    matches. Many normalized distances do not (e.g.
+    :py:meth:`.Levenshtein.dist`, which divides by the length of the longer
+    term, and :py:meth:`.Euclidean.dist` & :py:meth:`.Manhattan.dist`), nor
+    does the OSA mode of Levenshtein. Every evaluation of
+    the metric, during building & searching, is counted in distance_calls,
+    which may be reset to observe the pruning of individual searches.
+    """
+
+    def __init__(self, terms=None, metric=None, n_jobs=1, seed=0):
+        """Initialize VPTree.
+
+        Parameters
+        ----------
+        terms : iterable
+            Terms to build the tree from
+        metric : function
+            A metric taking two terms & returning their distance; by
+            default, the Levenshtein distance, :py:func:`.levenshtein`
+        n_jobs : int
+            The number of worker processes to use to compute distances while
+            building the tree; None or a value less than 1 uses every
+            available CPU. The metric is handed to each worker process once,
+            as it starts; where worker processes are spawned rather than
+            forked (e.g. on Windows), it must be picklable (e.g. a
+            module-level function, or, on Python 3, a distance object's
+            method).
+        seed : int
+            The seed of the random selection of vantage points
+
+        """
+        self.metric = levenshtein if metric is None else metric
+        self.distance_calls = 0
+
+        terms = list(OrderedDict.fromkeys(terms if terms is not None else ()))
+        self._size = len(terms)
+
+        if n_jobs is None or n_jobs < 1:
+            n_jobs = cpu_count()
+        pool = None
+        if n_jobs > 1 and len(terms) > _PARALLEL_MIN:
+            pool = Pool(
+                n_jobs, initializer=_init_worker, initargs=(self.metric,)
+            )
+        try:
+            self._root = self._build(terms, Random(seed), pool, n_jobs)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+    def __len__(self):
+        """Return the number of terms in the tree.
+
+        Returns
+        -------
+        int
+            The number of terms in the tree
+
+        Examples
+        --------
+        >>> len(VPTree(['Niall', 'Neal', 'Niall']))
+        2
+
+        """
+        return self._size
+
+    def _distances(self, vantage_point, terms, pool, n_jobs):
+        """Return the distances of a list of terms from a vantage point.
+
+        Parameters
+        ----------
+        vantage_point : str
+            The vantage point
+        terms : list
+            The terms
+        pool : multiprocessing.Pool
+            A process pool, or None
+        n_jobs : int
+            The number of processes in the pool
+
+        Returns
+        -------
+        list
+            The distance of each term from the vantage point
+
+        Examples
+        --------
+        >>> tree = VPTree()
+        >>> tree._distances('Niall', ['Neal', 'Nigel'], None, 1)
+        [2, 2]
+        >>> tree.distance_calls
+        2
+
+        """
+        self.distance_calls += len(terms)
+        if pool is None or len(terms) < _PARALLEL_MIN:
+            return [self.metric(term, vantage_point) for term in terms]
+
+        size = -(-len(terms) // (n_jobs * 4))
+        parts = pool.map(
+            _vp_distances,
+            [
+                (vantage_point, terms[i : i + size])
+                for i in range(0, len(terms), size)
+            ],
+            chunksize=1,
+        )
+        return [dist for part in parts for dist in part]
+
+    def _build(self, terms, rng, pool, n_jobs):
+        """Build a (sub)tree of terms.
+
+        Parameters
+        ----------
+        terms : list
+            The terms
+        rng : random.Random
+            The random number generator used to select vantage points
+        pool : multiprocessing.Pool
+            A process pool, or None
+        n_jobs : int
+            The number of processes in the pool
+
+        Returns
+        -------
+        tuple
+            The root node, a (vantage point, mu, inside, outside) tuple, or
+            None if terms is empty
+
+        Examples
+        --------
+        >>> tree = VPTree()
+        >>> tree._build(['Niall', 'Neil'], Random(0), None, 1)
+        ('Neil', 3, None, ('Niall', 0, None, None))
+
+        """
+        if not terms:
+            return None
+
+        terms = list(terms)
+        index = rng.randrange(len(terms))
+        terms[index], terms[-1] = terms[-1], terms[index]
+        vantage_point = terms.pop()
+        if not terms:
+            return (vantage_point, 0, None, None)
+
+        dists = self._distances(vantage_point, terms, pool, n_jobs)
+        order = sorted(range(len(terms)), key=dists.__getitem__)
+        mid = len(terms) // 2
+        return (
+            vantage_point,
+            dists[order[mid]],
+            self._build([terms[i] for i in order[:mid]], rng, pool, n_jobs),
+            self._build([terms[i] for i in order[mid:]], rng, pool, n_jobs),
+        )
+
+    def search(self, term, radius):
+        """Return the terms within a distance of a term.
+
+        Parameters
+        ----------
+        term : str
+            The query term
+        radius : float
+            The maximum distance from term of the terms to return
+
+        Returns
+        -------
+        list
+            (term, distance) tuples, in increasing order of distance
+
+        Examples
+        --------
+        >>> tree = VPTree(['Niall', 'Neal', 'Neil', 'Nigel', 'Kneale'])
+        >>> tree.search('Nial', 1)
+        [('Neal', 1), ('Niall', 1)]
+        >>> tree.search('Nial', 2)
+        [('Neal', 1), ('Niall', 1), ('Neil', 2), ('Nigel', 2)]
+
+        """
+        results = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            vantage_point, mu, inside, outside = stack.pop()
+            distance = self.metric(term, vantage_point)
+            self.distance_calls += 1
+            if distance <= radius:
+                results.append((vantage_point, distance))
+            if inside is not None and distance - radius <= mu:
+                stack.append(inside)
+            if outside is not None and distance + radius >= mu:
+                stack.append(outside)
+
+        return sorted(results, key=lambda result: (result[1], result[0]))
+
+    def nearest(self, term, k=1):
+        """Return the nearest terms to a term.
+
+        The search radius shrinks to the distance of the k-th nearest term
+        found so far, and the subtree on the query's side of each vantage
+        point is searched first, so subtrees that cannot hold a nearer term
+        are pruned. Among terms tied at the k-th distance, which are
+        returned is arbitrary.
+
+        Parameters
+        ----------
+        term : str
+            The query term
+        k : int
+            The number of terms to return
+
+        Returns
+        -------
+        list
+            Up to k (term, distance) tuples, in increasing order of distance
+
+        Examples
+        --------
+        >>> tree = VPTree(['Niall', 'Neal', 'Neil', 'Nigel', 'Kneale'])
+        >>> tree.nearest('Nigelle')
+        [('Nigel', 2)]
+        >>> tree.nearest('Nigelle', 2)
+        [('Nigel', 2), ('Niall', 3)]
+
+        """
+        if self._root is None or k < 1:
+            return []
+
+        # A max-heap (by negated distance) of the best k terms found so far
+        best = []
+        # Each entry holds a node & a lower bound on the distance from term
+        # of the terms below it.
+        stack = [(self._root, 0.0)]
+        while stack:
+            node, bound = stack.pop()
+            if len(best) == k and bound >= -best[0][0]:
+                continue
+
+            vantage_point, mu, inside, outside = node
+            distance = self.metric(term, vantage_point)
+            self.distance_calls += 1
+            if len(best) < k:
+                heappush(best, (-distance, vantage_point))
+            elif distance < -best[0][0]:
+                heappushpop(best, (-distance, vantage_point))
+
+            # Push the nearer subtree last, so that it is searched first
+            children = [(inside, distance - mu), (outside, mu - distance)]
+            if distance >= mu:
+                children.reverse()
+            for child, child_bound in reversed(children):
+                if child is not None:
+                    stack.append((child, max(bound, child_bound)))
+
+        return sorted(
+            ((node_term, -neg_dist) for neg_dist, node_term in best),
+            key=lambda result: (result[1], result[0]),
+        )
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
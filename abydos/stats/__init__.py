@@ -62,7 +62,7 @@ Some examples of the basic functions:
 
 
 
-Two pairwise functions are provided:
+Three pairwise functions are provided:
 
     - mean pairwise similarity (:py:func:`.mean_pairwise_similarity`), which
       returns the mean similarity (using a supplied similarity function) among
@@ -71,6 +71,10 @@ Two pairwise functions are provided:
       (:py:func:`.pairwise_similarity_statistics`), which returns the max, min,
       mean, and standard deviation of pairwise similarities between two
       collections
+    - pairwise matrix (:py:func:`.pairwise_matrix`), which returns the
+      (optionally condensed) matrix of pairwise similarities, computed in
+      parallel by a pool of worker processes, and which underlies the other
+      two functions
 
 The confusion table class (:py:class:`.ConfusionTable`) can be constructed in
 a number of ways:
@@ -198,7 +202,11 @@ from ._mean import (
     std,
     var,
 )
-from ._pairwise import mean_pairwise_similarity, pairwise_similarity_statistics
+from ._pairwise import (
+    mean_pairwise_similarity,
+    pairwise_matrix,
+    pairwise_similarity_statistics,
+)
 
 __all__ = [
     'ConfusionTable',
@@ -222,6 +230,7 @@ __all__ = [
     'std',
     'var',
     'mean_pairwise_similarity',
+    'pairwise_matrix',
     'pairwise_similarity_statistics',
 ]
 
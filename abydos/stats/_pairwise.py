@@ -28,16 +28,641 @@ from __future__ import (
     unicode_literals,
 )
 
+from math import exp as math_exp
+from math import log
+from multiprocessing import Pool, RawArray, cpu_count
+
+from numpy import column_stack as np_column_stack
+from numpy import float64 as np_float64
+from numpy import frombuffer as np_frombuffer
+from numpy import triu_indices as np_triu_indices
+from numpy import zeros as np_zeros
+
 from six.moves import range
 
-from ._mean import amean, hmean, std
+from ._mean import amean, gmean, hmean, std
 from ..distance import sim
 
-__all__ = ['mean_pairwise_similarity', 'pairwise_similarity_statistics']
+__all__ = [
+    'mean_pairwise_similarity',
+    'pairwise_matrix',
+    'pairwise_similarity_statistics',
+]
+
+_WORKER_STATE = {}
+
+
+def _row_blocks(row_lengths, chunk_size):
+    """Split rows into contiguous blocks of roughly chunk_size pairs each.
+
+    Parameters
+    ----------
+    row_lengths : list
+        The number of pairs in each row
+    chunk_size : int
+        The target number of pairs per block
+
+    Returns
+    -------
+    list
+        A list of (start, stop) row ranges
+
+    Examples
+    --------
+    >>> _row_blocks([4, 3, 2, 1], 5)
+    [(0, 2), (2, 4)]
+    >>> _row_blocks([3, 3], 1)
+    [(0, 1), (1, 2)]
+
+    """
+    blocks = []
+    start = 0
+    pairs = 0
+    for row, length in enumerate(row_lengths):
+        pairs += length
+        if pairs >= chunk_size:
+            blocks.append((start, row + 1))
+            start = row + 1
+            pairs = 0
+    if start < len(row_lengths):
+        blocks.append((start, len(row_lengths)))
+    return blocks
+
+
+def _to_list(collection, name):
+    """Return a collection (or a string that can be split) as a list.
+
+    Parameters
+    ----------
+    collection : list
+        A collection of terms or a string that can be split
+    name : str
+        The name of the collection, for error messages
+
+    Returns
+    -------
+    list
+        The members of the collection
+
+    Raises
+    ------
+    ValueError
+        collection is neither a string nor iterable type
+
+    Examples
+    --------
+    >>> _to_list('Niall Neal', 'collection')
+    ['Niall', 'Neal']
+
+    """
+    if hasattr(collection, 'split'):
+        collection = collection.split()
+    if not hasattr(collection, '__iter__'):
+        raise ValueError(
+            '{} is neither a string nor iterable type'.format(name)
+        )
+    return list(collection)
+
+
+def _plan_blocks(src, tar, symmetric, n_jobs, chunk_size):
+    """Divide the pairs of a pairwise computation into row blocks.
+
+    Parameters
+    ----------
+    src : list
+        The collection indexing the rows
+    tar : list or None
+        The collection indexing the columns, or None if the rows are compared
+        with each other
+    symmetric : bool
+        Set to True if all pairwise similarities should be calculated in both
+        directions
+    n_jobs : int
+        The number of worker processes requested; None or a value less than 1
+        uses every available CPU
+    chunk_size : int
+        The (approximate) number of pairs in each block, or None to divide the
+        pairs into four blocks per worker
+
+    Returns
+    -------
+    tuple
+        The list of (start, stop) row ranges and the number of worker
+        processes to use
+
+    Examples
+    --------
+    >>> _plan_blocks(['a', 'b', 'c', 'd', 'e'], None, False, 1, 5)
+    ([(0, 2), (2, 5)], 1)
+    >>> _plan_blocks(['a', 'b', 'c'], ['d', 'e'], True, 8, None)
+    ([(0, 1), (1, 2), (2, 3)], 3)
+
+    """
+    n = len(src)
+    if tar is not None:
+        row_lengths = [len(tar)] * n
+    else:
+        row_lengths = [n - i - 1 for i in range(n)]
+    if symmetric:
+        row_lengths = [2 * length for length in row_lengths]
+
+    if n_jobs is None or n_jobs < 1:
+        n_jobs = cpu_count()
+    if chunk_size is None:
+        chunk_size = sum(row_lengths) // (n_jobs * 4)
+    blocks = _row_blocks(row_lengths, max(chunk_size, 1))
+    return blocks, min(n_jobs, len(blocks))
+
+
+def _run_blocks(func, blocks, n_jobs, initargs):
+    """Apply a block function to each block, in-process or in a pool.
+
+    Parameters
+    ----------
+    func : function
+        A function taking a (start, stop) row range
+    blocks : list
+        The (start, stop) row ranges
+    n_jobs : int
+        The number of worker processes to use
+    initargs : tuple
+        The arguments to :py:func:`_init_worker`
+
+    Returns
+    -------
+    list
+        The results of func for each block
+
+    """
+    if n_jobs <= 1:
+        _init_worker(*initargs)
+        try:
+            return [func(block) for block in blocks]
+        finally:
+            _WORKER_STATE.clear()
+
+    pool = Pool(n_jobs, initializer=_init_worker, initargs=initargs)
+    try:
+        return pool.map(func, blocks, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _init_worker(
+    out, shape, src, tar, metric, symmetric, condensed, diagonal=1.0
+):
+    """Store the shared state of a pairwise_matrix worker process.
+
+    Parameters
+    ----------
+    out : multiprocessing.RawArray or numpy.ndarray or None
+        The (shared) output buffer, if any
+    shape : tuple
+        The shape of the output array
+    src : list
+        The collection indexing the rows
+    tar : list or None
+        The collection indexing the columns, or None if the rows are compared
+        with each other
+    metric : function
+        A similarity metric function
+    symmetric : bool
+        Set to True if the lower triangle should be calculated rather than
+        mirrored
+    condensed : bool
+        Set to True if the output is a condensed upper triangle
+    diagonal : float
+        The value of the diagonal of a full matrix, or None to calculate it
+        with metric
+
+    """
+    if out is not None:
+        if not hasattr(out, 'reshape'):
+            out = np_frombuffer(out, dtype=np_float64)
+        out = out.reshape(shape)
+    _WORKER_STATE['out'] = out
+    _WORKER_STATE['src'] = src
+    _WORKER_STATE['tar'] = tar
+    _WORKER_STATE['metric'] = metric
+    _WORKER_STATE['symmetric'] = symmetric
+    _WORKER_STATE['condensed'] = condensed
+    _WORKER_STATE['diagonal'] = diagonal
+
+
+def _fill_rows(block):
+    """Fill a block of rows of the output of pairwise_matrix.
+
+    Parameters
+    ----------
+    block : tuple
+        The (start, stop) range of rows to fill
+
+    """
+    out = _WORKER_STATE['out']
+    src = _WORKER_STATE['src']
+    tar = _WORKER_STATE['tar']
+    metric = _WORKER_STATE['metric']
+    n = len(src)
+
+    for i in range(*block):
+        if tar is not None:
+            out[i, :] = [metric(src[i], term) for term in tar]
+            continue
+
+        row = [metric(src[i], src[j]) for j in range(i + 1, n)]
+        if _WORKER_STATE['condensed']:
+            offset = i * n - i * (i + 1) // 2
+            out[offset : offset + len(row)] = row
+            continue
+
+        if _WORKER_STATE['diagonal'] is None:
+            out[i, i] = metric(src[i], src[i])
+        else:
+            out[i, i] = _WORKER_STATE['diagonal']
+        out[i, i + 1 :] = row
+        if _WORKER_STATE['symmetric']:
+            row = [metric(src[j], src[i]) for j in range(i + 1, n)]
+        out[i + 1 :, i] = row
+
+
+class _PairwiseAggregate(object):
+    """Running aggregate of a stream of pairwise similarities.
+
+    Maintains the count, max, min, Welford's running mean & sum of squared
+    deviations :cite:`Welford:1962`, and the sums of logs & reciprocals
+    needed for the geometric & harmonic means, so that statistics can be
+    calculated in constant memory. Partial aggregates (e.g. from separate
+    worker processes) can be merged :cite:`Chan:1979`.
+    """
+
+    def __init__(self):
+        """Initialize an empty aggregate."""
+        self.count = 0
+        self.max = float('-inf')
+        self.min = float('inf')
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.log_sum = 0.0
+        self.recip_sum = 0.0
+        self.zeros = 0
+
+    def add(self, value):
+        """Add a value to the aggregate.
+
+        Parameters
+        ----------
+        value : float
+            A similarity value
+
+        Examples
+        --------
+        >>> agg = _PairwiseAggregate()
+        >>> for val in (0.5, 0.25, 1.0):
+        ...     agg.add(val)
+        >>> agg.count, agg.max, agg.min, agg.mean
+        (3, 1.0, 0.25, 0.5833333333333334)
+
+        """
+        self.count += 1
+        if value > self.max:
+            self.max = value
+        if value < self.min:
+            self.min = value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value == 0:
+            self.zeros += 1
+        else:
+            self.log_sum += log(value) if value > 0 else float('nan')
+            self.recip_sum += 1 / value
+
+    def merge(self, other):
+        """Merge another aggregate into this one.
+
+        Parameters
+        ----------
+        other : _PairwiseAggregate
+            Another aggregate
+
+        Examples
+        --------
+        >>> agg = _PairwiseAggregate()
+        >>> agg.add(0.5)
+        >>> other = _PairwiseAggregate()
+        >>> other.add(0.25)
+        >>> other.add(1.0)
+        >>> agg.merge(other)
+        >>> agg.count, agg.max, agg.min, agg.mean
+        (3, 1.0, 0.25, 0.5833333333333334)
+
+        """
+        if not other.count:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.max = max(self.max, other.max)
+        self.min = min(self.min, other.min)
+        self.log_sum += other.log_sum
+        self.recip_sum += other.recip_sum
+        self.zeros += other.zeros
+
+    def mean_value(self, mean_func):
+        """Return the mean of the aggregated values.
+
+        Parameters
+        ----------
+        mean_func : function
+            The mean function to emulate: :py:func:`.amean`,
+            :py:func:`.gmean`, or :py:func:`.hmean`
+
+        Returns
+        -------
+        float
+            The mean of the aggregated values
+
+        Raises
+        ------
+        ValueError
+            Streaming statistics support only amean, gmean, and hmean
+
+        Examples
+        --------
+        >>> agg = _PairwiseAggregate()
+        >>> for val in (1, 2, 3, 4):
+        ...     agg.add(val)
+        >>> agg.mean_value(amean)
+        2.5
+        >>> round(agg.mean_value(gmean), 12)
+        2.213363839401
+        >>> round(agg.mean_value(hmean), 12)
+        1.92
+
+        """
+        if mean_func is amean:
+            return self.mean
+        if mean_func is gmean:
+            if self.zeros:
+                return 0.0
+            return math_exp(self.log_sum / self.count)
+        if mean_func is hmean:
+            # Follows the special cases of hmean
+            if self.max == self.min:
+                return self.max
+            if self.zeros:
+                return float('nan') if self.zeros > 1 else 0
+            return self.count / self.recip_sum
+        raise ValueError(
+            'Streaming statistics support only amean, gmean, and hmean'
+        )
+
+    def std(self, mean_func):
+        """Return the population standard deviation about a mean.
+
+        Parameters
+        ----------
+        mean_func : function
+            The mean function to emulate, as for :py:meth:`mean_value`
+
+        Returns
+        -------
+        float
+            The standard deviation of the aggregated values about their mean
+
+        Examples
+        --------
+        >>> agg = _PairwiseAggregate()
+        >>> for val in (1, 2, 3, 4):
+        ...     agg.add(val)
+        >>> round(agg.std(amean), 12)
+        1.11803398875
+
+        """
+        # The squared deviations about any center c equal those about the
+        # arithmetic mean plus count * (mean - c) ** 2.
+        offset = self.mean - self.mean_value(mean_func)
+        return (self.m2 / self.count + offset * offset) ** 0.5
+
+
+def _aggregate_rows(block):
+    """Aggregate the similarities of a block of rows of pairs.
+
+    Parameters
+    ----------
+    block : tuple
+        The (start, stop) range of rows to aggregate
+
+    Returns
+    -------
+    _PairwiseAggregate
+        The aggregate of the block's similarities
+
+    """
+    src = _WORKER_STATE['src']
+    tar = _WORKER_STATE['tar']
+    metric = _WORKER_STATE['metric']
+    symmetric = _WORKER_STATE['symmetric']
+    agg = _PairwiseAggregate()
+
+    for i in range(*block):
+        terms = tar if tar is not None else src[i + 1 :]
+        for term in terms:
+            agg.add(metric(src[i], term))
+            if symmetric:
+                agg.add(metric(term, src[i]))
+    return agg
+
+
+def _pairwise_aggregate(src, tar, metric, symmetric, n_jobs, chunk_size):
+    """Return the merged aggregate of the similarities of a collection.
+
+    Parameters
+    ----------
+    src : list
+        The collection indexing the rows
+    tar : list or None
+        The collection indexing the columns, or None if the rows are compared
+        with each other
+    metric : function
+        A similarity metric function
+    symmetric : bool
+        Set to True if all pairwise similarities should be calculated in both
+        directions
+    n_jobs : int
+        The number of worker processes to use
+    chunk_size : int
+        The (approximate) number of pairs in each block sent to a worker
+
+    Returns
+    -------
+    _PairwiseAggregate
+        The aggregate of all the pairwise similarities
+
+    Raises
+    ------
+    ValueError
+        There are no pairs to aggregate
+
+    """
+    blocks, n_jobs = _plan_blocks(src, tar, symmetric, n_jobs, chunk_size)
+    agg = _PairwiseAggregate()
+    for partial in _run_blocks(
+        _aggregate_rows,
+        blocks,
+        n_jobs,
+        (None, None, src, tar, metric, symmetric, False),
+    ):
+        agg.merge(partial)
+    if not agg.count:
+        raise ValueError('There are no pairs to aggregate')
+    return agg
+
+
+def pairwise_matrix(
+    collection,
+    metric=sim,
+    tar_collection=None,
+    symmetric=False,
+    condensed=False,
+    n_jobs=1,
+    chunk_size=None,
+    diagonal=1.0,
+):
+    r"""Calculate the matrix of pairwise similarities of a collection.
+
+    The pairs are split into blocks of rows, which are distributed to a pool
+    of worker processes that write their results directly into a
+    shared-memory array. When a process pool is used, the metric must be
+    picklable (e.g. a module-level function or a distance object's method),
+    so lambdas & locally defined functions are only supported with n_jobs=1.
+
+    Parameters
+    ----------
+    collection : list
+        A collection of terms or a string that can be split
+    metric : function
+        A similarity metric function
+    tar_collection : list
+        A second collection of terms or a string that can be split; if
+        supplied, the similarities between each member of collection (rows)
+        and each member of tar_collection (columns) are calculated
+    symmetric : bool
+        Set to True if all pairwise similarities should be calculated in both
+        directions; otherwise the lower triangle mirrors the upper triangle
+    condensed : bool
+        Set to True to return only the upper triangle (excluding the
+        diagonal), in row-major order, as an array of length
+        :math:`\frac{n(n-1)}{2}`
+    n_jobs : int
+        The number of worker processes to use; None or a value less than 1
+        uses every available CPU
+    chunk_size : int
+        The (approximate) number of pairs in each block sent to a worker; by
+        default, the pairs are divided into four blocks per worker
+    diagonal : float
+        The similarity of each member of a single collection to itself (1.0
+        by default), or None to calculate it with metric
+
+    Returns
+    -------
+    numpy.ndarray
+        The matrix of pairwise similarities
+
+    Raises
+    ------
+    ValueError
+        metric must be a function
+    ValueError
+        collection is neither a string nor iterable type
+    ValueError
+        tar_collection is neither a string nor iterable type
+    ValueError
+        condensed output is only supported for a single collection with a
+        symmetric metric
+
+    Examples
+    --------
+    >>> pairwise_matrix(['Niall', 'Neal', 'Neil'])
+    array([[1.  , 0.6 , 0.4 ],
+           [0.6 , 1.  , 0.75],
+           [0.4 , 0.75, 1.  ]])
+    >>> pairwise_matrix(['Niall', 'Neal', 'Neil'], condensed=True)
+    array([0.6 , 0.4 , 0.75])
+    >>> pairwise_matrix(['Niall', 'Neal'], tar_collection=['Neil'])
+    array([[0.4 ],
+           [0.75]])
+    >>> from abydos.distance import dist_levenshtein
+    >>> pairwise_matrix(['Niall', 'Neal', 'Neil'], dist_levenshtein,
+    ... diagonal=0.0)
+    array([[0.  , 0.4 , 0.6 ],
+           [0.4 , 0.  , 0.25],
+           [0.6 , 0.25, 0.  ]])
+
+    """
+    if not callable(metric):
+        raise ValueError('metric must be a function')
+
+    collection = _to_list(collection, 'collection')
+    if tar_collection is not None:
+        tar_collection = _to_list(tar_collection, 'tar_collection')
+
+    if condensed and (symmetric or tar_collection is not None):
+        raise ValueError(
+            'condensed output is only supported for a single collection '
+            + 'with a symmetric metric'
+        )
+
+    n = len(collection)
+    if tar_collection is not None:
+        shape = (n, len(tar_collection))
+    else:
+        shape = (n * (n - 1) // 2,) if condensed else (n, n)
+
+    blocks, n_jobs = _plan_blocks(
+        collection, tar_collection, symmetric, n_jobs, chunk_size
+    )
+
+    if n_jobs <= 1:
+        out = np_zeros(shape, dtype=np_float64)
+    else:
+        size = 1
+        for dim in shape:
+            size *= dim
+        out = RawArray('d', size)
+
+    _run_blocks(
+        _fill_rows,
+        blocks,
+        n_jobs,
+        (
+            out,
+            shape,
+            collection,
+            tar_collection,
+            metric,
+            symmetric,
+            condensed,
+            diagonal,
+        ),
+    )
+
+    if n_jobs > 1:
+        out = np_frombuffer(out, dtype=np_float64).reshape(shape)
+    return out
 
 
 def mean_pairwise_similarity(
-    collection, metric=sim, mean_func=hmean, symmetric=False
+    collection,
+    metric=sim,
+    mean_func=hmean,
+    symmetric=False,
+    n_jobs=1,
+    chunk_size=None,
+    stream=False,
 ):
     """Calculate the mean pairwise similarity of a collection of strings.
 
@@ -56,6 +681,15 @@ def mean_pairwise_similarity(
     symmetric : bool
         Set to True if all pairwise similarities should be calculated in both
         directions
+    n_jobs : int
+        The number of worker processes to use (see :py:func:`pairwise_matrix`)
+    chunk_size : int
+        The (approximate) number of pairs in each block sent to a worker
+    stream : bool
+        Set to True to aggregate the similarities as they are calculated,
+        in constant memory, rather than collecting them in a list; only
+        :py:func:`.amean`, :py:func:`.gmean`, and :py:func:`.hmean` are
+        supported as mean_func
 
     Returns
     -------
@@ -72,6 +706,8 @@ def mean_pairwise_similarity(
         collection is neither a string nor iterable type
     ValueError
         collection has fewer than two members
+    ValueError
+        Streaming statistics support only amean, gmean, and hmean
 
     Examples
     --------
@@ -80,6 +716,9 @@ def mean_pairwise_similarity(
     0.519801980198
     >>> round(mean_pairwise_similarity(['Niall', 'Neal', 'Neil']), 12)
     0.545454545455
+    >>> round(mean_pairwise_similarity(['Niall', 'Neal', 'Neil'],
+    ... stream=True), 12)
+    0.545454545455
 
     """
     if not callable(mean_func):
@@ -96,15 +735,32 @@ def mean_pairwise_similarity(
 
     collection = list(collection)
 
-    pairwise_values = []
-
-    for i in range(len(collection)):
-        for j in range(i + 1, len(collection)):
-            pairwise_values.append(metric(collection[i], collection[j]))
-            if symmetric:
-                pairwise_values.append(metric(collection[j], collection[i]))
-
-    return mean_func(pairwise_values)
+    if stream:
+        return _pairwise_aggregate(
+            collection, None, metric, symmetric, n_jobs, chunk_size
+        ).mean_value(mean_func)
+
+    if symmetric:
+        matrix = pairwise_matrix(
+            collection,
+            metric,
+            symmetric=True,
+            n_jobs=n_jobs,
+            chunk_size=chunk_size,
+        )
+        upper = matrix[np_triu_indices(len(collection), 1)]
+        lower = matrix.T[np_triu_indices(len(collection), 1)]
+        pairwise_values = np_column_stack((upper, lower)).ravel()
+    else:
+        pairwise_values = pairwise_matrix(
+            collection,
+            metric,
+            condensed=True,
+            n_jobs=n_jobs,
+            chunk_size=chunk_size,
+        )
+
+    return mean_func(pairwise_values.tolist())
 
 
 def pairwise_similarity_statistics(
@@ -113,6 +769,9 @@ def pairwise_similarity_statistics(
     metric=sim,
     mean_func=amean,
     symmetric=False,
+    n_jobs=1,
+    chunk_size=None,
+    stream=False,
 ):
     """Calculate the pairwise similarity statistics a collection of strings.
 
@@ -134,6 +793,15 @@ def pairwise_similarity_statistics(
     symmetric : bool
         Set to True if all pairwise similarities should be calculated in both
         directions
+    n_jobs : int
+        The number of worker processes to use (see :py:func:`pairwise_matrix`)
+    chunk_size : int
+        The (approximate) number of pairs in each block sent to a worker
+    stream : bool
+        Set to True to aggregate the similarities as they are calculated,
+        in constant memory, rather than collecting them in a list; only
+        :py:func:`.amean`, :py:func:`.gmean`, and :py:func:`.hmean` are
+        supported as mean_func
 
     Returns
     -------
@@ -150,12 +818,18 @@ def pairwise_similarity_statistics(
         src_collection is neither a string nor iterable
     ValueError
         tar_collection is neither a string nor iterable
+    ValueError
+        Streaming statistics support only amean, gmean, and hmean
 
     Example
     -------
     >>> tuple(round(_, 12) for _ in pairwise_similarity_statistics(
     ... ['Christopher', 'Kristof', 'Christobal'], ['Niall', 'Neal', 'Neil']))
     (0.2, 0.0, 0.118614718615, 0.075070477184)
+    >>> tuple(round(_, 12) for _ in pairwise_similarity_statistics(
+    ... ['Christopher', 'Kristof', 'Christobal'], ['Niall', 'Neal', 'Neil'],
+    ... stream=True))
+    (0.2, 0.0, 0.118614718615, 0.075070477184)
 
     """
     if not callable(mean_func):
@@ -176,13 +850,38 @@ def pairwise_similarity_statistics(
     src_collection = list(src_collection)
     tar_collection = list(tar_collection)
 
-    pairwise_values = []
-
-    for src in src_collection:
-        for tar in tar_collection:
-            pairwise_values.append(metric(src, tar))
-            if symmetric:
-                pairwise_values.append(metric(tar, src))
+    if stream:
+        agg = _pairwise_aggregate(
+            src_collection,
+            tar_collection,
+            metric,
+            symmetric,
+            n_jobs,
+            chunk_size,
+        )
+        return agg.max, agg.min, agg.mean_value(mean_func), agg.std(mean_func)
+
+    pairwise_values = pairwise_matrix(
+        src_collection,
+        metric,
+        tar_collection=tar_collection,
+        n_jobs=n_jobs,
+        chunk_size=chunk_size,
+    ).ravel()
+    if symmetric:
+        pairwise_values = np_column_stack(
+            (
+                pairwise_values,
+                pairwise_matrix(
+                    tar_collection,
+                    metric,
+                    tar_collection=src_collection,
+                    n_jobs=n_jobs,
+                    chunk_size=chunk_size,
+                ).T.ravel(),
+            )
+        ).ravel()
+    pairwise_values = pairwise_values.tolist()
 
     return (
         max(pairwise_values),
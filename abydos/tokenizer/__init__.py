@@ -19,7 +19,7 @@
 """abydos.tokenizer.
 
 The tokenizer package collects classes whose purpose is to tokenize
-text. Currently, this is limited to the :py:class:`.QGrams` class, which
+text. Principally, this is the :py:class:`.QGrams` class, which
 tokenizes a string into q-grams. The class supports different values of
 q, the addition of start and stop symbols, and skip values. It even supports
 multiple values for q and skip, using lists or ranges.
@@ -43,6 +43,18 @@ QGrams({'i': 10, 'n': 7, 'r': 4, 'a': 4, 'in': 3, 't': 2, 'e': 2, 'd': 2,
  'tr': 1, 'ed': 1, 'ds': 1, 'ic': 1, 'si': 1, 'cp': 1, 'il': 1, 'pi': 1,
  'ln': 1, 'nr': 1, 'ai': 1, 'ra': 1, 'a#': 1})
 
+The :py:class:`.QGramVectorizer` class maps whole collections of strings to
+sparse q-gram count matrices (:py:class:`.QGramMatrix`) over a shared, interned
+vocabulary, from which the multiset intersection sizes of all pairs of rows can
+be calculated at once.
+
+>>> vec = QGramVectorizer()
+>>> qgm = vec.transform(['Niall', 'Neil', 'Nigel'])
+>>> qgm.intersection(vec.transform(['Neal']))
+array([[3.],
+       [3.],
+       [2.]])
+
 ----
 
 """
@@ -54,9 +66,10 @@ from __future__ import (
     unicode_literals,
 )
 
+from ._qgram_vectorizer import QGramMatrix, QGramVectorizer
 from ._qgrams import QGrams
 
-__all__ = ['QGrams']
+__all__ = ['QGramMatrix', 'QGramVectorizer', 'QGrams']
 
 
 if __name__ == '__main__':
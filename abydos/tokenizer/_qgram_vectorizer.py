@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2014-2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tokenizer._qgram_vectorizer.
+
+QGramVectorizer & QGramMatrix sparse q-gram count classes
+"""
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+from collections import Counter
+
+from numpy import arange as np_arange
+from numpy import argsort as np_argsort
+from numpy import array as np_array
+from numpy import bincount as np_bincount
+from numpy import cumsum as np_cumsum
+from numpy import float64 as np_float64
+from numpy import int64 as np_int64
+from numpy import minimum as np_minimum
+from numpy import repeat as np_repeat
+from numpy import zeros as np_zeros
+
+from six.moves import range
+
+from ._qgrams import QGrams
+
+__all__ = ['QGramMatrix', 'QGramVectorizer']
+
+
+class QGramMatrix(object):
+    """A sparse matrix of q-gram counts.
+
+    Each row holds the counts of the q-grams of one term, stored in
+    compressed sparse row (CSR) form: the column indices & counts of row i
+    are ``indices[indptr[i]:indptr[i + 1]]`` & ``data[indptr[i]:indptr[i +
+    1]]``. Columns index the vocabulary of the :py:class:`QGramVectorizer`
+    that created the matrix.
+    """
+
+    def __init__(self, indptr, indices, data, n_cols):
+        """Initialize QGramMatrix.
+
+        Parameters
+        ----------
+        indptr : numpy.ndarray
+            The offsets of each row's entries in indices & data
+        indices : numpy.ndarray
+            The column index of each entry
+        data : numpy.ndarray
+            The count of each entry
+        n_cols : int
+            The number of columns (the vocabulary size)
+
+        """
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.shape = (len(indptr) - 1, n_cols)
+        self.magnitudes = np_bincount(
+            np_repeat(np_arange(self.shape[0]), indptr[1:] - indptr[:-1]),
+            weights=data,
+            minlength=self.shape[0],
+        )
+        self._columns = None
+
+    def __len__(self):
+        """Return the number of rows.
+
+        Returns
+        -------
+        int
+            The number of rows
+
+        Examples
+        --------
+        >>> len(QGramVectorizer().transform(['cat', 'hat']))
+        2
+
+        """
+        return self.shape[0]
+
+    def _column_index(self):
+        """Return the matrix in compressed sparse column (CSC) form.
+
+        Returns
+        -------
+        tuple
+            The column offsets, row indices, and counts
+
+        Examples
+        --------
+        >>> qgm = QGramVectorizer().transform(['cat', 'hat'])
+        >>> col_ptr, rows, counts = qgm._column_index()
+        >>> col_ptr
+        array([0, 1, 2, 4, 6, 7, 8])
+        >>> rows
+        array([0, 0, 0, 1, 0, 1, 1, 1])
+
+        """
+        if self._columns is None:
+            rows = np_repeat(
+                np_arange(self.shape[0]), self.indptr[1:] - self.indptr[:-1]
+            )
+            order = np_argsort(self.indices, kind='mergesort')
+            col_ptr = np_zeros(self.shape[1] + 1, dtype=np_int64)
+            np_cumsum(
+                np_bincount(self.indices, minlength=self.shape[1]),
+                out=col_ptr[1:],
+            )
+            self._columns = (col_ptr, rows[order], self.data[order])
+        return self._columns
+
+    def intersection(self, other):
+        """Return the sizes of the multiset intersections of each row pair.
+
+        For each row i of this matrix and row j of other, the size of the
+        intersection of their q-gram multisets, i.e. the sum over q-grams of
+        the lesser count, is calculated. Only pairs sharing a q-gram are
+        visited, by way of an inverted (column) index of other.
+
+        Parameters
+        ----------
+        other : QGramMatrix
+            Another matrix, created by the same vectorizer
+
+        Returns
+        -------
+        numpy.ndarray
+            The intersection sizes, with one row per row of this matrix and
+            one column per row of other
+
+        Examples
+        --------
+        >>> vec = QGramVectorizer()
+        >>> qgm = vec.transform(['Niall', 'Neil', 'Nigel'])
+        >>> qgm.intersection(qgm)
+        array([[6., 2., 3.],
+               [2., 5., 2.],
+               [3., 2., 6.]])
+
+        """
+        col_ptr, col_rows, col_data = other._column_index()
+        out = np_zeros((self.shape[0], other.shape[0]), dtype=np_float64)
+
+        for i in range(self.shape[0]):
+            start, stop = self.indptr[i], self.indptr[i + 1]
+            cols = self.indices[start:stop]
+            counts = self.data[start:stop]
+            known = cols < other.shape[1]
+            cols = cols[known]
+            counts = counts[known]
+
+            starts = col_ptr[cols]
+            lengths = col_ptr[cols + 1] - starts
+            total = lengths.sum()
+            if not total:
+                continue
+
+            # Gather the postings of every column of row i into one array
+            positions = np_repeat(
+                starts - np_cumsum(lengths) + lengths, lengths
+            ) + np_arange(total)
+            out[i] = np_bincount(
+                col_rows[positions],
+                weights=np_minimum(
+                    col_data[positions], np_repeat(counts, lengths)
+                ),
+                minlength=other.shape[0],
+            )
+        return out
+
+
+class QGramVectorizer(object):
+    """Q-gram vectorizer.
+
+    Maps collections of terms to sparse q-gram count matrices
+    (:py:class:`QGramMatrix`) over a shared vocabulary, in which each
+    distinct q-gram is interned to a column index the first time it is seen.
+    """
+
+    def __init__(self, qval=2, start_stop='$#', skip=0):
+        """Initialize QGramVectorizer.
+
+        Parameters
+        ----------
+        qval : int or Iterable
+            The q-gram length (defaults to 2), as for :py:class:`QGrams`
+        start_stop : str
+            The start & stop symbols, as for :py:class:`QGrams`
+        skip : int or Iterable
+            The number of characters to skip, as for :py:class:`QGrams`
+
+        """
+        self.qval = qval
+        self.start_stop = start_stop
+        self.skip = skip
+        self.vocabulary = {}
+
+    def transform(self, collection):
+        """Return the q-gram count matrix of a collection.
+
+        Q-grams not yet in the vocabulary are added to it, so matrices
+        created by successive calls share their column indices.
+
+        Parameters
+        ----------
+        collection : iterable
+            A collection of strings (or QGrams/Counter objects, which are used
+            as-is)
+
+        Returns
+        -------
+        QGramMatrix
+            The q-gram counts of each member of collection
+
+        Examples
+        --------
+        >>> vec = QGramVectorizer()
+        >>> qgm = vec.transform(['cat', 'hat'])
+        >>> qgm.shape
+        (2, 6)
+        >>> qgm.magnitudes
+        array([4., 4.])
+        >>> sorted(vec.vocabulary.items())
+        [('$c', 0), ('$h', 4), ('at', 2), ('ca', 1), ('ha', 5), ('t#', 3)]
+
+        """
+        indptr = [0]
+        indices = []
+        data = []
+
+        for term in collection:
+            if not isinstance(term, Counter):
+                term = QGrams(term, self.qval, self.start_stop, self.skip)
+            for qgram, count in term.items():
+                if count > 0:
+                    indices.append(
+                        self.vocabulary.setdefault(qgram, len(self.vocabulary))
+                    )
+                    data.append(count)
+            indptr.append(len(indices))
+
+        return QGramMatrix(
+            np_array(indptr, dtype=np_int64),
+            np_array(indices, dtype=np_int64),
+            np_array(data, dtype=np_int64),
+            len(self.vocabulary),
+        )
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -121,6 +121,37 @@ class ArithmeticCoderTestCases(unittest.TestCase):
         # Test wrapper
         self.assertEqual(ac_decode(3911665, 23, self.niall_probs), 'Niall')
 
+    def test_arithmetic_fixed_precision(self):
+        """Test abydos.compression.Arithmetic fixed-precision coding."""
+        self.coder.set_probs(self.niall_probs)
+        self.assertEqual(self.coder.encode('', 32), (254, 8))
+        self.assertEqual(self.coder.decode(254, 8, 32), '')
+        self.assertEqual(self.coder.encode('Niall', 32), (1955832, 22))
+        self.assertEqual(self.coder.decode(1955832, 22, 32), 'Niall')
+        self.assertRaises(KeyError, self.coder.encode, 'NIALL', 32)
+        self.assertRaises(ValueError, self.coder.encode, 'Niall', 8)
+        self.assertRaises(ValueError, self.coder.decode, 1955832, 22, 8)
+
+        # Codes are within a bit of those of exact arithmetic
+        for word in NIALL:
+            longval, nbits = self.coder.encode(word, 32)
+            self.assertLessEqual(abs(nbits - self.coder.encode(word)[1]), 1)
+            self.assertEqual(self.coder.decode(longval, nbits, 32), word)
+
+        text = ' '.join(NIALL) * 20
+        self.coder.train(text)
+        for precision in (16, 32, 64):
+            self.assertEqual(
+                self.coder.decode(
+                    *self.coder.encode(text, precision), precision=precision
+                ),
+                text,
+            )
+
+        self.coder.set_probs({'\x00': (0, 1)})
+        self.assertEqual(self.coder.encode('', 32), (1, 2))
+        self.assertEqual(self.coder.decode(1, 2, 32), '')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -94,6 +94,27 @@ class BWTTestCases(unittest.TestCase):
                 self.coder.decode(self.coder.encode(w, '$'), '$'), w
             )
 
+    def test_bwt_long(self):
+        """Test abydos.compression.BWT.encode & .decode on long words."""
+        # Long enough to be encoded by way of a suffix array
+        for w in (
+            'SIX.MIXED.PIXIES.SIFT.SIXTY.PIXIE.DUST.BOXES' * 40,
+            'a' * 2000,
+            'abracadabra' * 200 + 'בְּרֵאשִׁית',
+            ''.join(chr(65 + (i * i) % 57) for i in range(3000)),
+        ):
+            rotations = sorted(
+                (w + '$')[i:] + (w + '$')[:i] for i in range(len(w) + 1)
+            )
+            code = ''.join(r[-1] for r in rotations)
+            self.assertEqual(self.coder.encode(w, '$'), code)
+            self.assertEqual(self.coder.decode(code, '$'), w)
+            self.assertEqual(self.coder.decode(self.coder.encode(w)), w)
+
+        # Codes that are not the transform of any word decode as before
+        self.assertEqual(self.coder.decode('ab$ab$', '$'), 'a$a$a')
+        self.assertEqual(self.coder.decode('b$a$', '$'), '$$b')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -30,7 +30,19 @@ from __future__ import (
 
 import unittest
 
-from abydos.distance import Dice, Levenshtein
+from abydos.distance import (
+    Bag,
+    Dice,
+    Eudex,
+    Ident,
+    Indel,
+    Jaccard,
+    JaroWinkler,
+    LCSseq,
+    Levenshtein,
+    Tversky,
+    Typo,
+)
 
 
 class DistanceTestCases(unittest.TestCase):
@@ -42,6 +54,8 @@ class DistanceTestCases(unittest.TestCase):
     lev = Levenshtein()
     dice = Dice()
 
+    names = ['', 'a', 'Niall', 'Neal', 'Neil', 'Njall', 'Nigel', 'NIALL']
+
     def test_sim(self):
         """Test abydos.distance._Distance.sim."""
         self.assertEqual(
@@ -71,6 +85,121 @@ class DistanceTestCases(unittest.TestCase):
             self.dice.dist_abs('Niall', 'Nigel'),
         )
 
+    def test_sim_many(self):
+        """Test abydos.distance._Distance.sim_many."""
+        ident = Ident()
+        self.assertEqual(list(ident.sim_many('a', [])), [])
+        self.assertEqual(
+            list(ident.sim_many('abc', ['abc', 'abd', 'abc'])),
+            [1.0, 0.0, 1.0],
+        )
+
+        for cmp in (
+            self.lev,
+            self.dice,
+            Bag(),
+            Eudex(),
+            Jaccard(),
+            JaroWinkler(),
+            Tversky(),
+            Typo(),
+        ):
+            for src in self.names:
+                sims = cmp.sim_many(src, self.names)
+                self.assertEqual(len(sims), len(self.names))
+                for tar, sim in zip(self.names, sims):
+                    self.assertAlmostEqual(sim, cmp.sim(src, tar))
+
+    def test_dist_many(self):
+        """Test abydos.distance._Distance.dist_many."""
+        ident = Ident()
+        self.assertEqual(list(ident.dist_many('a', [])), [])
+        self.assertEqual(
+            list(ident.dist_many('abc', ['abc', 'abd', 'abc'])),
+            [0.0, 1.0, 0.0],
+        )
+
+        for cmp, kwargs in (
+            (self.lev, {}),
+            (self.lev, {'mode': 'osa'}),
+            (self.lev, {'cost': (1, 2, 3, 4)}),
+            (self.lev, {'max_distance': 0.4}),
+            (self.dice, {'qval': 1}),
+            (self.dice, {'qval': 8}),
+            (Bag(), {}),
+            (Eudex(), {'weights': 'fibonacci'}),
+            (Eudex(), {'weights': None}),
+            (Jaccard(), {}),
+            (JaroWinkler(), {}),
+            (JaroWinkler(), {'mode': 'jaro', 'long_strings': True}),
+            (JaroWinkler(), {'qval': 2}),
+            (Tversky(), {'alpha': 2, 'beta': 0.5, 'bias': 0.25}),
+            (Typo(), {}),
+            (Typo(), {'metric': 'manhattan', 'layout': 'AZERTY'}),
+        ):
+            for src in self.names:
+                dists = cmp.dist_many(src, self.names, **kwargs)
+                self.assertEqual(len(dists), len(self.names))
+                for tar, dist in zip(self.names, dists):
+                    self.assertAlmostEqual(dist, cmp.dist(src, tar, **kwargs))
+
+        # Generators are consumed only once
+        self.assertEqual(
+            list(self.lev.dist_many('abc', (name for name in ['abc', 'ab']))),
+            [0.0, 1 / 3],
+        )
+
+    def test_sim_pairs(self):
+        """Test abydos.distance._Distance.sim_pairs."""
+        ident = Ident()
+        self.assertEqual(list(ident.sim_pairs([])), [])
+        self.assertEqual(
+            list(ident.sim_pairs([('abc', 'abc'), ('abc', 'abd')])),
+            [1.0, 0.0],
+        )
+
+        pairs = [(src, tar) for src in self.names for tar in self.names]
+        for cmp, kwargs in (
+            (self.lev, {}),
+            (self.lev, {'mode': 'osa', 'cost': (1, 2, 3, 4)}),
+            (self.dice, {}),
+            (Indel(), {}),
+            (LCSseq(), {}),
+            (JaroWinkler(), {}),
+        ):
+            sims = cmp.sim_pairs(pairs, **kwargs)
+            self.assertEqual(len(sims), len(pairs))
+            for (src, tar), sim in zip(pairs, sims):
+                self.assertAlmostEqual(sim, cmp.sim(src, tar, **kwargs))
+
+    def test_dist_pairs(self):
+        """Test abydos.distance._Distance.dist_pairs."""
+        ident = Ident()
+        self.assertEqual(list(ident.dist_pairs([])), [])
+        self.assertEqual(
+            list(ident.dist_pairs([('abc', 'abc'), ('abc', 'abd')])),
+            [0.0, 1.0],
+        )
+
+        pairs = [(src, tar) for src in self.names for tar in self.names]
+        for cmp, kwargs in (
+            (self.lev, {}),
+            (self.lev, {'mode': 'osa'}),
+            (self.lev, {'cost': (1, 2, 3, 4)}),
+            (self.dice, {'qval': 1}),
+            (Indel(), {}),
+            (LCSseq(), {}),
+            (Typo(), {}),
+        ):
+            dists = cmp.dist_pairs(pairs, **kwargs)
+            self.assertEqual(len(dists), len(pairs))
+            for (src, tar), dist in zip(pairs, dists):
+                self.assertAlmostEqual(dist, cmp.dist(src, tar, **kwargs))
+
+        # Generators are consumed only once
+        pairs = (pair for pair in [('a', 'a'), ('a', 'b')])
+        self.assertEqual(list(self.lev.dist_pairs(pairs)), [0.0, 1.0])
+
 
 if __name__ == '__main__':
     unittest.main()
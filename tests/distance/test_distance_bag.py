@@ -92,6 +92,23 @@ class BagTestCases(unittest.TestCase):
         # Test wrapper
         self.assertAlmostEqual(dist_bag('nelson', 'neilsen'), 2 / 7)
 
+    def test_bag_dist_matrix(self):
+        """Test abydos.distance.Bag.dist_matrix."""
+        terms = ['', 'a', 'abc', 'bca', 'abcd', 'nelson', 'neilsen', 'abc']
+        matrix = self.cmp.dist_matrix(terms)
+        for i, src in enumerate(terms):
+            for j, tar in enumerate(terms):
+                self.assertAlmostEqual(matrix[i, j], self.cmp.dist(src, tar))
+
+        self.assertEqual(
+            self.cmp.dist_matrix(['ab'], ['ab', 'ba', 'cd', '']).tolist(),
+            [[0.0, 0.0, 1.0, 1.0]],
+        )
+        self.assertEqual(
+            self.cmp.sim_matrix(['ab'], ['ab', 'ba', 'cd', '']).tolist(),
+            [[1.0, 1.0, 0.0, 0.0]],
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
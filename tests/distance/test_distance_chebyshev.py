@@ -82,6 +82,23 @@ class ChebyshevTestCases(unittest.TestCase):
         """Test abydos.distance.Chebyshev.sim."""
         self.assertRaises(NotImplementedError, self.cmp.sim)
 
+    def test_chebyshev_dist_many(self):
+        """Test abydos.distance.Chebyshev.dist_many."""
+        self.assertRaises(NotImplementedError, self.cmp.dist_many)
+
+    def test_chebyshev_sim_many(self):
+        """Test abydos.distance.Chebyshev.sim_many."""
+        self.assertRaises(NotImplementedError, self.cmp.sim_many)
+
+    def test_chebyshev_sim_matrix(self):
+        """Test abydos.distance.Chebyshev.sim_matrix & .dist_matrix."""
+        self.assertRaises(
+            NotImplementedError, self.cmp.sim_matrix, ['nelson'], ['neilsen']
+        )
+        self.assertRaises(
+            NotImplementedError, self.cmp.dist_matrix, ['nelson'], ['neilsen']
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -127,6 +127,23 @@ class CosineSimilarityTestCases(unittest.TestCase):
             dist_cosine('nelson', 'neilsen'), 1 - (4 / math.sqrt(7 * 8))
         )
 
+    def test_cosine_sim_matrix(self):
+        """Test abydos.distance.Cosine.sim_matrix."""
+        matrix = self.cmp.sim_matrix(['', 'nelson', 'neilsen'])
+        self.assertEqual(matrix[0].tolist(), [1.0, 0.0, 0.0])
+        self.assertAlmostEqual(matrix[1, 1], 1.0)
+        self.assertAlmostEqual(matrix[1, 2], 4 / math.sqrt(7 * 8))
+        self.assertAlmostEqual(matrix[2, 1], 4 / math.sqrt(7 * 8))
+        self.assertAlmostEqual(
+            self.cmp.sim_matrix([NONQ_FROM], [NONQ_TO], 0)[0, 0],
+            4 / math.sqrt(9 * 7),
+        )
+
+        # strings without q-grams
+        self.assertEqual(
+            self.cmp.sim_matrix(['nelson'], ['neilsen'], 7).tolist(), [[0.0]]
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -37,6 +37,8 @@ from abydos.distance import (
     sim_damerau,
 )
 
+from .. import NONQ_FROM, NONQ_TO
+
 
 class DamerauLevenshteinTestCases(unittest.TestCase):
     """Test Damerau-Levenshtein functions.
@@ -73,6 +75,77 @@ class DamerauLevenshteinTestCases(unittest.TestCase):
         # Test wrapper
         self.assertEqual(damerau_levenshtein('CA', 'ABC'), 2)
 
+    def test_damerau_levenshtein_dist_abs_max_distance(self):
+        """Test abydos.distance.DamerauLevenshtein.dist_abs w/ max_distance."""
+        self.assertEqual(self.cmp.dist_abs('a', 'abcd', max_distance=2), 3)
+        self.assertEqual(self.cmp.dist_abs('', 'abcd', max_distance=2), 3)
+        self.assertEqual(self.cmp.dist_abs('CA', 'ABC', max_distance=1), 2)
+
+        for cost in (
+            (1, 1, 1, 1),
+            (2, 2, 2, 2),
+            (5, 5, 10, 5),
+            (2, 2, 1, 3),
+            (5, 7, 10, 10),
+        ):
+            for src, tar in (
+                ('CA', 'ABC'),
+                ('Niall', 'Neil'),
+                ('ATCG', 'TAGC'),
+                ('sturgeon', 'urgently'),
+                ('abcdef', 'bcdfae'),
+                ('abba', 'baab'),
+                ('', 'ab'),
+            ):
+                dist = self.cmp.dist_abs(src, tar, cost)
+                for max_distance in range(0, dist + 2):
+                    self.assertEqual(
+                        self.cmp.dist_abs(src, tar, cost, max_distance),
+                        min(dist, max_distance + 1),
+                    )
+
+        # A leading delete may be cheaper than any cell of the first row
+        self.assertEqual(
+            self.cmp.dist_abs('ba', 'a', cost=(1, 1, 2, 2), max_distance=1), 1
+        )
+        self.assertEqual(
+            self.cmp.dist_abs('bd', 'd', cost=(2, 2, 3, 4), max_distance=2), 2
+        )
+
+        # Test wrapper
+        self.assertEqual(damerau_levenshtein('CA', 'ABC', max_distance=1), 2)
+
+    def test_damerau_levenshtein_dist_abs_wavefront(self):
+        """Test abydos.distance.DamerauLevenshtein's wavefront kernel."""
+        pairs = (
+            ('ATCG', 'TAGC'),
+            ('CA', 'ABC'),
+            ('a', 'bcd'),
+            ('abcdef', 'bcdfae'),
+            ('sturgeon', 'urgently'),
+            (NONQ_FROM, NONQ_TO),
+            (NONQ_FROM * 3, NONQ_TO[::-1] * 2),
+        )
+        for src, tar in pairs:
+            for cost in (
+                (1, 1, 1, 1),
+                (5, 5, 10, 5),
+                (2, 2, 1, 3),
+                (1.5, 1, 2, 1.4),
+            ):
+                self.assertEqual(
+                    self.cmp._dist_abs_wavefront(src, tar, cost),  # noqa: SF01
+                    self.cmp._dist_abs_dp(src, tar, cost),  # noqa: SF01
+                )
+
+        # Long strings are sent to the wavefront kernel
+        self.assertEqual(
+            self.cmp.dist_abs(NONQ_FROM * 3, NONQ_TO * 2),
+            self.cmp._dist_abs_dp(  # noqa: SF01
+                NONQ_FROM * 3, NONQ_TO * 2, (1, 1, 1, 1)
+            ),
+        )
+
     def test_damerau_dist(self):
         """Test abydos.distance.DamerauLevenshtein.dist."""
         self.assertEqual(self.cmp.dist('', ''), 0)
@@ -115,8 +188,14 @@ class DamerauLevenshteinTestCases(unittest.TestCase):
             ValueError, self.cmp.dist, 'ab', 'ba', cost=(10, 10, 10, 5)
         )
 
+        self.assertAlmostEqual(
+            self.cmp.dist('CA', 'ABC', max_distance=2 / 3), 2 / 3
+        )
+        self.assertEqual(self.cmp.dist('CA', 'ABC', max_distance=0.5), 1.0)
+
         # Test wrapper
         self.assertAlmostEqual(dist_damerau('abbc', 'abc'), 1 / 4)
+        self.assertEqual(dist_damerau('CA', 'ABC', max_distance=0.5), 1.0)
 
     def test_damerau_sim(self):
         """Test abydos.distance.DamerauLevenshtein.sim."""
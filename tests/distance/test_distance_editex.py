@@ -32,6 +32,8 @@ import unittest
 
 from abydos.distance import Editex, dist_editex, editex, sim_editex
 
+from .. import NONQ_FROM, NONQ_TO
+
 
 class EditexTestCases(unittest.TestCase):
     """Test Editex functions.
@@ -79,6 +81,36 @@ class EditexTestCases(unittest.TestCase):
         # Test wrapper
         self.assertEqual(editex('niall', 'neal', local=True), 1)
 
+    def test_editex_dist_abs_wavefront(self):
+        """Test abydos.distance.Editex.dist_abs's wavefront kernel."""
+        pairs = (
+            ('NIALL', 'NEIL'),
+            ('CAT', 'HAT'),
+            ('A', 'BCD'),
+            ('WHALE', 'HWAIL'),
+            (NONQ_FROM.upper(), NONQ_TO.upper()),
+            (NONQ_FROM.upper() * 3, NONQ_TO.upper() * 2),
+        )
+        for src, tar in pairs:
+            for cost in ((0, 1, 2), (1, 3, 4), (0, 0.5, 1.5)):
+                for local in (False, True):
+                    self.assertEqual(
+                        self.cmp._dist_abs_wavefront(  # noqa: SF01
+                            src, tar, cost, local
+                        ),
+                        self.cmp._dist_abs_dp(  # noqa: SF01
+                            src, tar, cost, local
+                        ),
+                    )
+
+        # Long strings are sent to the wavefront kernel
+        self.assertEqual(
+            self.cmp.dist_abs(NONQ_FROM * 3, NONQ_TO * 2),
+            self.cmp._dist_abs_dp(  # noqa: SF01
+                NONQ_FROM.upper() * 3, NONQ_TO.upper() * 2, (0, 1, 2), False
+            ),
+        )
+
     def test_editex_sim(self):
         """Test abydos.distance.Editex.sim."""
         self.assertEqual(self.cmp.sim('', ''), 1)
@@ -168,6 +168,39 @@ class EuclideanTestCases(unittest.TestCase):
             dist_euclidean('nelson', 'neilsen'), 7 ** 0.5 / 23 ** 0.5
         )
 
+    def test_euclidean_sim_many(self):
+        """Test abydos.distance.Euclidean.sim_many & .dist_many."""
+        targets = ['nelson', 'neilsen', '', 'Niall', 'nelson']
+        for qval in (2, 0):
+            self.assertEqual(
+                self.cmp.sim_many('neilsen', targets, qval).tolist(),
+                [self.cmp.sim('neilsen', tar, qval) for tar in targets],
+            )
+            self.assertEqual(
+                self.cmp.dist_many('neilsen', targets, qval).tolist(),
+                [self.cmp.dist('neilsen', tar, qval) for tar in targets],
+            )
+
+    def test_euclidean_sim_matrix(self):
+        """Test abydos.distance.Euclidean.sim_matrix & .dist_matrix."""
+        terms = ['nelson', 'neilsen', '', 'Niall', 'nelson']
+        for qval in (2, 0):
+            self.assertEqual(
+                self.cmp.sim_matrix(terms, None, qval).tolist(),
+                [
+                    [self.cmp.sim(src, tar, qval) for tar in terms]
+                    for src in terms
+                ],
+            )
+            self.assertEqual(
+                self.cmp.dist_matrix(terms[:2], terms, qval).tolist(),
+                [
+                    [self.cmp.dist(src, tar, qval) for tar in terms]
+                    for src in terms[:2]
+                ],
+            )
+        self.assertEqual(self.cmp.sim_matrix(terms, []).shape, (5, 0))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -50,6 +50,8 @@ class GotohTestCases(unittest.TestCase):
     def test_gotoh_dist_abs(self):
         """Test abydos.distance.Gotoh.dist_abs."""
         self.assertEqual(gotoh('', ''), 0)
+        self.assertAlmostEqual(gotoh('abc', ''), -1.8)
+        self.assertAlmostEqual(gotoh('', 'abcd', 1, 0.5), -2.5)
 
         # https://en.wikipedia.org/wiki/Needleman–Wunsch_algorithm
         self.assertEqual(
@@ -94,6 +96,17 @@ class GotohTestCases(unittest.TestCase):
             gotoh('AGACTAGTTAC', 'CGAGACGT', 5, 5, _sim_wikipedia), 16
         )
 
+    def test_gotoh_dist_abs_long(self):
+        """Test abydos.distance.Gotoh.dist_abs on long strings."""
+        dna = 'AGACTAGTTACCGAGACGT' * 20
+        self.assertEqual(self.cmp.dist_abs(dna, dna), len(dna))
+        self.assertAlmostEqual(
+            self.cmp.dist_abs(dna, dna[5:-5]), 364.8, places=4
+        )
+        self.assertEqual(
+            self.cmp.dist_abs(dna, dna[::-1], 5, 1, _sim_wikipedia), 1879
+        )
+
     def test_gotoh_dist_abs_nialls(self):
         """Test abydos.distance.Gotoh.dist_abs (Nialls set)."""
         # checked against http://ds9a.nl/nwunsch/ (mismatch=1, gap=2, skew=2)
@@ -114,6 +127,33 @@ class GotohTestCases(unittest.TestCase):
                 self.nw.dist_abs(NIALL[0], NIALL[i], 2, _sim_nw),
             )
 
+    def test_gotoh_alignment(self):
+        """Test abydos.distance.Gotoh.alignment."""
+        self.assertEqual(self.cmp.alignment('', ''), (0.0, '', ''))
+        self.assertEqual(self.cmp.alignment('cat', 'hat'), (2.0, 'cat', 'hat'))
+        score, src, tar = self.cmp.alignment('abc', '')
+        self.assertAlmostEqual(score, -1.8)
+        self.assertEqual((src, tar), ('abc', '---'))
+
+        dna = 'AGACTAGTTACCGAGACGT' * 20
+        for src, tar in (
+            (NIALL[0], NIALL[3]),
+            (NIALL[0], NIALL[15]),
+            (dna, dna[5:-5]),
+            (dna, dna[7:150] + dna[170:-3]),
+        ):
+            score, src_aln, tar_aln = self.cmp.alignment(
+                src, tar, 2, 1, _sim_nw
+            )
+            self.assertAlmostEqual(
+                score, self.cmp.dist_abs(src, tar, 2, 1, _sim_nw), places=4
+            )
+            self.assertEqual(src_aln.replace('-', ''), src)
+            self.assertEqual(tar_aln.replace('-', ''), tar)
+            self.assertNotIn(
+                '--', ''.join(a + b for a, b in zip(src_aln, tar_aln))
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -32,6 +32,8 @@ import unittest
 
 from abydos.distance import Indel, dist_indel, indel, sim_indel
 
+from .. import NONQ_FROM, NONQ_TO
+
 
 class IndelTestCases(unittest.TestCase):
     """Test indel functions.
@@ -74,8 +76,14 @@ class IndelTestCases(unittest.TestCase):
         self.assertAlmostEqual(self.cmp.dist('Colin', 'Coiln'), 0.2)
         self.assertAlmostEqual(self.cmp.dist('Coiln', 'Colin'), 0.2)
 
+        self.assertAlmostEqual(
+            self.cmp.dist('Colin', 'Coiln', max_distance=0.2), 0.2
+        )
+        self.assertEqual(self.cmp.dist('Nigel', 'Niall', max_distance=0.2), 1)
+
         # Test wrapper
         self.assertAlmostEqual(dist_indel('Colin', 'Coiln'), 0.2)
+        self.assertEqual(dist_indel('Nigel', 'Niall', max_distance=0.2), 1)
 
     def test_indel_dist_abs(self):
         """Test abydos.distance.Indel.dist_abs."""
@@ -92,8 +100,57 @@ class IndelTestCases(unittest.TestCase):
         self.assertAlmostEqual(self.cmp.dist_abs('Colin', 'Coiln'), 2)
         self.assertAlmostEqual(self.cmp.dist_abs('Coiln', 'Colin'), 2)
 
+        self.assertEqual(self.cmp.dist_abs('abcd', 'efgh', max_distance=8), 8)
+        self.assertEqual(self.cmp.dist_abs('abcd', 'efgh', max_distance=2), 3)
+        self.assertEqual(self.cmp.dist_abs('abcd', 'a', max_distance=2), 3)
+        self.assertEqual(
+            self.cmp.dist_abs('Niall', 'Nigel', max_distance=4), 4
+        )
+        self.assertEqual(
+            self.cmp.dist_abs('Niall', 'Nigel', max_distance=3), 4
+        )
+
         # Test wrapper
         self.assertAlmostEqual(indel('Colin', 'Coiln'), 2)
+        self.assertEqual(indel('Niall', 'Nigel', max_distance=3), 4)
+
+    def test_indel_dist_abs_long(self):
+        """Test abydos.distance.Indel.dist_abs on long strings."""
+        src = ' '.join([NONQ_FROM, NONQ_TO] * 25)
+        # 8 deletes & 2 inserts
+        tar = src[:100] + '#' + src[103:700] + '%' + src[705:]
+        self.assertEqual(self.cmp.dist_abs(src, tar), 10)
+        self.assertEqual(self.cmp.dist_abs(tar, src), 10)
+        self.assertEqual(self.cmp.dist_abs(src, tar, max_distance=10), 10)
+        self.assertEqual(self.cmp.dist_abs(src, tar, max_distance=9), 10)
+        self.assertAlmostEqual(
+            self.cmp.dist(src, tar), 10 / (len(src) + len(tar))
+        )
+
+    def test_indel_dist_abs_pairs(self):
+        """Test abydos.distance.Indel.dist_abs_pairs."""
+        pairs = [
+            ('', ''),
+            ('a', ''),
+            ('', 'abc'),
+            ('abcd', 'efgh'),
+            ('Nigel', 'Niall'),
+            ('Colin', 'Coiln'),
+            ('a' * 70 + 'bc', 'a' * 65 + 'cb'),
+            ('x' * 66 + 'bc', 'a' * 65 + 'cb'),
+        ]
+        self.assertEqual(
+            list(self.cmp.dist_abs_pairs(pairs)),
+            [self.cmp.dist_abs(src, tar) for src, tar in pairs],
+        )
+        self.assertEqual(
+            list(self.cmp.dist_pairs(pairs)),
+            [self.cmp.dist(src, tar) for src, tar in pairs],
+        )
+        self.assertEqual(
+            list(self.cmp.sim_pairs(pairs)),
+            [self.cmp.sim(src, tar) for src, tar in pairs],
+        )
 
 
 if __name__ == '__main__':
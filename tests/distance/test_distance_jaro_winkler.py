@@ -32,6 +32,8 @@ import unittest
 
 from abydos.distance import JaroWinkler, dist_jaro_winkler, sim_jaro_winkler
 
+from .. import NONQ_FROM, NONQ_TO
+
 
 class JaroWinklerTestCases(unittest.TestCase):
     """Test Jaro(-Winkler) functions.
@@ -117,6 +119,23 @@ class JaroWinklerTestCases(unittest.TestCase):
             sim_jaro_winkler('DIXON', 'DICKSONX', mode='winkler'), 0.81333333
         )
 
+    def test_jaro_winkler_sim_long(self):
+        """Test abydos.distance.JaroWinkler.sim on long strings."""
+        self.assertAlmostEqual(
+            self.cmp.sim(NONQ_FROM, NONQ_TO), 0.7834391534391535
+        )
+        self.assertAlmostEqual(
+            self.cmp.sim(NONQ_FROM * 3, NONQ_TO * 3, mode='jaro'),
+            0.755399937752879,
+        )
+        self.assertAlmostEqual(
+            self.cmp.sim(NONQ_FROM, NONQ_TO, qval=2), 0.6883482861743732
+        )
+        self.assertEqual(
+            list(self.cmp.sim_many(NONQ_FROM, [NONQ_TO, NONQ_FROM, ''])),
+            [self.cmp.sim(NONQ_FROM, NONQ_TO), 1.0, 0.0],
+        )
+
     def test_dist_jaro_winkler(self):
         """Test abydos.distance.JaroWinkler.dist."""
         self.assertEqual(self.cmp.dist('', '', mode='jaro'), 0)
@@ -29,9 +29,12 @@ from __future__ import (
 )
 
 import unittest
+from random import Random
 
 from abydos.distance import LCSseq, dist_lcsseq, lcsseq, sim_lcsseq
 
+from .. import NONQ_FROM, NONQ_TO
+
 
 class LCSseqTestCases(unittest.TestCase):
     """Test LCSseq functions.
@@ -81,6 +84,119 @@ class LCSseqTestCases(unittest.TestCase):
         # Test wrapper
         self.assertEqual(lcsseq('ABC', 'BCD'), 'BC')
 
+    def test_lcsseq_long(self):
+        """Test abydos.distance.LCSseq.lcsseq on long strings."""
+
+        def _is_subsequence(sub, string):
+            chars = iter(string)
+            return all(char in chars for char in sub)
+
+        src = ' '.join([NONQ_FROM, NONQ_TO] * 25)
+        tar = ' '.join([NONQ_TO, NONQ_FROM[::-1]] * 20)
+        for src, tar in (
+            (src, tar),
+            (tar, src),
+            (src, src[100:200]),
+            (src[:1], tar),
+            (src, ''),
+        ):
+            length = self.cmp._lcsseq_len(src, tar)  # noqa: SF01
+            result = self.cmp.lcsseq(src, tar)
+            self.assertEqual(len(result), length)
+            self.assertTrue(_is_subsequence(result, src))
+            self.assertTrue(_is_subsequence(result, tar))
+        self.assertEqual(self.cmp.lcsseq(src, src[100:200]), src[100:200])
+
+        # Above 2**24 cells, Hirschberg's algorithm divides the problem, and
+        # agrees with the full matrix on length
+        src = ' '.join([NONQ_FROM, NONQ_TO] * 25)
+        tar = ' '.join([NONQ_TO, NONQ_FROM[::-1]] * 100)
+        self.assertGreater(len(src) * len(tar), 1 << 24)
+        result = self.cmp.lcsseq(src, tar)
+        self.assertEqual(
+            len(result), len(self.cmp._lcsseq_matrix(src, tar))  # noqa: SF01
+        )
+        self.assertTrue(_is_subsequence(result, src))
+        self.assertTrue(_is_subsequence(result, tar))
+
+        src, tar = src[:200], tar[:150]
+        self.assertEqual(
+            self.cmp._lcsseq_row(src, tar),  # noqa: SF01
+            [
+                len(self.cmp._lcsseq_matrix(src, tar[:j]))  # noqa: SF01
+                for j in range(0, len(tar) + 1)
+            ],
+        )
+
+    def test_lcsseq_traceback(self):
+        """Test abydos.distance.LCSseq.lcsseq against a matrix traceback."""
+
+        def _traceback(src, tar):
+            # The traceback of the full matrix, as LCSseq.lcsseq read it
+            # out before its matrix was kept as bit-vectors
+            lengths = [[0] * (len(tar) + 1) for _ in range(len(src) + 1)]
+            for i, src_char in enumerate(src):
+                for j, tar_char in enumerate(tar):
+                    if src_char == tar_char:
+                        lengths[i + 1][j + 1] = lengths[i][j] + 1
+                    else:
+                        lengths[i + 1][j + 1] = max(
+                            lengths[i + 1][j], lengths[i][j + 1]
+                        )
+            result = ''
+            i, j = len(src), len(tar)
+            while i != 0 and j != 0:
+                if lengths[i][j] == lengths[i - 1][j]:
+                    i -= 1
+                elif lengths[i][j] == lengths[i][j - 1]:
+                    j -= 1
+                else:
+                    result = src[i - 1] + result
+                    i -= 1
+                    j -= 1
+            return result
+
+        # Strings of 66 to 120 characters, whose matrices exceed 4096 cells,
+        # where ties were once broken differently
+        rand = Random(0)
+        for alphabet in ('ACGT', 'abcdefghij'):
+            for _ in range(20):
+                src, tar = (
+                    ''.join(
+                        rand.choice(alphabet)
+                        for _ in range(rand.randint(66, 120))
+                    )
+                    for _ in range(2)
+                )
+                self.assertEqual(
+                    self.cmp.lcsseq(src, tar), _traceback(src, tar)
+                )
+        src = ' '.join([NONQ_FROM, NONQ_TO] * 2)
+        tar = ' '.join([NONQ_TO, NONQ_FROM[::-1]] * 2)
+        self.assertEqual(self.cmp.lcsseq(src, tar), _traceback(src, tar))
+
+    def test_lcsseq_len_long(self):
+        """Test abydos.distance.LCSseq._lcsseq_len on long strings."""
+        src = ' '.join([NONQ_FROM, NONQ_TO] * 25)
+        for tar in (
+            src[:100] + '#' + src[103:700] + '%' + src[705:],
+            src[:1000] + 'x' + src[1000:] + 'yz',
+            src[::-1],
+        ):
+            length = self.cmp._lcsseq_len(src, tar)  # noqa: SF01
+            self.assertEqual(
+                length, self.cmp._lcsseq_row(src, tar)[-1]  # noqa: SF01
+            )
+            self.assertEqual(
+                length, self.cmp._lcsseq_len(tar, src)  # noqa: SF01
+            )
+        self.assertEqual(
+            self.cmp._lcsseq_len(  # noqa: SF01
+                src, src[:100] + '#' + src[103:700] + '%' + src[705:]
+            ),
+            len(src) - 8,
+        )
+
     def test_lcsseq_sim(self):
         """Test abydos.distance.LCSseq.sim."""
         self.assertEqual(self.cmp.sim('', ''), 1)
@@ -161,6 +277,25 @@ class LCSseqTestCases(unittest.TestCase):
         # Test wrapper
         self.assertAlmostEqual(dist_lcsseq('ABC', 'BCD'), 1 / 3)
 
+    def test_lcsseq_sim_pairs(self):
+        """Test abydos.distance.LCSseq.sim_pairs & .dist_pairs."""
+        pairs = [
+            ('', ''),
+            ('A', ''),
+            ('', 'ABCD'),
+            ('ABCD', 'ABCD'),
+            ('DIXON', 'DICKSONX'),
+            ('XMJYAUZ', 'MZJAWXU'),
+            ('cc', 'bbbbcccccc'),
+            (NONQ_FROM, NONQ_TO),
+            (NONQ_FROM * 2, NONQ_TO * 3),
+        ]
+        sims = self.cmp.sim_pairs(pairs)
+        dists = self.cmp.dist_pairs(pairs)
+        for (src, tar), sim, dist in zip(pairs, sims, dists):
+            self.assertAlmostEqual(sim, self.cmp.sim(src, tar))
+            self.assertAlmostEqual(dist, self.cmp.dist(src, tar))
+
 
 if __name__ == '__main__':
     unittest.main()
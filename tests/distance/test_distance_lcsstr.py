@@ -32,6 +32,8 @@ import unittest
 
 from abydos.distance import LCSstr, dist_lcsstr, lcsstr, sim_lcsstr
 
+from .. import NONQ_FROM, NONQ_TO
+
 
 class LCSstrTestCases(unittest.TestCase):
     """Test LCSstr functions.
@@ -97,6 +99,47 @@ ACTGCCTGGGAAAAGATCGGCAGCCACGGTGGCGAGTATGGCGCCGAGGCCGT',
         # Test wrapper
         self.assertEqual(lcsstr('ABC', 'BCD'), 'BC')
 
+    def test_lcsstr_stl(self):
+        """Test abydos.distance.LCSstr._lcsstr_stl."""
+
+        def _brute_force(src, tar):
+            longest, src_start, tar_start = 0, 0, 0
+            for i in range(len(src)):
+                for j in range(len(tar)):
+                    k = 0
+                    while (
+                        i + k < len(src)
+                        and j + k < len(tar)
+                        and src[i + k] == tar[j + k]
+                    ):
+                        k += 1
+                    # prefer the earliest end in src, then in tar
+                    if k > longest or (
+                        k == longest
+                        and k
+                        and (i + k, j) < (src_start + longest, tar_start)
+                    ):
+                        longest, src_start, tar_start = k, i, j
+            return src_start, tar_start, longest
+
+        pairs = [
+            ('', ''),
+            ('A', ''),
+            ('', 'A'),
+            ('abcabc', 'cabcab'),
+            ('aaaa', 'aa'),
+            ('abab', 'baba'),
+            ('mississippi', 'sipping ssippi'),
+            (NONQ_FROM, NONQ_TO),
+            (NONQ_TO, NONQ_FROM),
+            (NONQ_FROM * 5, NONQ_TO[::-1] + NONQ_FROM[7:30]),
+        ]
+        for src, tar in pairs:
+            self.assertEqual(
+                self.cmp._lcsstr_stl(src, tar),  # noqa: SF01
+                _brute_force(src, tar),
+            )
+
     def test_lcsstr_sim(self):
         """Test abydos.distance.LCSstr.sim."""
         self.assertEqual(self.cmp.sim('', ''), 1)
@@ -37,6 +37,8 @@ from abydos.distance import (
     sim_levenshtein,
 )
 
+from .. import NONQ_FROM, NONQ_TO
+
 
 class LevenshteinTestCases(unittest.TestCase):
     """Test Levenshtein functions.
@@ -156,6 +158,181 @@ class LevenshteinTestCases(unittest.TestCase):
             levenshtein('ab', 'ba', 'osa', cost=(10, 10, 10, 5)), 5
         )
 
+    def test_levenshtein_dist_abs_bitpar(self):
+        """Test abydos.distance.Levenshtein.dist_abs's bit-parallel engine."""
+        # Doubling every cost sends a comparison through the matrix-based
+        # implementation, which must agree with the bit-parallel one.
+        pairs = (
+            ('ATCG', 'TAGC'),
+            ('ACTG', 'TAGC'),
+            ('CA', 'ABC'),
+            ('abcdefg', 'xabxcdxxefxgx'),
+            ('sturgeon', 'urgently'),
+            ('levenshtein', 'frankenstein'),
+            ('java was neat', 'scala is great'),
+            ('abba', 'baab'),
+            ('Niall', 'Nigel'),
+            ('a' * 70 + 'bc' + 'd' * 10, 'a' * 69 + 'cb' + 'd' * 12),
+        )
+        for src, tar in pairs:
+            for mode in ('lev', 'osa'):
+                self.assertEqual(
+                    self.cmp.dist_abs(src, tar, mode),
+                    self.cmp.dist_abs(src, tar, mode, (2, 2, 2, 2)) // 2,
+                )
+                self.assertEqual(
+                    self.cmp.dist_abs(tar, src, mode),
+                    self.cmp.dist_abs(src, tar, mode),
+                )
+
+        self.assertEqual(
+            self.cmp.dist_abs('a' * 70 + 'bc', 'a' * 70 + 'cb', 'osa'), 1
+        )
+        self.assertEqual(
+            self.cmp.dist_abs('a' * 70 + 'bc', 'a' * 70 + 'cb', 'lev'), 2
+        )
+
+    def test_levenshtein_dist_abs_wavefront(self):
+        """Test abydos.distance.Levenshtein.dist_abs's wavefront kernel."""
+        pairs = (
+            ('ATCG', 'TAGC'),
+            ('CA', 'ABC'),
+            ('a', 'bcd'),
+            ('sturgeon', 'urgently'),
+            ('levenshtein', 'frankenstein'),
+            (NONQ_FROM, NONQ_TO),
+            (NONQ_FROM * 3, NONQ_TO * 2),
+        )
+        for src, tar in pairs:
+            for mode in ('lev', 'osa'):
+                for cost in (
+                    (2, 2, 2, 2),
+                    (5, 7, 10, 3),
+                    (1.5, 0.5, 1.2, 0.7),
+                ):
+                    self.assertEqual(
+                        self.cmp._dist_abs_wavefront(  # noqa: SF01
+                            src, tar, mode, cost
+                        ),
+                        self.cmp._dist_abs_dp(  # noqa: SF01
+                            src, tar, mode, cost
+                        ),
+                    )
+
+        # Long strings are sent to the wavefront kernel
+        self.assertEqual(
+            self.cmp.dist_abs(NONQ_FROM * 3, NONQ_TO * 2, cost=(2, 2, 2, 2)),
+            2 * self.cmp.dist_abs(NONQ_FROM * 3, NONQ_TO * 2),
+        )
+
+    def test_levenshtein_dist_abs_diagonal(self):
+        """Test abydos.distance.Levenshtein.dist_abs on long strings."""
+        src = ' '.join([NONQ_FROM, NONQ_TO] * 25)
+        peq = self.cmp._pattern_bitmasks(src)  # noqa: SF01
+        for tar in (
+            src[:100] + '#' + src[103:700] + '%' + src[705:],
+            src[:1000] + 'x' + src[1000:] + 'yz',
+            'xyz' + src[:-1],
+            src[::-1],
+        ):
+            dist = self.cmp._dist_abs_bitpar(  # noqa: SF01
+                peq, len(src), tar
+            )
+            self.assertEqual(self.cmp.dist_abs(src, tar), dist)
+            self.assertEqual(self.cmp.dist_abs(tar, src), dist)
+            for max_distance in range(0, min(dist, 20) + 2):
+                self.assertEqual(
+                    self.cmp.dist_abs(src, tar, max_distance=max_distance),
+                    min(dist, max_distance + 1),
+                )
+
+        # Substitutions costing as much as an insert & a delete
+        tar = src[:100] + '#' + src[103:700] + '%' + src[705:]
+        self.assertEqual(self.cmp.dist_abs(src, tar, cost=(1, 1, 2, 2)), 10)
+
+    def test_levenshtein_dist_abs_pairs(self):
+        """Test abydos.distance.Levenshtein.dist_abs_pairs."""
+        self.assertEqual(list(self.cmp.dist_abs_pairs([])), [])
+        self.assertEqual(list(self.cmp.dist_abs_pairs([('', '')])), [0.0])
+
+        pairs = [
+            ('', ''),
+            ('', 'abc'),
+            ('abc', ''),
+            ('cat', 'hat'),
+            ('Niall', 'Neil'),
+            ('aluminum', 'Catalan'),
+            ('ATCG', 'TAGC'),
+            ('ACTG', 'TAGC'),
+            ('CA', 'ABC'),
+            ('abba', 'baab'),
+            ('a' * 70 + 'bc' + 'd' * 10, 'a' * 69 + 'cb' + 'd' * 12),
+            ('a' * 70 + 'bc', 'ac'),
+            (NONQ_FROM, NONQ_TO),
+            (NONQ_TO, NONQ_FROM[:40]),
+        ]
+        for mode in ('lev', 'osa'):
+            for cost in (
+                (1, 1, 1, 1),
+                (1, 1, 2, 2),
+                (1, 1, 9999, 9999),
+                (5, 7, 10, 3),
+                (1.5, 0.5, 1.2, 0.7),
+            ):
+                dists = self.cmp.dist_abs_pairs(pairs, mode, cost)
+                for (src, tar), dist in zip(pairs, dists):
+                    self.assertEqual(
+                        dist, self.cmp.dist_abs(src, tar, mode, cost)
+                    )
+                dists = self.cmp.dist_pairs(pairs, mode, cost)
+                for (src, tar), dist in zip(pairs, dists):
+                    self.assertAlmostEqual(
+                        dist, self.cmp.dist(src, tar, mode, cost)
+                    )
+
+        # Pairs are divided into batches by length
+        words = NONQ_FROM.split()
+        pairs = [
+            (word, word[::-1] + 'x' * (len(word) % 4)) for word in words
+        ] * 150
+        dists = self.cmp.dist_abs_pairs(pairs, 'osa')
+        for (src, tar), dist in zip(pairs, dists[: len(words)]):
+            self.assertEqual(dist, self.cmp.dist_abs(src, tar, 'osa'))
+        self.assertEqual(list(dists), list(dists[: len(words)]) * 150)
+
+    def test_levenshtein_dist_abs_max_distance(self):
+        """Test abydos.distance.Levenshtein.dist_abs with max_distance."""
+        # Lengths alone exceed max_distance
+        self.assertEqual(self.cmp.dist_abs('a', 'abcd', max_distance=2), 3)
+        self.assertEqual(self.cmp.dist_abs('', 'abcd', max_distance=2), 3)
+        self.assertEqual(
+            self.cmp.dist_abs('ab', '', cost=(5, 7, 10, 10), max_distance=10),
+            11,
+        )
+
+        for mode in ('lev', 'osa'):
+            for cost in ((1, 1, 1, 1), (2, 2, 2, 2), (5, 7, 10, 5)):
+                for src, tar in (
+                    ('Niall', 'Neil'),
+                    ('ATCG', 'TAGC'),
+                    ('sturgeon', 'urgently'),
+                    ('levenshtein', 'frankenstein'),
+                    ('abba', 'baab'),
+                    ('', 'ab'),
+                ):
+                    dist = self.cmp.dist_abs(src, tar, mode, cost)
+                    for max_distance in range(0, dist + 2):
+                        self.assertEqual(
+                            self.cmp.dist_abs(
+                                src, tar, mode, cost, max_distance
+                            ),
+                            min(dist, max_distance + 1),
+                        )
+
+        # Test wrapper
+        self.assertEqual(levenshtein('Niall', 'Neil', max_distance=2), 3)
+        self.assertEqual(levenshtein('Niall', 'Neil', max_distance=3), 3)
+
     def test_levenshtein_dist(self):
         """Test abydos.distance.Levenshtein.dist."""
         self.assertEqual(self.cmp.dist('', ''), 0)
@@ -170,8 +347,20 @@ class LevenshteinTestCases(unittest.TestCase):
         self.assertAlmostEqual(self.cmp.dist('abbc', 'ac'), 1 / 2)
         self.assertAlmostEqual(self.cmp.dist('abbc', 'abc'), 1 / 4)
 
+        self.assertAlmostEqual(
+            self.cmp.dist('abbc', 'abc', max_distance=0.25), 1 / 4
+        )
+        self.assertEqual(self.cmp.dist('abbc', 'ac', max_distance=0.25), 1.0)
+        self.assertAlmostEqual(
+            self.cmp.dist('abbc', 'ac', 'osa', (2, 2, 1, 1), 0.5), 1 / 2
+        )
+        self.assertEqual(
+            self.cmp.dist('abbc', 'ac', 'osa', (2, 2, 1, 1), 0.4), 1.0
+        )
+
         # Test wrapper
         self.assertAlmostEqual(dist_levenshtein('abbc', 'abc'), 1 / 4)
+        self.assertEqual(dist_levenshtein('abbc', 'ac', max_distance=0.25), 1)
 
     def test_levenshtein_sim(self):
         """Test abydos.distance.Levenshtein.sim."""
@@ -190,6 +379,23 @@ class LevenshteinTestCases(unittest.TestCase):
         # Test wrapper
         self.assertAlmostEqual(sim_levenshtein('abbc', 'abc'), 3 / 4)
 
+    def test_levenshtein_sim_many(self):
+        """Test abydos.distance.Levenshtein.sim_many."""
+        names = ['Niall', 'Neal', 'Neil', 'Njall', 'Nigel', '', 'Niall']
+        for kwargs in (
+            {},
+            {'mode': 'osa'},
+            {'cost': (1, 2, 3, 4)},
+            {'max_distance': 0.4},
+        ):
+            for src in names:
+                self.assertEqual(
+                    self.cmp.sim_many(src, names, **kwargs).tolist(),
+                    (1.0 - self.cmp.dist_many(src, names, **kwargs)).tolist(),
+                )
+                for tar, sim in zip(names, self.cmp.sim_many(src, names)):
+                    self.assertAlmostEqual(sim, self.cmp.sim(src, tar))
+
 
 if __name__ == '__main__':
     unittest.main()
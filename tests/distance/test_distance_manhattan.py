@@ -134,6 +134,19 @@ class ManhattanTestCases(unittest.TestCase):
         # Test wrapper
         self.assertAlmostEqual(dist_manhattan('nelson', 'neilsen'), 7 / 15)
 
+    def test_manhattan_sim_many(self):
+        """Test abydos.distance.Manhattan.sim_many & .dist_many."""
+        targets = ['nelson', 'neilsen', '', 'Niall', 'nelson']
+        for qval in (2, 0):
+            self.assertEqual(
+                self.cmp.sim_many('neilsen', targets, qval).tolist(),
+                [self.cmp.sim('neilsen', tar, qval) for tar in targets],
+            )
+            self.assertEqual(
+                self.cmp.dist_many('neilsen', targets, qval).tolist(),
+                [self.cmp.dist('neilsen', tar, qval) for tar in targets],
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -165,6 +165,28 @@ class MinkowskiTestCases(unittest.TestCase):
         # Test wrapper
         self.assertAlmostEqual(dist_minkowski('nelson', 'neilsen'), 7 / 15)
 
+    def test_minkowski_sim_many(self):
+        """Test abydos.distance.Minkowski.sim_many & .dist_many."""
+        targets = ['nelson', 'neilsen', '', 'Niall', 'nelson']
+        for qval in (2, 0):
+            self.assertEqual(
+                self.cmp.sim_many('neilsen', targets, qval).tolist(),
+                [self.cmp.sim('neilsen', tar, qval) for tar in targets],
+            )
+            self.assertEqual(
+                self.cmp.dist_many('neilsen', targets, qval).tolist(),
+                [self.cmp.dist('neilsen', tar, qval) for tar in targets],
+            )
+        self.assertEqual(
+            self.cmp.sim_many('neilsen', targets, 2, 2).tolist(),
+            [self.cmp.sim('neilsen', tar, 2, 2) for tar in targets],
+        )
+        inf = float('inf')
+        self.assertEqual(
+            self.cmp.dist_many('neilsen', targets, pval=inf).tolist(),
+            [self.cmp.dist('neilsen', tar, pval=inf) for tar in targets],
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
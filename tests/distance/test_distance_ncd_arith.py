@@ -74,6 +74,14 @@ class NCDarithTestCases(unittest.TestCase):
         self.assertAlmostEqual(self.cmp.dist('Njáll', 'Njall'), 0.75)
         self.assertAlmostEqual(self.cmp.dist('Njall', 'Njáll'), 0.75)
 
+        # Fixed-precision arithmetic
+        cmp32 = NCDarith(precision=32)
+        self.assertEqual(cmp32.dist('', ''), 0)
+        self.assertAlmostEqual(
+            cmp32.dist('Niall', 'Neil', self.arith.get_probs()),
+            0.5909090909090909,
+        )
+
         # Test wrapper
         self.assertAlmostEqual(
             dist_ncd_arith('Niall', 'Neil', self.arith.get_probs()),
@@ -115,6 +123,93 @@ class NCDarithTestCases(unittest.TestCase):
             0.3913043478260869,
         )
 
+    def test_ncd_arith_dist_matrix(self):
+        """Test abydos.distance.NCDarith.dist_many & .dist_matrix."""
+        names = ['Niall', 'Neal', 'Neil', 'Njáll', 'Nigel']
+        probs = self.arith.get_probs()
+        for cmp in (NCDarith(), NCDarith(precision=32)):
+            for dists, probs_arg in (
+                (cmp.dist_matrix(names), None),
+                (cmp.dist_matrix(names, probs=probs), probs),
+            ):
+                for i, src in enumerate(names):
+                    self.assertEqual(
+                        list(dists[i]),
+                        [cmp.dist(src, tar, probs_arg) for tar in names],
+                    )
+                    self.assertEqual(
+                        list(cmp.dist_many(src, names, probs_arg)),
+                        list(dists[i]),
+                    )
+            self.assertEqual(
+                cmp.sim_many('Niall', names, probs).tolist(),
+                (1.0 - dists[0]).tolist(),
+            )
+
+        # n_jobs is accepted, but every pair is compared in this thread
+        cmp = NCDarith(precision=32)
+        for probs_arg in (None, probs):
+            dists = cmp.dist_matrix(names, probs=probs_arg)
+            self.assertEqual(
+                cmp.dist_matrix(names, probs=probs_arg, n_jobs=2).tolist(),
+                dists.tolist(),
+            )
+            self.assertEqual(
+                cmp.dist_many('Neil', names, probs_arg, n_jobs=None).tolist(),
+                dists[2].tolist(),
+            )
+
+        # Changing the probabilities empties the cache
+        cmp = NCDarith()
+        cmp.dist('Niall', 'Neil', probs)
+        cmp.dist('Niall', 'Neil', Arithmetic('Niall Neil').get_probs())
+        self.assertEqual(
+            cmp.dist('Niall', 'Neil', probs),
+            NCDarith().dist('Niall', 'Neil', probs),
+        )
+
+    def test_ncd_arith_train(self):
+        """Test abydos.distance.NCDarith.train."""
+        names = ['Niall', 'Neal', 'Neil', 'Njáll', 'Nigel']
+        probs = self.arith.get_probs()
+        for precision in (None, 32):
+            cmp = NCDarith(precision)
+            self.assertIsNone(cmp.get_probs())
+            cmp.train(' '.join(NIALL))
+            self.assertEqual(cmp.get_probs(), probs)
+            dists = NCDarith(precision).dist_matrix(names, probs=probs)
+            self.assertEqual(cmp.dist_matrix(names).tolist(), dists.tolist())
+
+            # Trained probabilities may be shared between instances, & are
+            # used whenever none are passed
+            shared = NCDarith(precision, probs=cmp.get_probs())
+            self.assertEqual(
+                shared.dist_many('Niall', names).tolist(), dists[0].tolist()
+            )
+            self.assertEqual(shared.dist('Neil', 'Nigel'), dists[2, 4])
+            # Probabilities passed take precedence
+            other = Arithmetic('Niall Neil').get_probs()
+            self.assertEqual(
+                shared.dist('Niall', 'Neil', other),
+                NCDarith(precision).dist('Niall', 'Neil', other),
+            )
+            self.assertEqual(shared.dist('Niall', 'Neil'), dists[0, 2])
+
+        self.assertAlmostEqual(
+            NCDarith(probs=probs).dist('Niall', 'Neil'), 0.608695652173913
+        )
+
+        # Characters absent from the training text are reported
+        for precision in (None, 32):
+            cmp = NCDarith(precision)
+            cmp.train('Niall Neal Neil Nigel')
+            self.assertRaises(ValueError, cmp.dist, 'Xavier', 'Neil')
+            self.assertRaises(
+                ValueError, cmp.dist_matrix, ['Niall', 'Xavier', 'Neil']
+            )
+            cmp.train('Niall Neal Neil Nigel Xavier')
+            self.assertLess(cmp.dist('Xavier', 'Neil'), 1.0)
+
 
 if __name__ == '__main__':
     unittest.main()
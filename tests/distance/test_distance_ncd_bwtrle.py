@@ -77,6 +77,17 @@ class NCDbwtrleTestCases(unittest.TestCase):
             sim_ncd_bwtrle('banana', 'banane'), 0.42857142857
         )
 
+    def test_ncd_bwtrle_dist_matrix(self):
+        """Test abydos.distance.NCDbwtrle.dist_many & .dist_matrix."""
+        names = ['banana', 'bandana', 'ananas', 'banana']
+        dists = self.cmp.dist_matrix(names, names[:2])
+        for i, src in enumerate(names):
+            for j, tar in enumerate(names[:2]):
+                self.assertEqual(dists[i, j], NCDbwtrle().dist(src, tar))
+        self.assertEqual(
+            list(self.cmp.dist_many('ananas', names[:2])), list(dists[2])
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
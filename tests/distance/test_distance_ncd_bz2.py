@@ -28,6 +28,7 @@ from __future__ import (
     unicode_literals,
 )
 
+import pickle
 import unittest
 
 from abydos.distance import NCDbz2, dist_ncd_bz2, sim_ncd_bz2
@@ -59,6 +60,37 @@ class CompressionTestCases(unittest.TestCase):
         # Test wrapper
         self.assertAlmostEqual(sim_ncd_bz2('abcdefg', 'fg'), 0.84375)
 
+    def test_ncd_bz2_dist_matrix(self):
+        """Test abydos.distance.NCDbz2.dist_many & .dist_matrix."""
+        names = ['Niall', 'Neal', 'Neil', 'Njáll', 'Nigel']
+        dists = self.cmp.dist_matrix(names)
+        for i, src in enumerate(names):
+            self.assertEqual(
+                list(dists[i]), [NCDbz2().dist(src, tar) for tar in names]
+            )
+            self.assertEqual(
+                list(self.cmp.dist_many(src, names)), list(dists[i])
+            )
+
+    def test_ncd_bz2_dist_matrix_threads(self):
+        """Test abydos.distance.NCDbz2.dist_matrix with threads."""
+        names = ['Niall', 'Neal', 'Neil', 'Njáll', 'Nigel']
+        self.assertEqual(
+            NCDbz2().dist_matrix(names, n_jobs=3).tolist(),
+            self.cmp.dist_matrix(names).tolist(),
+        )
+
+    def test_ncd_bz2_pickle(self):
+        """Test pickling abydos.distance.NCDbz2."""
+        names = ['Niall', 'Neal', 'Neil', 'Njáll', 'Nigel']
+        cmp = NCDbz2()
+        dists = cmp.dist_matrix(names).tolist()
+        cmp = pickle.loads(pickle.dumps(cmp))
+        # The cache is kept & the lock recreated
+        self.assertEqual(len(cmp._sizes), len(names))  # noqa: SF01
+        self.assertEqual(cmp.dist_matrix(names).tolist(), dists)
+        self.assertEqual(cmp.dist_matrix(names, n_jobs=3).tolist(), dists)
+
 
 if __name__ == '__main__':
     unittest.main()
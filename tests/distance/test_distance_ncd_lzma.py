@@ -34,6 +34,8 @@ from abydos.distance import NCDlzma, dist_ncd_lzma, sim_ncd_lzma
 
 from six import PY3
 
+from .. import NIALL
+
 try:
     import lzma
 except ImportError:  # pragma: no cover
@@ -93,6 +95,43 @@ class CompressionTestCases(unittest.TestCase):
                     sim_ncd_lzma('abcdefg', 'fg'), 0.8260869565217
                 )
 
+    def test_ncd_lzma_train(self):
+        """Test abydos.distance.NCDlzma.train."""
+        if lzma is not None:
+            cmp = NCDlzma()
+            self.assertIsNone(cmp.get_filters())
+            if not PY3:
+                # Raw LZMA2 filter chains are supported only on Python 3.3+
+                self.assertRaises(ValueError, cmp.train, NIALL)
+                self.assertRaises(ValueError, NCDlzma, filters=[{}])
+                return
+
+            untrained = [cmp._compress(name) for name in NIALL]  # noqa: SF01
+            cmp.dist('Niall', 'Neil')
+            cmp.train(NIALL)
+            # Training empties the cache
+            self.assertEqual(len(cmp._sizes), 0)  # noqa: SF01
+            self.assertEqual(cmp.get_filters()[0]['dict_size'], 4096)
+            trained = [cmp._compress(name) for name in NIALL]  # noqa: SF01
+            for before, after in zip(untrained, trained):
+                self.assertLess(after, before)
+
+            self.assertAlmostEqual(cmp.dist('Niall', 'Njáll'), 0.6)
+            self.assertAlmostEqual(cmp.dist('Neil', 'Nigel'), 0.5555555555556)
+
+            # The dictionary holds two of the longest strings
+            cmp.train(['a' * 3000])
+            self.assertEqual(cmp.get_filters()[0]['dict_size'], 8192)
+            cmp.train([])
+            self.assertEqual(cmp.get_filters()[0]['dict_size'], 4096)
+
+            # The filter chain may be shared
+            shared = NCDlzma(filters=cmp.get_filters())
+            self.assertEqual(
+                shared.dist_matrix(NIALL, n_jobs=4).tolist(),
+                cmp.dist_matrix(NIALL).tolist(),
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
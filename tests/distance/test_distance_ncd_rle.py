@@ -71,6 +71,17 @@ class CompressionTestCases(unittest.TestCase):
         # Test wrapper
         self.assertAlmostEqual(sim_ncd_rle('abb', 'bbba'), 2 / 3)
 
+    def test_ncd_rle_dist_matrix(self):
+        """Test abydos.distance.NCDrle.dist_many & .dist_matrix."""
+        names = ['aaab', 'baaa', 'aaac', 'aaab', '']
+        dists = self.cmp.dist_matrix(names)
+        for i, src in enumerate(names):
+            for j, tar in enumerate(names):
+                self.assertEqual(dists[i, j], NCDrle().dist(src, tar))
+        self.assertEqual(
+            list(self.cmp.dist_many('aaab', names)), list(dists[0])
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -28,10 +28,18 @@ from __future__ import (
     unicode_literals,
 )
 
+import pickle
 import unittest
+import zlib
+from random import Random
+from string import ascii_lowercase
 
 from abydos.distance import NCDzlib, dist_ncd_zlib, sim_ncd_zlib
 
+from six import PY3
+
+from .. import NIALL
+
 
 class CompressionTestCases(unittest.TestCase):
     """Test compression distance functions.
@@ -59,6 +67,156 @@ class CompressionTestCases(unittest.TestCase):
         # Test wrapper
         self.assertAlmostEqual(sim_ncd_zlib('abcdefg', 'fg'), 0.46153846153846)
 
+    def test_ncd_zlib_dist_matrix(self):
+        """Test abydos.distance.NCDzlib.dist_many & .dist_matrix."""
+        names = ['Niall', 'Neal', 'Neil', 'Njáll', 'Nigel', 'Niall', '']
+        cmp = NCDzlib(cache_size=3)
+        dists = cmp.dist_matrix(names)
+        self.assertLessEqual(len(cmp._sizes), 3)  # noqa: SF01
+        for i, src in enumerate(names):
+            for j, tar in enumerate(names):
+                # Compressed sizes do not depend on earlier comparisons
+                self.assertEqual(dists[i, j], NCDzlib().dist(src, tar))
+            self.assertEqual(list(cmp.dist_many(src, names)), list(dists[i]))
+        self.assertEqual(
+            cmp.dist_matrix(names[:2], names).tolist(), dists[:2].tolist()
+        )
+        self.assertEqual(
+            cmp.sim_matrix(names).tolist(), (1.0 - dists).tolist()
+        )
+        self.assertEqual(
+            cmp.sim_many('Niall', names).tolist(), (1.0 - dists[0]).tolist()
+        )
+
+        self.assertEqual(cmp.dist_matrix([]).shape, (0, 0))
+        self.assertEqual(cmp.dist_matrix(names, []).shape, (7, 0))
+
+    def test_ncd_zlib_dist_matrix_threads(self):
+        """Test abydos.distance.NCDzlib.dist_matrix with threads."""
+        names = ['Niall', 'Neal', 'Neil', 'Njáll', 'Nigel', 'Niall', '']
+        dists = NCDzlib().dist_matrix(names)
+        for n_jobs in (2, 4, None):
+            cmp = NCDzlib(cache_size=3)
+            self.assertEqual(
+                cmp.dist_matrix(names, n_jobs=n_jobs).tolist(), dists.tolist()
+            )
+            self.assertEqual(
+                cmp.dist_matrix(names[:2], names, n_jobs=n_jobs).tolist(),
+                dists[:2].tolist(),
+            )
+            self.assertEqual(
+                cmp.dist_many('Neil', names, n_jobs=n_jobs).tolist(),
+                dists[2].tolist(),
+            )
+
+    def test_ncd_zlib_pickle(self):
+        """Test pickling abydos.distance.NCDzlib."""
+        names = ['Niall', 'Neal', 'Neil', 'Njáll', 'Nigel']
+        cmps = [NCDzlib(level=9)]
+        if PY3:
+            trained = NCDzlib()
+            trained.train(NIALL)
+            cmps.append(trained)
+        for cmp in cmps:
+            dists = cmp.dist_matrix(names).tolist()
+            clone = pickle.loads(pickle.dumps(cmp))
+            self.assertEqual(clone._level, cmp._level)  # noqa: SF01
+            self.assertEqual(clone.get_zdict(), cmp.get_zdict())
+            self.assertEqual(len(clone._sizes), len(names))  # noqa: SF01
+            clone._clear_cache()  # noqa: SF01
+            self.assertEqual(clone.dist_matrix(names).tolist(), dists)
+            self.assertEqual(
+                clone.dist_matrix(names, n_jobs=3).tolist(), dists
+            )
+
+    def test_ncd_zlib_train(self):
+        """Test abydos.distance.NCDzlib.train."""
+        cmp = NCDzlib()
+        self.assertIsNone(cmp.get_zdict())
+        if not PY3:
+            # zlib takes preset dictionaries only on Python 3.3+
+            self.assertRaises(ValueError, cmp.train, NIALL)
+            self.assertRaises(ValueError, NCDzlib, zdict=b'Niall')
+            return
+
+        untrained = [cmp._compress(name) for name in NIALL]  # noqa: SF01
+        cmp.dist('Niall', 'Neil')
+        cmp.train(NIALL[:10])
+        # Training empties the cache
+        self.assertEqual(len(cmp._sizes), 0)  # noqa: SF01
+        self.assertEqual(
+            cmp.get_zdict(),
+            'NealNeelNeilNelNeleNiallNigelNigelliNjallNjáll'.encode('utf-8'),
+        )
+        trained = [cmp._compress(name) for name in NIALL]  # noqa: SF01
+        self.assertLess(sum(trained), sum(untrained))
+        for before, after in zip(untrained, trained):
+            self.assertLessEqual(after, before)
+
+        self.assertEqual(cmp.dist('Niall', 'Njáll'), 0.25)
+        self.assertEqual(cmp.dist('Neil', 'Nigel'), 0.25)
+        # The most frequent strings are kept, last
+        corpus = NIALL + ('Neil', 'Neil', 'Niall')
+        self.assertEqual(
+            cmp._make_zdict(corpus, 9), b'NiallNeil'  # noqa: SF01
+        )
+
+        # The dictionary may be shared, & the sizes do not depend on earlier
+        # compressions or on the thread
+        dists = cmp.dist_matrix(NIALL)
+        for n_jobs in (1, 4):
+            shared = NCDzlib(zdict=cmp.get_zdict())
+            self.assertEqual(
+                shared.dist_matrix(NIALL, n_jobs=n_jobs).tolist(),
+                dists.tolist(),
+            )
+        self.assertEqual(
+            [
+                NCDzlib(zdict=cmp.get_zdict()).dist(src, 'Neil')
+                for src in NIALL
+            ],
+            dists[:, 2].tolist(),
+        )
+
+    def test_ncd_zlib_long(self):
+        """Test abydos.distance.NCDzlib with strings of several KB."""
+        rand = Random(0)
+        doc = ''.join(rand.choice(ascii_lowercase) for _ in range(3000))
+        doc2 = doc[1000:] + ' '.join(NIALL * 20)
+        cmps = [NCDzlib()]
+        if PY3:
+            trained = NCDzlib()
+            trained.train(NIALL)
+            cmps.append(trained)
+        for cmp in cmps:
+            self.assertLessEqual(
+                cmp._compress(doc), cmp._compress(doc + doc2)  # noqa: SF01
+            )
+            self.assertGreaterEqual(cmp.dist(doc, doc2), 0.0)
+            self.assertLessEqual(cmp.dist(doc, doc2), 1.0)
+        if not PY3:
+            return
+
+        # Strings are compressed with the windows they need, and the same
+        # size results as from zlib's largest window
+        narrow_len = trained._narrow_len  # noqa: SF01
+        for text in (doc[:narrow_len], doc[: narrow_len + 1], doc + doc2):
+            compressor = zlib.compressobj(
+                zlib.Z_DEFAULT_COMPRESSION,
+                zlib.DEFLATED,
+                15,
+                4,
+                zdict=trained.get_zdict(),
+            )
+            compressor.compress(b'')
+            compressor.flush(zlib.Z_SYNC_FLUSH)
+            data = text.encode('utf-8')
+            self.assertEqual(
+                trained._compress(text),  # noqa: SF01
+                len(compressor.compress(data))
+                + len(compressor.flush(zlib.Z_FULL_FLUSH)),
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
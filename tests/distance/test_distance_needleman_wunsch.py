@@ -164,6 +164,88 @@ class NeedlemanWunschTestCases(unittest.TestCase):
                 needleman_wunsch(NIALL[0], NIALL[i], 2, _sim_nw), nw_vals[i]
             )
 
+    def test_needleman_wunsch_substitution_matrix(self):
+        """Test abydos.distance.NeedlemanWunsch._substitution_matrix."""
+        calls = []
+
+        def _sim_counted(src, tar):
+            calls.append((src, tar))
+            return _sim_wikipedia(src, tar)
+
+        sub = self.cmp._substitution_matrix  # noqa: SF01
+        src_codes, tar_codes, sub_mat = sub(
+            'AGACTAGTTAC', 'CGAGACGT', _sim_counted
+        )
+        self.assertEqual(list(src_codes), [0, 1, 0, 2, 3, 0, 1, 3, 3, 0, 2])
+        self.assertEqual(list(tar_codes), [0, 1, 2, 1, 2, 0, 1, 3])
+        self.assertEqual(sub_mat.shape, (4, 4))
+        self.assertEqual(sub_mat[0, 2], 10)
+        self.assertEqual(sub_mat[3, 0], 0)
+        self.assertEqual(len(calls), 16)
+        self.assertEqual(len(set(calls)), 16)
+
+        # The similarity of each pair of characters is found just once
+        del calls[:]
+        self.assertEqual(
+            self.cmp.dist_abs('AGACTAGTTAC', 'CGAGACGT', 5, _sim_counted), 16
+        )
+        self.assertEqual(len(calls), 16)
+
+        # sim_matrix's alphabet is still checked
+        def _sim_dna(src, tar):
+            return NeedlemanWunsch.sim_matrix(src, tar, alphabet='ACGT')
+
+        self.assertEqual(
+            self.cmp.dist_abs('GATTACA', 'GCATGC', 1, _sim_dna), 2
+        )
+        self.assertRaises(
+            ValueError, self.cmp.dist_abs, 'GATTACA', 'GCATGCU', 1, _sim_dna
+        )
+        self.assertEqual(self.cmp.dist_abs('GATTACA', '', 1, _sim_dna), -7)
+
+    def test_needleman_wunsch_dist_abs_long(self):
+        """Test abydos.distance.NeedlemanWunsch.dist_abs on long strings."""
+        dna = 'AGACTAGTTACCGAGACGT' * 20
+        self.assertEqual(self.cmp.dist_abs(dna, dna), len(dna))
+        self.assertEqual(self.cmp.dist_abs(dna, dna[1:-1]), len(dna) - 4)
+        self.assertEqual(
+            self.cmp.dist_abs(dna, dna[::-1], 5, _sim_wikipedia),
+            self.cmp.dist_abs(dna[::-1], dna, 5, _sim_wikipedia),
+        )
+
+    def test_needleman_wunsch_alignment(self):
+        """Test abydos.distance.NeedlemanWunsch.alignment."""
+        self.assertEqual(self.cmp.alignment('', ''), (0.0, '', ''))
+        self.assertEqual(self.cmp.alignment('abc', ''), (-3.0, 'abc', '---'))
+        self.assertEqual(self.cmp.alignment('', 'abc'), (-3.0, '---', 'abc'))
+        self.assertEqual(self.cmp.alignment('cat', 'hat'), (2.0, 'cat', 'hat'))
+        self.assertEqual(
+            self.cmp.alignment('Niall', 'Neil'), (1.0, 'Niall', 'N-eil')
+        )
+
+        for i in range(len(NIALL)):
+            score, src, tar = self.cmp.alignment(
+                NIALL[0], NIALL[i], 2, _sim_nw
+            )
+            self.assertEqual(
+                score, self.cmp.dist_abs(NIALL[0], NIALL[i], 2, _sim_nw)
+            )
+            self.assertEqual(len(src), len(tar))
+            self.assertEqual(src.replace('-', ''), NIALL[0])
+            self.assertEqual(tar.replace('-', ''), NIALL[i])
+
+    def test_needleman_wunsch_alignment_long(self):
+        """Test abydos.distance.NeedlemanWunsch.alignment on long strings."""
+        # These are long enough to be split, per Hirschberg
+        dna = 'AGACTAGTTACCGAGACGT' * 20
+        tar = dna[7:150] + dna[170:-3]
+        for args in ((), (5, _sim_wikipedia)):
+            score, src_aln, tar_aln = self.cmp.alignment(dna, tar, *args)
+            self.assertEqual(score, self.cmp.dist_abs(dna, tar, *args))
+            self.assertEqual(len(src_aln), len(tar_aln))
+            self.assertEqual(src_aln.replace('-', ''), dna)
+            self.assertEqual(tar_aln.replace('-', ''), tar)
+
 
 if __name__ == '__main__':
     unittest.main()
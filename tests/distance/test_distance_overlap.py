@@ -104,6 +104,16 @@ class OverlapTestCases(unittest.TestCase):
         # Test wrapper
         self.assertAlmostEqual(dist_overlap('nelson', 'neilsen'), 3 / 7)
 
+    def test_overlap_sim_matrix(self):
+        """Test abydos.distance.Overlap.sim_matrix."""
+        matrix = self.cmp.sim_matrix(['', 'nelson', 'neilsen'])
+        self.assertEqual(matrix[0].tolist(), [1.0, 0.0, 0.0])
+        self.assertAlmostEqual(matrix[1, 2], 4 / 7)
+        self.assertAlmostEqual(matrix[2, 1], 4 / 7)
+        self.assertAlmostEqual(
+            self.cmp.dist_matrix([NONQ_FROM], [NONQ_TO], 0)[0, 0], 3 / 7
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -105,6 +105,16 @@ class RatcliffObershelpTestCases(unittest.TestCase):
                     SequenceMatcher(None, word1, word2).ratio(),
                 )
 
+        # Long strings, on which SequenceMatcher's junk heuristic must be off
+        with open(_corpus_file('variantNames.csv')) as variants:
+            lines = [line.strip() for line in variants][1:41]
+        src = ' '.join(lines[:25])
+        tar = ' '.join(lines[15:])
+        self.assertAlmostEqual(
+            self.cmp.sim(src, tar),
+            SequenceMatcher(None, src, tar, autojunk=False).ratio(),
+        )
+
         # Test wrapper
         self.assertAlmostEqual(
             sim_ratcliff_obershelp('alexandre', 'aleksander'),
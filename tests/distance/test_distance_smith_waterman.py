@@ -73,6 +73,15 @@ class SmithWatermanTestCases(unittest.TestCase):
             smith_waterman('AGACTAGTTAC', 'CGAGACGT', 5, _sim_wikipedia), 26
         )
 
+    def test_smith_waterman_dist_abs_long(self):
+        """Test abydos.distance.SmithWaterman.dist_abs on long strings."""
+        dna = 'AGACTAGTTACCGAGACGT' * 20
+        self.assertEqual(self.cmp.dist_abs(dna, dna), len(dna))
+        self.assertEqual(self.cmp.dist_abs(dna, 'x' + dna + 'x'), len(dna) - 1)
+        self.assertEqual(
+            self.cmp.dist_abs(dna, dna[::-1], 5, _sim_wikipedia), 1878
+        )
+
     def test_smith_waterman_dist_abs_nialls(self):
         """Test abydos.distance.SmithWaterman.dist_abs (Nialls set)."""
         sw_vals = (5, 1, 1, 3, 2, 1, 1, 0, 0, 1, 1, 2, 2, 1, 0, 0)
@@ -81,6 +90,59 @@ class SmithWatermanTestCases(unittest.TestCase):
                 self.cmp.dist_abs(NIALL[0], NIALL[i], 2, _sim_nw), sw_vals[i]
             )
 
+    def test_smith_waterman_dist_abs_many(self):
+        """Test abydos.distance.SmithWaterman.dist_abs_many."""
+        self.assertEqual(list(self.cmp.dist_abs_many('cat', [])), [])
+        self.assertEqual(
+            list(self.cmp.dist_abs_many('', ['cat', ''])), [0.0, 0.0]
+        )
+
+        for gap_cost in (1, 2, 0.4):
+            self.assertEqual(
+                list(self.cmp.dist_abs_many(NIALL[0], NIALL, gap_cost)),
+                [self.cmp.dist_abs(NIALL[0], tar, gap_cost) for tar in NIALL],
+            )
+        self.assertEqual(
+            list(self.cmp.dist_abs_many(NIALL[0], NIALL, 2, _sim_nw)),
+            [5, 1, 1, 3, 2, 1, 1, 0, 0, 1, 1, 2, 2, 1, 0, 0],
+        )
+
+        dna = 'AGACTAGTTACCGAGACGT' * 20
+        targets = [dna, dna[::-1], 'A', '', dna[5:-5], dna[:200] * 3]
+        self.assertEqual(
+            list(self.cmp.dist_abs_many(dna, targets, 5, _sim_wikipedia)),
+            [
+                self.cmp.dist_abs(dna, tar, 5, _sim_wikipedia)
+                for tar in targets
+            ],
+        )
+
+    def test_smith_waterman_alignment(self):
+        """Test abydos.distance.SmithWaterman.alignment."""
+        self.assertEqual(self.cmp.alignment('', ''), (0.0, '', ''))
+        self.assertEqual(self.cmp.alignment('abc', ''), (0.0, '', ''))
+        self.assertEqual(self.cmp.alignment('cat', 'hat'), (2.0, 'at', 'at'))
+        self.assertEqual(
+            self.cmp.alignment('aluminum', 'Catalan'), (0.0, '', '')
+        )
+
+        dna = 'AGACTAGTTACCGAGACGT' * 20
+        cases = [((NIALL[0], name), ((), (2,))) for name in NIALL] + [
+            (pair, ((), (2, _sim_nw), (5, _sim_wikipedia)))
+            for pair in (
+                ('AGACTAGTTAC', 'CGAGACGT'),
+                # These are long enough to be split, per Hirschberg
+                (dna, dna[7:150] + dna[170:-3]),
+            )
+        ]
+        for (src, tar), arg_sets in cases:
+            for args in arg_sets:
+                score, src_aln, tar_aln = self.cmp.alignment(src, tar, *args)
+                self.assertEqual(score, self.cmp.dist_abs(src, tar, *args))
+                self.assertEqual(len(src_aln), len(tar_aln))
+                # The alignment ends with the ends of both strings
+                self.assertTrue(src.endswith(src_aln.replace('-', '')))
+                self.assertTrue(tar.endswith(tar_aln.replace('-', '')))
 
 if __name__ == '__main__':
     unittest.main()
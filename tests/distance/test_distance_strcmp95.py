@@ -82,6 +82,26 @@ class Strcmp95TestCases(unittest.TestCase):
         # Test wrapper
         self.assertAlmostEqual(sim_strcmp95('DIXON', 'DICKSONX'), 0.839333333)
 
+    def test_strcmp95_sim_similar_chars(self):
+        """Test abydos.distance.Strcmp95.sim with similar characters."""
+        # The adjusted weights are symmetric
+        for char1, char2 in self.cmp._sp_mx:  # noqa: SF01
+            self.assertEqual(self.cmp._adjwt[char1][char2], 3)  # noqa: SF01
+            self.assertEqual(self.cmp._adjwt[char2][char1], 3)  # noqa: SF01
+
+        self.assertAlmostEqual(self.cmp.sim('OSCAR', '0SKAR'), 0.81333333)
+        self.assertAlmostEqual(
+            self.cmp.sim('OSCAR', '0SKAR', True), 0.84444444
+        )
+        self.assertAlmostEqual(self.cmp.sim('B0B', 'BOB8'), 0.8025)
+        self.assertAlmostEqual(self.cmp.sim('PHILIP', 'FILIP'), 0.82222222)
+        self.assertAlmostEqual(
+            self.cmp.sim('PHILIP', 'FILIP', True), 0.86324786
+        )
+        self.assertAlmostEqual(
+            self.cmp.sim('Van Dyke', 'Wan Dike', True), 0.91574074
+        )
+
     def test_strcmp95_dist(self):
         """Test abydos.distance.Strcmp95.dist."""
         self.assertEqual(self.cmp.dist('', ''), 0)
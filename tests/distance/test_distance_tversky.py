@@ -160,6 +160,43 @@ class TverskyIndexTestCases(unittest.TestCase):
         # Test wrapper
         self.assertAlmostEqual(dist_tversky('nelson', 'neilsen'), 7 / 11)
 
+    def test_tversky_sim_matrix(self):
+        """Test abydos.distance.Tversky.sim_matrix."""
+        terms = ['', 'nelson', 'neilsen', 'niall', 'neal', 'a', 'niall']
+        for args in ((2,), (2, 2, 1), (2, 1, 2, 0.5), (0,), (1,), (7,)):
+            matrix = self.cmp.sim_matrix(terms, None, *args)
+            self.assertEqual(matrix.shape, (len(terms), len(terms)))
+            for i, src in enumerate(terms):
+                for j, tar in enumerate(terms):
+                    self.assertAlmostEqual(
+                        matrix[i, j], self.cmp.sim(src, tar, *args)
+                    )
+
+        matrix = self.cmp.sim_matrix([NONQ_FROM, NONQ_TO], [NONQ_TO], 0)
+        self.assertEqual(matrix.shape, (2, 1))
+        self.assertAlmostEqual(matrix[0, 0], 1 / 3)
+        self.assertAlmostEqual(matrix[1, 0], 1.0)
+
+        # supplied q-gram tests
+        self.assertEqual(
+            self.cmp.sim_matrix([QGrams('')], [QGrams('')]).tolist(), [[1.0]]
+        )
+        self.assertAlmostEqual(
+            self.cmp.sim_matrix([QGrams('nelson')], ['neilsen'])[0, 0], 4 / 11
+        )
+
+        self.assertEqual(self.cmp.sim_matrix([], ['a']).shape, (0, 1))
+        self.assertRaises(
+            ValueError, self.cmp.sim_matrix, ['abcd'], ['dcba'], 2, -1, -1
+        )
+
+    def test_tversky_dist_matrix(self):
+        """Test abydos.distance.Tversky.dist_matrix."""
+        matrix = self.cmp.dist_matrix(['', 'nelson'], ['nelson', 'neilsen'])
+        self.assertEqual(matrix.tolist()[0], [1.0, 1.0])
+        self.assertAlmostEqual(matrix[1, 0], 0.0)
+        self.assertAlmostEqual(matrix[1, 1], 7 / 11)
+
 
 if __name__ == '__main__':
     unittest.main()
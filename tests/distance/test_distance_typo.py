@@ -32,6 +32,8 @@ import unittest
 
 from abydos.distance import Typo, dist_typo, sim_typo, typo
 
+from .. import NONQ_FROM, NONQ_TO
+
 
 class TypoTestCases(unittest.TestCase):
     """Test Typo functions.
@@ -74,6 +76,42 @@ class TypoTestCases(unittest.TestCase):
             typo('asdf', 'asdt', metric='log-euclidean'), 0.4406868
         )
 
+    def test_typo_dist_abs_wavefront(self):
+        """Test abydos.distance.Typo.dist_abs's wavefront kernel."""
+        src = NONQ_FROM.replace(' ', '')
+        tar = NONQ_TO.replace(' ', '')
+        pairs = (
+            ('Niall', 'Neil'),
+            ('cat', 'hat'),
+            ('a', 'bcd'),
+            ('Colin', 'Cuilen'),
+            (src, tar),
+            (src * 3, tar * 2),
+        )
+        for metric in ('euclidean', 'manhattan', 'log-euclidean'):
+            for cost in ((1, 1, 0.5, 0.5), (2, 3, 1, 0.25)):
+                sub = self.cmp._substitution_cost_func(  # noqa: SF01
+                    metric, cost[2], cost[3], 'QWERTY'
+                )
+                for src, tar in pairs:
+                    self.assertEqual(
+                        self.cmp._dist_abs_wavefront(  # noqa: SF01
+                            src, tar, cost[0], cost[1], sub
+                        ),
+                        self.cmp._dist_abs_dp(  # noqa: SF01
+                            src, tar, cost[0], cost[1], sub
+                        ),
+                    )
+
+        # Long strings are sent to the wavefront kernel
+        sub = self.cmp._substitution_cost_func(  # noqa: SF01
+            'euclidean', 0.5, 0.5, 'QWERTY'
+        )
+        self.assertEqual(
+            self.cmp.dist_abs(src * 3, tar * 2),
+            self.cmp._dist_abs_dp(src * 3, tar * 2, 1, 1, sub),  # noqa: SF01
+        )
+
     def test_typo_sim(self):
         """Test abydos.distance.Typo.sim."""
         # Base cases
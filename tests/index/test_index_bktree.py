@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2014-2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.index.test_index_bktree.
+
+This module contains unit tests for abydos.index.BKTree
+"""
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+import codecs
+import pickle
+import unittest
+
+from abydos.distance import DamerauLevenshtein, Hamming, Indel, Levenshtein
+from abydos.index import BKTree
+
+from .. import COLIN, NIALL, _corpus_file
+
+
+class BKTreeTestCases(unittest.TestCase):
+    """Test abydos.index.BKTree."""
+
+    with codecs.open(_corpus_file('nachnamen.csv'), encoding='utf-8') as f:
+        names = sorted({line.split(',')[0] for line in f if line[0] != '#'})[
+            :1000
+        ]
+
+    def test_bktree(self):
+        """Test abydos.index.BKTree."""
+        tree = BKTree()
+        self.assertEqual(len(tree), 0)
+        self.assertEqual(tree.search('Niall', 3), [])
+        self.assertEqual(tree.nearest('Niall'), [])
+
+        tree.update(NIALL)
+        tree.add('Niall')
+        self.assertEqual(len(tree), len(set(NIALL)))
+        self.assertEqual(tree.search('Niall', 0), [('Niall', 0)])
+        self.assertEqual(tree.search('Nial', 0), [])
+        self.assertEqual(tree.nearest('Niall', 0), [])
+        self.assertEqual(tree.nearest('Niall', 1), [('Niall', 0)])
+        self.assertEqual(len(tree.nearest('Niall', 100)), len(set(NIALL)))
+
+        tree = pickle.loads(pickle.dumps(BKTree(COLIN)))
+        self.assertEqual(len(tree), len(COLIN))
+        self.assertEqual(
+            tree.search('Colin', 1)[:3],
+            [('Colin', 0), ('Colinn', 1), ('Collin', 1)],
+        )
+
+    def test_bktree_exhaustive(self):
+        """Test abydos.index.BKTree against exhaustive search."""
+        for metric, names in (
+            (Levenshtein().dist_abs, self.names),
+            (DamerauLevenshtein().dist_abs, self.names[:200]),
+            (Indel().dist_abs, self.names[:200]),
+            (Hamming().dist_abs, self.names),
+        ):
+            calls = [0]
+
+            def _counted(src, tar):
+                calls[0] += 1
+                return metric(src, tar)
+
+            tree = BKTree(names, _counted)
+            self.assertEqual(len(tree), len(names))
+
+            for term in names[::67] + ['Niall', 'Schmid']:
+                dists = sorted((metric(term, name), name) for name in names)
+                for radius in (0, 1, 2):
+                    calls[0] = 0
+                    self.assertEqual(
+                        tree.search(term, radius),
+                        [(name, d) for d, name in dists if d <= radius],
+                    )
+                    if radius == 1:
+                        self.assertLess(calls[0], len(names) // 2)
+
+                nearest = tree.nearest(term, 5)
+                self.assertEqual(
+                    [d for _, d in nearest], [d for d, _ in dists[:5]]
+                )
+                for name, dist in nearest:
+                    self.assertEqual(metric(term, name), dist)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2014-2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.index.test_index_levenshtein_trie.
+
+This module contains unit tests for abydos.index.LevenshteinTrie
+"""
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+import codecs
+import pickle
+import unittest
+
+from abydos.distance import levenshtein
+from abydos.index import LevenshteinTrie
+
+from .. import COLIN, NIALL, _corpus_file
+
+
+class LevenshteinTrieTestCases(unittest.TestCase):
+    """Test abydos.index.LevenshteinTrie."""
+
+    with codecs.open(_corpus_file('nachnamen.csv'), encoding='utf-8') as f:
+        names = sorted({line.split(',')[0] for line in f if line[0] != '#'})
+
+    def test_levenshtein_trie(self):
+        """Test abydos.index.LevenshteinTrie."""
+        self.assertRaises(ValueError, LevenshteinTrie, mode='dl')
+
+        trie = LevenshteinTrie()
+        self.assertEqual(len(trie), 0)
+        self.assertEqual(trie.search('Niall', 3), [])
+        self.assertNotIn('', trie)
+
+        trie.update(NIALL)
+        trie.add('Niall')
+        self.assertEqual(len(trie), len(set(NIALL)))
+        self.assertIn('Niall', trie)
+        self.assertNotIn('Nial', trie)
+        self.assertNotIn('Nialls', trie)
+        self.assertEqual(trie.search('Niall', -1), [])
+        self.assertEqual(trie.search('Niall', 0), [('Niall', 0)])
+        self.assertEqual(trie.search('Nial', 0), [])
+        self.assertEqual(len(trie.search('Niall', 100)), len(set(NIALL)))
+
+        trie.add('')
+        self.assertIn('', trie)
+        self.assertEqual(trie.search('a', 1), [('', 1)])
+
+        trie = pickle.loads(pickle.dumps(LevenshteinTrie(COLIN)))
+        self.assertEqual(len(trie), len(COLIN))
+        self.assertEqual(
+            trie.search('Colin', 1)[:3],
+            [('Colin', 0), ('Colinn', 1), ('Collin', 1)],
+        )
+
+        # Transpositions count once under osa, but twice under lev
+        self.assertEqual(LevenshteinTrie(['Niall']).search('Nilal', 1), [])
+        self.assertEqual(
+            LevenshteinTrie(['Niall'], mode='osa').search('Nilal', 1),
+            [('Niall', 1)],
+        )
+        self.assertEqual(
+            LevenshteinTrie(['abc'], mode='osa').search('ca', 2), []
+        )
+
+    def test_levenshtein_trie_exhaustive(self):
+        """Test abydos.index.LevenshteinTrie against exhaustive search."""
+        queries = self.names[::997] + ['Niall', 'Schmid', 'Mleur', 'a', '']
+        for mode in ('lev', 'osa'):
+            trie = LevenshteinTrie(self.names, mode=mode)
+            self.assertEqual(len(trie), len(self.names))
+            for term in queries:
+                dists = sorted(
+                    (levenshtein(term, name, mode=mode), name)
+                    for name in self.names
+                )
+                for max_distance in (0, 1, 2, 3):
+                    self.assertEqual(
+                        trie.search(term, max_distance),
+                        [(name, d) for d, name in dists if d <= max_distance],
+                    )
+
+
+if __name__ == '__main__':
+    unittest.main()
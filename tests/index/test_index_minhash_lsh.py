@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2014-2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.index.test_index_minhash_lsh.
+
+This module contains unit tests for abydos.index.MinHashLSHIndex
+"""
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+import codecs
+import pickle
+import unittest
+
+from abydos.distance import Dice, Jaccard
+from abydos.index import MinHashLSHIndex
+
+from .. import COLIN, NIALL, _corpus_file
+
+
+class MinHashLSHIndexTestCases(unittest.TestCase):
+    """Test abydos.index.MinHashLSHIndex."""
+
+    with codecs.open(_corpus_file('nachnamen.csv'), encoding='utf-8') as f:
+        names = sorted({line.split(',')[0] for line in f if line[0] != '#'})[
+            :1500
+        ]
+
+    def test_minhash_lsh_index(self):
+        """Test abydos.index.MinHashLSHIndex."""
+        idx = MinHashLSHIndex(NIALL + COLIN)
+        self.assertEqual(len(idx), len(set(NIALL + COLIN)))
+        self.assertIn('Niall', idx)
+        self.assertNotIn('Nial', idx)
+
+        # queries are verified exactly & ordered by similarity
+        cmp = Jaccard()
+        for term in ('Niall', 'Colin', 'Nial', 'Collins', ''):
+            results = idx.query(term, 0.3)
+            for match, sim in results:
+                self.assertEqual(sim, cmp.sim(term, match))
+                self.assertGreaterEqual(sim, 0.3)
+            self.assertEqual(
+                [sim for _, sim in results],
+                sorted((sim for _, sim in results), reverse=True),
+            )
+        self.assertEqual(idx.query('Niall')[0], ('Niall', 1.0))
+        self.assertEqual(idx.query('Zzyzx'), [])
+
+        # remove
+        idx.remove('Niall')
+        self.assertNotIn('Niall', idx)
+        self.assertNotIn('Niall', idx.candidates('Niall'))
+        self.assertRaises(KeyError, idx.remove, 'Niall')
+        idx.add('Niall')
+        idx.add('Niall')
+        self.assertEqual(len(idx), len(set(NIALL + COLIN)))
+        self.assertEqual(idx.query('Niall')[0], ('Niall', 1.0))
+
+        # removing every term empties the buckets
+        for term in NIALL + COLIN:
+            if term in idx:
+                idx.remove(term)
+        self.assertEqual(len(idx), 0)
+        self.assertEqual(idx._buckets, [{} for _ in range(32)])  # noqa: SF01
+
+        self.assertRaises(ValueError, MinHashLSHIndex, num_perm=100, bands=3)
+        self.assertRaises(ValueError, MinHashLSHIndex, bands=0)
+
+    def test_minhash_lsh_index_recall(self):
+        """Test abydos.index.MinHashLSHIndex against exhaustive search."""
+        idx = MinHashLSHIndex(self.names)
+        cmp = Jaccard()
+        missed = found = 0
+        for term in self.names[::25]:
+            expected = {
+                name for name in self.names if cmp.sim(term, name) >= 0.6
+            }
+            results = {name for name, _ in idx.query(term, 0.6)}
+            self.assertLessEqual(results, expected)
+            found += len(results)
+            missed += len(expected - results)
+        self.assertLess(missed, 0.05 * (found + missed))
+
+        # Dice verification with fewer, wider bands
+        idx = MinHashLSHIndex(
+            self.names, qval=3, num_perm=64, bands=16, metric=Dice()
+        )
+        cmp = Dice()
+        for term in self.names[::50]:
+            for name, sim in idx.query(term, 0.7):
+                self.assertEqual(sim, cmp.sim(term, name, 3))
+
+    def test_minhash_lsh_index_pickle(self):
+        """Test pickling abydos.index.MinHashLSHIndex."""
+        idx = MinHashLSHIndex(self.names[:300], seed=12)
+        idx2 = pickle.loads(pickle.dumps(idx))
+        self.assertEqual(len(idx2), 300)
+        for term in self.names[:300:7] + ['Niall']:
+            self.assertEqual(idx.query(term, 0.4), idx2.query(term, 0.4))
+            self.assertEqual(
+                idx.signature(term).tolist(), idx2.signature(term).tolist()
+            )
+
+        # signatures depend only on the seed
+        self.assertEqual(
+            MinHashLSHIndex(seed=12).signature('Niall').tolist(),
+            idx.signature('Niall').tolist(),
+        )
+        self.assertNotEqual(
+            MinHashLSHIndex(seed=13).signature('Niall').tolist(),
+            idx.signature('Niall').tolist(),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
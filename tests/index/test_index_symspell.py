@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2014-2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.index.test_index_symspell.
+
+This module contains unit tests for abydos.index.SymSpellIndex
+"""
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+import codecs
+import pickle
+import unittest
+from functools import partial
+
+from abydos.corpus import Corpus
+from abydos.distance import DamerauLevenshtein, Levenshtein, levenshtein
+from abydos.index import SymSpellIndex
+
+from .. import NIALL, NONQ_FROM, NONQ_TO, _corpus_file
+
+
+class SymSpellIndexTestCases(unittest.TestCase):
+    """Test abydos.index.SymSpellIndex."""
+
+    with codecs.open(
+        _corpus_file('wikipediaCommonMisspellings.csv'), encoding='utf-8'
+    ) as f:
+        next(f)
+        misspellings = [line.strip().split(',') for line in f]
+    words = sorted({correct for _, correct in misspellings})
+
+    def test_symspell(self):
+        """Test abydos.index.SymSpellIndex."""
+        self.assertRaises(
+            ValueError, SymSpellIndex, max_distance=3, prefix_length=3
+        )
+        self.assertRaises(ValueError, SymSpellIndex, mode='hamming')
+
+        idx = SymSpellIndex()
+        self.assertEqual(len(idx), 0)
+        self.assertEqual(idx.query('Niall'), [])
+        self.assertRaises(ValueError, idx.query, 'Niall', 3)
+
+        idx.update(NIALL)
+        idx.add('Niall', 5)
+        self.assertEqual(len(idx), len(set(NIALL)))
+        self.assertIn('Niall', idx)
+        self.assertNotIn('Nial', idx)
+        self.assertEqual(idx.frequency('Niall'), 6)
+        self.assertEqual(idx.frequency('Nial'), 0)
+        self.assertEqual(idx.query('Niall', 0), [('Niall', 0)])
+        self.assertEqual(idx.query('Nial', 0), [])
+        self.assertEqual(idx.query('Nial', 1)[0], ('Niall', 1))
+
+        idx = pickle.loads(pickle.dumps(idx))
+        self.assertEqual(idx.query('Nial', 1)[0], ('Niall', 1))
+
+        # Transpositions count once under osa & dl, but twice under lev
+        idx = SymSpellIndex(['Niall'], mode='lev')
+        self.assertEqual(idx.query('Nilal'), [('Niall', 2)])
+        self.assertEqual(idx.query('Nilal', 1), [])
+        idx = SymSpellIndex(['Niall'], mode='osa')
+        self.assertEqual(idx.query('Nilal', 1), [('Niall', 1)])
+        idx = SymSpellIndex(['abc'], mode='dl')
+        self.assertEqual(idx.query('ca'), [('abc', 2)])
+        idx = SymSpellIndex(['abc'], mode='osa')
+        self.assertEqual(idx.query('ca'), [])
+
+        # Frequencies from a corpus break ties in distance
+        corp = Corpus(NONQ_FROM + ' ' + NONQ_TO)
+        idx = SymSpellIndex(corp.words())
+        self.assertEqual(idx.frequency('fox.'), 1)
+        self.assertEqual(idx.frequency('brown'), 2)
+        self.assertEqual(idx.query('dog', 1), [('dog', 0), ('dog.', 1)])
+        self.assertEqual(idx.query('he', 1), [('the', 1), ('The', 1)])
+
+    def test_symspell_exhaustive(self):
+        """Test abydos.index.SymSpellIndex against exhaustive search."""
+        queries = [error for error, _ in self.misspellings[::97]]
+        for mode, prefix_length, words in (
+            ('osa', 7, self.words),
+            ('osa', None, self.words[::3]),
+            ('lev', 4, self.words[::3]),
+            ('dl', 7, self.words[::11]),
+        ):
+            if mode == 'dl':
+                metric = DamerauLevenshtein().dist_abs
+            else:
+                metric = partial(Levenshtein().dist_abs, mode=mode)
+
+            idx = SymSpellIndex(words, prefix_length=prefix_length, mode=mode)
+            self.assertEqual(len(idx), len(words))
+            for term in queries:
+                dists = sorted((metric(term, word), word) for word in words)
+                for max_distance in (0, 1, 2):
+                    self.assertEqual(
+                        idx.query(term, max_distance),
+                        [(w, d) for d, w in dists if d <= max_distance],
+                    )
+
+    def test_symspell_linear_scan(self):
+        """Benchmark abydos.index.SymSpellIndex against a linear scan.
+
+        Rather than timing the queries, this counts the edit distances each
+        computes, where a linear scan computes one per word.
+        """
+        queries = [error for error, _ in self.misspellings[::89]]
+        idx = SymSpellIndex(self.words, mode='lev')
+
+        verified = []
+        distance = idx._distance  # noqa: SF01
+
+        def _counted_distance(src, tar, max_distance):
+            verified.append(tar)
+            return distance(src, tar, max_distance)
+
+        idx._distance = _counted_distance  # noqa: SF01
+
+        linear = [
+            sorted(
+                (dist, word)
+                for dist, word in (
+                    (levenshtein(term, word), word) for word in self.words
+                )
+                if dist <= 2
+            )
+            for term in queries
+        ]
+        indexed = [idx.query(term) for term in queries]
+
+        self.assertEqual(
+            indexed, [[(w, d) for d, w in found] for found in linear]
+        )
+        # Each query verifies fewer than 1% of the words a linear scan does
+        self.assertLess(len(verified) * 100, len(queries) * len(self.words))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2014-2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.index.test_index_vptree.
+
+This module contains unit tests for abydos.index.VPTree
+"""
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+import codecs
+import pickle
+import unittest
+
+from abydos.distance import Euclidean, Jaccard, Levenshtein, Manhattan
+from abydos.index import VPTree
+
+from .. import COLIN, NIALL, _corpus_file
+
+
+class VPTreeTestCases(unittest.TestCase):
+    """Test abydos.index.VPTree."""
+
+    with codecs.open(_corpus_file('nachnamen.csv'), encoding='utf-8') as f:
+        names = sorted({line.split(',')[0] for line in f if line[0] != '#'})[
+            :1500
+        ]
+
+    def test_vptree(self):
+        """Test abydos.index.VPTree."""
+        tree = VPTree()
+        self.assertEqual(len(tree), 0)
+        self.assertEqual(tree.search('Niall', 1), [])
+        self.assertEqual(tree.nearest('Niall'), [])
+        self.assertEqual(tree.distance_calls, 0)
+
+        tree = VPTree(NIALL + ('Niall',))
+        self.assertEqual(len(tree), len(set(NIALL)))
+        self.assertEqual(tree.search('Niall', 0), [('Niall', 0)])
+        self.assertEqual(tree.search('Nial', 0), [])
+        self.assertEqual(tree.nearest('Niall', 0), [])
+        self.assertEqual(tree.nearest('Niall', 1), [('Niall', 0)])
+        self.assertEqual(len(tree.nearest('Niall', 100)), len(set(NIALL)))
+        self.assertEqual(len(tree.search('Niall', 100)), len(set(NIALL)))
+
+        tree = pickle.loads(pickle.dumps(VPTree(COLIN)))
+        self.assertEqual(len(tree), len(COLIN))
+        self.assertEqual(
+            tree.search('Colin', 1)[:4],
+            [('Colin', 0), ('Colinn', 1), ('Collin', 1), ('Colon', 1)],
+        )
+
+        # The same seed selects the same vantage points
+        self.assertEqual(
+            VPTree(COLIN)._root, VPTree(COLIN)._root  # noqa: SF01
+        )
+        self.assertNotEqual(
+            VPTree(COLIN)._root, VPTree(COLIN, seed=1)._root  # noqa: SF01
+        )
+
+    def test_vptree_parallel(self):
+        """Test abydos.index.VPTree built with a process pool."""
+        metric = Levenshtein().dist_abs
+        serial = VPTree(self.names, metric)
+        parallel = VPTree(self.names, metric, n_jobs=2)
+        self.assertEqual(serial._root, parallel._root)  # noqa: SF01
+        self.assertEqual(serial.distance_calls, parallel.distance_calls)
+        self.assertEqual(
+            VPTree(self.names[:10], metric, n_jobs=None)._root,  # noqa: SF01
+            VPTree(self.names[:10], metric)._root,  # noqa: SF01
+        )
+
+    def test_vptree_exhaustive(self):
+        """Test abydos.index.VPTree against exhaustive search."""
+        for metric, names, radii in (
+            (Levenshtein().dist_abs, self.names, (0, 1, 2)),
+            (Euclidean().dist_abs, self.names[::3], (0, 2.5, 3)),
+            (Manhattan().dist_abs, self.names[::3], (0, 6, 9)),
+            (Jaccard().dist, self.names[::3], (0.3, 0.5)),
+        ):
+            tree = VPTree(names, metric)
+            self.assertEqual(len(tree), len(names))
+            self.assertGreaterEqual(tree.distance_calls, len(names) - 1)
+
+            for term in names[::97] + ['Niall', 'Schmid']:
+                dists = sorted((metric(term, name), name) for name in names)
+                for radius in radii:
+                    tree.distance_calls = 0
+                    self.assertEqual(
+                        tree.search(term, radius),
+                        [(name, d) for d, name in dists if d <= radius],
+                    )
+                    if radius == 0:
+                        self.assertLess(tree.distance_calls, len(names) // 2)
+
+                for k in (1, 5):
+                    nearest = tree.nearest(term, k)
+                    self.assertEqual(
+                        [d for _, d in nearest], [d for d, _ in dists[:k]]
+                    )
+                    for name, dist in nearest:
+                        self.assertEqual(metric(term, name), dist)
+
+
+if __name__ == '__main__':
+    unittest.main()
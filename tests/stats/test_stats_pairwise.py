@@ -29,13 +29,16 @@ from __future__ import (
 )
 
 import unittest
+from math import isnan
 
-from abydos.distance import sim_jaccard
+from abydos.distance import Jaccard, sim_jaccard, sim_tversky
 from abydos.stats import (
     amean,
     gmean,
     hmean,
+    median,
     mean_pairwise_similarity,
+    pairwise_matrix,
     pairwise_similarity_statistics,
 )
 
@@ -157,6 +160,61 @@ class MPSTestCases(unittest.TestCase):
             mean_pairwise_similarity(set(NIALL)),
         )
 
+        # Test parallel
+        self.assertEqual(
+            mean_pairwise_similarity(NIALL, n_jobs=2, chunk_size=7),
+            mean_pairwise_similarity(NIALL),
+        )
+        self.assertEqual(
+            mean_pairwise_similarity(
+                NIALL, symmetric=True, n_jobs=2, chunk_size=7
+            ),
+            mean_pairwise_similarity(NIALL, symmetric=True),
+        )
+
+        # Test stream
+        for mean_func in (amean, gmean, hmean):
+            for symmetric in (False, True):
+                self.assertAlmostEqual(
+                    mean_pairwise_similarity(
+                        NIALL,
+                        mean_func=mean_func,
+                        symmetric=symmetric,
+                        stream=True,
+                    ),
+                    mean_pairwise_similarity(
+                        NIALL, mean_func=mean_func, symmetric=symmetric
+                    ),
+                )
+        self.assertAlmostEqual(
+            mean_pairwise_similarity(
+                NIALL, stream=True, n_jobs=2, chunk_size=9
+            ),
+            mean_pairwise_similarity(NIALL),
+        )
+        self.assertEqual(
+            mean_pairwise_similarity(['a', 'a', 'a'], stream=True), 1.0
+        )
+        self.assertEqual(
+            mean_pairwise_similarity(['a', 'b', 'ab'], stream=True), 0
+        )
+        self.assertTrue(
+            isnan(mean_pairwise_similarity(['a', 'b', 'c', 'ab'], stream=True))
+        )
+        self.assertEqual(
+            mean_pairwise_similarity(
+                ['a', 'b', 'ab'], mean_func=gmean, stream=True
+            ),
+            0.0,
+        )
+        self.assertRaises(
+            ValueError,
+            mean_pairwise_similarity,
+            NIALL,
+            mean_func=median,
+            stream=True,
+        )
+
 
 class PSSTestCases(unittest.TestCase):
     """Test pairwise similarity statistics functions.
@@ -252,6 +310,172 @@ class PSSTestCases(unittest.TestCase):
         self.assertRaises(ValueError, pairwise_similarity_statistics, 5, NIALL)
         self.assertRaises(ValueError, pairwise_similarity_statistics, NIALL, 5)
 
+        # Test parallel
+        self.assertEqual(
+            pairwise_similarity_statistics(
+                NIALL, NIALL_1WORD, metric=sim_tversky, n_jobs=2, chunk_size=5
+            ),
+            pairwise_similarity_statistics(
+                NIALL, NIALL_1WORD, metric=sim_tversky
+            ),
+        )
+        self.assertEqual(
+            pairwise_similarity_statistics(
+                NIALL, ('Kneal',), symmetric=True, n_jobs=2
+            ),
+            pairwise_similarity_statistics(NIALL, ('Kneal',), symmetric=True),
+        )
+
+        # Test generators
+        self.assertEqual(
+            pairwise_similarity_statistics(
+                (name for name in NIALL), iter(('Kneal',)), symmetric=True
+            ),
+            pairwise_similarity_statistics(NIALL, ('Kneal',), symmetric=True),
+        )
+
+        # Test stream
+        for mean_func in (amean, gmean, hmean):
+            for symmetric in (False, True):
+                for n_jobs in (1, 2):
+                    for stat, stream_stat in zip(
+                        pairwise_similarity_statistics(
+                            NIALL,
+                            NIALL_1WORD,
+                            mean_func=mean_func,
+                            symmetric=symmetric,
+                        ),
+                        pairwise_similarity_statistics(
+                            NIALL,
+                            NIALL_1WORD,
+                            mean_func=mean_func,
+                            symmetric=symmetric,
+                            n_jobs=n_jobs,
+                            stream=True,
+                        ),
+                    ):
+                        self.assertAlmostEqual(stat, stream_stat)
+        self.assertRaises(
+            ValueError,
+            pairwise_similarity_statistics,
+            NIALL,
+            (),
+            stream=True,
+        )
+
+
+class PMTestCases(unittest.TestCase):
+    """Test pairwise matrix function.
+
+    abydos.stats.pairwise_matrix
+    """
+
+    def test_pairwise_matrix(self):
+        """Test abydos.stats.pairwise_matrix."""
+        n = len(NIALL)
+        matrix = pairwise_matrix(NIALL, sim_jaccard)
+        self.assertEqual(matrix.shape, (n, n))
+        for i in range(n):
+            for j in range(n):
+                self.assertEqual(matrix[i, j], sim_jaccard(NIALL[i], NIALL[j]))
+
+        # Test symmetric with an asymmetric metric
+        tversky = pairwise_matrix(
+            NIALL, lambda src, tar: sim_tversky(src, tar, 1, 0), symmetric=True
+        )
+        for i in range(n):
+            for j in range(n):
+                self.assertEqual(
+                    tversky[i, j], sim_tversky(NIALL[i], NIALL[j], 1, 0)
+                )
+        self.assertFalse((tversky == tversky.T).all())
+
+        # The diagonal is filled, unless it is to be calculated
+        calls = []
+
+        def _counted_jaccard(src, tar):
+            calls.append((src, tar))
+            return sim_jaccard(src, tar)
+
+        for diagonal in (1.0, 0.5, None):
+            del calls[:]
+            values = pairwise_matrix(
+                NIALL, _counted_jaccard, diagonal=diagonal
+            )
+            self.assertEqual(
+                len(calls), n * (n - 1) // 2 + (n if diagonal is None else 0)
+            )
+            self.assertEqual(
+                [values[i, i] for i in range(n)],
+                [
+                    sim_jaccard(term, term) if diagonal is None else diagonal
+                    for term in NIALL
+                ],
+            )
+
+        # Test condensed
+        condensed = pairwise_matrix(NIALL, sim_jaccard, condensed=True)
+        self.assertEqual(len(condensed), n * (n - 1) // 2)
+        self.assertEqual(
+            list(condensed),
+            [matrix[i, j] for i in range(n) for j in range(i + 1, n)],
+        )
+
+        # Test two collections
+        cross = pairwise_matrix(
+            NIALL, sim_jaccard, tar_collection=' '.join(NIALL_1WORD)
+        )
+        self.assertEqual(cross.shape, (n, len(NIALL_1WORD)))
+        self.assertEqual(cross[4, 2], sim_jaccard(NIALL[4], NIALL_1WORD[2]))
+
+        # Test parallel
+        for chunk_size in (None, 1, 10, 1000):
+            self.assertTrue(
+                (
+                    pairwise_matrix(
+                        NIALL, sim_jaccard, n_jobs=2, chunk_size=chunk_size
+                    )
+                    == matrix
+                ).all()
+            )
+        self.assertTrue(
+            (
+                pairwise_matrix(NIALL, Jaccard().sim, condensed=True, n_jobs=2)
+                == condensed
+            ).all()
+        )
+        self.assertTrue(
+            (
+                pairwise_matrix(
+                    NIALL,
+                    sim_jaccard,
+                    tar_collection=NIALL_1WORD,
+                    n_jobs=2,
+                    chunk_size=3,
+                )
+                == cross
+            ).all()
+        )
+
+        # Test small & empty collections
+        self.assertEqual(pairwise_matrix([]).shape, (0, 0))
+        self.assertEqual(pairwise_matrix(['a'], condensed=True).shape, (0,))
+        self.assertEqual(pairwise_matrix(['a'], n_jobs=4).tolist(), [[1.0]])
+
+        self.assertRaises(ValueError, pairwise_matrix, NIALL, 'imaginary')
+        self.assertRaises(ValueError, pairwise_matrix, 0)
+        self.assertRaises(ValueError, pairwise_matrix, NIALL, tar_collection=0)
+        self.assertRaises(
+            ValueError, pairwise_matrix, NIALL, condensed=True, symmetric=True
+        )
+        self.assertRaises(
+            ValueError,
+            pairwise_matrix,
+            NIALL,
+            condensed=True,
+            tar_collection=NIALL,
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
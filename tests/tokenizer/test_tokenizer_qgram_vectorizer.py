@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2014-2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.tokenizer.test_tokenizer_qgram_vectorizer.
+
+This module contains unit tests for abydos.tokenizer.QGramVectorizer
+"""
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+import unittest
+from collections import Counter
+
+from abydos.tokenizer import QGramVectorizer, QGrams
+
+
+class QGramVectorizerTestCases(unittest.TestCase):
+    """Test abydos.tokenizer.QGramVectorizer & QGramMatrix."""
+
+    terms = ['', 'a', 'NELSON', 'NEILSEN', 'ALLALL', 'LALALA', 'NELSON']
+
+    def test_qgram_vectorizer_transform(self):
+        """Test abydos.tokenizer.QGramVectorizer.transform."""
+        vec = QGramVectorizer()
+        qgm = vec.transform(self.terms)
+        self.assertEqual(qgm.shape, (len(self.terms), len(vec.vocabulary)))
+        self.assertEqual(len(qgm), len(self.terms))
+        for i, term in enumerate(self.terms):
+            row = {
+                qgram: qgm.data[k]
+                for qgram, col in vec.vocabulary.items()
+                for k in range(qgm.indptr[i], qgm.indptr[i + 1])
+                if qgm.indices[k] == col
+            }
+            self.assertEqual(row, dict(QGrams(term)))
+            self.assertEqual(qgm.magnitudes[i], QGrams(term).count())
+
+        # The vocabulary is extended, not rebuilt, by later calls
+        size = len(vec.vocabulary)
+        qgm2 = vec.transform(['NELS', 'XYZ'])
+        self.assertEqual(len(vec.vocabulary), size + 5)
+        self.assertEqual(qgm2.shape, (2, size + 5))
+
+        # Counters are used as-is
+        vec = QGramVectorizer(qval=3, start_stop='')
+        qgm = vec.transform([Counter({'the': 2, 'cat': 1, 'dog': 0}), 'abcd'])
+        self.assertEqual(qgm.magnitudes.tolist(), [3.0, 2.0])
+        self.assertNotIn('dog', vec.vocabulary)
+        self.assertIn('bcd', vec.vocabulary)
+
+        self.assertEqual(QGramVectorizer().transform([]).shape, (0, 0))
+
+    def test_qgram_matrix_intersection(self):
+        """Test abydos.tokenizer.QGramMatrix.intersection."""
+        for qval in (1, 2, 3):
+            vec = QGramVectorizer(qval=qval)
+            qgm = vec.transform(self.terms)
+            inter = qgm.intersection(qgm)
+            for i, src in enumerate(self.terms):
+                for j, tar in enumerate(self.terms):
+                    self.assertEqual(
+                        inter[i, j],
+                        sum((QGrams(src, qval) & QGrams(tar, qval)).values()),
+                    )
+
+        # A matrix created before the vocabulary grew
+        vec = QGramVectorizer()
+        old = vec.transform(['NELSON'])
+        new = vec.transform(['NEILSEN', 'XYZ'])
+        self.assertEqual(old.intersection(new).tolist(), [[4.0, 0.0]])
+        self.assertEqual(new.intersection(old).tolist(), [[4.0], [0.0]])
+
+        self.assertEqual(vec.transform([]).intersection(old).shape, (0, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()